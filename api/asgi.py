@@ -0,0 +1,485 @@
+"""ASGI application serving the card endpoint with non-blocking upstream requests
+
+Cards are answered as by the Flask app, with the decisions of api/cards.py and
+api/utils.py and the same caches and templates, but thumbnails and view counts are
+fetched with an asynchronous HTTP client, so a single process can keep many card
+requests in flight while it waits on upstream servers. The sqlite and redis cache
+backends block, so they are called in threads. All other requests, such as the demo
+page, are passed on to the Flask app.
+
+Requires the ``async`` extra (``pip install '.[async]'``) and can be served with::
+
+    uvicorn api.asgi:app
+"""
+
+import asyncio
+import io
+import sys
+import time
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import parse_qs
+
+import aiohttp
+from flask.wrappers import Request
+
+from .batching import AsyncMicroBatcher
+from .breaker import CircuitBreakers, host_of, is_failure_status, upstream_breakers
+from .cache import call_cache
+from .cards import (
+    CardReply,
+    card_cache_key,
+    card_etag,
+    card_reply,
+    error_reply,
+    error_status,
+    is_complete,
+    pack_card,
+    parse_card_params,
+    published_text,
+    rendered_card,
+    revalidated_reply,
+    unpack_card,
+)
+from .compression import negotiate_encoding
+from .config import (
+    UPSTREAM_CONNECT_TIMEOUT,
+    UPSTREAM_DEADLINE,
+    UPSTREAM_IDLE_TIMEOUT,
+    UPSTREAM_MAX_CONNECTIONS_PER_HOST,
+    UPSTREAM_READ_TIMEOUT,
+    VIEWS_BATCH_SIZE,
+    VIEWS_BATCH_WINDOW,
+)
+from .exceptions import CircuitOpenError, UpstreamError
+from .index import app as flask_app, build_card, card_cache, encode_card, render_error_card
+from .metrics import (
+    finish_request,
+    mark_finished,
+    record_stages_since,
+    response_bytes,
+    start_request,
+    timed,
+    upstream_responses,
+)
+from .thumbnails import ThumbnailVariant, can_process, plan_thumbnail
+from .utils import (
+    PLACEHOLDER_THUMBNAIL,
+    encode_thumbnail,
+    format_fetched_views,
+    parse_shields_views,
+    parse_youtube_views,
+    raise_if_missing,
+    remember_if_missing,
+    shields_views_url,
+    thumbnail_cache,
+    thumbnail_cache_key,
+    thumbnail_url,
+    tries_smaller_variant,
+    upstream_calls,
+    uses_youtube_api,
+    views_cache,
+    views_to_cache,
+    youtube_views_url,
+)
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class AsyncHTTPClient:
+    """Asynchronous HTTP client which pools keep-alive connections per upstream host
+
+    The session is created on first use so that it belongs to the running event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int = UPSTREAM_MAX_CONNECTIONS_PER_HOST,
+        connect_timeout: float = UPSTREAM_CONNECT_TIMEOUT,
+        read_timeout: float = UPSTREAM_READ_TIMEOUT,
+        idle_timeout: float = UPSTREAM_IDLE_TIMEOUT,
+        user_agent: str = "GitHub Readme YouTube Cards",
+        breakers: Optional[CircuitBreakers] = None,
+    ):
+        self.max_connections_per_host = max_connections_per_host
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.idle_timeout = idle_timeout
+        self.user_agent = user_agent
+        self.breakers = breakers
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def get(self, url: str) -> tuple[bytes, str]:
+        """Send a GET request and return the response body and content type
+
+        Raises:
+            CircuitOpenError: If requests to the host are stopped by its circuit breaker
+            UpstreamError: If the request fails, times out or the response is an HTTP error
+        """
+        host = host_of(url)
+        breaker = None if self.breakers is None else self.breakers.get(host)
+        if breaker is not None and not breaker.allow():
+            upstream_responses.inc(host, "circuit_open")
+            raise CircuitOpenError(f"Requests to {host} are paused after repeated failures")
+        start = time.monotonic()
+        try:
+            response = await self._get(url, host)
+        except UpstreamError as e:
+            if breaker is not None:
+                failed = is_failure_status(e.status, host)
+                breaker.record(time.monotonic() - start, failed=failed)
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.record(time.monotonic() - start, failed=True)
+            raise
+        if breaker is not None:
+            breaker.record(time.monotonic() - start, failed=False)
+        return response
+
+    async def _get(self, url: str, host: str) -> tuple[bytes, str]:
+        try:
+            async with self._get_session().get(url) as response:
+                upstream_responses.inc(host, str(response.status))
+                if response.status >= 400:
+                    raise UpstreamError(
+                        f"HTTP Error {response.status}: {response.reason}", status=response.status
+                    )
+                return await response.read(), response.headers.get("Content-Type", "")
+        except asyncio.TimeoutError as e:
+            upstream_responses.inc(host, "timeout")
+            raise UpstreamError(f"Timed out requesting {host}", status=504) from e
+        except aiohttp.ClientError as e:
+            upstream_responses.inc(host, "error")
+            raise UpstreamError(f"Failed to request {host}: {e}") from e
+
+    async def close(self) -> None:
+        """Close the session and its connections"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=0,
+                    limit_per_host=self.max_connections_per_host,
+                    keepalive_timeout=self.idle_timeout,
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.connect_timeout, sock_read=self.read_timeout
+                ),
+                headers={"User-Agent": self.user_agent},
+            )
+        return self._session
+
+
+# client used for all requests to upstream servers from the event loop
+http_client = AsyncHTTPClient(breakers=upstream_breakers)
+
+
+async def fetch_thumbnail(video_id: str, card_width: int = 250) -> str:
+    """Return the base-64 data URI of a video thumbnail sized for a card width,
+    downloading it only if it is not cached
+
+    Concurrent requests for the same thumbnail share a single download.
+
+    Raises:
+        UpstreamError: If the request fails
+    """
+    plan = plan_thumbnail(card_width)
+    key = thumbnail_cache_key(video_id, plan)
+    cached = await call_cache(thumbnail_cache, thumbnail_cache.get, key)
+    if cached is not None:
+        return cached.decode("ascii")
+    thumbnail = await upstream_calls.do_async(
+        ("thumbnail", key), lambda: download_thumbnail(video_id, plan)
+    )
+    await call_cache(thumbnail_cache, thumbnail_cache.set, key, thumbnail.encode("ascii"))
+    return thumbnail
+
+
+async def download_thumbnail(video_id: str, plan: list[tuple[ThumbnailVariant, int]]) -> str:
+    """Download and encode the first thumbnail in the plan which exists for the video
+
+    If the preferred thumbnail size does not exist for the video, a smaller one is used.
+
+    Raises:
+        UpstreamError: If the request fails
+    """
+    for variant, width in plan:
+        try:
+            data, mime_type = await http_client.get(thumbnail_url(video_id, variant))
+        except UpstreamError as e:
+            if tries_smaller_variant(e, variant, plan):
+                continue
+            remember_if_missing(video_id, e)
+            raise
+        # images are decoded and encoded off the event loop
+        encode = asyncio.to_thread if can_process() else run_inline
+        return await encode(encode_thumbnail, video_id, data, mime_type, variant, width)
+    raise AssertionError("unreachable")
+
+
+async def run_inline(func: Callable[..., Any], *args: Any) -> Any:
+    """Call a function on the event loop, with the same signature as asyncio.to_thread"""
+    return func(*args)
+
+
+async def fetch_views_value(video_id: str) -> str:
+    """Get the unformatted number of views for a YouTube video from the configured provider
+
+    With the "youtube" provider, view counts are fetched from the YouTube Data API in
+    batches with those of other videos requested at the same time, falling back to
+    shields.io if the API fails.
+
+    Raises:
+        UpstreamError: If the request fails
+    """
+    if uses_youtube_api():
+        try:
+            return await views_batcher.get(video_id)
+        except UpstreamError:
+            pass
+    return await fetch_shields_views_value(video_id)
+
+
+async def fetch_shields_views_value(video_id: str) -> str:
+    """Get the unformatted number of views for a YouTube video from shields.io (ex. "1.2M")
+
+    Raises:
+        UpstreamError: If the request fails
+    """
+    data, _ = await http_client.get(shields_views_url(video_id))
+    return parse_shields_views(data)
+
+
+async def fetch_youtube_views_batch(video_ids: list[str]) -> dict[str, str]:
+    """Get the number of views of up to 50 videos from the YouTube Data API (ex. "1234567")
+
+    Raises:
+        UpstreamError: If the request fails
+    """
+    data, _ = await http_client.get(youtube_views_url(video_ids))
+    return parse_youtube_views(data)
+
+
+# view counts requested at the same time, fetched from the YouTube Data API together
+views_batcher: AsyncMicroBatcher[str] = AsyncMicroBatcher(
+    fetch_youtube_views_batch, window=VIEWS_BATCH_WINDOW, max_size=VIEWS_BATCH_SIZE
+)
+
+
+async def fetch_views(
+    video_id: str, lang: str = "en", *, fetched: Optional[list[str]] = None
+) -> Optional[str]:
+    """Get number of views for a YouTube video as a formatted metric, an empty string if the
+    video has no view count, or None if it could not be fetched
+
+    Cached view counts are returned immediately, and refreshed in the background once stale.
+    Concurrent requests for the same video share a single request to shields.io. If a list
+    is given, a view count which had to be fetched is added to it instead of being cached,
+    so it can be cached once the video is known to exist.
+    """
+
+    async def load() -> str:
+        value = await upstream_calls.do_async(
+            ("views", video_id), lambda: fetch_views_value(video_id)
+        )
+        if fetched is not None:
+            fetched.append(value)
+        return value
+
+    try:
+        value = await views_cache.get_async(video_id, load, store=fetched is None)
+    except Exception:
+        return None
+    return format_fetched_views(value, lang)
+
+
+async def fetch_thumbnail_and_views(
+    video_id: str, card_width: int, lang: str, *, timeout: float
+) -> tuple[str, Optional[str]]:
+    """Fetch the thumbnail data URI and formatted view count of a video concurrently
+
+    Both requests share a single deadline. If the view count fails or is not ready in time,
+    it is None so the card can still be rendered without it. While the thumbnail server is
+    failing, PLACEHOLDER_THUMBNAIL is returned right away unless the thumbnail is cached.
+    Videos recently found missing fail without any requests, and view counts are only
+    cached once the thumbnail was found, so requests for random IDs don't fill the cache.
+
+    Raises:
+        UpstreamError: If the thumbnail request fails or is not fetched before the deadline
+    """
+    raise_if_missing(video_id)
+    start = time.perf_counter()
+    finished: dict[str, float] = {}
+    fetched_views: list[str] = []
+    thumbnail_task = asyncio.ensure_future(fetch_thumbnail(video_id, card_width))
+    thumbnail_task.add_done_callback(mark_finished(finished, "thumbnail"))
+    views_task = asyncio.ensure_future(fetch_views(video_id, lang, fetched=fetched_views))
+    views_task.add_done_callback(mark_finished(finished, "views"))
+    await asyncio.wait((thumbnail_task, views_task), timeout=timeout)
+    record_stages_since(start, finished, ("thumbnail", "views"))
+    if not views_task.done():
+        views_task.cancel()
+    if not thumbnail_task.done():
+        thumbnail_task.cancel()
+        raise UpstreamError("Timed out fetching the video thumbnail", status=504)
+    views = views_task.result() if not views_task.cancelled() else None
+    try:
+        thumbnail = thumbnail_task.result()
+    except CircuitOpenError:
+        return PLACEHOLDER_THUMBNAIL, views
+    value = views_to_cache(views, fetched_views)
+    if value is not None:
+        await views_cache.set_async(video_id, value)
+    return thumbnail, views
+
+
+async def render_card_response(scope: Scope) -> tuple[int, dict[str, str], bytes]:
+    """Render the response to a request for a card
+
+    Returns the status code, headers and body of the response.
+    """
+    environ = {
+        "QUERY_STRING": scope["query_string"].decode("latin-1"),
+        "REQUEST_METHOD": "GET",
+        **wsgi_headers(scope),
+    }
+    start_request()
+    with flask_app.app_context():
+        try:
+            reply = await serve_card(Request(environ))
+        except Exception as e:
+            status = error_status(e)
+            reply = error_reply(status, render_error_card(status, str(e)))
+    headers = dict(reply.headers)
+    timings = finish_request()
+    if timings is not None:
+        headers["Server-Timing"] = timings.server_timing()
+    assert isinstance(reply.body, bytes)
+    response_bytes.observe(str(reply.status), len(reply.body))
+    return reply.status, headers, reply.body
+
+
+async def serve_card(req: Request) -> CardReply:
+    """Get the reply to a request for a card, which is only rendered if it is not cached and
+    the request doesn't have it already
+
+    Raises:
+        ValidationError: If the query parameters are invalid
+        UpstreamError: If the thumbnail cannot be fetched
+    """
+    with timed("validate"):
+        params = parse_card_params(req)
+    # formatted once, so the cache key and ETag of the card follow the text it shows
+    published = published_text(params)
+    with timed("cache"):
+        key = card_cache_key(params, published)
+        cached = await call_cache(card_cache, card_cache.get, key)
+        card = None if cached is None else unpack_card(cached)
+    encoding = negotiate_encoding(req.accept_encodings)
+    cacheable = True
+    if card is None:
+        thumbnail, views = await fetch_thumbnail_and_views(
+            params.video_id, params.width, params.lang, timeout=UPSTREAM_DEADLINE
+        )
+        cacheable = is_complete(thumbnail, views)
+        # a view count which could not be fetched is left out of the card
+        views = views or ""
+        etag = card_etag(key, thumbnail, views, published)
+        revalidated = revalidated_reply(req.environ, etag, encoding)
+        if revalidated is not None:
+            return revalidated
+        body = build_card(params, thumbnail, views, published).encode("utf-8")
+        card = rendered_card(body, etag)
+        if cacheable:
+            await call_cache(card_cache, card_cache.set, key, pack_card(card))
+    card = await call_cache(card_cache, encode_card, card, encoding, key if cacheable else None)
+    return card_reply(req.environ, card, encoding)
+
+
+def wsgi_headers(scope: Scope) -> dict[str, str]:
+    """Get the headers of a request as WSGI environ variables"""
+    environ = {}
+    for name, value in scope.get("headers", []):
+        key = name.decode("latin-1").upper().replace("-", "_")
+        if key not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            key = f"HTTP_{key}"
+        environ[key] = value.decode("latin-1")
+    return environ
+
+
+def call_flask_app(scope: Scope) -> tuple[int, dict[str, str], bytes]:
+    """Serve a request without a request body through the Flask app
+
+    Used for everything other than cards, such as the demo page and its static files.
+    """
+    server_name, server_port = scope.get("server") or ("localhost", 80)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", ""),
+        "PATH_INFO": scope["path"],
+        "QUERY_STRING": scope["query_string"].decode("latin-1"),
+        "SERVER_NAME": server_name,
+        "SERVER_PORT": str(server_port),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+        **wsgi_headers(scope),
+    }
+    response: dict[str, Any] = {}
+
+    def start_response(status: str, headers: list[tuple[str, str]], exc_info=None):
+        response["status"] = int(status.split(" ", 1)[0])
+        response["headers"] = dict(headers)
+
+    chunks = flask_app(environ, start_response)
+    try:
+        body = b"".join(chunks)
+    finally:
+        if hasattr(chunks, "close"):
+            chunks.close()  # type: ignore
+    return response["status"], response["headers"], body
+
+
+async def app(scope: Scope, receive: Receive, send: Send) -> None:
+    """ASGI entry point serving cards asynchronously and other requests through the Flask app"""
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await http_client.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    if scope["type"] != "http":
+        return
+    is_card = scope["path"] == "/" and scope["method"] in ("GET", "HEAD")
+    if is_card and "id" in parse_qs(scope["query_string"].decode("latin-1")):
+        status, headers, body = await render_card_response(scope)
+    else:
+        status, headers, body = await asyncio.to_thread(call_flask_app, scope)
+    if status != 304:
+        headers["Content-Length"] = str(len(body))
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in headers.items()
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
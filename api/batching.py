@@ -0,0 +1,189 @@
+"""Micro-batching of lookups which an upstream API can answer for many keys in one call
+
+Keys requested within a short window of each other are collected into a batch, which
+is loaded with a single call once the window has passed or the batch is full. Every
+caller waits for the batch its key is in and gets the value of its own key.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+from .exceptions import UpstreamError
+
+T = TypeVar("T")
+
+
+class MissingFromBatchError(UpstreamError):
+    """Exception raised when a batch was loaded without a value for a key."""
+
+    def __init__(self, key: str):
+        super().__init__(f"No result for {key}", status=404)
+
+
+class BatchStats:
+    """Counters of the batches of a batcher"""
+
+    def __init__(self):
+        self.batches = 0
+        self.keys = 0
+        self.largest = 0
+
+    def count(self, size: int) -> None:
+        self.batches += 1
+        self.keys += size
+        self.largest = max(self.largest, size)
+
+    def as_dict(self) -> dict[str, int]:
+        return {"batches": self.batches, "keys": self.keys, "largest_batch": self.largest}
+
+
+class MicroBatcher(Generic[T]):
+    """Thread-safe collector of keys into batches loaded with a single call
+
+    The first caller of a batch waits for the window to pass and then loads the batch
+    in its own thread, unless the batch fills up first, in which case the caller who
+    filled it loads it right away. No other threads are used.
+    """
+
+    def __init__(
+        self,
+        load_batch: Callable[[list[str]], dict[str, T]],
+        *,
+        window: float,
+        max_size: int,
+    ):
+        self.load_batch = load_batch
+        self.window = window
+        self.max_size = max_size
+        self._batch: Optional[dict[str, Future]] = None
+        self._condition = threading.Condition()
+        self._stats = BatchStats()
+
+    def get(self, key: str) -> T:
+        """Get the value of a key, loaded in a batch with the keys requested around the same time
+
+        Raises:
+            MissingFromBatchError: If the batch was loaded without a value for the key
+            Exception: Any exception raised while loading the batch
+        """
+        with self._condition:
+            batch = self._batch
+            is_first = batch is None
+            if batch is None:
+                batch = self._batch = {}
+            future = batch.get(key)
+            if future is None:
+                future = batch[key] = Future()
+            is_full = len(batch) >= self.max_size
+            if is_full:
+                # close the batch so later keys start a new one
+                self._batch = None
+                self._condition.notify_all()
+            elif is_first:
+                self._condition.wait_for(lambda: self._batch is not batch, timeout=self.window)
+                # the batch is loaded by whoever closes it
+                is_full = self._batch is batch
+                if is_full:
+                    self._batch = None
+        if is_full:
+            self._load(batch)
+        return future.result()
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of batches and keys loaded and the size of the largest batch"""
+        with self._condition:
+            return self._stats.as_dict()
+
+    def _load(self, batch: dict[str, Future]) -> None:
+        with self._condition:
+            self._stats.count(len(batch))
+        try:
+            values = self.load_batch(list(batch))
+        except BaseException as e:
+            for future in batch.values():
+                future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        for key, future in batch.items():
+            if key in values:
+                future.set_result(values[key])
+            else:
+                future.set_exception(MissingFromBatchError(key))
+
+
+class AsyncMicroBatcher(Generic[T]):
+    """Collector of keys into batches loaded with a single call on the running event loop"""
+
+    def __init__(
+        self,
+        load_batch: Callable[[list[str]], Awaitable[dict[str, T]]],
+        *,
+        window: float,
+        max_size: int,
+    ):
+        self.load_batch = load_batch
+        self.window = window
+        self.max_size = max_size
+        self._batch: Optional[dict[str, asyncio.Future]] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # batches being loaded, referenced until they are done
+        self._loading: set[asyncio.Task] = set()
+        self._stats = BatchStats()
+
+    async def get(self, key: str) -> T:
+        """Get the value of a key, loaded in a batch with the keys requested around the same time
+
+        Raises:
+            MissingFromBatchError: If the batch was loaded without a value for the key
+            Exception: Any exception raised while loading the batch
+        """
+        loop = asyncio.get_running_loop()
+        # a batch left open by an event loop which was closed is never loaded
+        if self._batch is None or self._loop is not loop:
+            self._batch = {}
+            self._loop = loop
+            self._timer = loop.call_later(self.window, self._close)
+        future = self._batch.get(key)
+        if future is None:
+            future = self._batch[key] = loop.create_future()
+        if len(self._batch) >= self.max_size:
+            self._close()
+        # callers may be cancelled without cancelling the batch
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of batches and keys loaded and the size of the largest batch"""
+        return self._stats.as_dict()
+
+    def _close(self) -> None:
+        batch, self._batch = self._batch, None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if batch:
+            self._stats.count(len(batch))
+            task = asyncio.ensure_future(self._load(batch))
+            self._loading.add(task)
+            task.add_done_callback(self._loading.discard)
+
+    async def _load(self, batch: dict[str, asyncio.Future]) -> None:
+        try:
+            values = await self.load_batch(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+        except BaseException:
+            # callers waiting on the batch are cancelled with it, such as at shutdown
+            for future in batch.values():
+                future.cancel()
+            raise
+        for key, future in batch.items():
+            if key in values:
+                future.set_result(values[key])
+            else:
+                future.set_exception(MissingFromBatchError(key))
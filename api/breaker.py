@@ -0,0 +1,159 @@
+"""Circuit breakers which stop requests to upstream hosts that keep failing or are too slow
+
+A breaker opens after a number of consecutive failed requests to its host, where
+responses slower than a threshold count as failures too. While it is open, requests
+to the host fail right away with ``CircuitOpenError`` instead of waiting on it, so
+cards can be served degraded. Once the reset timeout has passed, a single trial
+request is let through: the breaker closes if it succeeds and opens again if not.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+from .config import (
+    UPSTREAM_BREAKER_FAILURES,
+    UPSTREAM_BREAKER_RESET_TIMEOUT,
+    UPSTREAM_BREAKER_SLOW_THRESHOLD,
+    YOUTUBE_API_BASE_URL,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def host_of(url: str) -> str:
+    """Get the host name of a URL including the port if there is one"""
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    return host if parts.port is None else f"{host}:{parts.port}"
+
+
+# hosts which respond with 403 once their daily quota is exceeded, until it resets
+QUOTA_HOSTS = {host_of(YOUTUBE_API_BASE_URL)}
+
+
+def is_failure_status(status: int, host: str = "") -> bool:
+    """Whether a response status means the upstream host is failing, rather than the request
+
+    A 403 from a host with a quota means the quota is exceeded, so every request fails
+    until it resets.
+    """
+    return status >= 500 or status == 429 or (status == 403 and host in QUOTA_HOSTS)
+
+
+class CircuitBreaker:
+    """Circuit breaker for a single upstream host
+
+    Every request let through by ``allow()`` must be followed by a call to ``record()``.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int,
+        slow_threshold: float,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.slow_threshold = slow_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent to the host"""
+        if self.failure_threshold <= 0:
+            return True
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                # let a single trial request through
+                self.state = HALF_OPEN
+                return True
+            self.rejected += 1
+            return False
+
+    def record(self, elapsed: float, *, failed: bool) -> None:
+        """Record the outcome of a request that took elapsed seconds"""
+        failed = failed or elapsed >= self.slow_threshold
+        with self._lock:
+            if not failed:
+                self.state = CLOSED
+                self.consecutive_failures = 0
+                return
+            self.failures += 1
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.opened += 1
+                self.state = OPEN
+                self._opened_at = self._clock()
+
+    def stats(self) -> dict[str, object]:
+        """Return the state of the breaker along with its failure and rejection counters"""
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "failures": self.failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
+
+
+class CircuitBreakers:
+    """Circuit breakers of the upstream hosts, created on first use"""
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = UPSTREAM_BREAKER_FAILURES,
+        slow_threshold: float = UPSTREAM_BREAKER_SLOW_THRESHOLD,
+        reset_timeout: float = UPSTREAM_BREAKER_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.slow_threshold = slow_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> CircuitBreaker:
+        """Get the breaker of a host"""
+        with self._lock:
+            breaker: Optional[CircuitBreaker] = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(
+                    failure_threshold=self.failure_threshold,
+                    slow_threshold=self.slow_threshold,
+                    reset_timeout=self.reset_timeout,
+                    clock=self._clock,
+                )
+            return breaker
+
+    def clear(self) -> None:
+        """Forget all breakers, closing them"""
+        with self._lock:
+            self._breakers.clear()
+
+    def stats(self) -> dict[str, dict[str, object]]:
+        """Return the state and counters of the breaker of each host"""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {host: breaker.stats() for host, breaker in breakers.items()}
+
+
+# breakers of the upstream hosts, shared by the synchronous and asynchronous clients
+upstream_breakers = CircuitBreakers()
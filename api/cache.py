@@ -0,0 +1,367 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future
+from typing import Any, Awaitable, Callable, Hashable, NamedTuple, Optional, Protocol, TypeVar
+
+import orjson
+
+T = TypeVar("T")
+
+
+class CacheBackend(Protocol):
+    """Store of byte strings by string key, with expiry and a size limit
+
+    ``LRUCache`` keeps entries in the memory of a process, while the backends in
+    ``api.cache_backends`` share them between processes.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value for a key, or None if it is missing or expired"""
+
+    def set(self, key: str, value: bytes, *, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting other entries as needed to stay within the size limit"""
+
+    def delete(self, key: str) -> None:
+        """Remove a key from the cache if present"""
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters"""
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit and miss counters along with the usage of the cache"""
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    size: int
+    expires: float
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache bounded by the total size of its values.
+
+    Each entry expires after a time-to-live. When adding an entry would exceed the
+    size limit, the least recently used entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        ttl: float,
+        size_of: Callable[[Any], int] = len,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._size_of = size_of
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for a key, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires <= self._clock():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: Hashable, value: Any, *, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting least recently used entries to stay within the size limit.
+        Values larger than the whole cache are not stored.
+        """
+        size = self._size_of(value)
+        if size > self.max_bytes:
+            return
+        expires = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            while self._entries and self.current_bytes + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            self._entries[key] = CacheEntry(value, size, expires)
+            self.current_bytes += size
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key from the cache if present"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit, miss and eviction counters along with the current usage"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self.current_bytes -= entry.size
+
+
+async def call_cache(backend: Any, func: Callable[..., T], *args: Any) -> T:
+    """Call a function using a cache backend from an event loop, in a thread unless the
+    backend keeps its entries in memory, since the other backends block on disk or network I/O
+    """
+    if isinstance(backend, LRUCache):
+        return func(*args)
+    return await asyncio.to_thread(func, *args)
+
+
+class StaleWhileRevalidateCache:
+    """Cache that serves stale values immediately while refreshing them in the background.
+
+    A value is fresh for ``ttl`` seconds after it is loaded. For ``stale_ttl`` seconds
+    after that, it is still returned right away, but a background refresh is started.
+    Once both windows have passed, the value is loaded again before returning.
+
+    Values must be serializable to JSON, since they are stored along with their load time
+    in a cache backend, which is an in-process ``LRUCache`` unless one is given. The load
+    time is read from the clock, so backends shared between hosts need a wall clock.
+
+    Background refreshes run on the given executor, or on a new thread if there is none.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        ttl: float,
+        stale_ttl: float,
+        size_of: Callable[[bytes], int] = len,
+        clock: Callable[[], float] = time.monotonic,
+        executor: Optional[Executor] = None,
+        backend: Optional[CacheBackend] = None,
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._executor = executor
+        # entries are serialized [value, loaded_at] pairs which are removed once they are
+        # too stale to serve
+        if backend is None:
+            backend = LRUCache(
+                max_bytes=max_bytes, ttl=ttl + stale_ttl, size_of=size_of, clock=clock
+            )
+        self._cache: CacheBackend = backend
+        self._refreshing: set[str] = set()
+        # references to background refresh tasks so they are not garbage collected while running
+        self._tasks: set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+        self.stale_hits = 0
+        self.refresh_errors = 0
+
+    def get(self, key: str, load: Callable[[], Any], *, store: bool = True) -> Any:
+        """Return the value for a key, calling load() to fetch it if it is missing or expired
+
+        A value fetched by load() is only stored if store is true, otherwise the caller may
+        store it later with set(). Background refreshes of stale values are always stored.
+
+        Raises:
+            Exception: Any exception raised by load() when there is no value to serve
+        """
+        entry = self._get_entry(key)
+        if entry is None:
+            return self._load(key, load) if store else load()
+        value, loaded_at = entry
+        if self._clock() - loaded_at >= self.ttl and self._claim_refresh(key):
+            if self._executor is not None:
+                self._executor.submit(self._refresh, key, load)
+            else:
+                threading.Thread(target=self._refresh, args=(key, load), daemon=True).start()
+        return value
+
+    async def get_async(
+        self, key: str, load: Callable[[], Awaitable[Any]], *, store: bool = True
+    ) -> Any:
+        """Return the value for a key, awaiting load() to fetch it if it is missing or expired
+
+        Stale values are refreshed in a background task on the running event loop. Backends
+        which don't keep entries in memory are called in a thread.
+
+        Raises:
+            Exception: Any exception raised by load() when there is no value to serve
+        """
+        entry = await call_cache(self._cache, self._get_entry, key)
+        if entry is None:
+            value = await load()
+            if store:
+                await self.set_async(key, value)
+            return value
+        value, loaded_at = entry
+        if self._clock() - loaded_at >= self.ttl and self._claim_refresh(key):
+            task = asyncio.create_task(self._refresh_async(key, load))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value loaded now"""
+        self._set_entry(key, value)
+
+    async def set_async(self, key: str, value: Any) -> None:
+        """Store a value loaded now, calling backends which don't keep entries in memory in
+        a thread
+        """
+        await call_cache(self._cache, self._set_entry, key, value)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters"""
+        self._cache.clear()
+        with self._lock:
+            self.stale_hits = self.refresh_errors = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return the counters of the underlying cache along with the stale hits"""
+        with self._lock:
+            return self._cache.stats() | {
+                "stale_hits": self.stale_hits,
+                "refresh_errors": self.refresh_errors,
+            }
+
+    def _get_entry(self, key: str) -> Optional[tuple[Any, float]]:
+        data = self._cache.get(key)
+        if data is None:
+            return None
+        value, loaded_at = orjson.loads(data)
+        return value, loaded_at
+
+    def _set_entry(self, key: str, value: Any) -> None:
+        self._cache.set(key, orjson.dumps([value, self._clock()]))
+
+    def _load(self, key: str, load: Callable[[], Any]) -> Any:
+        value = load()
+        self._set_entry(key, value)
+        return value
+
+    def _claim_refresh(self, key: str) -> bool:
+        """Count a stale hit and return whether the caller should start refreshing the key"""
+        with self._lock:
+            self.stale_hits += 1
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _refresh(self, key: str, load: Callable[[], Any]) -> None:
+        try:
+            self._load(key, load)
+        except Exception:
+            # keep serving the stale value until it expires or a later refresh succeeds
+            with self._lock:
+                self.refresh_errors += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    async def _refresh_async(self, key: str, load: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            value = await load()
+            await call_cache(self._cache, self._set_entry, key, value)
+        except Exception:
+            with self._lock:
+                self.refresh_errors += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into a single call.
+
+    While a call for a key is in flight, later calls for that key wait for it and
+    share its result or exception instead of calling again. Once it completes, the
+    next call for the key starts a new one.
+
+    Threads and tasks on an event loop are coalesced separately.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, Future] = {}
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        """Return the result of call(), or of the call already in flight for the key
+
+        Raises:
+            Exception: Any exception raised by the call, in every caller sharing it
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.shared += 1
+                leader = False
+            else:
+                future = self._calls[key] = Future()
+                self.calls += 1
+                leader = True
+        if leader:
+            try:
+                future.set_result(call())
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    del self._calls[key]
+        return future.result()
+
+    async def do_async(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the result of awaiting call(), or of the call already in flight for the key
+
+        The call runs in its own task, so it is not cancelled when a caller waiting for it is.
+
+        Raises:
+            Exception: Any exception raised by the call, in every caller sharing it
+        """
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is not None:
+                self.shared += 1
+            else:
+                task = self._tasks[key] = asyncio.ensure_future(call())
+                self.calls += 1
+                task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of calls made and of callers that shared an in-flight call"""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "shared": self.shared,
+                "in_flight": len(self._calls) + len(self._tasks),
+            }
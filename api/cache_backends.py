@@ -0,0 +1,673 @@
+"""Cache backends shared by the worker processes of a server
+
+``SQLiteCache`` keeps entries in a SQLite database on disk, shared by the processes
+of a node, and ``RedisCache`` keeps them on a Redis server, shared by every node.
+Both store byte strings by string key like the in-process ``LRUCache``, and the
+backend used for thumbnails, view counts and cards is chosen with ``CACHE_BACKEND``.
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar, Union
+from urllib.parse import unquote, urlsplit
+
+from .cache import CacheBackend, LRUCache
+from .config import CACHE_BACKEND, CACHE_REDIS_URL, CACHE_SQLITE_PATH
+from .directories import private_directory, user_temp_directory
+
+T = TypeVar("T")
+
+# prefix of the keys of every entry on a Redis server, which may be shared with other apps
+REDIS_KEY_PREFIX = "youtube-cards"
+
+
+def create_cache(
+    namespace: str,
+    *,
+    max_bytes: int,
+    ttl: float,
+    size_of: Callable[[bytes], int] = len,
+    backend: str = CACHE_BACKEND,
+) -> CacheBackend:
+    """Create the cache of a kind of entries with the configured backend
+
+    Caches with different namespaces don't share entries, and each has its own size limit.
+    """
+    if backend == "sqlite":
+        path = CACHE_SQLITE_PATH or default_sqlite_path()
+        return SQLiteCache(path, namespace=namespace, max_bytes=max_bytes, ttl=ttl, size_of=size_of)
+    if backend == "redis":
+        return RedisCache(
+            CACHE_REDIS_URL, namespace=namespace, max_bytes=max_bytes, ttl=ttl, size_of=size_of
+        )
+    return LRUCache(max_bytes=max_bytes, ttl=ttl, size_of=size_of)
+
+
+def default_sqlite_path() -> str:
+    """Get the path of the database of the sqlite backend in a directory private to the
+    current user, since entries planted by other users would be served as cards
+
+    Raises:
+        OSError: If the directory is not private to the current user
+    """
+    return os.path.join(private_directory(user_temp_directory("youtube-cards")), "cache.sqlite3")
+
+
+class SQLiteCache:
+    """Least-recently-used cache in a SQLite database, shared by the processes of a node
+
+    The database is written in WAL mode, so readers don't wait on writers, and reads never
+    write. Entries expire after a time-to-live, and when adding an entry would exceed the
+    size limit of its namespace, the least recently used entries are evicted first, which
+    includes expired entries since they are no longer used. The total size of each
+    namespace is kept up to date by every store, rather than summed up each time.
+
+    Entries are only marked as used again once ``touch_interval`` seconds have passed
+    since they last were, and those marks are written in a batch by the next store of the
+    process, so hits don't take the write lock.
+
+    Writers wait at most ``timeout`` seconds for another process holding the database.
+    Errors of the database, such as it being locked, are counted and treated as cache
+    misses, and stores that fail are skipped, so cards are still served.
+    """
+
+    # maximum number of hits waiting to be marked as used, after which further hits are
+    # not marked until the next store
+    MAX_PENDING_TOUCHES = 1024
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        namespace: str,
+        max_bytes: int,
+        ttl: float,
+        size_of: Callable[[bytes], int] = len,
+        touch_interval: float = 60,
+        timeout: float = 0.1,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._size_of = size_of
+        self.touch_interval = touch_interval
+        self.timeout = timeout
+        self._clock = clock
+        # connections can't be shared between threads, so each thread opens its own
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # times entries were used by hits of this process, written by its next store
+        self._touches: dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def __len__(self) -> int:
+        (count,) = (
+            self._connection()
+            .execute("SELECT COUNT(*) FROM cache_entries WHERE namespace = ?", (self.namespace,))
+            .fetchone()
+        )
+        return count
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value for a key, or None if it is missing, expired or unavailable"""
+        try:
+            now = self._clock()
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT value, expires, used FROM cache_entries"
+                    " WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error:
+            self._count("errors")
+            self._count("misses")
+            return None
+        if row is None or row[1] <= now:
+            self._count("misses")
+            return None
+        value, _, used = row
+        with self._lock:
+            self.hits += 1
+            if now - used >= self.touch_interval and (
+                len(self._touches) < self.MAX_PENDING_TOUCHES or key in self._touches
+            ):
+                self._touches[key] = now
+        return bytes(value)
+
+    def set(self, key: str, value: bytes, *, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting least recently used entries to stay within the size limit.
+        Values larger than the whole cache are not stored, and neither are values the
+        database is unavailable for.
+        """
+        size = self._size_of(value)
+        if size > self.max_bytes:
+            return
+        now = self._clock()
+        expires = now + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            touches, self._touches = self._touches, {}
+        try:
+            evicted = self._transaction(
+                lambda conn: self._store(conn, key, value, size, expires, now, touches)
+            )
+        except sqlite3.Error:
+            self._count("errors")
+            return
+        self._count("evictions", len(evicted))
+
+    def delete(self, key: str) -> None:
+        """Remove a key from the cache if present"""
+        try:
+            self._transaction(lambda conn: self._delete(conn, key))
+        except sqlite3.Error:
+            self._count("errors")
+
+    def clear(self) -> None:
+        """Remove all entries of the namespace and reset the counters"""
+
+        def clear_namespace(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+            conn.execute("DELETE FROM cache_sizes WHERE namespace = ?", (self.namespace,))
+
+        self._transaction(clear_namespace)
+        with self._lock:
+            self._touches.clear()
+            self.hits = self.misses = self.evictions = self.errors = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit, miss, eviction and error counters of this process along with the
+        current usage of the namespace, which is 0 while the database is unavailable
+        """
+        try:
+            entries, size = (
+                self._connection()
+                .execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+                    " WHERE namespace = ?",
+                    (self.namespace,),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error:
+            entries = size = 0
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "errors": self.errors,
+                "entries": entries,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+            }
+
+    def close(self) -> None:
+        """Close the connection of the current thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # autocommit, with transactions started explicitly where needed
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # values come last, so the other columns are read without reading past them
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " expires REAL NOT NULL,"
+                " used REAL NOT NULL,"
+                " value BLOB NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            # covers finding the least recently used entries
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_entries_used"
+                " ON cache_entries (namespace, used, size, key)"
+            )
+            # total size of the entries of each namespace
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_sizes ("
+                " namespace TEXT PRIMARY KEY,"
+                " size INTEGER NOT NULL)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        """Call a function with the connection of the current thread in a write transaction
+
+        The write lock is taken up front, so processes evicting at the same time don't
+        overshoot the size limit.
+        """
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = func(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        return result
+
+    def _store(
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        value: bytes,
+        size: int,
+        expires: float,
+        now: float,
+        touches: dict[str, float],
+    ) -> list[tuple[str, str]]:
+        """Store a value of a size and mark the entries used by hits, returning the entries
+        evicted
+        """
+        if touches:
+            conn.executemany(
+                "UPDATE cache_entries SET used = ? WHERE namespace = ? AND key = ? AND used < ?",
+                [(used, self.namespace, hit, used) for hit, used in touches.items()],
+            )
+        self._delete(conn, key)
+        excess = self._size(conn) + size - self.max_bytes
+        evicted = []
+        freed = 0
+        if excess > 0:
+            rows = conn.execute(
+                "SELECT key, size FROM cache_entries WHERE namespace = ? ORDER BY used",
+                (self.namespace,),
+            )
+            for old_key, old_size in rows:
+                evicted.append((self.namespace, old_key))
+                freed += old_size
+                if freed >= excess:
+                    break
+            conn.executemany("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", evicted)
+        conn.execute(
+            "INSERT INTO cache_entries (namespace, key, size, expires, used, value)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (self.namespace, key, size, expires, now, value),
+        )
+        self._add_size(conn, size - freed)
+        return evicted
+
+    def _delete(self, conn: sqlite3.Connection, key: str) -> None:
+        """Remove a key in a transaction, if present"""
+        row = conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key = ? RETURNING size",
+            (self.namespace, key),
+        ).fetchone()
+        if row is not None:
+            self._add_size(conn, -row[0])
+
+    def _size(self, conn: sqlite3.Connection) -> int:
+        """Get the total size of the entries of the namespace in a transaction
+
+        The total is only summed up from the entries when it was never stored, such as in
+        databases written by earlier versions.
+        """
+        row = conn.execute(
+            "SELECT size FROM cache_sizes WHERE namespace = ?", (self.namespace,)
+        ).fetchone()
+        if row is not None:
+            return row[0]
+        (size,) = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?",
+            (self.namespace,),
+        ).fetchone()
+        conn.execute(
+            "INSERT INTO cache_sizes (namespace, size) VALUES (?, ?)", (self.namespace, size)
+        )
+        return size
+
+    def _add_size(self, conn: sqlite3.Connection, change: int) -> None:
+        """Change the stored total size of the namespace in a transaction, if it is stored"""
+        conn.execute(
+            "UPDATE cache_sizes SET size = size + ? WHERE namespace = ?", (change, self.namespace)
+        )
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+
+class RedisError(Exception):
+    """Exception raised when a Redis server replies with an error."""
+
+
+RedisReply = Union[bytes, int, list, None]
+
+
+class RedisConnection:
+    """Connection to a Redis server speaking the RESP2 protocol"""
+
+    def __init__(self, url: str, *, timeout: float):
+        parts = urlsplit(url)
+        self._sock = socket.create_connection(
+            (parts.hostname or "localhost", parts.port or 6379), timeout=timeout
+        )
+        self._reader = self._sock.makefile("rb")
+        if parts.password is not None:
+            auth = [unquote(parts.password)]
+            if parts.username:
+                auth.insert(0, unquote(parts.username))
+            self.command("AUTH", *auth)
+        db = parts.path.lstrip("/")
+        if db and db != "0":
+            self.command("SELECT", db)
+
+    def command(self, *args: Union[str, bytes, int, float]) -> RedisReply:
+        """Send a command and return its reply
+
+        Raises:
+            RedisError: If the server replies with an error
+            OSError: If the connection fails or times out
+        """
+        return self.pipeline(args)[0]
+
+    def pipeline(self, *commands: tuple[Union[str, bytes, int, float], ...]) -> list[RedisReply]:
+        """Send commands at once and return their replies, in a single round trip
+
+        Raises:
+            RedisError: If the server replies to any of them with an error, once every
+                reply is read
+            OSError: If the connection fails or times out
+        """
+        request = []
+        for args in commands:
+            encoded = [arg if isinstance(arg, bytes) else str(arg).encode() for arg in args]
+            request.append(b"*%d\r\n" % len(encoded))
+            for arg in encoded:
+                request.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        self._sock.sendall(b"".join(request))
+        replies: list[RedisReply] = []
+        error = None
+        for _ in commands:
+            try:
+                replies.append(self._read_reply())
+            except RedisError as e:
+                error = error or e
+        if error is not None:
+            raise error
+        return replies
+
+    def close(self) -> None:
+        self._reader.close()
+        self._sock.close()
+
+    def _read_reply(self) -> RedisReply:
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection to the Redis server was closed")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest
+        if kind == b"-":
+            raise RedisError(rest.decode(errors="replace"))
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            length = int(rest)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError("Connection to the Redis server was closed")
+            return data[:-2]
+        if kind == b"*":
+            length = int(rest)
+            return None if length < 0 else [self._read_reply() for _ in range(length)]
+        raise RedisError(f"Unexpected reply from the Redis server: {line!r}")
+
+
+class RedisCache:
+    """Least-recently-used cache on a Redis server, shared by every process and node using
+    the server
+
+    Entries expire after a time-to-live set on the server. The size of each entry and the
+    time it was last used are kept in a hash and a sorted set of its namespace, along with
+    the total size of the namespace, so when adding an entry exceeds the size limit of its
+    namespace, the least recently used entries are evicted first, which includes expired
+    entries since they are no longer used. Processes storing at the same time may overshoot
+    the limit until their next store.
+
+    Hits are marked as used along with the next store of the process, so they take a
+    single round trip.
+
+    Errors talking to the server are counted and treated as cache misses, so cards are
+    still served while the server is unavailable. After failing to connect, no connection
+    is attempted for ``retry_interval`` seconds, so requests don't each wait on the
+    connection timeout while the server is down.
+    """
+
+    # maximum number of hits waiting to be marked as used, after which further hits are
+    # not marked until the next store
+    MAX_PENDING_TOUCHES = 1024
+    # number of least recently used entries fetched at a time while evicting
+    EVICTION_BATCH = 32
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        namespace: str,
+        max_bytes: int,
+        ttl: float,
+        size_of: Callable[[bytes], int] = len,
+        timeout: float = 1,
+        retry_interval: float = 5,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.url = url
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+        self._size_of = size_of
+        self._clock = clock
+        self._prefix = f"{REDIS_KEY_PREFIX}:{namespace}:"
+        # bookkeeping of the namespace, whose keys can't be taken by the key of an entry
+        self._sizes_key = f"{REDIS_KEY_PREFIX}:{namespace}#sizes"
+        self._used_key = f"{REDIS_KEY_PREFIX}:{namespace}#used"
+        self._total_key = f"{REDIS_KEY_PREFIX}:{namespace}#total"
+        # connections aren't safe to share between threads, so each thread opens its own
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # times entries were used by hits of this process, sent with its next store
+        self._touches: dict[str, float] = {}
+        # monotonic time before which no connection is attempted after one failed
+        self._retry_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value for a key, or None if it is missing, expired or unavailable"""
+        value = self._command("GET", self._prefix + key)
+        if not isinstance(value, bytes):
+            self._count("misses")
+            return None
+        with self._lock:
+            self.hits += 1
+            if len(self._touches) < self.MAX_PENDING_TOUCHES or key in self._touches:
+                self._touches[key] = self._clock()
+        return value
+
+    def set(self, key: str, value: bytes, *, ttl: Optional[float] = None) -> None:
+        """Store a value with an expiry, evicting least recently used entries to stay within
+        the size limit. Values larger than the whole cache are not stored.
+        """
+        size = self._size_of(value)
+        if size > self.max_bytes:
+            return
+        milliseconds = max(1, int((self.ttl if ttl is None else ttl) * 1000))
+        now = self._clock()
+        with self._lock:
+            touches, self._touches = self._touches, {}
+        commands: list[tuple[Union[str, bytes, int, float], ...]] = [
+            ("HGET", self._sizes_key, key),
+            ("HSET", self._sizes_key, key, size),
+            ("ZADD", self._used_key, now, key),
+            ("SET", self._prefix + key, value, "PX", milliseconds),
+        ]
+        if touches:
+            # entries evicted since their hit are not added back
+            used = [arg for hit, hit_used in touches.items() for arg in (hit_used, hit)]
+            commands.append(("ZADD", self._used_key, "XX", *used))
+        replies = self._pipeline(*commands)
+        if replies is None:
+            return
+        previous = replies[0]
+        total = self._command(
+            "INCRBY", self._total_key, size - (int(previous) if previous is not None else 0)
+        )
+        if isinstance(total, int) and total > self.max_bytes:
+            self._evict(total - self.max_bytes, keep=key)
+
+    def delete(self, key: str) -> None:
+        """Remove a key from the cache if present"""
+        self._remove([key])
+
+    def clear(self) -> None:
+        """Remove all entries of the namespace and reset the counters"""
+        cursor: Any = b"0"
+        while True:
+            reply = self._command("SCAN", cursor, "MATCH", f"{self._prefix}*", "COUNT", 500)
+            if not isinstance(reply, list):
+                break
+            cursor, keys = reply
+            if keys:
+                self._command("DEL", *keys)
+            if cursor == b"0":
+                break
+        self._command("DEL", self._sizes_key, self._used_key, self._total_key)
+        with self._lock:
+            self._touches.clear()
+            self.hits = self.misses = self.evictions = self.errors = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit, miss, eviction and error counters of this process along with the
+        current usage of the namespace, which is 0 while the server is unavailable
+        """
+        replies = self._pipeline(
+            ("HLEN", self._sizes_key), ("GET", self._total_key), count_errors=False
+        )
+        entries, size = replies if replies is not None else (0, None)
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "errors": self.errors,
+                "entries": entries if isinstance(entries, int) else 0,
+                "bytes": int(size) if size is not None else 0,
+                "max_bytes": self.max_bytes,
+            }
+
+    def close(self) -> None:
+        """Close the connection of the current thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _evict(self, excess: int, *, keep: str) -> None:
+        """Remove least recently used entries until at least a number of bytes are freed,
+        other than the entry just stored
+        """
+        freed = 0
+        while freed < excess:
+            keys = self._command("ZRANGE", self._used_key, 0, self.EVICTION_BATCH - 1)
+            if not isinstance(keys, list):
+                return
+            keys = [key.decode() for key in keys if key.decode() != keep]
+            if not keys:
+                return
+            sizes = self._command("HMGET", self._sizes_key, *keys)
+            if not isinstance(sizes, list):
+                return
+            evicted = []
+            for key, size in zip(keys, sizes):
+                evicted.append(key)
+                freed += int(size) if size is not None else 0
+                if freed >= excess:
+                    break
+            removed = self._remove(evicted)
+            if removed is None:
+                return
+            self._count("evictions", removed)
+
+    def _remove(self, keys: list[str]) -> Optional[int]:
+        """Remove entries along with their bookkeeping, returning the number removed, or None
+        if the server is unavailable
+
+        Only the sizes of entries whose bookkeeping this process removed are subtracted
+        from the total, so processes removing the same entry don't both subtract it.
+        """
+        commands: list[tuple[Union[str, bytes, int], ...]] = [
+            ("HMGET", self._sizes_key, *keys),
+            ("DEL", *(self._prefix + key for key in keys)),
+            ("ZREM", self._used_key, *keys),
+        ]
+        commands += [("HDEL", self._sizes_key, key) for key in keys]
+        replies = self._pipeline(*commands)
+        if replies is None:
+            return None
+        sizes, removed = replies[0], replies[3:]
+        freed = sum(int(size) for size, done in zip(sizes, removed) if done and size is not None)
+        if freed:
+            self._command("INCRBY", self._total_key, -freed)
+        return sum(1 for done in removed if done)
+
+    def _command(self, *args: Union[str, bytes, int, float]) -> RedisReply:
+        """Send a command on the connection of the current thread, returning None on errors"""
+        replies = self._pipeline(args)
+        return None if replies is None else replies[0]
+
+    def _pipeline(
+        self, *commands: tuple[Union[str, bytes, int, float], ...], count_errors: bool = True
+    ) -> Optional[list]:
+        """Send commands at once on the connection of the current thread and return their
+        replies, or None on errors, which are counted unless count_errors is False
+        """
+        conn = getattr(self._local, "conn", None)
+        try:
+            if conn is None:
+                if time.monotonic() < self._retry_at:
+                    raise ConnectionError("Connecting to the Redis server failed recently")
+                try:
+                    conn = self._local.conn = RedisConnection(self.url, timeout=self.timeout)
+                except OSError:
+                    self._retry_at = time.monotonic() + self.retry_interval
+                    raise
+            return conn.pipeline(*commands)
+        except (OSError, RedisError, ValueError):
+            # the connection may be in an unknown state, so open a new one next time
+            self.close()
+            if count_errors:
+                self._count("errors")
+            return None
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
@@ -0,0 +1,242 @@
+"""Answering card requests, shared by the Flask app and the ASGI app
+
+Both apps validate the same parameters, cache cards under the same keys, revalidate them
+with the same validators and reply with the same headers, so they only differ in how they
+wait on upstream servers and caches.
+"""
+
+import hashlib
+import os
+import time
+from datetime import datetime, timezone
+from functools import cache
+from glob import glob
+from time import gmtime, strftime
+from typing import Any, Iterator, NamedTuple, Optional, Union
+
+from flask.wrappers import Request
+from werkzeug.http import is_resource_modified
+
+from .config import CACHE_MAX_AGE, CACHE_S_MAXAGE, CACHE_STALE_WHILE_REVALIDATE, CARD_RENDERER
+from .utils import PLACEHOLDER_THUMBNAIL, format_relative_time
+from .validate import (
+    validate_color,
+    validate_int,
+    validate_lang,
+    validate_string,
+    validate_video_id,
+)
+
+# content type of cards and error cards
+CARD_CONTENT_TYPE = "image/svg+xml; charset=utf-8"
+
+# modules and templates cards are rendered with, whose changes change the ETags of cards
+CARD_SOURCES = [
+    os.path.join(os.path.dirname(__file__), "*.py"),
+    os.path.join(os.path.dirname(__file__), "templates", "*.svg"),
+]
+
+
+class CardParams(NamedTuple):
+    video_id: str
+    width: int
+    border_radius: int
+    background_color: str
+    title_color: str
+    stats_color: str
+    title: str
+    max_title_lines: int
+    publish_timestamp: int
+    duration_seconds: int
+    lang: str
+
+
+def parse_card_params(req: Request) -> CardParams:
+    """Validate the query parameters of a card request
+
+    Raises:
+        ValidationError: If the video ID is missing or invalid
+    """
+    return CardParams(
+        video_id=validate_video_id(req, "id"),
+        width=validate_int(req, "width", default=250),
+        border_radius=validate_int(req, "border_radius", default=5),
+        background_color=validate_color(req, "background_color", default="#0d1117"),
+        title_color=validate_color(req, "title_color", default="#ffffff"),
+        stats_color=validate_color(req, "stats_color", default="#dedede"),
+        title=validate_string(req, "title", default=""),
+        max_title_lines=validate_int(req, "max_title_lines", default=1),
+        publish_timestamp=validate_int(req, "timestamp", default=0),
+        duration_seconds=validate_int(req, "duration", default=0),
+        lang=validate_lang(req, "lang", default="en"),
+    )
+
+
+def published_text(params: CardParams) -> str:
+    """Get the relative time a card shows its video was published at (ex. "3 hours ago"),
+    or an empty string if the request has no publish time
+    """
+    if not params.publish_timestamp:
+        return ""
+    return format_relative_time(params.publish_timestamp, params.lang)
+
+
+def card_cache_key(params: CardParams, published: str) -> str:
+    """Get the key of a rendered card from its parameters and the relative time it shows,
+    so it changes exactly when the relative time text does
+    """
+    key = repr((tuple(params), published))
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def is_complete(thumbnail: str, views: Optional[str]) -> bool:
+    """Whether a card has its thumbnail and view count, so it can be cached, where the view
+    count is None if it could not be fetched, and empty if the video has none
+
+    Cards are degraded while an upstream server is failing, which may be temporary, while
+    videos which hide their view count are shown without one until they no longer do.
+    """
+    return views is not None and thumbnail != PLACEHOLDER_THUMBNAIL
+
+
+class RenderedCard(NamedTuple):
+    body: bytes
+    # digest of what the card is rendered from, sent quoted in the ETag header
+    etag: str
+    # when the card was rendered, in seconds since the epoch
+    last_modified: int
+
+
+def rendered_card(body: bytes, etag: str) -> RenderedCard:
+    """Get a card which was just rendered with its validators"""
+    return RenderedCard(body, etag, int(time.time()))
+
+
+@cache
+def source_digest() -> bytes:
+    """Get a digest of the modules and templates cards are rendered with, computed once,
+    so that cards rendered by another version of the app have other ETags
+    """
+    digest = hashlib.blake2b(CARD_RENDERER.encode("ascii"), digest_size=16)
+    for path in sorted(path for pattern in CARD_SOURCES for path in glob(pattern)):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.digest()
+
+
+def card_etag(key: str, thumbnail: str, views: str, published: str) -> str:
+    """Compute the ETag of a card from its cache key, thumbnail data URI, formatted view
+    count and relative publish time, which determine the card, so a conditional request is
+    answered before rendering it
+    """
+    digest = hashlib.blake2b(source_digest(), digest_size=16)
+    digest.update(f"{key}\n{views}\n{published}\n".encode("utf-8"))
+    digest.update(thumbnail.encode("ascii"))
+    return digest.hexdigest()
+
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """Get the ETag of a card compressed with an encoding, or the ETag itself if it is None"""
+    return etag if encoding is None else f"{etag}-{encoding}"
+
+
+def pack_card(card: RenderedCard) -> bytes:
+    """Serialize a card with its validators for the card cache"""
+    return f"{card.etag} {card.last_modified}\n".encode("ascii") + card.body
+
+
+def unpack_card(data: bytes) -> Optional[RenderedCard]:
+    """Deserialize a card from the card cache, returns None if it was not packed by pack_card"""
+    header, _, body = data.partition(b"\n")
+    try:
+        etag, last_modified = header.decode("ascii").split(" ")
+        return RenderedCard(body, etag, int(last_modified))
+    except ValueError:
+        return None
+
+
+def is_modified(environ: dict[str, Any], etag: str, last_modified: Optional[int] = None) -> bool:
+    """Whether a card differs from the one a conditional request has, so it must be sent
+
+    Without the time the card was rendered, only If-None-Match is checked.
+    """
+    return is_resource_modified(
+        environ,
+        etag=etag,
+        last_modified=(
+            None if last_modified is None else datetime.fromtimestamp(last_modified, timezone.utc)
+        ),
+    )
+
+
+def cache_headers(last_modified: Optional[float] = None) -> dict[str, str]:
+    """Get the headers to cache a response no longer than an hour, last modified now unless
+    another time is given
+    """
+    return {
+        "Expires": strftime(
+            "%a, %d %b %Y %H:%M:%S GMT", gmtime(datetime.now().timestamp() + CACHE_MAX_AGE)
+        ),
+        "Last-Modified": strftime("%a, %d %b %Y %H:%M:%S GMT", gmtime(last_modified)),
+        "Cache-Control": (
+            f"public, max-age={CACHE_MAX_AGE}, s-maxage={CACHE_S_MAXAGE}, "
+            f"stale-while-revalidate={CACHE_STALE_WHILE_REVALIDATE}"
+        ),
+    }
+
+
+def card_headers(etag: str, last_modified: Optional[int] = None) -> dict[str, str]:
+    """Get the headers to cache a card and revalidate it, last modified now unless the time
+    it was rendered is given
+
+    Rendered cards are compressed for clients which accept it, so caches must keep a card
+    for each Accept-Encoding.
+    """
+    return (
+        {"Content-Type": CARD_CONTENT_TYPE}
+        | cache_headers(last_modified)
+        | {"ETag": f'"{etag}"', "Vary": "Accept-Encoding"}
+    )
+
+
+class CardReply(NamedTuple):
+    status: int
+    headers: dict[str, str]
+    # the SVG, or its chunks if the card is streamed
+    body: Union[bytes, Iterator[bytes]]
+
+
+def revalidated_reply(
+    environ: dict[str, Any], etag: str, encoding: Optional[str]
+) -> Optional[CardReply]:
+    """Get the 304 reply to a conditional request which has the card of an ETag compressed
+    with an encoding, returns None if the card must be rendered and sent
+    """
+    etag = encoded_etag(etag, encoding)
+    if is_modified(environ, etag):
+        return None
+    return CardReply(304, card_headers(etag), b"")
+
+
+def card_reply(environ: dict[str, Any], card: RenderedCard, encoding: Optional[str]) -> CardReply:
+    """Get the reply with a card compressed with an encoding, or the 304 reply to a
+    conditional request which has the card already
+    """
+    headers = card_headers(card.etag, card.last_modified)
+    if not is_modified(environ, card.etag, card.last_modified):
+        return CardReply(304, headers, b"")
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return CardReply(200, headers, card.body)
+
+
+def error_status(error: Exception) -> int:
+    """Get the status code of the error card of a request which failed with an error,
+    500 unless it is an error of the request or of an upstream server
+    """
+    return getattr(error, "status", 500)
+
+
+def error_reply(status: int, card: bytes) -> CardReply:
+    """Get the reply with the error card of a request which failed"""
+    return CardReply(status, {"Content-Type": CARD_CONTENT_TYPE} | cache_headers(), card)
@@ -0,0 +1,167 @@
+"""Compile the advance widths of the card font into ``api/glyph_table.py``
+
+Advance widths are read from the Roboto font embedded in
+``api/templates/resources/roboto.css``. Characters missing from the font are
+measured by class, since they are drawn with a fallback font: marks and format
+characters take no space, East Asian wide characters take a full em and anything
+else takes the average width of Roboto's letters. Consecutive characters with the
+same width are merged into ranges, so widths are looked up by binary search.
+
+Run after changing the embedded font::
+
+    python -m api.compile_glyphs
+"""
+
+import base64
+import os
+import re
+import struct
+import unicodedata
+from typing import Iterator
+
+FONT_CSS_PATH = os.path.join(os.path.dirname(__file__), "templates", "resources", "roboto.css")
+TABLE_PATH = os.path.join(os.path.dirname(__file__), "glyph_table.py")
+
+# characters measured, which covers every script in use
+LAST_CODE_POINT = 0x3FFFF
+
+HEADER = '''"""Advance widths of the card font by range of code points
+
+Generated by ``python -m api.compile_glyphs``, do not edit.
+"""
+
+# fmt: off
+'''
+
+
+def load_font(css_path: str = FONT_CSS_PATH) -> bytes:
+    """Decode the TrueType font embedded in a stylesheet as a data URI"""
+    with open(css_path, encoding="utf-8") as f:
+        match = re.search(r"base64,([A-Za-z0-9+/=]+)", f.read())
+    assert match, f"No embedded font in {css_path}"
+    return base64.b64decode(match.group(1))
+
+
+def font_tables(font: bytes) -> dict[str, bytes]:
+    """Split a TrueType font into its tables"""
+    (num_tables,) = struct.unpack_from(">H", font, 4)
+    tables = {}
+    for i in range(num_tables):
+        tag, _, offset, length = struct.unpack_from(">4sIII", font, 12 + 16 * i)
+        tables[tag.decode("ascii").strip()] = font[offset : offset + length]
+    return tables
+
+
+def character_map(cmap: bytes) -> dict[int, int]:
+    """Map code points to glyph IDs using the Unicode BMP subtable (format 4) of a cmap table"""
+    (num_subtables,) = struct.unpack_from(">H", cmap, 2)
+    for i in range(num_subtables):
+        platform, encoding, offset = struct.unpack_from(">HHI", cmap, 4 + 8 * i)
+        (subtable_format,) = struct.unpack_from(">H", cmap, offset)
+        if (platform, encoding) in ((3, 1), (0, 3)) and subtable_format == 4:
+            break
+    else:
+        raise ValueError("No Unicode BMP character map in the font")
+    (seg_count_x2,) = struct.unpack_from(">H", cmap, offset + 6)
+    seg_count = seg_count_x2 // 2
+    end_codes = struct.unpack_from(f">{seg_count}H", cmap, offset + 14)
+    start_codes = struct.unpack_from(f">{seg_count}H", cmap, offset + 16 + seg_count_x2)
+    deltas = struct.unpack_from(f">{seg_count}h", cmap, offset + 16 + 2 * seg_count_x2)
+    range_offsets_at = offset + 16 + 3 * seg_count_x2
+    range_offsets = struct.unpack_from(f">{seg_count}H", cmap, range_offsets_at)
+    glyphs = {}
+    for segment, (start, end) in enumerate(zip(start_codes, end_codes)):
+        for code_point in range(start, min(end, 0xFFFE) + 1):
+            if range_offsets[segment] == 0:
+                glyph = (code_point + deltas[segment]) & 0xFFFF
+            else:
+                at = (
+                    range_offsets_at
+                    + 2 * segment
+                    + range_offsets[segment]
+                    + 2 * (code_point - start)
+                )
+                (glyph,) = struct.unpack_from(">H", cmap, at)
+                if glyph:
+                    glyph = (glyph + deltas[segment]) & 0xFFFF
+            if glyph:
+                glyphs[code_point] = glyph
+    return glyphs
+
+
+def glyph_advances(tables: dict[str, bytes]) -> list[int]:
+    """Get the advance width of every glyph from the hhea and hmtx tables"""
+    (num_metrics,) = struct.unpack_from(">H", tables["hhea"], 34)
+    (num_glyphs,) = struct.unpack_from(">H", tables["maxp"], 4)
+    advances = [struct.unpack_from(">H", tables["hmtx"], 4 * i)[0] for i in range(num_metrics)]
+    # glyphs after the last metric share its advance width
+    return advances + [advances[-1]] * (num_glyphs - num_metrics)
+
+
+def fallback_advance(char: str, units_per_em: int, average: int) -> int:
+    """Estimate the advance width of a character missing from the font"""
+    if unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return units_per_em
+    return average
+
+
+def advance_ranges(css_path: str = FONT_CSS_PATH) -> tuple[int, int, list[tuple[int, int]]]:
+    """Get the units per em, the fallback width and the (first code point, advance width)
+    of each range of characters with the same width
+    """
+    tables = font_tables(load_font(css_path))
+    (units_per_em,) = struct.unpack_from(">H", tables["head"], 18)
+    glyphs = character_map(tables["cmap"])
+    advances = glyph_advances(tables)
+    letters = [
+        advances[glyphs[ord(c)]] for c in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    ]
+    average = round(sum(letters) / len(letters))
+
+    def widths() -> Iterator[int]:
+        for code_point in range(LAST_CODE_POINT + 1):
+            if code_point in glyphs:
+                yield advances[glyphs[code_point]]
+            else:
+                yield fallback_advance(chr(code_point), units_per_em, average)
+
+    ranges: list[tuple[int, int]] = []
+    for code_point, width in enumerate(widths()):
+        if not ranges or ranges[-1][1] != width:
+            ranges.append((code_point, width))
+    return units_per_em, average, ranges
+
+
+def compile_glyphs(css_path: str = FONT_CSS_PATH) -> str:
+    """Get the source of the glyph table module"""
+    units_per_em, average, ranges = advance_ranges(css_path)
+
+    def int_list(name: str, values: list[int]) -> str:
+        rows = [", ".join(map(str, values[i : i + 16])) for i in range(0, len(values), 16)]
+        return f"{name} = [\n" + "".join(f"    {row},\n" for row in rows) + "]\n"
+
+    return "\n".join(
+        [
+            HEADER,
+            "# font units per em of the advance widths",
+            f"UNITS_PER_EM = {units_per_em}",
+            "# advance width of characters past the last range",
+            f"FALLBACK_ADVANCE = {average}",
+            "# first code point of each range of characters with the same advance width",
+            int_list("RANGE_STARTS", [start for start, _ in ranges]),
+            "# advance width of the characters in each range",
+            int_list("RANGE_ADVANCES", [width for _, width in ranges]),
+        ]
+    )
+
+
+def main():
+    with open(TABLE_PATH, "w", encoding="utf-8") as f:
+        f.write(compile_glyphs())
+    print(f"Wrote {os.path.relpath(TABLE_PATH)}")
+
+
+if __name__ == "__main__":
+    main()
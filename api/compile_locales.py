@@ -0,0 +1,191 @@
+"""Compile the translations and the Babel data used by cards into ``api/locale_table.py``
+
+The table holds the YAML translations of every locale in ``api/locale``, along with
+their plural rules, number symbols, compact number patterns and relative time
+patterns from Babel, so cards in these languages are formatted without parsing YAML
+or loading Babel locale data at runtime.
+
+Run after adding or changing a translation or upgrading Babel::
+
+    python -m api.compile_locales
+"""
+
+import os
+import re
+from pprint import pformat
+from typing import Any, Optional
+
+import yaml
+from babel import Locale
+from babel.dates import TIMEDELTA_UNITS
+from babel.numbers import NumberPattern, parse_pattern
+from babel.plural import _PythonCompiler
+
+LOCALE_DIR = os.path.join(os.path.dirname(__file__), "locale")
+TABLE_PATH = os.path.join(os.path.dirname(__file__), "locale_table.py")
+
+# units relative times are formatted in
+RELATIVE_TIME_FORMAT = "long"
+
+HEADER = '''"""Translations and Babel data of the locales in api/locale
+
+Generated by ``python -m api.compile_locales``, do not edit.
+"""
+
+# flake8: noqa
+# fmt: off'''
+
+# helpers compiled plural rules call, by the names they call them
+PLURAL_HELPERS = {"MOD": "cldr_modulo", "IN": "in_range_list", "WITHIN": "within_range_list"}
+
+
+def load_translations(locale_dir: str = LOCALE_DIR) -> dict[str, dict[str, str]]:
+    """Load the translations of every locale from its YAML file"""
+    translations = {}
+    for file in sorted(os.listdir(locale_dir)):
+        lang = file.removesuffix(".yml")
+        with open(os.path.join(locale_dir, file), encoding="utf-8") as f:
+            translations[lang] = yaml.safe_load(f)[lang]
+    return translations
+
+
+def compile_pattern(pattern: NumberPattern) -> tuple[str, str, int, int, int, int, int]:
+    """Get the prefix, suffix, integer digits, fraction digits and grouping of a number pattern
+
+    Quoted text in the prefix and suffix is unquoted as Babel does when applying the pattern.
+    """
+    assert pattern.scale == 0 and not pattern.exp_prec and "@" not in pattern.pattern
+
+    def unquote(text: str) -> str:
+        return re.sub(r"'([^']*)'", lambda m: m.group(1) or "'", text)
+
+    return (
+        unquote(pattern.prefix[0]),
+        unquote(pattern.suffix[0]),
+        pattern.int_prec[0],
+        pattern.frac_prec[0],
+        pattern.frac_prec[1],
+        pattern.grouping[0],
+        pattern.grouping[1],
+    )
+
+
+def compile_compact_formats(locale: Locale) -> list[tuple[int, Optional[int], dict[str, Any]]]:
+    """Get the magnitudes of the short compact number formats of a locale, largest first,
+    with the number they are divided by and their pattern for each plural form
+
+    The divisor is None for patterns without an abbreviation, which format the number as is.
+    """
+    compact_format = locale.compact_decimal_formats["short"]
+    forms = [*sorted(locale.plural_form.tags), "other"] + (["1"] if "1" in compact_format else [])
+    formats = []
+    for magnitude in sorted((int(m) for m in compact_format["other"]), reverse=True):
+        other = compact_format["other"][str(magnitude)]
+        divisor = None
+        if other.pattern != "0":
+            divisor = magnitude // (10 ** (other.pattern.count("0") - 1))
+        patterns = {}
+        for form in forms:
+            pattern = compact_format.get(form, {}).get(str(magnitude), other)
+            patterns[form] = compile_pattern(parse_pattern(pattern))
+        formats.append((magnitude, divisor, patterns))
+    return formats
+
+
+def compile_relative_time(locale: Locale) -> dict[str, dict[str, dict[str, str]]]:
+    """Get the relative time patterns of a locale by direction, unit and plural form
+
+    Patterns are looked up the same way as ``babel.dates.format_timedelta``,
+    an empty pattern meaning no pattern was found.
+    """
+    date_fields = locale._data["date_fields"]
+    unit_patterns = locale._data["unit_patterns"]
+    forms = [*sorted(locale.plural_form.tags), "other"]
+    table = {}
+    for direction in ("future", "past"):
+        table[direction] = {}
+        for unit, _ in TIMEDELTA_UNITS:
+            relative = date_fields.get(f"{unit}-{RELATIVE_TIME_FORMAT}") or date_fields[unit]
+            duration = unit_patterns.get(f"duration-{unit}", {})
+            candidates = [
+                relative[direction],
+                duration.get(RELATIVE_TIME_FORMAT),
+                duration.get("short"),
+            ]
+            table[direction][unit] = {}
+            for form in forms:
+                pattern = ""
+                for patterns in filter(None, candidates):
+                    pattern = patterns.get(form) or patterns.get("other")
+                    if pattern:
+                        break
+                table[direction][unit][form] = pattern or ""
+    return table
+
+
+def compile_plural_rule(name: str, locale: Locale) -> str:
+    """Get the source of a function returning the plural form of a number from its operands"""
+    compiler = _PythonCompiler()
+    lines = [f"def {name}(n, i, v, w, f, t, c, e):"]
+    for tag, ast in locale.plural_form.abstract:
+        lines.append(f"    if {compiler.compile(ast)}: return {tag!r}")
+    lines.append(f"    return {'other'!r}")
+    return "\n".join(lines)
+
+
+def compile_helper_import(rules: list[str]) -> str:
+    """Get the import of the plural helpers called by compiled plural rules, and no others"""
+    used = [
+        f"{helper} as {alias}"
+        for alias, helper in PLURAL_HELPERS.items()
+        if any(re.search(rf"\b{alias}\(", rule) for rule in rules)
+    ]
+    return f"from .plural import {', '.join(used)}" if used else ""
+
+
+def compile_tables(locale_dir: str = LOCALE_DIR) -> dict[str, Any]:
+    """Compile the data tables for every locale in the locale directory"""
+    translations = load_translations(locale_dir)
+    locales = {lang: Locale.parse(lang) for lang in translations}
+    return {
+        "TRANSLATIONS": translations,
+        "NUMBER_SYMBOLS": {
+            lang: (locale.number_symbols["latn"]["decimal"], locale.number_symbols["latn"]["group"])
+            for lang, locale in locales.items()
+        },
+        "DECIMAL_FORMATS": {
+            lang: compile_pattern(locale.decimal_formats[None]) for lang, locale in locales.items()
+        },
+        "COMPACT_FORMATS": {
+            lang: compile_compact_formats(locale) for lang, locale in locales.items()
+        },
+        "TIMEDELTA_UNITS": tuple(TIMEDELTA_UNITS),
+        "RELATIVE_TIME": {lang: compile_relative_time(locale) for lang, locale in locales.items()},
+    }
+
+
+def compile_locales(locale_dir: str = LOCALE_DIR) -> str:
+    """Get the source of the locale table module"""
+    tables = compile_tables(locale_dir)
+    langs = list(tables["TRANSLATIONS"])
+    rules = [compile_plural_rule(f"plural_{lang}", Locale.parse(lang)) for lang in langs]
+    sections = [HEADER]
+    helper_import = compile_helper_import(rules)
+    if helper_import:
+        sections[0] += f"\n\n{helper_import}"
+    for name, table in tables.items():
+        sections.append(f"{name} = {pformat(table, width=100, sort_dicts=False)}\n")
+    sections.extend(rule + "\n" for rule in rules)
+    plural_forms = ", ".join(f"{lang!r}: plural_{lang}" for lang in langs)
+    sections.append(f"PLURAL_FORMS = {{{plural_forms}}}\n")
+    return "\n\n".join(sections)
+
+
+def main():
+    with open(TABLE_PATH, "w", encoding="utf-8") as f:
+        f.write(compile_locales())
+    print(f"Wrote {os.path.relpath(TABLE_PATH)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compression of card responses in the encodings their clients accept
+
+Cards are mostly the base-64 data URI of their thumbnail, which compresses back to about
+the size of the image, so compressing them saves about a quarter of the bytes sent.
+"""
+
+import gzip
+from functools import cache
+from types import ModuleType
+from typing import Optional
+
+from werkzeug.datastructures import Accept
+
+from .config import BROTLI_QUALITY, CARD_ENCODINGS, GZIP_LEVEL
+
+
+@cache
+def load_brotli() -> Optional[ModuleType]:
+    """Import the brotli module on first use, or return None if it is not installed"""
+    try:
+        import brotli
+    except ImportError:  # pragma: no cover - brotli is an optional dependency
+        return None
+    return brotli
+
+
+@cache
+def supported_encodings() -> tuple[str, ...]:
+    """Get the configured encodings which can be used, in order of preference"""
+    return tuple(
+        encoding
+        for encoding in CARD_ENCODINGS
+        if encoding == "gzip" or (encoding == "br" and load_brotli() is not None)
+    )
+
+
+def negotiate_encoding(accept_encodings: Accept) -> Optional[str]:
+    """Choose the encoding of a response from the Accept-Encoding header of its request,
+    returns None if it is sent uncompressed
+
+    Encodings the client prefers equally are chosen in the order of CARD_ENCODINGS.
+    """
+    return accept_encodings.best_match(supported_encodings())
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a response body with a supported encoding"""
+    if encoding == "br":
+        brotli = load_brotli()
+        assert brotli is not None
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    # without a modification time, the same body is always compressed to the same bytes
+    return gzip.compress(body, GZIP_LEVEL, mtime=0)
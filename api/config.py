@@ -0,0 +1,133 @@
+import os
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer from an environment variable, returns the default if unset or invalid."""
+    try:
+        return int(os.environ.get(name, ""))
+    except ValueError:
+        return default
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """Read a boolean from an environment variable ("1", "true" or "yes"), returns the default if unset."""
+    value = os.environ.get(name, "").strip().lower()
+    if not value:
+        return default
+    return value in ("1", "true", "yes")
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a float from an environment variable, returns the default if unset or invalid."""
+    try:
+        return float(os.environ.get(name, ""))
+    except ValueError:
+        return default
+
+
+# where thumbnails, view counts and cards are cached: "memory" in each process, "sqlite" in a
+# database on disk shared by the processes of a node, or "redis" on a Redis server
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory").lower()
+# path of the database of the "sqlite" cache backend, in a directory private to the current
+# user in the system temp directory if unset
+CACHE_SQLITE_PATH = os.environ.get("CACHE_SQLITE_PATH")
+# URL of the server of the "redis" cache backend
+CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+# maximum total size in bytes of the encoded thumbnails kept in memory (0 disables the cache)
+THUMBNAIL_CACHE_MAX_BYTES = env_int("THUMBNAIL_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+# number of seconds a cached thumbnail is served before it is downloaded again
+THUMBNAIL_CACHE_TTL = env_float("THUMBNAIL_CACHE_TTL", 24 * 60 * 60)
+# maximum total size in bytes of the IDs of videos without a thumbnail kept in the memory of
+# each process, apart from the other caches whatever their backend (0 disables the cache)
+MISSING_VIDEOS_CACHE_MAX_BYTES = env_int("MISSING_VIDEOS_CACHE_MAX_BYTES", 1024 * 1024)
+# number of seconds a video without a thumbnail is answered with an error card without
+# requesting its thumbnail again
+MISSING_VIDEOS_CACHE_TTL = env_float("MISSING_VIDEOS_CACHE_TTL", 5 * 60)
+
+# where view counts are fetched from: "shields" for img.shields.io, or "youtube" for the YouTube
+# Data API in batches, falling back to img.shields.io
+VIEWS_PROVIDER = os.environ.get("VIEWS_PROVIDER", "shields").lower()
+# key of the YouTube Data API, required by the "youtube" views provider
+YOUTUBE_API_KEY = os.environ.get("YOUTUBE_API_KEY", "")
+# number of seconds view counts requested together are collected into a batch
+VIEWS_BATCH_WINDOW = env_float("VIEWS_BATCH_WINDOW", 0.005)
+# maximum number of videos in a batch, at most 50 for the YouTube Data API
+VIEWS_BATCH_SIZE = min(env_int("VIEWS_BATCH_SIZE", 50), 50)
+
+# maximum total size in bytes of the view counts kept in memory (0 disables the cache)
+VIEWS_CACHE_MAX_BYTES = env_int("VIEWS_CACHE_MAX_BYTES", 4 * 1024 * 1024)
+# number of seconds a view count is served without being refreshed
+VIEWS_CACHE_TTL = env_float("VIEWS_CACHE_TTL", 10 * 60)
+# number of seconds after the TTL during which a stale view count is served while it is refreshed
+VIEWS_CACHE_STALE_TTL = env_float("VIEWS_CACHE_STALE_TTL", 24 * 60 * 60)
+
+# base URL of the server that thumbnails are downloaded from
+YTIMG_BASE_URL = os.environ.get("YTIMG_BASE_URL", "https://i.ytimg.com")
+# base URL of the server that view counts are fetched from
+SHIELDS_BASE_URL = os.environ.get("SHIELDS_BASE_URL", "https://img.shields.io")
+# base URL of the YouTube Data API that batches of view counts are fetched from
+YOUTUBE_API_BASE_URL = os.environ.get("YOUTUBE_API_BASE_URL", "https://youtube.googleapis.com")
+# maximum number of threads per process used for upstream requests
+UPSTREAM_WORKERS = env_int("UPSTREAM_WORKERS", 16)
+# number of seconds a card request waits for the thumbnail and view count in total
+UPSTREAM_DEADLINE = env_float("UPSTREAM_DEADLINE", 8)
+# maximum number of simultaneous connections per process to each upstream host
+UPSTREAM_MAX_CONNECTIONS_PER_HOST = env_int("UPSTREAM_MAX_CONNECTIONS_PER_HOST", 10)
+# number of seconds to wait for a connection to an upstream server to be established
+UPSTREAM_CONNECT_TIMEOUT = env_float("UPSTREAM_CONNECT_TIMEOUT", 3)
+# number of seconds to wait for data from an upstream server once connected
+UPSTREAM_READ_TIMEOUT = env_float("UPSTREAM_READ_TIMEOUT", 5)
+# number of seconds an unused keep-alive connection is kept open
+UPSTREAM_IDLE_TIMEOUT = env_float("UPSTREAM_IDLE_TIMEOUT", 30)
+# number of consecutive failed or slow requests to an upstream host after which requests to it
+# are stopped and cards are served without its data (0 disables the circuit breaker)
+UPSTREAM_BREAKER_FAILURES = env_int("UPSTREAM_BREAKER_FAILURES", 5)
+# number of seconds after which a response from an upstream host counts as a failure
+UPSTREAM_BREAKER_SLOW_THRESHOLD = env_float("UPSTREAM_BREAKER_SLOW_THRESHOLD", 4)
+# number of seconds requests to a failing upstream host are stopped before one is tried again
+UPSTREAM_BREAKER_RESET_TIMEOUT = env_float("UPSTREAM_BREAKER_RESET_TIMEOUT", 30)
+
+# number of seconds clients and proxies may cache a card, as sent in the Cache-Control header
+CACHE_MAX_AGE = env_int("CACHE_MAX_AGE", 60 * 60)
+# number of seconds shared caches such as CDNs may cache a card, as sent in the Cache-Control header
+CACHE_S_MAXAGE = env_int("CACHE_S_MAXAGE", CACHE_MAX_AGE)
+# number of seconds after a card expires that caches may serve it while they revalidate it
+CACHE_STALE_WHILE_REVALIDATE = env_int("CACHE_STALE_WHILE_REVALIDATE", 24 * 60 * 60)
+# maximum total size in bytes of the rendered cards kept in memory (0 disables the cache)
+CARD_CACHE_MAX_BYTES = env_int("CARD_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+# number of seconds a rendered card is served from the cache, defaults to the Cache-Control max-age
+CARD_CACHE_TTL = env_float("CARD_CACHE_TTL", CACHE_MAX_AGE)
+# maximum total size in bytes of the rendered error cards kept in memory (0 disables the cache)
+ERROR_CACHE_MAX_BYTES = env_int("ERROR_CACHE_MAX_BYTES", 4 * 1024 * 1024)
+
+# encodings cards are compressed with for clients which accept them, in order of preference
+# ("br" requires brotli), or empty to send cards uncompressed
+CARD_ENCODINGS = tuple(
+    encoding.strip()
+    for encoding in os.environ.get("CARD_ENCODINGS", "br,gzip").lower().split(",")
+    if encoding.strip()
+)
+# compression level of gzip encoded cards from 1 to 9
+GZIP_LEVEL = env_int("GZIP_LEVEL", 6)
+# quality of brotli encoded cards from 0 to 11
+BROTLI_QUALITY = env_int("BROTLI_QUALITY", 5)
+
+# format thumbnails are recompressed to before they are embedded ("jpeg" or "webp"),
+# or "original" to embed them as downloaded; recompressing requires Pillow
+THUMBNAIL_FORMAT = os.environ.get("THUMBNAIL_FORMAT", "original").lower()
+# quality of recompressed thumbnails from 1 to 100
+THUMBNAIL_QUALITY = env_int("THUMBNAIL_QUALITY", 75)
+# ratio of thumbnail pixels to card width, such as 2 for high density displays
+THUMBNAIL_SCALE = env_float("THUMBNAIL_SCALE", 1)
+
+# whether cards missing from the cache are streamed in chunks instead of rendered in memory;
+# streamed cards are not added to the card cache
+STREAM_CARDS = env_bool("STREAM_CARDS", False)
+# maximum number of characters per chunk of a streamed card
+STREAM_CHUNK_SIZE = env_int("STREAM_CHUNK_SIZE", 16 * 1024)
+# renderer used for cards, "fast" for the precompiled renderer or "jinja" for the template
+CARD_RENDERER = os.environ.get("CARD_RENDERER", "fast").lower()
+# directory compiled templates are cached in across processes, created private to the current
+# user, or empty to disable the cache; Jinja's directory for the current user is used if unset
+TEMPLATE_CACHE_DIR = os.environ.get("TEMPLATE_CACHE_DIR")
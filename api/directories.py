@@ -0,0 +1,28 @@
+"""Directories for files the app loads back, such as compiled templates and cached cards
+
+Files in a shared directory like the system temp directory could be planted by any other
+local user, so they are only kept in directories private to the user running the app.
+"""
+
+import os
+import stat
+import tempfile
+
+
+def user_temp_directory(name: str) -> str:
+    """Get the path of a directory in the system temp directory for the current user"""
+    return os.path.join(tempfile.gettempdir(), f"{name}-{os.getuid()}")
+
+
+def private_directory(path: str) -> str:
+    """Create a directory only the current user can access, or check that an existing one is
+
+    Raises:
+        OSError: If the directory cannot be created, or is not a directory owned by the
+            current user and inaccessible to others
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise OSError(f"{path} is not a directory private to the current user")
+    return path
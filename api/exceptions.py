@@ -8,3 +8,18 @@ class ValidationError(StatusException, ValueError):
     def __init__(self, message, status=400):
         super().__init__(message)
         self.status = status
+
+
+class UpstreamError(StatusException):
+    """Exception raised when a request to an upstream server fails or times out."""
+
+    def __init__(self, message, status=502):
+        super().__init__(message)
+        self.status = status
+
+
+class CircuitOpenError(UpstreamError):
+    """Exception raised when requests to a failing upstream server are stopped."""
+
+    def __init__(self, message, status=503):
+        super().__init__(message, status)
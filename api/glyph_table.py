@@ -0,0 +1,368 @@
+"""Advance widths of the card font by range of code points
+
+Generated by ``python -m api.compile_glyphs``, do not edit.
+"""
+
+# fmt: off
+
+# font units per em of the advance widths
+UNITS_PER_EM = 2048
+# advance width of characters past the last range
+FALLBACK_ADVANCE = 1160
+# first code point of each range of characters with the same advance width
+RANGE_STARTS = [
+    0, 1, 2, 3, 13, 14, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41,
+    42, 43, 44, 45, 46, 47, 48, 58, 59, 60, 61, 62, 63, 64, 65, 66,
+    67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82,
+    83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98,
+    99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114,
+    115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 160, 161, 162,
+    163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178,
+    180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 198, 199, 200,
+    204, 208, 209, 210, 215, 216, 217, 221, 222, 223, 224, 230, 231, 232, 236, 240,
+    241, 242, 247, 248, 249, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 263,
+    264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279,
+    280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295,
+    296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311,
+    312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327,
+    328, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344,
+    345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360,
+    361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376,
+    377, 378, 379, 380, 381, 382, 383, 384, 399, 400, 402, 403, 416, 417, 418, 431,
+    432, 433, 496, 497, 506, 507, 508, 509, 510, 511, 536, 537, 538, 539, 540, 567,
+    568, 601, 602, 700, 701, 710, 711, 712, 713, 714, 728, 729, 730, 731, 732, 733,
+    734, 755, 756, 768, 880, 888, 890, 896, 900, 901, 902, 903, 904, 905, 906, 907,
+    908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923,
+    924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939,
+    940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955,
+    956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971,
+    972, 973, 974, 975, 977, 978, 979, 982, 983, 1024, 1026, 1027, 1028, 1029, 1030, 1032,
+    1033, 1034, 1035, 1036, 1037, 1038, 1039, 1040, 1041, 1042, 1043, 1044, 1045, 1046, 1047, 1048,
+    1050, 1051, 1052, 1053, 1054, 1055, 1056, 1057, 1058, 1059, 1060, 1061, 1062, 1063, 1064, 1065,
+    1066, 1067, 1068, 1069, 1070, 1071, 1072, 1073, 1074, 1075, 1076, 1077, 1078, 1079, 1080, 1082,
+    1083, 1084, 1085, 1086, 1087, 1088, 1089, 1090, 1091, 1092, 1093, 1094, 1095, 1096, 1097, 1098,
+    1099, 1100, 1101, 1102, 1103, 1104, 1106, 1107, 1108, 1109, 1110, 1111, 1112, 1113, 1114, 1115,
+    1116, 1117, 1118, 1119, 1120, 1121, 1122, 1123, 1124, 1125, 1126, 1127, 1128, 1129, 1130, 1131,
+    1132, 1133, 1134, 1135, 1136, 1137, 1138, 1139, 1140, 1141, 1142, 1143, 1144, 1145, 1146, 1147,
+    1148, 1149, 1150, 1151, 1152, 1153, 1154, 1155, 1162, 1163, 1164, 1165, 1166, 1167, 1168, 1169,
+    1170, 1171, 1172, 1173, 1174, 1175, 1176, 1177, 1178, 1179, 1180, 1181, 1182, 1183, 1184, 1185,
+    1186, 1187, 1188, 1189, 1190, 1191, 1192, 1193, 1194, 1195, 1196, 1197, 1198, 1199, 1200, 1201,
+    1202, 1203, 1204, 1205, 1206, 1207, 1208, 1209, 1210, 1211, 1212, 1213, 1214, 1215, 1216, 1217,
+    1218, 1219, 1220, 1221, 1222, 1223, 1224, 1225, 1226, 1227, 1228, 1229, 1230, 1231, 1232, 1233,
+    1234, 1235, 1236, 1237, 1238, 1239, 1240, 1241, 1242, 1243, 1244, 1245, 1246, 1247, 1248, 1250,
+    1251, 1252, 1253, 1254, 1255, 1256, 1257, 1258, 1259, 1260, 1261, 1262, 1263, 1264, 1265, 1266,
+    1267, 1268, 1269, 1270, 1271, 1272, 1273, 1274, 1275, 1276, 1277, 1278, 1279, 1280, 1281, 1282,
+    1283, 1284, 1285, 1286, 1287, 1288, 1289, 1290, 1291, 1292, 1293, 1294, 1295, 1296, 1297, 1298,
+    1299, 1300, 1328, 1329, 1367, 1369, 1419, 1421, 1424, 1425, 1470, 1471, 1472, 1473, 1475, 1476,
+    1478, 1479, 1480, 1488, 1515, 1519, 1525, 1536, 1542, 1552, 1563, 1564, 1565, 1611, 1632, 1648,
+    1649, 1750, 1758, 1759, 1765, 1767, 1769, 1770, 1774, 1806, 1807, 1808, 1809, 1810, 1840, 1867,
+    1869, 1958, 1969, 1970, 1984, 2027, 2036, 2043, 2045, 2046, 2070, 2074, 2075, 2084, 2085, 2088,
+    2089, 2094, 2096, 2111, 2112, 2137, 2140, 2142, 2143, 2144, 2155, 2160, 2191, 2192, 2194, 2200,
+    2208, 2250, 2307, 2362, 2363, 2364, 2365, 2369, 2377, 2381, 2382, 2385, 2392, 2402, 2404, 2433,
+    2434, 2436, 2437, 2445, 2447, 2449, 2451, 2473, 2474, 2481, 2482, 2483, 2486, 2490, 2492, 2493,
+    2497, 2501, 2503, 2505, 2507, 2509, 2510, 2511, 2519, 2520, 2524, 2526, 2527, 2530, 2532, 2534,
+    2558, 2559, 2561, 2563, 2564, 2565, 2571, 2575, 2577, 2579, 2601, 2602, 2609, 2610, 2612, 2613,
+    2615, 2616, 2618, 2620, 2621, 2622, 2625, 2627, 2631, 2633, 2635, 2638, 2641, 2642, 2649, 2653,
+    2654, 2655, 2662, 2672, 2674, 2677, 2678, 2679, 2689, 2691, 2692, 2693, 2702, 2703, 2706, 2707,
+    2729, 2730, 2737, 2738, 2740, 2741, 2746, 2748, 2749, 2753, 2758, 2759, 2761, 2762, 2763, 2765,
+    2766, 2768, 2769, 2784, 2786, 2788, 2790, 2802, 2809, 2810, 2816, 2817, 2818, 2820, 2821, 2829,
+    2831, 2833, 2835, 2857, 2858, 2865, 2866, 2868, 2869, 2874, 2876, 2877, 2879, 2880, 2881, 2885,
+    2887, 2889, 2891, 2893, 2894, 2901, 2903, 2904, 2908, 2910, 2911, 2914, 2916, 2918, 2936, 2946,
+    2947, 2948, 2949, 2955, 2958, 2961, 2962, 2966, 2969, 2971, 2972, 2973, 2974, 2976, 2979, 2981,
+    2984, 2987, 2990, 3002, 3006, 3008, 3009, 3011, 3014, 3017, 3018, 3021, 3022, 3024, 3025, 3031,
+    3032, 3046, 3067, 3072, 3073, 3076, 3077, 3085, 3086, 3089, 3090, 3113, 3114, 3130, 3132, 3133,
+    3134, 3137, 3141, 3142, 3145, 3146, 3150, 3157, 3159, 3160, 3163, 3165, 3166, 3168, 3170, 3172,
+    3174, 3184, 3191, 3201, 3202, 3213, 3214, 3217, 3218, 3241, 3242, 3252, 3253, 3258, 3260, 3261,
+    3263, 3264, 3269, 3270, 3271, 3273, 3274, 3276, 3278, 3285, 3287, 3293, 3295, 3296, 3298, 3300,
+    3302, 3312, 3313, 3315, 3328, 3330, 3341, 3342, 3345, 3346, 3387, 3389, 3393, 3397, 3398, 3401,
+    3402, 3405, 3406, 3408, 3412, 3426, 3428, 3430, 3456, 3457, 3458, 3460, 3461, 3479, 3482, 3506,
+    3507, 3516, 3517, 3518, 3520, 3527, 3530, 3531, 3535, 3538, 3541, 3542, 3543, 3544, 3552, 3558,
+    3568, 3570, 3573, 3585, 3633, 3634, 3636, 3643, 3647, 3655, 3663, 3676, 3713, 3715, 3716, 3717,
+    3718, 3723, 3724, 3748, 3749, 3750, 3751, 3761, 3762, 3764, 3773, 3774, 3776, 3781, 3782, 3783,
+    3784, 3790, 3792, 3802, 3804, 3808, 3840, 3864, 3866, 3893, 3894, 3895, 3896, 3897, 3898, 3912,
+    3913, 3949, 3953, 3967, 3968, 3973, 3974, 3976, 3981, 3992, 3993, 4029, 4030, 4038, 4039, 4045,
+    4046, 4059, 4096, 4141, 4145, 4146, 4152, 4153, 4155, 4157, 4159, 4184, 4186, 4190, 4193, 4209,
+    4213, 4226, 4227, 4229, 4231, 4237, 4238, 4253, 4254, 4294, 4295, 4296, 4301, 4302, 4304, 4352,
+    4448, 4681, 4682, 4686, 4688, 4695, 4696, 4697, 4698, 4702, 4704, 4745, 4746, 4750, 4752, 4785,
+    4786, 4790, 4792, 4799, 4800, 4801, 4802, 4806, 4808, 4823, 4824, 4881, 4882, 4886, 4888, 4955,
+    4957, 4960, 4989, 4992, 5018, 5024, 5110, 5112, 5118, 5120, 5789, 5792, 5881, 5888, 5906, 5909,
+    5910, 5919, 5938, 5940, 5943, 5952, 5970, 5972, 5984, 5997, 5998, 6001, 6002, 6004, 6016, 6068,
+    6070, 6071, 6078, 6086, 6087, 6089, 6100, 6109, 6110, 6112, 6122, 6128, 6138, 6144, 6155, 6160,
+    6170, 6176, 6265, 6272, 6277, 6279, 6313, 6314, 6315, 6320, 6390, 6400, 6431, 6432, 6435, 6439,
+    6441, 6444, 6448, 6450, 6451, 6457, 6460, 6464, 6465, 6468, 6510, 6512, 6517, 6528, 6572, 6576,
+    6602, 6608, 6619, 6622, 6679, 6681, 6683, 6684, 6686, 6742, 6743, 6744, 6751, 6752, 6753, 6754,
+    6755, 6757, 6765, 6771, 6781, 6783, 6784, 6794, 6800, 6810, 6816, 6830, 6832, 6863, 6912, 6916,
+    6964, 6965, 6966, 6971, 6972, 6973, 6978, 6979, 6989, 6992, 7019, 7028, 7039, 7040, 7042, 7074,
+    7078, 7080, 7082, 7083, 7086, 7142, 7143, 7144, 7146, 7149, 7150, 7151, 7154, 7156, 7164, 7212,
+    7220, 7222, 7224, 7227, 7242, 7245, 7305, 7312, 7355, 7357, 7368, 7376, 7379, 7380, 7393, 7394,
+    7401, 7405, 7406, 7412, 7413, 7416, 7418, 7419, 7424, 7616, 7680, 7681, 7682, 7742, 7743, 7744,
+    7808, 7809, 7810, 7811, 7812, 7813, 7814, 7840, 7841, 7842, 7843, 7844, 7845, 7846, 7847, 7848,
+    7849, 7850, 7851, 7852, 7853, 7854, 7855, 7856, 7857, 7858, 7859, 7860, 7861, 7862, 7863, 7864,
+    7865, 7866, 7867, 7868, 7869, 7870, 7871, 7872, 7873, 7874, 7875, 7876, 7877, 7878, 7879, 7880,
+    7881, 7882, 7883, 7884, 7885, 7886, 7887, 7888, 7889, 7890, 7891, 7892, 7893, 7894, 7895, 7896,
+    7897, 7898, 7899, 7900, 7901, 7902, 7903, 7904, 7905, 7906, 7907, 7908, 7909, 7910, 7911, 7912,
+    7913, 7914, 7915, 7916, 7917, 7918, 7919, 7920, 7921, 7922, 7923, 7924, 7925, 7926, 7927, 7928,
+    7929, 7930, 7958, 7960, 7966, 7968, 8006, 8008, 8013, 8014, 8016, 8024, 8025, 8026, 8027, 8028,
+    8029, 8030, 8031, 8062, 8064, 8117, 8118, 8133, 8134, 8148, 8150, 8156, 8157, 8176, 8178, 8181,
+    8182, 8191, 8192, 8193, 8194, 8195, 8196, 8197, 8198, 8199, 8200, 8201, 8202, 8203, 8208, 8210,
+    8211, 8212, 8214, 8215, 8216, 8218, 8219, 8220, 8221, 8222, 8223, 8224, 8225, 8226, 8227, 8229,
+    8230, 8231, 8232, 8234, 8239, 8240, 8241, 8242, 8243, 8244, 8249, 8251, 8252, 8253, 8260, 8261,
+    8288, 8293, 8294, 8304, 8306, 8308, 8309, 8319, 8320, 8335, 8336, 8349, 8352, 8355, 8356, 8357,
+    8358, 8359, 8360, 8361, 8362, 8363, 8364, 8365, 8369, 8370, 8377, 8378, 8379, 8380, 8381, 8382,
+    8385, 8400, 8433, 8448, 8453, 8454, 8467, 8468, 8470, 8471, 8482, 8483, 8486, 8487, 8494, 8495,
+    8539, 8540, 8541, 8542, 8543, 8588, 8592, 8706, 8707, 8710, 8711, 8719, 8720, 8721, 8722, 8723,
+    8730, 8731, 8734, 8735, 8747, 8748, 8776, 8777, 8800, 8801, 8804, 8805, 8806, 8986, 8988, 9001,
+    9003, 9193, 9197, 9200, 9201, 9203, 9204, 9255, 9280, 9291, 9312, 9674, 9675, 9725, 9727, 9748,
+    9750, 9800, 9812, 9855, 9856, 9875, 9876, 9889, 9890, 9898, 9900, 9917, 9919, 9924, 9926, 9934,
+    9935, 9940, 9941, 9962, 9963, 9970, 9972, 9973, 9974, 9978, 9979, 9981, 9982, 9989, 9990, 9994,
+    9996, 10024, 10025, 10060, 10061, 10062, 10063, 10067, 10070, 10071, 10072, 10133, 10136, 10160, 10161, 10175,
+    10176, 11035, 11037, 11088, 11089, 11093, 11094, 11124, 11126, 11158, 11159, 11503, 11506, 11508, 11513, 11558,
+    11559, 11560, 11565, 11566, 11568, 11624, 11631, 11633, 11647, 11648, 11671, 11680, 11687, 11688, 11695, 11696,
+    11703, 11704, 11711, 11712, 11719, 11720, 11727, 11728, 11735, 11736, 11743, 11744, 11776, 11870, 12330, 12334,
+    12351, 12352, 12441, 12443, 12872, 12880, 19904, 19968, 42192, 42540, 42560, 42607, 42611, 42612, 42622, 42654,
+    42656, 42736, 42738, 42744, 42752, 42955, 42960, 42962, 42963, 42964, 42965, 42970, 42994, 43010, 43011, 43014,
+    43015, 43019, 43020, 43045, 43047, 43052, 43053, 43056, 43066, 43072, 43128, 43136, 43204, 43206, 43214, 43226,
+    43232, 43250, 43263, 43264, 43302, 43310, 43335, 43346, 43348, 43359, 43360, 43392, 43395, 43443, 43444, 43446,
+    43450, 43452, 43454, 43470, 43471, 43482, 43486, 43493, 43494, 43519, 43520, 43561, 43567, 43569, 43571, 43573,
+    43575, 43584, 43587, 43588, 43596, 43597, 43598, 43600, 43610, 43612, 43644, 43645, 43696, 43697, 43698, 43701,
+    43703, 43705, 43710, 43712, 43713, 43714, 43715, 43739, 43756, 43758, 43766, 43767, 43777, 43783, 43785, 43791,
+    43793, 43799, 43808, 43815, 43816, 43823, 43824, 43884, 43888, 44005, 44006, 44008, 44009, 44013, 44014, 44016,
+    44026, 55216, 55239, 55243, 55292, 55296, 60929, 60930, 60931, 63171, 63172, 63744, 64256, 64257, 64258, 64259,
+    64261, 64263, 64275, 64280, 64285, 64286, 64287, 64311, 64312, 64317, 64318, 64319, 64320, 64322, 64323, 64325,
+    64326, 64451, 64467, 64912, 64914, 64968, 64975, 64976, 65008, 65024, 65040, 65056, 65072, 65136, 65141, 65142,
+    65277, 65279, 65280, 65377, 65471, 65474, 65480, 65482, 65488, 65490, 65496, 65498, 65501, 65512, 65519, 65529,
+    65532, 65533, 65534, 65536, 65548, 65549, 65575, 65576, 65595, 65596, 65598, 65599, 65614, 65616, 65630, 65664,
+    65787, 65792, 65795, 65799, 65844, 65847, 65935, 65936, 65949, 65952, 65953, 66000, 66045, 66046, 66176, 66205,
+    66208, 66257, 66272, 66273, 66300, 66304, 66340, 66349, 66379, 66384, 66422, 66427, 66432, 66462, 66463, 66500,
+    66504, 66518, 66560, 66718, 66720, 66730, 66736, 66772, 66776, 66812, 66816, 66856, 66864, 66916, 66927, 66939,
+    66940, 66955, 66956, 66963, 66964, 66966, 66967, 66978, 66979, 66994, 66995, 67002, 67003, 67005, 67072, 67383,
+    67392, 67414, 67424, 67432, 67456, 67462, 67463, 67505, 67506, 67515, 67584, 67590, 67592, 67593, 67594, 67638,
+    67639, 67641, 67644, 67645, 67647, 67670, 67671, 67743, 67751, 67760, 67808, 67827, 67828, 67830, 67835, 67868,
+    67871, 67898, 67903, 67904, 67968, 68024, 68028, 68048, 68050, 68097, 68100, 68101, 68103, 68108, 68112, 68116,
+    68117, 68120, 68121, 68150, 68152, 68155, 68159, 68160, 68169, 68176, 68185, 68192, 68256, 68288, 68325, 68327,
+    68331, 68343, 68352, 68406, 68409, 68438, 68440, 68467, 68472, 68498, 68505, 68509, 68521, 68528, 68608, 68681,
+    68736, 68787, 68800, 68851, 68858, 68900, 68904, 68912, 68922, 69216, 69247, 69248, 69290, 69291, 69293, 69294,
+    69296, 69298, 69376, 69416, 69424, 69446, 69457, 69466, 69488, 69506, 69510, 69514, 69552, 69580, 69600, 69623,
+    69632, 69633, 69634, 69688, 69703, 69710, 69714, 69744, 69745, 69747, 69749, 69750, 69759, 69762, 69811, 69815,
+    69817, 69819, 69821, 69822, 69826, 69827, 69837, 69838, 69840, 69865, 69872, 69882, 69888, 69891, 69927, 69932,
+    69933, 69941, 69942, 69960, 69968, 70003, 70004, 70007, 70016, 70018, 70070, 70079, 70089, 70093, 70095, 70096,
+    70112, 70113, 70133, 70144, 70162, 70163, 70191, 70194, 70196, 70197, 70198, 70200, 70206, 70207, 70272, 70279,
+    70280, 70281, 70282, 70286, 70287, 70302, 70303, 70314, 70320, 70367, 70368, 70371, 70379, 70384, 70394, 70400,
+    70402, 70404, 70405, 70413, 70415, 70417, 70419, 70441, 70442, 70449, 70450, 70452, 70453, 70458, 70459, 70461,
+    70464, 70465, 70469, 70471, 70473, 70475, 70478, 70480, 70481, 70487, 70488, 70493, 70500, 70502, 70509, 70512,
+    70517, 70656, 70712, 70720, 70722, 70725, 70726, 70727, 70748, 70749, 70750, 70751, 70754, 70784, 70835, 70841,
+    70842, 70843, 70847, 70849, 70850, 70852, 70856, 70864, 70874, 71040, 71090, 71094, 71096, 71100, 71102, 71103,
+    71105, 71132, 71134, 71168, 71219, 71227, 71229, 71230, 71231, 71233, 71237, 71248, 71258, 71264, 71277, 71296,
+    71339, 71340, 71341, 71342, 71344, 71350, 71351, 71352, 71354, 71360, 71370, 71424, 71451, 71453, 71456, 71458,
+    71462, 71463, 71468, 71472, 71495, 71680, 71727, 71736, 71737, 71739, 71740, 71840, 71923, 71935, 71943, 71945,
+    71946, 71948, 71956, 71957, 71959, 71960, 71990, 71991, 71993, 71995, 71997, 71998, 71999, 72003, 72004, 72007,
+    72016, 72026, 72096, 72104, 72106, 72148, 72152, 72154, 72156, 72160, 72161, 72165, 72192, 72193, 72203, 72243,
+    72249, 72251, 72255, 72263, 72264, 72272, 72273, 72279, 72281, 72284, 72330, 72343, 72344, 72346, 72355, 72368,
+    72441, 72704, 72713, 72714, 72752, 72759, 72760, 72766, 72767, 72768, 72774, 72784, 72813, 72816, 72848, 72850,
+    72872, 72873, 72874, 72881, 72882, 72884, 72885, 72887, 72960, 72967, 72968, 72970, 72971, 73009, 73015, 73018,
+    73019, 73020, 73022, 73023, 73030, 73031, 73032, 73040, 73050, 73056, 73062, 73063, 73065, 73066, 73103, 73104,
+    73106, 73107, 73109, 73110, 73111, 73112, 73113, 73120, 73130, 73440, 73459, 73461, 73465, 73648, 73649, 73664,
+    73714, 73727, 74650, 74752, 74863, 74864, 74869, 74880, 75076, 77712, 77811, 77824, 78895, 78896, 78905, 82944,
+    83527, 92160, 92729, 92736, 92767, 92768, 92778, 92782, 92863, 92864, 92874, 92880, 92910, 92912, 92917, 92918,
+    92928, 92976, 92983, 92998, 93008, 93018, 93019, 93026, 93027, 93048, 93053, 93072, 93760, 93851, 93952, 94027,
+    94031, 94032, 94088, 94095, 94099, 94112, 94180, 94181, 113664, 113771, 113776, 113789, 113792, 113801, 113808, 113818,
+    113820, 113821, 113823, 113824, 113828, 118528, 118574, 118576, 118599, 118608, 118724, 118784, 119030, 119040, 119079, 119081,
+    119143, 119146, 119155, 119171, 119173, 119180, 119210, 119214, 119275, 119296, 119362, 119365, 119366, 119520, 119540, 119552,
+    119639, 119648, 119673, 119808, 119893, 119894, 119965, 119966, 119968, 119970, 119971, 119973, 119975, 119977, 119981, 119982,
+    119994, 119995, 119996, 119997, 120004, 120005, 120070, 120071, 120075, 120077, 120085, 120086, 120093, 120094, 120122, 120123,
+    120127, 120128, 120133, 120134, 120135, 120138, 120145, 120146, 120486, 120488, 120780, 120782, 121344, 121399, 121403, 121453,
+    121461, 121462, 121476, 121477, 121484, 121499, 121504, 121505, 121520, 122624, 122655, 122880, 122887, 122888, 122905, 122907,
+    122914, 122915, 122917, 122918, 122923, 123136, 123181, 123184, 123191, 123198, 123200, 123210, 123214, 123216, 123536, 123566,
+    123567, 123584, 123628, 123632, 123642, 123647, 123648, 124896, 124903, 124904, 124908, 124909, 124911, 124912, 124927, 124928,
+    125125, 125127, 125136, 125143, 125184, 125252, 125259, 125260, 125264, 125274, 125278, 125280, 126065, 126133, 126209, 126270,
+    126464, 126468, 126469, 126496, 126497, 126499, 126500, 126501, 126503, 126504, 126505, 126515, 126516, 126520, 126521, 126522,
+    126523, 126524, 126530, 126531, 126535, 126536, 126537, 126538, 126539, 126540, 126541, 126544, 126545, 126547, 126548, 126549,
+    126551, 126552, 126553, 126554, 126555, 126556, 126557, 126558, 126559, 126560, 126561, 126563, 126564, 126565, 126567, 126571,
+    126572, 126579, 126580, 126584, 126585, 126589, 126590, 126591, 126592, 126602, 126603, 126620, 126625, 126628, 126629, 126634,
+    126635, 126652, 126704, 126706, 126976, 126980, 126981, 127020, 127024, 127124, 127136, 127151, 127153, 127168, 127169, 127183,
+    127185, 127222, 127232, 127374, 127375, 127377, 127387, 127406, 127462, 127488, 127777, 127789, 127798, 127799, 127869, 127870,
+    127892, 127904, 127947, 127951, 127956, 127968, 127985, 127988, 127989, 127992, 128063, 128064, 128065, 128066, 128253, 128255,
+    128318, 128331, 128335, 128336, 128360, 128378, 128379, 128405, 128407, 128420, 128421, 128507, 128592, 128640, 128710, 128716,
+    128717, 128720, 128723, 128725, 128736, 128747, 128752, 128756, 128768, 128884, 128896, 128985, 129024, 129036, 129040, 129096,
+    129104, 129114, 129120, 129160, 129168, 129198, 129200, 129202, 129280, 129292, 129339, 129340, 129350, 129351, 129536, 129620,
+    129632, 129646, 129792, 129939, 129940, 129995, 130032, 130042,
+]
+
+# advance width of the characters in each range
+RANGE_ADVANCES = [
+    0, 1160, 0, 1160, 507, 1160, 507, 527, 655, 1261, 1150, 1500, 1273, 357, 700, 712,
+    882, 1161, 402, 565, 539, 844, 1150, 496, 433, 1041, 1124, 1070, 967, 1839, 1336, 1275,
+    1333, 1343, 1164, 1132, 1395, 1460, 557, 1130, 1284, 1102, 1788, 1460, 1408, 1292, 1408, 1261,
+    1215, 1222, 1328, 1303, 1817, 1284, 1230, 1226, 543, 840, 543, 856, 924, 633, 1114, 1149,
+    1072, 1155, 1085, 711, 1149, 1128, 497, 489, 1038, 497, 1795, 1130, 1168, 1149, 1164, 693,
+    1056, 669, 1129, 992, 1539, 1015, 969, 1015, 693, 499, 693, 1393, 1160, 507, 499, 1120,
+    1190, 1460, 1075, 491, 1256, 856, 1609, 915, 961, 1134, 565, 1610, 938, 765, 1094, 751,
+    642, 1160, 1001, 534, 507, 751, 931, 960, 1500, 1589, 1593, 969, 1336, 1914, 1333, 1164,
+    557, 1373, 1460, 1408, 1092, 1408, 1328, 1230, 1210, 1218, 1114, 1729, 1072, 1085, 506, 1200,
+    1130, 1168, 1169, 1160, 1129, 969, 1180, 969, 1336, 1114, 1336, 1114, 1336, 1114, 1333, 1072,
+    1333, 1072, 1333, 1072, 1333, 1072, 1343, 1305, 1373, 1223, 1164, 1085, 1164, 1085, 1164, 1085,
+    1164, 1085, 1164, 1085, 1395, 1149, 1395, 1149, 1395, 1149, 1395, 1149, 1460, 1128, 1434, 1158,
+    557, 506, 557, 506, 557, 506, 557, 497, 557, 506, 1687, 986, 1130, 515, 1284, 1038,
+    1139, 1102, 497, 1102, 497, 1102, 647, 1102, 717, 1103, 553, 1460, 1130, 1460, 1130, 1460,
+    1130, 1419, 1160, 1408, 1168, 1408, 1168, 1408, 1168, 1953, 1860, 1261, 693, 1261, 693, 1261,
+    693, 1215, 1056, 1215, 1056, 1215, 1056, 1215, 1056, 1222, 669, 1222, 709, 1222, 669, 1328,
+    1129, 1328, 1129, 1328, 1129, 1328, 1129, 1328, 1129, 1328, 1129, 1817, 1539, 1230, 969, 1230,
+    1226, 1015, 1226, 1015, 1226, 1015, 508, 1160, 1415, 1160, 697, 1160, 1406, 1170, 1160, 1424,
+    1267, 1160, 515, 1160, 1336, 1114, 1914, 1729, 1408, 1160, 1215, 1056, 1222, 669, 1160, 515,
+    1160, 1079, 1160, 409, 1160, 964, 909, 1160, 939, 1160, 874, 497, 685, 554, 966, 764,
+    1160, 602, 1160, 0, 1160, 2048, 1160, 2048, 525, 1035, 1336, 535, 1164, 1460, 557, 2048,
+    1428, 2048, 1330, 1382, 663, 1336, 1275, 1139, 1444, 1164, 1226, 1460, 1393, 557, 1284, 1342,
+    1788, 1460, 1169, 1408, 1461, 1292, 2048, 1169, 1222, 1230, 1467, 1284, 1417, 1362, 557, 1230,
+    1157, 1104, 1160, 663, 1117, 1157, 1213, 1026, 1160, 1104, 1061, 1160, 1166, 663, 1139, 1134,
+    1160, 992, 1004, 1168, 1220, 1160, 1101, 1160, 1068, 1117, 1443, 1015, 1434, 1687, 663, 1117,
+    1168, 1117, 1687, 1160, 1185, 1090, 1160, 1608, 1160, 1164, 1535, 1139, 1380, 1215, 557, 1130,
+    2193, 2212, 1666, 1284, 1460, 1287, 1460, 1336, 1291, 1275, 1139, 1540, 1164, 1859, 1215, 1460,
+    1316, 1449, 1788, 1460, 1408, 1461, 1292, 1333, 1222, 1287, 1580, 1284, 1497, 1402, 1927, 1984,
+    1554, 1771, 1285, 1380, 1831, 1304, 1114, 1132, 1170, 859, 1236, 1085, 1568, 1040, 1182, 1106,
+    1184, 1519, 1181, 1168, 1182, 1149, 1072, 984, 969, 1485, 1015, 1213, 1113, 1656, 1694, 1271,
+    1590, 1112, 1101, 1671, 1124, 1085, 1128, 859, 1101, 1056, 497, 506, 489, 1737, 1764, 1161,
+    1106, 1182, 969, 1182, 1800, 1579, 1285, 1110, 1835, 1528, 1234, 1094, 1803, 1547, 1745, 1505,
+    2308, 2001, 1059, 987, 1417, 1434, 1393, 1163, 1290, 1027, 1290, 1027, 2377, 2137, 1393, 1160,
+    1793, 1572, 1800, 1579, 1330, 1095, 1277, 0, 1545, 1261, 1285, 1110, 1307, 1161, 1123, 912,
+    1139, 859, 1243, 1029, 1954, 1633, 1215, 1040, 1434, 1208, 1289, 1150, 1336, 1063, 1676, 1411,
+    1535, 1241, 1999, 1460, 2097, 1780, 1518, 1235, 1333, 1072, 1222, 984, 1230, 1026, 1230, 1026,
+    1304, 1066, 1836, 1372, 1468, 1174, 1391, 1130, 1391, 1128, 1583, 1213, 1583, 1213, 557, 1859,
+    1568, 1289, 1114, 1534, 1263, 1458, 1160, 1554, 1260, 1402, 1113, 1871, 1598, 557, 1336, 1114,
+    1336, 1114, 1914, 1729, 1164, 1085, 1415, 1079, 1415, 1079, 1859, 1568, 1215, 1040, 1192, 1460,
+    1182, 1460, 1182, 1408, 1168, 1393, 1163, 1393, 1163, 1380, 1101, 1287, 969, 1287, 969, 1287,
+    969, 1402, 1113, 1139, 859, 1771, 1590, 1207, 939, 1326, 1088, 1284, 1015, 1270, 1155, 1684,
+    1764, 1622, 1323, 1097, 1031, 1985, 1653, 2043, 1697, 1270, 1053, 1453, 1312, 1380, 1104, 1538,
+    1266, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160, 0, 1160, 0, 1160, 0,
+    1160, 0, 2048, 1160, 2048, 1160, 2048, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 0,
+    1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 2048, 0, 1160, 0, 1160, 0, 2048,
+    1160, 0, 1160, 2048, 1160, 0, 1160, 2048, 0, 1160, 0, 1160, 0, 1160, 0, 1160,
+    0, 2048, 1160, 2048, 1160, 0, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 2048, 0,
+    1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 0,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160,
+    0, 2048, 1160, 2048, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 2048, 1160,
+    0, 2048, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160,
+    2048, 1160, 2048, 0, 2048, 1160, 0, 2048, 0, 2048, 0, 2048, 0, 2048, 1160, 2048,
+    1160, 2048, 1160, 0, 1160, 0, 1160, 2048, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160,
+    2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160, 0, 2048, 0, 1160, 2048, 1160, 0,
+    2048, 1160, 2048, 1160, 0, 2048, 1160, 2048, 1160, 0, 2048, 0, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160, 0, 1160, 0, 2048,
+    1160, 2048, 1160, 0, 2048, 0, 1160, 2048, 1160, 2048, 1160, 0, 2048, 1160, 2048, 0,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 0, 1160, 2048, 1160, 2048, 1160, 0, 2048, 1160, 2048, 1160,
+    2048, 1160, 2048, 0, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160,
+    0, 1160, 2048, 0, 2048, 0, 2048, 0, 2048, 1160, 2048, 1160, 2048, 1160, 0, 2048,
+    1160, 2048, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160,
+    0, 1160, 2048, 0, 1160, 2048, 1160, 0, 2048, 1160, 2048, 1160, 2048, 1160, 0, 2048,
+    1160, 2048, 1160, 2048, 0, 1160, 2048, 1160, 2048, 1160, 0, 1160, 0, 2048, 1160, 2048,
+    1160, 0, 1160, 2048, 1160, 0, 2048, 1160, 2048, 0, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 0, 2048, 1160, 0, 2048, 0, 2048, 1160, 2048, 1160,
+    2048, 1160, 2048, 1160, 0, 1160, 0, 2048, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048,
+    0, 2048, 1160, 2048, 1160, 2048, 1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 2048,
+    1160, 2048, 0, 1160, 0, 1160, 0, 1160, 0, 2048, 0, 2048, 1160, 0, 1160, 2048,
+    1160, 2048, 1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 0,
+    1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 1160,
+    2048, 1160, 0, 1160, 2048, 1160, 0, 2048, 1160, 2048, 1160, 2048, 0, 2048, 1160, 0,
+    1160, 0, 1160, 0, 1160, 0, 1160, 0, 2048, 1160, 2048, 1160, 2048, 1160, 0, 1160,
+    2048, 1160, 2048, 1160, 0, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160, 0,
+    1160, 2048, 1160, 0, 1160, 0, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160,
+    2048, 1160, 2048, 1160, 0, 1160, 0, 2048, 1160, 0, 1160, 0, 2048, 0, 1160, 0,
+    1160, 0, 1160, 0, 2048, 0, 1160, 2048, 1160, 2048, 1160, 2048, 0, 2048, 0, 1160,
+    0, 1160, 0, 1160, 0, 1160, 0, 1160, 2048, 1160, 0, 1160, 2048, 0, 1160, 0,
+    1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 2048, 1160, 0,
+    1160, 0, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160, 0, 1160, 0,
+    1160, 0, 1160, 0, 1160, 0, 1160, 2048, 1160, 0, 1336, 1114, 1160, 1788, 1795, 1160,
+    1817, 1539, 1817, 1539, 1817, 1539, 1160, 1336, 1114, 1336, 1114, 1336, 1114, 1336, 1114, 1336,
+    1114, 1336, 1114, 1336, 1114, 1336, 1114, 1336, 1114, 1336, 1114, 1336, 1114, 1336, 1114, 1164,
+    1085, 1164, 1085, 1164, 1085, 1164, 1085, 1164, 1085, 1164, 1085, 1164, 1085, 1164, 1085, 557,
+    506, 557, 497, 1408, 1168, 1408, 1168, 1408, 1168, 1408, 1168, 1408, 1168, 1408, 1168, 1408,
+    1168, 1406, 1170, 1406, 1170, 1406, 1170, 1406, 1170, 1406, 1170, 1328, 1129, 1328, 1129, 1424,
+    1267, 1424, 1267, 1424, 1267, 1424, 1267, 1424, 1267, 1230, 969, 1230, 969, 1230, 969, 1230,
+    969, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 1478, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1044, 2089, 1044, 2089, 697, 522, 348, 1151, 560, 418, 209, 0, 564, 1160,
+    1344, 1599, 1160, 933, 409, 407, 409, 724, 731, 705, 1160, 1129, 1167, 690, 1160, 964,
+    1370, 382, 1160, 0, 1160, 1962, 1160, 357, 655, 1160, 614, 1160, 1054, 1160, 931, 1160,
+    0, 2048, 0, 1160, 2048, 751, 1160, 864, 1160, 2048, 1160, 2048, 1160, 1132, 1190, 1160,
+    1621, 1680, 2166, 1515, 1579, 1185, 1150, 1160, 1498, 1160, 1058, 1140, 1160, 1352, 1359, 1160,
+    2048, 0, 2048, 1160, 1511, 1160, 974, 1160, 2106, 1160, 1281, 1160, 1362, 1160, 1303, 1160,
+    1574, 1751, 1743, 1642, 1160, 2048, 1160, 1167, 1160, 1444, 1160, 1422, 1160, 1199, 1170, 1160,
+    1221, 1160, 2106, 1160, 524, 1160, 1154, 1160, 1124, 1160, 1041, 1071, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 1032, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160,
+    2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160, 2048, 0, 2048,
+    1160, 2048, 0, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 1160, 0, 1160, 0,
+    1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 1160, 0,
+    1160, 0, 1160, 0, 1160, 0, 2048, 1160, 2048, 1160, 2048, 1160, 0, 2048, 1160, 2048,
+    0, 1160, 0, 1160, 0, 1160, 0, 1160, 2048, 1160, 2048, 0, 1160, 0, 1160, 0,
+    1160, 0, 1160, 2048, 1160, 2048, 1160, 0, 1160, 2048, 1160, 0, 1160, 0, 1160, 0,
+    2048, 1160, 0, 1160, 0, 1160, 2048, 1160, 2048, 1160, 0, 1160, 0, 1160, 0, 1160,
+    0, 1160, 0, 1160, 0, 1160, 2048, 1160, 0, 1160, 0, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 1160, 0, 1160, 0, 2048, 1160,
+    2048, 1160, 2048, 1160, 2048, 1160, 588, 655, 1160, 515, 1160, 2048, 1160, 1134, 1163, 1748,
+    1160, 2048, 1160, 2048, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 2048, 0, 2048, 1160, 2048, 1160,
+    2048, 0, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0,
+    2099, 2101, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160,
+    2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 2048, 1160, 2048,
+    1160, 2048, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 2048, 0, 2048, 0, 1160, 2048,
+    1160, 2048, 1160, 2048, 0, 2048, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 0, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 0, 1160, 2048, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 0, 1160, 0, 1160, 2048, 1160, 0, 1160, 0, 1160, 2048, 0, 1160, 0, 1160,
+    0, 1160, 0, 1160, 0, 2048, 0, 2048, 1160, 2048, 1160, 2048, 0, 1160, 0, 1160,
+    0, 2048, 1160, 2048, 1160, 0, 1160, 2048, 0, 1160, 0, 1160, 0, 1160, 0, 1160,
+    2048, 1160, 2048, 1160, 2048, 1160, 0, 1160, 0, 1160, 0, 1160, 0, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 1160, 0, 2048, 1160, 2048, 0,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160,
+    0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 2048, 0,
+    2048, 1160, 0, 1160, 0, 1160, 0, 1160, 2048, 1160, 0, 1160, 2048, 1160, 0, 1160,
+    0, 1160, 0, 1160, 0, 1160, 2048, 1160, 2048, 1160, 0, 2048, 1160, 0, 1160, 0,
+    1160, 0, 2048, 1160, 0, 1160, 0, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160,
+    0, 1160, 0, 1160, 0, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160, 0,
+    1160, 0, 2048, 1160, 2048, 1160, 0, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160,
+    2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160, 0, 1160, 0, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 0, 2048, 0, 1160, 0, 1160, 2048, 1160, 0, 1160, 0,
+    1160, 0, 1160, 0, 2048, 1160, 0, 1160, 0, 1160, 0, 1160, 0, 1160, 2048, 1160,
+    2048, 1160, 2048, 1160, 0, 2048, 0, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 0,
+    2048, 1160, 0, 1160, 0, 1160, 0, 2048, 1160, 2048, 1160, 2048, 1160, 0, 2048, 0,
+    2048, 0, 2048, 0, 1160, 0, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0,
+    2048, 1160, 0, 1160, 0, 1160, 2048, 1160, 2048, 1160, 0, 1160, 2048, 1160, 2048, 1160,
+    2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 2048, 1160,
+    2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 0, 1160, 2048,
+    1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    0, 1160, 2048, 0, 1160, 2048, 0, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 0, 1160, 0, 2048, 0, 2048, 0, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160,
+    0, 1160, 0, 1160, 0, 1160, 0, 1160, 2048, 1160, 0, 1160, 2048, 1160, 2048, 1160,
+    2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160,
+    2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160,
+    2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0, 1160, 0, 1160,
+    0, 1160, 0, 1160, 2048, 0, 2048, 0, 2048, 1160, 2048, 0, 2048, 0, 2048, 0,
+    2048, 0, 2048, 0, 2048, 1160, 2048, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 0,
+    2048, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160,
+    2048, 1160, 0, 2048, 1160, 0, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+    1160, 2048, 1160, 2048, 1160, 2048, 1160, 2048,
+]
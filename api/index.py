@@ -1,32 +1,301 @@
+import os
 from datetime import datetime
-from time import gmtime, strftime
+from functools import cache
+from typing import Any, Iterator, Optional
 
-from flask import Flask, render_template, request
-from flask.wrappers import Response
+from flask import Flask, jsonify, render_template, request
+from flask.wrappers import Request, Response
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup
 
+from .breaker import CLOSED, HALF_OPEN, OPEN, upstream_breakers
+from .cache import LRUCache
+from .cache_backends import create_cache
+from .cards import (
+    CardParams,
+    CardReply,
+    RenderedCard,
+    cache_headers,
+    card_cache_key,
+    card_etag,
+    card_headers,
+    card_reply,
+    encoded_etag,
+    error_reply,
+    error_status,
+    is_complete,
+    pack_card,
+    parse_card_params,
+    published_text,
+    rendered_card,
+    revalidated_reply,
+    unpack_card,
+)
+from .compression import compress, negotiate_encoding
+from .config import (
+    CARD_CACHE_MAX_BYTES,
+    CARD_CACHE_TTL,
+    CARD_RENDERER,
+    ERROR_CACHE_MAX_BYTES,
+    STREAM_CARDS,
+    STREAM_CHUNK_SIZE,
+    TEMPLATE_CACHE_DIR,
+    UPSTREAM_DEADLINE,
+)
+from .directories import private_directory
+from .layout import wrap_text
+from .metrics import (
+    METRIC_PREFIX,
+    finish_request,
+    response_bytes,
+    samples_exposition,
+    stage_seconds,
+    start_request,
+    timed,
+    upstream_responses,
+)
+from .renderer import main_fragments, render_main
+from .upstream import http_client
 from .utils import (
     data_uri_from_file,
-    data_uri_from_url,
     estimate_duration_width,
-    fetch_views,
-    format_relative_time,
+    fetch_thumbnail_and_views,
     is_rtl,
     is_rtl_title,
+    missing_videos,
     seconds_to_duration,
-    trim_lines,
-)
-from .validate import (
-    validate_color,
-    validate_int,
-    validate_lang,
-    validate_string,
-    validate_video_id,
+    thumbnail_cache,
+    upstream_calls,
+    views_batcher,
+    views_cache,
 )
 
+
+def template_bytecode_cache(directory: Optional[str]) -> Optional[FileSystemBytecodeCache]:
+    """Create a cache of compiled templates shared across processes and cold starts,
+    returns None if it is disabled or the directory is not private to the current user
+
+    Compiled templates are loaded with marshal, so they are only kept in a directory other
+    users can't write to: Jinja's own directory for the current user unless one is given.
+    """
+    if directory == "":
+        return None
+    try:
+        if directory is None:
+            return FileSystemBytecodeCache()
+        return FileSystemBytecodeCache(private_directory(directory))
+    except (OSError, RuntimeError):
+        # Jinja raises RuntimeError if its own directory is unsafe
+        return None
+
+
 app = Flask(__name__)
 
 # enable jinja2 autoescape for all files including SVG files
 app.jinja_options["autoescape"] = True
+# reuse templates compiled by previous processes
+app.jinja_options["bytecode_cache"] = template_bytecode_cache(TEMPLATE_CACHE_DIR)
+
+# rendered cards with their validators, packed by pack_card, keyed by a digest of their
+# parameters and the relative time bucket of their timestamp
+card_cache = create_cache("cards", max_bytes=CARD_CACHE_MAX_BYTES, ttl=CARD_CACHE_TTL)
+# rendered error cards keyed by status code and message
+error_cache = LRUCache(max_bytes=ERROR_CACHE_MAX_BYTES, ttl=CARD_CACHE_TTL)
+
+# marks where the thumbnail goes in a streamed card, which can't appear in escaped user input
+THUMBNAIL_PLACEHOLDER = Markup("<thumbnail>")
+
+# cache statistics exposed in /metrics with their names, types and descriptions
+CACHE_METRICS = {
+    "hits": ("hits_total", "counter", "Lookups which found an entry in each cache"),
+    "misses": ("misses_total", "counter", "Lookups which found no entry in each cache"),
+    "evictions": ("evictions_total", "counter", "Entries evicted from each cache for room"),
+    "entries": ("entries", "gauge", "Entries in each cache"),
+    "bytes": ("bytes", "gauge", "Size of the entries in each cache"),
+}
+
+# values of the states of circuit breakers in /metrics
+BREAKER_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# font size of titles in main.svg
+TITLE_FONT_SIZE = 15
+# font size of durations in main.svg
+DURATION_FONT_SIZE = 13
+
+ERROR_THUMBNAIL_PATH = os.path.join(
+    os.path.dirname(__file__), "templates", "resources", "error.jpg"
+)
+
+
+@cache
+def error_thumbnail() -> str:
+    """Get the data URI of the thumbnail of error cards, encoded once on the first error
+    since it is the same for every error card
+    """
+    return data_uri_from_file(ERROR_THUMBNAIL_PATH)
+
+
+def encode_card(card: RenderedCard, encoding: Optional[str], key: Optional[str]) -> RenderedCard:
+    """Get a card compressed with an encoding, with an ETag of its own, or the card itself if
+    the encoding is None
+
+    Compressed cards are cached alongside the card under its key, so each card is compressed
+    once per encoding. Cards which are not cached are given no key and compressed every time.
+    """
+    if encoding is None:
+        return card
+    etag = encoded_etag(card.etag, encoding)
+    variant_key = None if key is None else f"{key}:{encoding}"
+    if variant_key is not None:
+        cached = card_cache.get(variant_key)
+        encoded = None if cached is None else unpack_card(cached)
+        # a compressed card cached for an earlier rendering of the card is compressed again
+        if encoded is not None and encoded.etag == etag:
+            return encoded
+    with timed("compress"):
+        encoded = RenderedCard(compress(card.body, encoding), etag, card.last_modified)
+    if variant_key is not None:
+        card_cache.set(variant_key, pack_card(encoded))
+    return encoded
+
+
+def generate_card(
+    params: CardParams, thumbnail: str, views: str, published: Optional[str] = None
+) -> Iterator[bytes]:
+    """Render the card of a video in chunks of at most STREAM_CHUNK_SIZE characters
+
+    The template is rendered with a placeholder for the thumbnail, which is then written
+    in slices of the data URI, so the card is never held in memory as a whole.
+    """
+    context = card_context(params, THUMBNAIL_PLACEHOLDER, views, published)
+    if CARD_RENDERER == "jinja":
+        pieces = app.jinja_env.get_template("main.svg").generate(**context)
+    else:
+        pieces = iter(main_fragments(**context))
+    buffer: list[str] = []
+    buffered = 0
+    for piece in pieces:
+        before, placeholder, after = piece.partition(THUMBNAIL_PLACEHOLDER)
+        buffer.append(before)
+        buffered += len(before)
+        if placeholder:
+            yield "".join(buffer).encode("utf-8")
+            for start in range(0, len(thumbnail), STREAM_CHUNK_SIZE):
+                yield thumbnail[start : start + STREAM_CHUNK_SIZE].encode("ascii")
+            buffer, buffered = [after], len(after)
+        elif buffered >= STREAM_CHUNK_SIZE:
+            yield "".join(buffer).encode("utf-8")
+            buffer, buffered = [], 0
+    yield "".join(buffer).encode("utf-8")
+
+
+def build_card(
+    params: CardParams, thumbnail: str, views: str, published: Optional[str] = None
+) -> str:
+    """Render the card of a video from its thumbnail data URI, formatted view count and
+    relative publish time, which is formatted from the request unless it is given
+    """
+    with timed("format"):
+        context = card_context(params, thumbnail, views, published)
+    with timed("render"):
+        if CARD_RENDERER == "jinja":
+            return render_template("main.svg", **context)
+        return render_main(**context)
+
+
+def card_context(
+    params: CardParams, thumbnail: str, views: str, published: Optional[str] = None
+) -> dict[str, Any]:
+    """Get the variables for the card template of a video"""
+    title_lines = [
+        line.text
+        for line in wrap_text(
+            params.title, params.width - 20, params.max_title_lines, font_size=TITLE_FONT_SIZE
+        )
+    ]
+    diff = published_text(params) if published is None else published
+    stats = f"{views}\u2002•\u2002{diff}" if views and diff else (views or diff)
+    duration = seconds_to_duration(params.duration_seconds)
+    duration_width = estimate_duration_width(duration, font_size=DURATION_FONT_SIZE)
+    thumbnail_height = round(params.width * 0.56)
+    title_line_height = 20
+    title_height = len(title_lines) * title_line_height
+    height = thumbnail_height + title_height + 60
+    return dict(
+        width=params.width,
+        height=height,
+        title_line_height=title_line_height,
+        title_height=title_height,
+        background_color=params.background_color,
+        title_color=params.title_color,
+        stats_color=params.stats_color,
+        title_lines=title_lines,
+        stats=stats,
+        thumbnail=thumbnail,
+        duration=duration,
+        duration_width=duration_width,
+        border_radius=params.border_radius,
+        rtl=is_rtl(params.lang),
+        rtl_title=is_rtl_title("".join(title_lines)),
+        reduced_bandwidth=True,
+    )
+
+
+def render_error_card(status: int, message: str) -> bytes:
+    """Render an error card, reusing the cached card for repeated errors"""
+    key = (status, message)
+    card = error_cache.get(key)
+    if card is None:
+        card = render_template(
+            "error.svg",
+            message=message,
+            code=status,
+            thumbnail=error_thumbnail(),
+            reduced_bandwidth=True,
+        ).encode("utf-8")
+        error_cache.set(key, card)
+    return card
+
+
+def serve_card(req: Request) -> CardReply:
+    """Get the reply to a request for a card, which is only rendered if it is not cached and
+    the request doesn't have it already
+
+    Raises:
+        ValidationError: If the query parameters are invalid
+        UpstreamError: If the thumbnail cannot be fetched
+    """
+    with timed("validate"):
+        params = parse_card_params(req)
+    # formatted once, so the cache key and ETag of the card follow the text it shows
+    published = published_text(params)
+    with timed("cache"):
+        key = card_cache_key(params, published)
+        cached = card_cache.get(key)
+        card = None if cached is None else unpack_card(cached)
+    # streamed cards are sent uncompressed
+    encoding = None if card is None and STREAM_CARDS else negotiate_encoding(req.accept_encodings)
+    cacheable = True
+    if card is None:
+        thumbnail, views = fetch_thumbnail_and_views(
+            params.video_id, params.width, params.lang, timeout=UPSTREAM_DEADLINE
+        )
+        cacheable = is_complete(thumbnail, views)
+        # a view count which could not be fetched is left out of the card
+        views = views or ""
+        etag = card_etag(key, thumbnail, views, published)
+        revalidated = revalidated_reply(req.environ, etag, encoding)
+        if revalidated is not None:
+            return revalidated
+        if STREAM_CARDS:
+            body = generate_card(params, thumbnail, views, published)
+            return CardReply(200, card_headers(etag), body)
+        body = build_card(params, thumbnail, views, published).encode("utf-8")
+        card = rendered_card(body, etag)
+        if cacheable:
+            card_cache.set(key, pack_card(card))
+    card = encode_card(card, encoding, key if cacheable else None)
+    return card_reply(req.environ, card, encoding)
 
 
 @app.route("/")
@@ -35,75 +304,109 @@ def render():
         if "id" not in request.args:
             now = datetime.utcnow()
             return Response(response=render_template("index.html", now=now))
-        video_id = validate_video_id(request, "id")
-        width = validate_int(request, "width", default=250)
-        border_radius = validate_int(request, "border_radius", default=5)
-        background_color = validate_color(request, "background_color", default="#0d1117")
-        title_color = validate_color(request, "title_color", default="#ffffff")
-        stats_color = validate_color(request, "stats_color", default="#dedede")
-        title = validate_string(request, "title", default="")
-        max_title_lines = validate_int(request, "max_title_lines", default=1)
-        title_lines = trim_lines(title, (width - 20) // 8, max_title_lines)
-        publish_timestamp = validate_int(request, "timestamp", default=0)
-        duration_seconds = validate_int(request, "duration", default=0)
-        lang = validate_lang(request, "lang", default="en")
-        thumbnail = data_uri_from_url(f"https://i.ytimg.com/vi/{video_id}/mqdefault.jpg")
-        views = fetch_views(video_id, lang)
-        diff = format_relative_time(publish_timestamp, lang) if publish_timestamp else ""
-        stats = f"{views}\u2002•\u2002{diff}" if views and diff else (views or diff)
-        duration = seconds_to_duration(duration_seconds)
-        duration_width = estimate_duration_width(duration)
-        thumbnail_height = round(width * 0.56)
-        title_line_height = 20
-        title_height = len(title_lines) * title_line_height
-        height = thumbnail_height + title_height + 60
-        response = Response(
-            response=render_template(
-                "main.svg",
-                width=width,
-                height=height,
-                title_line_height=title_line_height,
-                title_height=title_height,
-                background_color=background_color,
-                title_color=title_color,
-                stats_color=stats_color,
-                title_lines=title_lines,
-                stats=stats,
-                thumbnail=thumbnail,
-                duration=duration,
-                duration_width=duration_width,
-                border_radius=border_radius,
-                rtl=is_rtl(lang),
-                rtl_title=is_rtl_title("".join(title_lines)),
-                reduced_bandwidth=True,
-            ),
-            status=200,
-            mimetype="image/svg+xml",
-        )
-        response.headers["Content-Type"] = "image/svg+xml; charset=utf-8"
-        return response
+        start_request()
+        reply = serve_card(request)
     except Exception as e:
-        status = getattr(e, "status", 500)
-        thumbnail = data_uri_from_file("./api/templates/resources/error.jpg")
-        return Response(
-            response=render_template(
-                "error.svg",
-                message=str(e),
-                code=status,
-                thumbnail=thumbnail,
-                reduced_bandwidth=True,
-            ),
-            status=status,
-            mimetype="image/svg+xml",
+        status = error_status(e)
+        reply = error_reply(status, render_error_card(status, str(e)))
+    return Response(response=reply.body, status=reply.status, headers=reply.headers)
+
+
+@app.route("/stats")
+def stats():
+    """Serve the counters of the caches and the state of the upstream servers as JSON"""
+    response = jsonify(collect_stats())
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+def collect_stats() -> dict[str, Any]:
+    """Get the counters of the caches, the upstream connections and the circuit breakers"""
+    connections = http_client.stats()
+    breakers = upstream_breakers.stats()
+    return {
+        "caches": {
+            "thumbnails": thumbnail_cache.stats(),
+            "views": views_cache.stats(),
+            "cards": card_cache.stats(),
+            "errors": error_cache.stats(),
+            "missing_videos": missing_videos.stats(),
+        },
+        "upstream_calls": upstream_calls.stats(),
+        "views_batches": views_batcher.stats(),
+        "upstreams": {
+            host: {"connections": connections.get(host, {}), "breaker": breakers.get(host, {})}
+            for host in sorted(connections.keys() | breakers.keys())
+        },
+    }
+
+
+@app.route("/metrics")
+def metrics():
+    """Serve the timings, upstream responses and cache counters in the Prometheus text format"""
+    response = Response(response=collect_metrics(), mimetype="text/plain")
+    response.headers["Content-Type"] = "text/plain; version=0.0.4; charset=utf-8"
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+def collect_metrics() -> str:
+    """Get the metrics of this process in the Prometheus text format"""
+    current = collect_stats()
+    caches = current["caches"]
+    cache_labels = {(name,): counters for name, counters in caches.items()}
+    breakers = {
+        (host,): BREAKER_STATE_VALUES[upstream["breaker"]["state"]]
+        for host, upstream in current["upstreams"].items()
+        if upstream["breaker"]
+    }
+    lines = [
+        *stage_seconds.exposition(),
+        *response_bytes.exposition(),
+        *upstream_responses.exposition(),
+    ]
+    for stat, (name, metric_type, description) in CACHE_METRICS.items():
+        lines += samples_exposition(
+            f"{METRIC_PREFIX}_cache_{name}",
+            description,
+            metric_type,
+            ("cache",),
+            {cache: counters[stat] for cache, counters in cache_labels.items() if stat in counters},
         )
+    lines += samples_exposition(
+        f"{METRIC_PREFIX}_cache_hit_ratio",
+        "Share of cache lookups which were hits",
+        "gauge",
+        ("cache",),
+        {name: hit_ratio(counters) for name, counters in cache_labels.items()},
+    )
+    lines += samples_exposition(
+        f"{METRIC_PREFIX}_upstream_breaker_state",
+        "State of the circuit breaker of each upstream host (0 closed, 1 half open, 2 open)",
+        "gauge",
+        ("host",),
+        breakers,
+    )
+    return "\n".join(lines) + "\n"
+
+
+def hit_ratio(counters: dict[str, Any]) -> float:
+    """Get the share of lookups in a cache which were hits, 0 before the first lookup"""
+    lookups = counters["hits"] + counters["misses"]
+    return counters["hits"] / lookups if lookups else 0
 
 
 @app.after_request
 def add_header(r):
-    """Add headers to cache the response no longer than an hour."""
-    r.headers["Expires"] = strftime(
-        "%a, %d %b %Y %H:%M:%S GMT", gmtime(datetime.now().timestamp() + 3600)
-    )
-    r.headers["Last-Modified"] = strftime("%a, %d %b %Y %H:%M:%S GMT", gmtime())
-    r.headers["Cache-Control"] = "public, max-age=3600"
+    """Add headers to cache the response no longer than an hour, unless it sets its own.
+
+    Card responses also get the durations of their stages in a Server-Timing header.
+    """
+    if "Cache-Control" not in r.headers:
+        r.headers.update(cache_headers())
+    timings = finish_request()
+    if timings is not None:
+        r.headers["Server-Timing"] = timings.server_timing()
+        if not r.is_streamed:
+            response_bytes.observe(str(r.status_code), r.content_length or 0)
     return r
@@ -0,0 +1,100 @@
+"""Measure and wrap text by its width in the card font
+
+Widths come from the advance widths of Roboto compiled into ``api.glyph_table`` by
+``python -m api.compile_glyphs``, so titles are wrapped by the space they take rather
+than by their number of characters.
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import NamedTuple
+
+from .glyph_table import RANGE_ADVANCES, RANGE_STARTS, UNITS_PER_EM
+
+ELLIPSIS = "…"
+
+# advance widths of the most common characters, looked up without a binary search
+COMMON_ADVANCES = [
+    RANGE_ADVANCES[bisect_right(RANGE_STARTS, code_point) - 1] for code_point in range(0x250)
+]
+
+
+class TextLine(NamedTuple):
+    text: str
+    # width of the line in pixels
+    width: float
+
+
+@lru_cache(maxsize=4096)
+def range_advance(code_point: int) -> int:
+    """Get the advance width of a code point from the range containing it"""
+    return RANGE_ADVANCES[bisect_right(RANGE_STARTS, code_point) - 1]
+
+
+def advance(char: str) -> int:
+    """Get the advance width of a character in font units"""
+    code_point = ord(char)
+    if code_point < len(COMMON_ADVANCES):
+        return COMMON_ADVANCES[code_point]
+    return range_advance(code_point)
+
+
+def measure_text(text: str, font_size: float) -> float:
+    """Get the width of text in pixels at a font size"""
+    return sum(map(advance, text)) * font_size / UNITS_PER_EM
+
+
+def wrap_text(text: str, max_width: float, max_lines: int, *, font_size: float) -> list[TextLine]:
+    """Wrap text into lines no wider than max_width pixels, adding an ellipsis if it is trimmed
+
+    Lines are broken at spaces and after wide characters such as CJK ideographs.
+    Words wider than a line are broken anywhere. Runs of whitespace are collapsed,
+    as they are when the SVG is rendered.
+    """
+    text = " ".join(text.split())
+    limit = max_width * UNITS_PER_EM / font_size
+    lines: list[TextLine] = []
+    if max_lines <= 0:
+        return lines
+    # start of the current line and its width so far in font units
+    start, width = 0, 0
+    # where the current line can end, its width there, and where the next line starts
+    break_end = resume = -1
+    break_width = resume_width = 0
+    common, common_end = COMMON_ADVANCES, len(COMMON_ADVANCES)
+    for i, char in enumerate(text):
+        code_point = ord(char)
+        char_width = common[code_point] if code_point < common_end else range_advance(code_point)
+        if code_point == 0x20:
+            break_end, break_width = i, width
+            resume, resume_width = i + 1, width + char_width
+        if width + char_width > limit and i > start:
+            if break_end <= start:
+                # no break opportunity, so break the word before this character
+                break_end = resume = i
+                break_width = resume_width = width
+            if len(lines) == max_lines - 1:
+                lines.append(trim_line(text[start:break_end], break_width, limit, font_size))
+                return lines
+            lines.append(TextLine(text[start:break_end], break_width * font_size / UNITS_PER_EM))
+            start, width = resume, width - resume_width
+            break_end = -1
+        width += char_width
+        if char_width == UNITS_PER_EM and code_point >= 0x1100:
+            break_end = resume = i + 1
+            break_width = resume_width = width
+    if start < len(text):
+        lines.append(TextLine(text[start:], width * font_size / UNITS_PER_EM))
+    return lines
+
+
+def trim_line(text: str, width: int, limit: float, font_size: float) -> TextLine:
+    """Trim the end of a line of the given width in font units so that an ellipsis fits"""
+    width += advance(ELLIPSIS)
+    end = len(text)
+    while end > 0 and width > limit:
+        end -= 1
+        width -= advance(text[end])
+    trimmed = text[:end].rstrip()
+    width -= sum(map(advance, text[len(trimmed) : end]))
+    return TextLine(trimmed + ELLIPSIS, width * font_size / UNITS_PER_EM)
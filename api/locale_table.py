@@ -0,0 +1,1530 @@
+"""Translations and Babel data of the locales in api/locale
+
+Generated by ``python -m api.compile_locales``, do not edit.
+"""
+
+# flake8: noqa
+# fmt: off
+
+from .plural import cldr_modulo as MOD, in_range_list as IN
+
+TRANSLATIONS = {'ar': {'direction': 'rtl', 'view': '1 مشاهدة', 'views': '%{number} مشاهدة'},
+ 'bn': {'view': '1 বার দেখা হয়েছে', 'views': '%{number} বার দেখা হয়েছে'},
+ 'de': {'view': '1 Aufruf', 'views': '%{number} Aufrufe'},
+ 'en': {'view': '1 view', 'views': '%{number} views'},
+ 'es': {'view': '1 vista', 'views': '%{number} vistas'},
+ 'fa': {'direction': 'rtl', 'view': '1 بازدید', 'views': '%{number} بازدید'},
+ 'fr': {'view': '1 vue', 'views': '%{number} vues'},
+ 'he': {'direction': 'rtl', 'view': '1 צפייה', 'views': '%{number} צפיות'},
+ 'hi': {'view': '1 बार देखा गया', 'views': '%{number} बार देखा गया'},
+ 'hu': {'view': '1 megtekintés', 'views': '%{number} megtekintés'},
+ 'id': {'view': '1 ditonton', 'views': '%{number} ditonton'},
+ 'it': {'view': '1 visualizzazione', 'views': '%{number} visualizzazioni'},
+ 'ja': {'view': '1 回視聴', 'views': '%{number} 回視聴'},
+ 'ko': {'view': '조회수 1회', 'views': '조회수 %{number}회'},
+ 'mi': {'view': '1 tirohanga', 'views': '%{number} tirohanga'},
+ 'pl': {'view': '1 wyświetlenie', 'views': '%{number} wyświetleń'},
+ 'pt': {'view': '1 visualização', 'views': '%{number} visualizações'},
+ 'sv': {'view': '1 visning', 'views': '%{number} visningar'},
+ 'ur': {'direction': 'rtl', 'view': '1 ملاحظة', 'views': '%{number} ملاحظات'}}
+
+
+NUMBER_SYMBOLS = {'ar': ('.', ','),
+ 'bn': ('.', ','),
+ 'de': (',', '.'),
+ 'en': ('.', ','),
+ 'es': (',', '.'),
+ 'fa': ('.', ','),
+ 'fr': (',', '\u202f'),
+ 'he': ('.', ','),
+ 'hi': ('.', ','),
+ 'hu': (',', '\xa0'),
+ 'id': (',', '.'),
+ 'it': (',', '.'),
+ 'ja': ('.', ','),
+ 'ko': ('.', ','),
+ 'mi': ('.', ','),
+ 'pl': (',', '\xa0'),
+ 'pt': (',', '.'),
+ 'sv': (',', '\xa0'),
+ 'ur': ('.', ',')}
+
+
+DECIMAL_FORMATS = {'ar': ('', '', 1, 0, 3, 3, 3),
+ 'bn': ('', '', 1, 0, 3, 3, 2),
+ 'de': ('', '', 1, 0, 3, 3, 3),
+ 'en': ('', '', 1, 0, 3, 3, 3),
+ 'es': ('', '', 1, 0, 3, 3, 3),
+ 'fa': ('', '', 1, 0, 3, 3, 3),
+ 'fr': ('', '', 1, 0, 3, 3, 3),
+ 'he': ('', '', 1, 0, 3, 3, 3),
+ 'hi': ('', '', 1, 0, 3, 3, 2),
+ 'hu': ('', '', 1, 0, 3, 3, 3),
+ 'id': ('', '', 1, 0, 3, 3, 3),
+ 'it': ('', '', 1, 0, 3, 3, 3),
+ 'ja': ('', '', 1, 0, 3, 3, 3),
+ 'ko': ('', '', 1, 0, 3, 3, 3),
+ 'mi': ('', '', 1, 0, 3, 3, 3),
+ 'pl': ('', '', 1, 0, 3, 3, 3),
+ 'pt': ('', '', 1, 0, 3, 3, 3),
+ 'sv': ('', '', 1, 0, 3, 3, 3),
+ 'ur': ('', '', 1, 0, 3, 3, 3)}
+
+
+COMPACT_FORMATS = {'ar': [(100000000000000,
+         1000000000000,
+         {'few': ('', '\xa0ترليون', 3, 0, 0, 1000, 1000),
+          'many': ('', '\xa0ترليون', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0ترليون', 3, 0, 0, 1000, 1000),
+          'two': ('', '\xa0ترليون', 3, 0, 0, 1000, 1000),
+          'zero': ('', '\xa0ترليون', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ترليون', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'few': ('', '\xa0ترليون', 2, 0, 0, 1000, 1000),
+          'many': ('', '\xa0ترليون', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0ترليون', 2, 0, 0, 1000, 1000),
+          'two': ('', '\xa0ترليون', 2, 0, 0, 1000, 1000),
+          'zero': ('', '\xa0ترليون', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ترليون', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         1000000000000,
+         {'few': ('', '\xa0ترليون', 1, 0, 0, 1000, 1000),
+          'many': ('', '\xa0ترليون', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0ترليون', 1, 0, 0, 1000, 1000),
+          'two': ('', '\xa0ترليون', 1, 0, 0, 1000, 1000),
+          'zero': ('', '\xa0ترليون', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ترليون', 1, 0, 0, 1000, 1000)}),
+        (100000000000,
+         1000000000,
+         {'few': ('', '\xa0مليار', 3, 0, 0, 1000, 1000),
+          'many': ('', '\xa0مليار', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0مليار', 3, 0, 0, 1000, 1000),
+          'two': ('', '\xa0مليار', 3, 0, 0, 1000, 1000),
+          'zero': ('', '\xa0مليار', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0مليار', 3, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'few': ('', '\xa0مليار', 2, 0, 0, 1000, 1000),
+          'many': ('', '\xa0مليار', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0مليار', 2, 0, 0, 1000, 1000),
+          'two': ('', '\xa0مليار', 2, 0, 0, 1000, 1000),
+          'zero': ('', '\xa0مليار', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0مليار', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000000,
+         {'few': ('', '\xa0مليار', 1, 0, 0, 1000, 1000),
+          'many': ('', '\xa0مليار', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0مليار', 1, 0, 0, 1000, 1000),
+          'two': ('', '\xa0مليار', 1, 0, 0, 1000, 1000),
+          'zero': ('', '\xa0مليار', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0مليار', 1, 0, 0, 1000, 1000)}),
+        (100000000,
+         1000000,
+         {'few': ('', '\xa0مليون', 3, 0, 0, 1000, 1000),
+          'many': ('', '\xa0مليون', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0مليون', 3, 0, 0, 1000, 1000),
+          'two': ('', '\xa0مليون', 3, 0, 0, 1000, 1000),
+          'zero': ('', '\xa0مليون', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0مليون', 3, 0, 0, 1000, 1000)}),
+        (10000000,
+         1000000,
+         {'few': ('', '\xa0مليون', 2, 0, 0, 1000, 1000),
+          'many': ('', '\xa0مليون', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0مليون', 2, 0, 0, 1000, 1000),
+          'two': ('', '\xa0مليون', 2, 0, 0, 1000, 1000),
+          'zero': ('', '\xa0مليون', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0مليون', 2, 0, 0, 1000, 1000)}),
+        (1000000,
+         1000000,
+         {'few': ('', '\xa0مليون', 1, 0, 0, 1000, 1000),
+          'many': ('', '\xa0مليون', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0مليون', 1, 0, 0, 1000, 1000),
+          'two': ('', '\xa0مليون', 1, 0, 0, 1000, 1000),
+          'zero': ('', '\xa0مليون', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0مليون', 1, 0, 0, 1000, 1000)}),
+        (100000,
+         1000,
+         {'few': ('', '\xa0ألف', 3, 0, 0, 1000, 1000),
+          'many': ('', '\xa0ألف', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0ألف', 3, 0, 0, 1000, 1000),
+          'two': ('', '\xa0ألف', 3, 0, 0, 1000, 1000),
+          'zero': ('', '\xa0ألف', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ألف', 3, 0, 0, 1000, 1000)}),
+        (10000,
+         1000,
+         {'few': ('', '\xa0ألف', 2, 0, 0, 1000, 1000),
+          'many': ('', '\xa0ألف', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0ألف', 2, 0, 0, 1000, 1000),
+          'two': ('', '\xa0ألف', 2, 0, 0, 1000, 1000),
+          'zero': ('', '\xa0ألف', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ألف', 2, 0, 0, 1000, 1000)}),
+        (1000,
+         1000,
+         {'few': ('', '\xa0آلاف', 1, 0, 0, 1000, 1000),
+          'many': ('', '\xa0ألف', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0ألف', 1, 0, 0, 1000, 1000),
+          'two': ('', '\xa0ألف', 1, 0, 0, 1000, 1000),
+          'zero': ('', '\xa0ألف', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ألف', 1, 0, 0, 1000, 1000)})],
+ 'bn': [(100000000000000,
+         1000000000000,
+         {'one': ('', '\xa0লা.কো.', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0লা.কো.', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'one': ('', '\xa0লা.কো.', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0লা.কো.', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         1000000000000,
+         {'one': ('', '\xa0লা.কো.', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0লা.কো.', 1, 0, 0, 1000, 1000)}),
+        (100000000000,
+         1000000000,
+         {'one': ('', 'কো', 3, 0, 0, 1000, 1000), 'other': ('', 'কো', 3, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'one': ('', '\xa0শত\xa0কো', 2, 0, 0, 1000, 1000),
+          'other': ('', 'শত\xa0কো', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         10000000,
+         {'one': ('', '\xa0কো', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0কো', 3, 0, 0, 1000, 1000)}),
+        (100000000,
+         10000000,
+         {'one': ('', '\xa0কো', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0কো', 2, 0, 0, 1000, 1000)}),
+        (10000000,
+         10000000,
+         {'one': ('', '\xa0কো', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0কো', 1, 0, 0, 1000, 1000)}),
+        (1000000,
+         100000,
+         {'one': ('', '\xa0লা', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0লা', 2, 0, 0, 1000, 1000)}),
+        (100000,
+         100000,
+         {'one': ('', '\xa0লা', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0লা', 1, 0, 0, 1000, 1000)}),
+        (10000,
+         1000,
+         {'one': ('', '\xa0হা', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0হা', 2, 0, 0, 1000, 1000)}),
+        (1000,
+         1000,
+         {'one': ('', '\xa0হা', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0হা', 1, 0, 0, 1000, 1000)})],
+ 'de': [(100000000000000,
+         1000000000000,
+         {'one': ('', '\xa0Bio.', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Bio.', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'one': ('', '\xa0Bio.', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Bio.', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         1000000000000,
+         {'one': ('', '\xa0Bio.', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Bio.', 1, 0, 0, 1000, 1000)}),
+        (100000000000,
+         1000000000,
+         {'one': ('', '\xa0Mrd.', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mrd.', 3, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'one': ('', '\xa0Mrd.', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mrd.', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000000,
+         {'one': ('', '\xa0Mrd.', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mrd.', 1, 0, 0, 1000, 1000)}),
+        (100000000,
+         1000000,
+         {'one': ('', '\xa0Mio.', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mio.', 3, 0, 0, 1000, 1000)}),
+        (10000000,
+         1000000,
+         {'one': ('', '\xa0Mio.', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mio.', 2, 0, 0, 1000, 1000)}),
+        (1000000,
+         1000000,
+         {'one': ('', '\xa0Mio.', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mio.', 1, 0, 0, 1000, 1000)}),
+        (100000,
+         None,
+         {'one': ('', '', 1, 0, 0, 1000, 1000), 'other': ('', '', 1, 0, 0, 1000, 1000)}),
+        (10000,
+         None,
+         {'one': ('', '', 1, 0, 0, 1000, 1000), 'other': ('', '', 1, 0, 0, 1000, 1000)}),
+        (1000,
+         None,
+         {'one': ('', '', 1, 0, 0, 1000, 1000), 'other': ('', '', 1, 0, 0, 1000, 1000)})],
+ 'en': [(100000000000000,
+         1000000000000,
+         {'one': ('', 'T', 3, 0, 0, 1000, 1000), 'other': ('', 'T', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'one': ('', 'T', 2, 0, 0, 1000, 1000), 'other': ('', 'T', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         1000000000000,
+         {'one': ('', 'T', 1, 0, 0, 1000, 1000), 'other': ('', 'T', 1, 0, 0, 1000, 1000)}),
+        (100000000000,
+         1000000000,
+         {'one': ('', 'B', 3, 0, 0, 1000, 1000), 'other': ('', 'B', 3, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'one': ('', 'B', 2, 0, 0, 1000, 1000), 'other': ('', 'B', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000000,
+         {'one': ('', 'B', 1, 0, 0, 1000, 1000), 'other': ('', 'B', 1, 0, 0, 1000, 1000)}),
+        (100000000,
+         1000000,
+         {'one': ('', 'M', 3, 0, 0, 1000, 1000), 'other': ('', 'M', 3, 0, 0, 1000, 1000)}),
+        (10000000,
+         1000000,
+         {'one': ('', 'M', 2, 0, 0, 1000, 1000), 'other': ('', 'M', 2, 0, 0, 1000, 1000)}),
+        (1000000,
+         1000000,
+         {'one': ('', 'M', 1, 0, 0, 1000, 1000), 'other': ('', 'M', 1, 0, 0, 1000, 1000)}),
+        (100000,
+         1000,
+         {'one': ('', 'K', 3, 0, 0, 1000, 1000), 'other': ('', 'K', 3, 0, 0, 1000, 1000)}),
+        (10000,
+         1000,
+         {'one': ('', 'K', 2, 0, 0, 1000, 1000), 'other': ('', 'K', 2, 0, 0, 1000, 1000)}),
+        (1000,
+         1000,
+         {'one': ('', 'K', 1, 0, 0, 1000, 1000), 'other': ('', 'K', 1, 0, 0, 1000, 1000)})],
+ 'es': [(100000000000000,
+         1000000000000,
+         {'many': ('', '\xa0B', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0B', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0B', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'many': ('', '\xa0B', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0B', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0B', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         1000000000000,
+         {'many': ('', '\xa0B', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0B', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0B', 1, 0, 0, 1000, 1000)}),
+        (100000000000,
+         1000000000,
+         {'many': ('', '\xa0mil\xa0M', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mil\xa0M', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mil\xa0M', 3, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'many': ('', '\xa0mil\xa0M', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mil\xa0M', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mil\xa0M', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000,
+         {'many': ('', '\xa0M', 4, 0, 0, 1000, 1000),
+          'one': ('', '\xa0M', 4, 0, 0, 1000, 1000),
+          'other': ('', '\xa0M', 4, 0, 0, 1000, 1000)}),
+        (100000000,
+         1000000,
+         {'many': ('', '\xa0M', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0M', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0M', 3, 0, 0, 1000, 1000)}),
+        (10000000,
+         1000000,
+         {'many': ('', '\xa0M', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0M', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0M', 2, 0, 0, 1000, 1000)}),
+        (1000000,
+         1000000,
+         {'many': ('', '\xa0M', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0M', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0M', 1, 0, 0, 1000, 1000)}),
+        (100000,
+         1000,
+         {'many': ('', '\xa0mil', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mil', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mil', 3, 0, 0, 1000, 1000)}),
+        (10000,
+         1000,
+         {'many': ('', '\xa0mil', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mil', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mil', 2, 0, 0, 1000, 1000)}),
+        (1000,
+         1000,
+         {'many': ('', '\xa0mil', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mil', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mil', 1, 0, 0, 1000, 1000)})],
+ 'fa': [(100000000000000,
+         1000000000000,
+         {'one': ('', '\xa0تریلیون', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0تریلیون', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'one': ('', '\xa0تریلیون', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0تریلیون', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         1000000000000,
+         {'one': ('', '\xa0تریلیون', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0تریلیون', 1, 0, 0, 1000, 1000)}),
+        (100000000000,
+         1000000000,
+         {'one': ('', '\xa0میلیارد', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0میلیارد', 3, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'one': ('', '\xa0میلیارد', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0میلیارد', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000000,
+         {'one': ('', '\xa0میلیارد', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0میلیارد', 1, 0, 0, 1000, 1000)}),
+        (100000000,
+         1000000,
+         {'one': ('', '\xa0میلیون', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0میلیون', 3, 0, 0, 1000, 1000)}),
+        (10000000,
+         1000000,
+         {'one': ('', '\xa0میلیون', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0میلیون', 2, 0, 0, 1000, 1000)}),
+        (1000000,
+         1000000,
+         {'one': ('', '\xa0میلیون', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0میلیون', 1, 0, 0, 1000, 1000)}),
+        (100000,
+         1000,
+         {'one': ('', '\xa0هزار', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0هزار', 3, 0, 0, 1000, 1000)}),
+        (10000,
+         1000,
+         {'one': ('', '\xa0هزار', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0هزار', 2, 0, 0, 1000, 1000)}),
+        (1000,
+         1000,
+         {'one': ('', '\xa0هزار', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0هزار', 1, 0, 0, 1000, 1000)})],
+ 'fr': [(100000000000000,
+         1000000000000,
+         {'many': ('', '\xa0Bn', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Bn', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Bn', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'many': ('', '\xa0Bn', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Bn', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Bn', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         1000000000000,
+         {'many': ('', '\xa0Bn', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Bn', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Bn', 1, 0, 0, 1000, 1000)}),
+        (100000000000,
+         1000000000,
+         {'many': ('', '\xa0Md', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Md', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Md', 3, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'many': ('', '\xa0Md', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Md', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Md', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000000,
+         {'many': ('', '\xa0Md', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Md', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Md', 1, 0, 0, 1000, 1000)}),
+        (100000000,
+         1000000,
+         {'many': ('', '\xa0M', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0M', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0M', 3, 0, 0, 1000, 1000)}),
+        (10000000,
+         1000000,
+         {'many': ('', '\xa0M', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0M', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0M', 2, 0, 0, 1000, 1000)}),
+        (1000000,
+         1000000,
+         {'many': ('', '\xa0M', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0M', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0M', 1, 0, 0, 1000, 1000)}),
+        (100000,
+         1000,
+         {'many': ('', '\xa0k', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0k', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0k', 3, 0, 0, 1000, 1000)}),
+        (10000,
+         1000,
+         {'many': ('', '\xa0k', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0k', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0k', 2, 0, 0, 1000, 1000)}),
+        (1000,
+         1000,
+         {'many': ('', '\xa0k', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0k', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0k', 1, 0, 0, 1000, 1000)})],
+ 'he': [(100000000000000,
+         1000000000000,
+         {'one': ('', 'T\u200f', 3, 0, 0, 1000, 1000),
+          'two': ('', 'T\u200f', 3, 0, 0, 1000, 1000),
+          'other': ('', 'T\u200f', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'one': ('', 'T\u200f', 2, 0, 0, 1000, 1000),
+          'two': ('', 'T\u200f', 2, 0, 0, 1000, 1000),
+          'other': ('', 'T\u200f', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         1000000000000,
+         {'one': ('', 'T\u200f', 1, 0, 0, 1000, 1000),
+          'two': ('', 'T\u200f', 1, 0, 0, 1000, 1000),
+          'other': ('', 'T\u200f', 1, 0, 0, 1000, 1000)}),
+        (100000000000,
+         1000000000,
+         {'one': ('', 'B\u200f', 3, 0, 0, 1000, 1000),
+          'two': ('', 'B\u200f', 3, 0, 0, 1000, 1000),
+          'other': ('', 'B\u200f', 3, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'one': ('', 'B\u200f', 2, 0, 0, 1000, 1000),
+          'two': ('', 'B\u200f', 2, 0, 0, 1000, 1000),
+          'other': ('', 'B\u200f', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000000,
+         {'one': ('', 'B\u200f', 1, 0, 0, 1000, 1000),
+          'two': ('', 'B\u200f', 1, 0, 0, 1000, 1000),
+          'other': ('', 'B\u200f', 1, 0, 0, 1000, 1000)}),
+        (100000000,
+         1000000,
+         {'one': ('', 'M\u200f', 3, 0, 0, 1000, 1000),
+          'two': ('', 'M\u200f', 3, 0, 0, 1000, 1000),
+          'other': ('', 'M\u200f', 3, 0, 0, 1000, 1000)}),
+        (10000000,
+         1000000,
+         {'one': ('', 'M\u200f', 2, 0, 0, 1000, 1000),
+          'two': ('', 'M\u200f', 2, 0, 0, 1000, 1000),
+          'other': ('', 'M\u200f', 2, 0, 0, 1000, 1000)}),
+        (1000000,
+         1000000,
+         {'one': ('', 'M\u200f', 1, 0, 0, 1000, 1000),
+          'two': ('', 'M\u200f', 1, 0, 0, 1000, 1000),
+          'other': ('', 'M\u200f', 1, 0, 0, 1000, 1000)}),
+        (100000,
+         1000,
+         {'one': ('', 'K\u200f', 3, 0, 0, 1000, 1000),
+          'two': ('', 'K\u200f', 3, 0, 0, 1000, 1000),
+          'other': ('', 'K\u200f', 3, 0, 0, 1000, 1000)}),
+        (10000,
+         1000,
+         {'one': ('', 'K\u200f', 2, 0, 0, 1000, 1000),
+          'two': ('', 'K\u200f', 2, 0, 0, 1000, 1000),
+          'other': ('', 'K\u200f', 2, 0, 0, 1000, 1000)}),
+        (1000,
+         1000,
+         {'one': ('', 'K\u200f', 1, 0, 0, 1000, 1000),
+          'two': ('', 'K\u200f', 1, 0, 0, 1000, 1000),
+          'other': ('', 'K\u200f', 1, 0, 0, 1000, 1000)})],
+ 'hi': [(100000000000000,
+         10000000000000,
+         {'one': ('', '\xa0नील', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0नील', 2, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         10000000000000,
+         {'one': ('', '\xa0नील', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0नील', 1, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         100000000000,
+         {'one': ('', '\xa0ख॰', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ख॰', 2, 0, 0, 1000, 1000)}),
+        (100000000000,
+         100000000000,
+         {'one': ('', '\xa0ख॰', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ख॰', 1, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'one': ('', '\xa0अ॰', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0अ॰', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000000,
+         {'one': ('', '\xa0अ॰', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0अ॰', 1, 0, 0, 1000, 1000)}),
+        (100000000,
+         10000000,
+         {'one': ('', '\xa0क॰', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0क॰', 2, 0, 0, 1000, 1000)}),
+        (10000000,
+         10000000,
+         {'one': ('', '\xa0क॰', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0क॰', 1, 0, 0, 1000, 1000)}),
+        (1000000,
+         100000,
+         {'one': ('', '\xa0लाख', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0लाख', 2, 0, 0, 1000, 1000)}),
+        (100000,
+         100000,
+         {'one': ('', '\xa0लाख', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0लाख', 1, 0, 0, 1000, 1000)}),
+        (10000,
+         1000,
+         {'one': ('', '\xa0हज़ार', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0हज़ार', 2, 0, 0, 1000, 1000)}),
+        (1000,
+         1000,
+         {'one': ('', '\xa0हज़ार', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0हज़ार', 1, 0, 0, 1000, 1000)})],
+ 'hu': [(100000000000000,
+         1000000000000,
+         {'one': ('', '\xa0B', 3, 0, 0, 1000, 1000), 'other': ('', '\xa0B', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'one': ('', '\xa0B', 2, 0, 0, 1000, 1000), 'other': ('', '\xa0B', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         1000000000000,
+         {'one': ('', '\xa0B', 1, 0, 0, 1000, 1000), 'other': ('', '\xa0B', 1, 0, 0, 1000, 1000)}),
+        (100000000000,
+         1000000000,
+         {'one': ('', '\xa0Mrd', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mrd', 3, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'one': ('', '\xa0Mrd', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mrd', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000000,
+         {'one': ('', '\xa0Mrd', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mrd', 1, 0, 0, 1000, 1000)}),
+        (100000000,
+         1000000,
+         {'one': ('', '\xa0M', 3, 0, 0, 1000, 1000), 'other': ('', '\xa0M', 3, 0, 0, 1000, 1000)}),
+        (10000000,
+         1000000,
+         {'one': ('', '\xa0M', 2, 0, 0, 1000, 1000), 'other': ('', '\xa0M', 2, 0, 0, 1000, 1000)}),
+        (1000000,
+         1000000,
+         {'one': ('', '\xa0M', 1, 0, 0, 1000, 1000), 'other': ('', '\xa0M', 1, 0, 0, 1000, 1000)}),
+        (100000,
+         1000,
+         {'one': ('', '\xa0E', 3, 0, 0, 1000, 1000), 'other': ('', '\xa0E', 3, 0, 0, 1000, 1000)}),
+        (10000,
+         1000,
+         {'one': ('', '\xa0E', 2, 0, 0, 1000, 1000), 'other': ('', '\xa0E', 2, 0, 0, 1000, 1000)}),
+        (1000,
+         1000,
+         {'one': ('', '\xa0E', 1, 0, 0, 1000, 1000), 'other': ('', '\xa0E', 1, 0, 0, 1000, 1000)})],
+ 'id': [(100000000000000, 1000000000000, {'other': ('', '\xa0T', 3, 0, 0, 1000, 1000)}),
+        (10000000000000, 1000000000000, {'other': ('', '\xa0T', 2, 0, 0, 1000, 1000)}),
+        (1000000000000, 1000000000000, {'other': ('', '\xa0T', 1, 0, 0, 1000, 1000)}),
+        (100000000000, 1000000000, {'other': ('', '\xa0M', 3, 0, 0, 1000, 1000)}),
+        (10000000000, 1000000000, {'other': ('', '\xa0M', 2, 0, 0, 1000, 1000)}),
+        (1000000000, 1000000000, {'other': ('', '\xa0M', 1, 0, 0, 1000, 1000)}),
+        (100000000, 1000000, {'other': ('', '\xa0jt', 3, 0, 0, 1000, 1000)}),
+        (10000000, 1000000, {'other': ('', '\xa0jt', 2, 0, 0, 1000, 1000)}),
+        (1000000, 1000000, {'other': ('', '\xa0jt', 1, 0, 0, 1000, 1000)}),
+        (100000, 1000, {'other': ('', '\xa0rb', 3, 0, 0, 1000, 1000)}),
+        (10000, 1000, {'other': ('', '\xa0rb', 2, 0, 0, 1000, 1000)}),
+        (1000, 1000, {'other': ('', '\xa0rb', 1, 0, 0, 1000, 1000)})],
+ 'it': [(100000000000000,
+         1000000000000,
+         {'many': ('', '\xa0Bln', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Bln', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Bln', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'many': ('', '\xa0Bln', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Bln', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Bln', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         1000000000000,
+         {'many': ('', '\xa0Bln', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Bln', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Bln', 1, 0, 0, 1000, 1000)}),
+        (100000000000,
+         1000000000,
+         {'many': ('', '\xa0Mld', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Mld', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mld', 3, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'many': ('', '\xa0Mld', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Mld', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mld', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000000,
+         {'many': ('', '\xa0Mld', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Mld', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mld', 1, 0, 0, 1000, 1000)}),
+        (100000000,
+         1000000,
+         {'many': ('', '\xa0Mln', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Mln', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mln', 3, 0, 0, 1000, 1000)}),
+        (10000000,
+         1000000,
+         {'many': ('', '\xa0Mln', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Mln', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mln', 2, 0, 0, 1000, 1000)}),
+        (1000000,
+         1000000,
+         {'many': ('', '\xa0Mln', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0Mln', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0Mln', 1, 0, 0, 1000, 1000)}),
+        (100000,
+         None,
+         {'many': ('', '', 1, 0, 0, 1000, 1000),
+          'one': ('', '', 1, 0, 0, 1000, 1000),
+          'other': ('', '', 1, 0, 0, 1000, 1000)}),
+        (10000,
+         None,
+         {'many': ('', '', 1, 0, 0, 1000, 1000),
+          'one': ('', '', 1, 0, 0, 1000, 1000),
+          'other': ('', '', 1, 0, 0, 1000, 1000)}),
+        (1000,
+         None,
+         {'many': ('', '', 1, 0, 0, 1000, 1000),
+          'one': ('', '', 1, 0, 0, 1000, 1000),
+          'other': ('', '', 1, 0, 0, 1000, 1000)})],
+ 'ja': [(10000000000000000000, 10000000000000000, {'other': ('', '京', 4, 0, 0, 1000, 1000)}),
+        (1000000000000000000, 10000000000000000, {'other': ('', '京', 3, 0, 0, 1000, 1000)}),
+        (100000000000000000, 10000000000000000, {'other': ('', '京', 2, 0, 0, 1000, 1000)}),
+        (10000000000000000, 10000000000000000, {'other': ('', '京', 1, 0, 0, 1000, 1000)}),
+        (1000000000000000, 1000000000000, {'other': ('', '兆', 4, 0, 0, 1000, 1000)}),
+        (100000000000000, 1000000000000, {'other': ('', '兆', 3, 0, 0, 1000, 1000)}),
+        (10000000000000, 1000000000000, {'other': ('', '兆', 2, 0, 0, 1000, 1000)}),
+        (1000000000000, 1000000000000, {'other': ('', '兆', 1, 0, 0, 1000, 1000)}),
+        (100000000000, 100000000, {'other': ('', '億', 4, 0, 0, 1000, 1000)}),
+        (10000000000, 100000000, {'other': ('', '億', 3, 0, 0, 1000, 1000)}),
+        (1000000000, 100000000, {'other': ('', '億', 2, 0, 0, 1000, 1000)}),
+        (100000000, 100000000, {'other': ('', '億', 1, 0, 0, 1000, 1000)}),
+        (10000000, 10000, {'other': ('', '万', 4, 0, 0, 1000, 1000)}),
+        (1000000, 10000, {'other': ('', '万', 3, 0, 0, 1000, 1000)}),
+        (100000, 10000, {'other': ('', '万', 2, 0, 0, 1000, 1000)}),
+        (10000, 10000, {'other': ('', '万', 1, 0, 0, 1000, 1000)}),
+        (1000, None, {'other': ('', '', 1, 0, 0, 1000, 1000)})],
+ 'ko': [(100000000000000, 1000000000000, {'other': ('', '조', 3, 0, 0, 1000, 1000)}),
+        (10000000000000, 1000000000000, {'other': ('', '조', 2, 0, 0, 1000, 1000)}),
+        (1000000000000, 1000000000000, {'other': ('', '조', 1, 0, 0, 1000, 1000)}),
+        (100000000000, 100000000, {'other': ('', '억', 4, 0, 0, 1000, 1000)}),
+        (10000000000, 100000000, {'other': ('', '억', 3, 0, 0, 1000, 1000)}),
+        (1000000000, 100000000, {'other': ('', '억', 2, 0, 0, 1000, 1000)}),
+        (100000000, 100000000, {'other': ('', '억', 1, 0, 0, 1000, 1000)}),
+        (10000000, 10000, {'other': ('', '만', 4, 0, 0, 1000, 1000)}),
+        (1000000, 10000, {'other': ('', '만', 3, 0, 0, 1000, 1000)}),
+        (100000, 10000, {'other': ('', '만', 2, 0, 0, 1000, 1000)}),
+        (10000, 10000, {'other': ('', '만', 1, 0, 0, 1000, 1000)}),
+        (1000, 1000, {'other': ('', '천', 1, 0, 0, 1000, 1000)})],
+ 'mi': [(100000000000000, 1000000000000, {'other': ('', 'T', 3, 0, 0, 1000, 1000)}),
+        (10000000000000, 1000000000000, {'other': ('', 'T', 2, 0, 0, 1000, 1000)}),
+        (1000000000000, 1000000000000, {'other': ('', 'T', 1, 0, 0, 1000, 1000)}),
+        (100000000000, 1000000000, {'other': ('', 'G', 3, 0, 0, 1000, 1000)}),
+        (10000000000, 1000000000, {'other': ('', 'G', 2, 0, 0, 1000, 1000)}),
+        (1000000000, 1000000000, {'other': ('', 'G', 1, 0, 0, 1000, 1000)}),
+        (100000000, 1000000, {'other': ('', 'M', 3, 0, 0, 1000, 1000)}),
+        (10000000, 1000000, {'other': ('', 'M', 2, 0, 0, 1000, 1000)}),
+        (1000000, 1000000, {'other': ('', 'M', 1, 0, 0, 1000, 1000)}),
+        (100000, 1000, {'other': ('', 'K', 3, 0, 0, 1000, 1000)}),
+        (10000, 1000, {'other': ('', 'K', 2, 0, 0, 1000, 1000)}),
+        (1000, 1000, {'other': ('', 'K', 1, 0, 0, 1000, 1000)})],
+ 'pl': [(100000000000000,
+         1000000000000,
+         {'few': ('', '\xa0bln', 3, 0, 0, 1000, 1000),
+          'many': ('', '\xa0bln', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0bln', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0bln', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'few': ('', '\xa0bln', 2, 0, 0, 1000, 1000),
+          'many': ('', '\xa0bln', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0bln', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0bln', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         1000000000000,
+         {'few': ('', '\xa0bln', 1, 0, 0, 1000, 1000),
+          'many': ('', '\xa0bln', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0bln', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0bln', 1, 0, 0, 1000, 1000)}),
+        (100000000000,
+         1000000000,
+         {'few': ('', '\xa0mld', 3, 0, 0, 1000, 1000),
+          'many': ('', '\xa0mld', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mld', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mld', 3, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'few': ('', '\xa0mld', 2, 0, 0, 1000, 1000),
+          'many': ('', '\xa0mld', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mld', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mld', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000000,
+         {'few': ('', '\xa0mld', 1, 0, 0, 1000, 1000),
+          'many': ('', '\xa0mld', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mld', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mld', 1, 0, 0, 1000, 1000)}),
+        (100000000,
+         1000000,
+         {'few': ('', '\xa0mln', 3, 0, 0, 1000, 1000),
+          'many': ('', '\xa0mln', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mln', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mln', 3, 0, 0, 1000, 1000)}),
+        (10000000,
+         1000000,
+         {'few': ('', '\xa0mln', 2, 0, 0, 1000, 1000),
+          'many': ('', '\xa0mln', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mln', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mln', 2, 0, 0, 1000, 1000)}),
+        (1000000,
+         1000000,
+         {'few': ('', '\xa0mln', 1, 0, 0, 1000, 1000),
+          'many': ('', '\xa0mln', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mln', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mln', 1, 0, 0, 1000, 1000)}),
+        (100000,
+         1000,
+         {'few': ('', '\xa0tys.', 3, 0, 0, 1000, 1000),
+          'many': ('', '\xa0tys.', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0tys.', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0tys.', 3, 0, 0, 1000, 1000)}),
+        (10000,
+         1000,
+         {'few': ('', '\xa0tys.', 2, 0, 0, 1000, 1000),
+          'many': ('', '\xa0tys.', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0tys.', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0tys.', 2, 0, 0, 1000, 1000)}),
+        (1000,
+         1000,
+         {'few': ('', '\xa0tys.', 1, 0, 0, 1000, 1000),
+          'many': ('', '\xa0tys.', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0tys.', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0tys.', 1, 0, 0, 1000, 1000)})],
+ 'pt': [(100000000000000,
+         1000000000000,
+         {'many': ('', '\xa0tri', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0tri', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0tri', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'many': ('', '\xa0tri', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0tri', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0tri', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         1000000000000,
+         {'many': ('', '\xa0tri', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0tri', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0tri', 1, 0, 0, 1000, 1000)}),
+        (100000000000,
+         1000000000,
+         {'many': ('', '\xa0bi', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0bi', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0bi', 3, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'many': ('', '\xa0bi', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0bi', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0bi', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000000,
+         {'many': ('', '\xa0bi', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0bi', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0bi', 1, 0, 0, 1000, 1000)}),
+        (100000000,
+         1000000,
+         {'many': ('', '\xa0mi', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mi', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mi', 3, 0, 0, 1000, 1000)}),
+        (10000000,
+         1000000,
+         {'many': ('', '\xa0mi', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mi', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mi', 2, 0, 0, 1000, 1000)}),
+        (1000000,
+         1000000,
+         {'many': ('', '\xa0mi', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mi', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mi', 1, 0, 0, 1000, 1000)}),
+        (100000,
+         1000,
+         {'many': ('', '\xa0mil', 3, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mil', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mil', 3, 0, 0, 1000, 1000)}),
+        (10000,
+         1000,
+         {'many': ('', '\xa0mil', 2, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mil', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mil', 2, 0, 0, 1000, 1000)}),
+        (1000,
+         1000,
+         {'many': ('', '\xa0mil', 1, 0, 0, 1000, 1000),
+          'one': ('', '\xa0mil', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mil', 1, 0, 0, 1000, 1000)})],
+ 'sv': [(100000000000000,
+         1000000000000,
+         {'one': ('', '\xa0bn', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0bn', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'one': ('', '\xa0bn', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0bn', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         1000000000000,
+         {'one': ('', '\xa0bn', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0bn', 1, 0, 0, 1000, 1000)}),
+        (100000000000,
+         1000000000,
+         {'one': ('', '\xa0md', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0md', 3, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'one': ('', '\xa0md', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0md', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000000,
+         {'one': ('', '\xa0md', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0md', 1, 0, 0, 1000, 1000)}),
+        (100000000,
+         1000000,
+         {'one': ('', '\xa0mn', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mn', 3, 0, 0, 1000, 1000)}),
+        (10000000,
+         1000000,
+         {'one': ('', '\xa0mn', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mn', 2, 0, 0, 1000, 1000)}),
+        (1000000,
+         1000000,
+         {'one': ('', '\xa0mn', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0mn', 1, 0, 0, 1000, 1000)}),
+        (100000,
+         1000,
+         {'one': ('', '\xa0tn', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0tn', 3, 0, 0, 1000, 1000)}),
+        (10000,
+         1000,
+         {'one': ('', '\xa0tn', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0tn', 2, 0, 0, 1000, 1000)}),
+        (1000,
+         1000,
+         {'one': ('', '\xa0tn', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0tn', 1, 0, 0, 1000, 1000)})],
+ 'ur': [(100000000000000,
+         1000000000000,
+         {'one': ('', '\xa0ٹریلین', 3, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ٹریلین', 3, 0, 0, 1000, 1000)}),
+        (10000000000000,
+         1000000000000,
+         {'one': ('', '\xa0ٹریلین', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ٹریلین', 2, 0, 0, 1000, 1000)}),
+        (1000000000000,
+         100000000000,
+         {'one': ('', '\xa0کھرب', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0کھرب', 2, 0, 0, 1000, 1000)}),
+        (100000000000,
+         100000000000,
+         {'one': ('', '\xa0کھرب', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0کھرب', 1, 0, 0, 1000, 1000)}),
+        (10000000000,
+         1000000000,
+         {'one': ('', '\xa0ارب', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ارب', 2, 0, 0, 1000, 1000)}),
+        (1000000000,
+         1000000000,
+         {'one': ('', '\xa0ارب', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ارب', 1, 0, 0, 1000, 1000)}),
+        (100000000,
+         10000000,
+         {'one': ('', '\xa0کروڑ', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0کروڑ', 2, 0, 0, 1000, 1000)}),
+        (10000000,
+         10000000,
+         {'one': ('', '\xa0کروڑ', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0کروڑ', 1, 0, 0, 1000, 1000)}),
+        (1000000,
+         100000,
+         {'one': ('', '\xa0لاکھ', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0لاکھ', 2, 0, 0, 1000, 1000)}),
+        (100000,
+         100000,
+         {'one': ('', '\xa0لاکھ', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0لاکھ', 1, 0, 0, 1000, 1000)}),
+        (10000,
+         1000,
+         {'one': ('', '\xa0ہزار', 2, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ہزار', 2, 0, 0, 1000, 1000)}),
+        (1000,
+         1000,
+         {'one': ('', '\xa0ہزار', 1, 0, 0, 1000, 1000),
+          'other': ('', '\xa0ہزار', 1, 0, 0, 1000, 1000)})]}
+
+
+TIMEDELTA_UNITS = (('year', 31536000),
+ ('month', 2592000),
+ ('week', 604800),
+ ('day', 86400),
+ ('hour', 3600),
+ ('minute', 60),
+ ('second', 1))
+
+
+RELATIVE_TIME = {'ar': {'future': {'year': {'few': 'خلال {0} سنوات',
+                            'many': 'خلال {0} سنة',
+                            'one': 'خلال سنة واحدة',
+                            'two': 'خلال سنتين',
+                            'zero': 'خلال {0} سنة',
+                            'other': 'خلال {0} سنة'},
+                   'month': {'few': 'خلال {0} أشهر',
+                             'many': 'خلال {0} شهرًا',
+                             'one': 'خلال شهر واحد',
+                             'two': 'خلال شهرين',
+                             'zero': 'خلال {0} شهر',
+                             'other': 'خلال {0} شهر'},
+                   'week': {'few': 'خلال {0} أسابيع',
+                            'many': 'خلال {0} أسبوعًا',
+                            'one': 'خلال أسبوع واحد',
+                            'two': 'خلال أسبوعين',
+                            'zero': 'خلال {0} أسبوع',
+                            'other': 'خلال {0} أسبوع'},
+                   'day': {'few': 'خلال {0} أيام',
+                           'many': 'خلال {0} يومًا',
+                           'one': 'خلال يوم واحد',
+                           'two': 'خلال يومين',
+                           'zero': 'خلال {0} يوم',
+                           'other': 'خلال {0} يوم'},
+                   'hour': {'few': 'خلال {0} ساعات',
+                            'many': 'خلال {0} ساعة',
+                            'one': 'خلال ساعة واحدة',
+                            'two': 'خلال ساعتين',
+                            'zero': 'خلال {0} ساعة',
+                            'other': 'خلال {0} ساعة'},
+                   'minute': {'few': 'خلال {0} دقائق',
+                              'many': 'خلال {0} دقيقة',
+                              'one': 'خلال دقيقة واحدة',
+                              'two': 'خلال دقيقتين',
+                              'zero': 'خلال {0} دقيقة',
+                              'other': 'خلال {0} دقيقة'},
+                   'second': {'few': 'خلال {0} ثوانٍ',
+                              'many': 'خلال {0} ثانية',
+                              'one': 'خلال ثانية واحدة',
+                              'two': 'خلال ثانيتين',
+                              'zero': 'خلال {0} ثانية',
+                              'other': 'خلال {0} ثانية'}},
+        'past': {'year': {'few': 'قبل {0} سنوات',
+                          'many': 'قبل {0} سنة',
+                          'one': 'قبل سنة واحدة',
+                          'two': 'قبل سنتين',
+                          'zero': 'قبل {0} سنة',
+                          'other': 'قبل {0} سنة'},
+                 'month': {'few': 'قبل {0} أشهر',
+                           'many': 'قبل {0} شهرًا',
+                           'one': 'قبل شهر واحد',
+                           'two': 'قبل شهرين',
+                           'zero': 'قبل {0} شهر',
+                           'other': 'قبل {0} شهر'},
+                 'week': {'few': 'قبل {0} أسابيع',
+                          'many': 'قبل {0} أسبوعًا',
+                          'one': 'قبل أسبوع واحد',
+                          'two': 'قبل أسبوعين',
+                          'zero': 'قبل {0} أسبوع',
+                          'other': 'قبل {0} أسبوع'},
+                 'day': {'few': 'قبل {0} أيام',
+                         'many': 'قبل {0} يومًا',
+                         'one': 'قبل يوم واحد',
+                         'two': 'قبل يومين',
+                         'zero': 'قبل {0} يوم',
+                         'other': 'قبل {0} يوم'},
+                 'hour': {'few': 'قبل {0} ساعات',
+                          'many': 'قبل {0} ساعة',
+                          'one': 'قبل ساعة واحدة',
+                          'two': 'قبل ساعتين',
+                          'zero': 'قبل {0} ساعة',
+                          'other': 'قبل {0} ساعة'},
+                 'minute': {'few': 'قبل {0} دقائق',
+                            'many': 'قبل {0} دقيقة',
+                            'one': 'قبل دقيقة واحدة',
+                            'two': 'قبل دقيقتين',
+                            'zero': 'قبل {0} دقيقة',
+                            'other': 'قبل {0} دقيقة'},
+                 'second': {'few': 'قبل {0} ثوانِ',
+                            'many': 'قبل {0} ثانية',
+                            'one': 'قبل ثانية واحدة',
+                            'two': 'قبل ثانيتين',
+                            'zero': 'قبل {0} ثانية',
+                            'other': 'قبل {0} ثانية'}}},
+ 'bn': {'future': {'year': {'one': '{0} বছরে', 'other': '{0} বছরে'},
+                   'month': {'one': '{0} মাসে', 'other': '{0} মাসে'},
+                   'week': {'one': '{0} সপ্তাহে', 'other': '{0} সপ্তাহে'},
+                   'day': {'one': '{0} দিনের মধ্যে', 'other': '{0} দিনের মধ্যে'},
+                   'hour': {'one': '{0} ঘন্টায়', 'other': '{0} ঘন্টায়'},
+                   'minute': {'one': '{0} মিনিটে', 'other': '{0} মিনিটে'},
+                   'second': {'one': '{0} সেকেন্ডে', 'other': '{0} সেকেন্ডে'}},
+        'past': {'year': {'one': '{0} বছর পূর্বে', 'other': '{0} বছর পূর্বে'},
+                 'month': {'one': '{0} মাস আগে', 'other': '{0} মাস আগে'},
+                 'week': {'one': '{0} সপ্তাহ আগে', 'other': '{0} সপ্তাহ আগে'},
+                 'day': {'one': '{0} দিন আগে', 'other': '{0} দিন আগে'},
+                 'hour': {'one': '{0} ঘন্টা আগে', 'other': '{0} ঘন্টা আগে'},
+                 'minute': {'one': '{0} মিনিট আগে', 'other': '{0} মিনিট আগে'},
+                 'second': {'one': '{0} সেকেন্ড আগে', 'other': '{0} সেকেন্ড পূর্বে'}}},
+ 'de': {'future': {'year': {'one': 'in {0} Jahr', 'other': 'in {0} Jahren'},
+                   'month': {'one': 'in {0} Monat', 'other': 'in {0} Monaten'},
+                   'week': {'one': 'in {0} Woche', 'other': 'in {0} Wochen'},
+                   'day': {'one': 'in {0} Tag', 'other': 'in {0} Tagen'},
+                   'hour': {'one': 'in {0} Stunde', 'other': 'in {0} Stunden'},
+                   'minute': {'one': 'in {0} Minute', 'other': 'in {0} Minuten'},
+                   'second': {'one': 'in {0} Sekunde', 'other': 'in {0} Sekunden'}},
+        'past': {'year': {'one': 'vor {0} Jahr', 'other': 'vor {0} Jahren'},
+                 'month': {'one': 'vor {0} Monat', 'other': 'vor {0} Monaten'},
+                 'week': {'one': 'vor {0} Woche', 'other': 'vor {0} Wochen'},
+                 'day': {'one': 'vor {0} Tag', 'other': 'vor {0} Tagen'},
+                 'hour': {'one': 'vor {0} Stunde', 'other': 'vor {0} Stunden'},
+                 'minute': {'one': 'vor {0} Minute', 'other': 'vor {0} Minuten'},
+                 'second': {'one': 'vor {0} Sekunde', 'other': 'vor {0} Sekunden'}}},
+ 'en': {'future': {'year': {'one': 'in {0} year', 'other': 'in {0} years'},
+                   'month': {'one': 'in {0} month', 'other': 'in {0} months'},
+                   'week': {'one': 'in {0} week', 'other': 'in {0} weeks'},
+                   'day': {'one': 'in {0} day', 'other': 'in {0} days'},
+                   'hour': {'one': 'in {0} hour', 'other': 'in {0} hours'},
+                   'minute': {'one': 'in {0} minute', 'other': 'in {0} minutes'},
+                   'second': {'one': 'in {0} second', 'other': 'in {0} seconds'}},
+        'past': {'year': {'one': '{0} year ago', 'other': '{0} years ago'},
+                 'month': {'one': '{0} month ago', 'other': '{0} months ago'},
+                 'week': {'one': '{0} week ago', 'other': '{0} weeks ago'},
+                 'day': {'one': '{0} day ago', 'other': '{0} days ago'},
+                 'hour': {'one': '{0} hour ago', 'other': '{0} hours ago'},
+                 'minute': {'one': '{0} minute ago', 'other': '{0} minutes ago'},
+                 'second': {'one': '{0} second ago', 'other': '{0} seconds ago'}}},
+ 'es': {'future': {'year': {'many': 'dentro de {0} años',
+                            'one': 'dentro de {0} año',
+                            'other': 'dentro de {0} años'},
+                   'month': {'many': 'dentro de {0} meses',
+                             'one': 'dentro de {0} mes',
+                             'other': 'dentro de {0} meses'},
+                   'week': {'many': 'dentro de {0} semanas',
+                            'one': 'dentro de {0} semana',
+                            'other': 'dentro de {0} semanas'},
+                   'day': {'many': 'dentro de {0} días',
+                           'one': 'dentro de {0} día',
+                           'other': 'dentro de {0} días'},
+                   'hour': {'many': 'dentro de {0} horas',
+                            'one': 'dentro de {0} hora',
+                            'other': 'dentro de {0} horas'},
+                   'minute': {'many': 'dentro de {0} minutos',
+                              'one': 'dentro de {0} minuto',
+                              'other': 'dentro de {0} minutos'},
+                   'second': {'many': 'dentro de {0} segundos',
+                              'one': 'dentro de {0} segundo',
+                              'other': 'dentro de {0} segundos'}},
+        'past': {'year': {'many': 'hace {0} años', 'one': 'hace {0} año', 'other': 'hace {0} años'},
+                 'month': {'many': 'hace {0} meses',
+                           'one': 'hace {0} mes',
+                           'other': 'hace {0} meses'},
+                 'week': {'many': 'hace {0} semanas',
+                          'one': 'hace {0} semana',
+                          'other': 'hace {0} semanas'},
+                 'day': {'many': 'hace {0} días', 'one': 'hace {0} día', 'other': 'hace {0} días'},
+                 'hour': {'many': 'hace {0} horas',
+                          'one': 'hace {0} hora',
+                          'other': 'hace {0} horas'},
+                 'minute': {'many': 'hace {0} minutos',
+                            'one': 'hace {0} minuto',
+                            'other': 'hace {0} minutos'},
+                 'second': {'many': 'hace {0} segundos',
+                            'one': 'hace {0} segundo',
+                            'other': 'hace {0} segundos'}}},
+ 'fa': {'future': {'year': {'one': '{0} سال بعد', 'other': '{0} سال بعد'},
+                   'month': {'one': '{0} ماه بعد', 'other': '{0} ماه بعد'},
+                   'week': {'one': '{0} هفته بعد', 'other': '{0} هفته بعد'},
+                   'day': {'one': '{0} روز دیگر', 'other': '{0} روز دیگر'},
+                   'hour': {'one': '{0} ساعت بعد', 'other': '{0} ساعت بعد'},
+                   'minute': {'one': '{0} دقیقه بعد', 'other': '{0} دقیقه بعد'},
+                   'second': {'one': '{0} ثانیه بعد', 'other': '{0} ثانیه بعد'}},
+        'past': {'year': {'one': '{0} سال پیش', 'other': '{0} سال پیش'},
+                 'month': {'one': '{0} ماه پیش', 'other': '{0} ماه پیش'},
+                 'week': {'one': '{0} هفته پیش', 'other': '{0} هفته پیش'},
+                 'day': {'one': '{0} روز پیش', 'other': '{0} روز پیش'},
+                 'hour': {'one': '{0} ساعت پیش', 'other': '{0} ساعت پیش'},
+                 'minute': {'one': '{0} دقیقه پیش', 'other': '{0} دقیقه پیش'},
+                 'second': {'one': '{0} ثانیه پیش', 'other': '{0} ثانیه پیش'}}},
+ 'fr': {'future': {'year': {'many': 'dans {0} ans', 'one': 'dans {0} an', 'other': 'dans {0} ans'},
+                   'month': {'many': 'dans {0} mois',
+                             'one': 'dans {0} mois',
+                             'other': 'dans {0} mois'},
+                   'week': {'many': 'dans {0} semaines',
+                            'one': 'dans {0} semaine',
+                            'other': 'dans {0} semaines'},
+                   'day': {'many': 'dans {0} jours',
+                           'one': 'dans {0} jour',
+                           'other': 'dans {0} jours'},
+                   'hour': {'many': 'dans {0} heures',
+                            'one': 'dans {0} heure',
+                            'other': 'dans {0} heures'},
+                   'minute': {'many': 'dans {0} minutes',
+                              'one': 'dans {0} minute',
+                              'other': 'dans {0} minutes'},
+                   'second': {'many': 'dans {0} secondes',
+                              'one': 'dans {0} seconde',
+                              'other': 'dans {0} secondes'}},
+        'past': {'year': {'many': 'il y a {0} ans',
+                          'one': 'il y a {0} an',
+                          'other': 'il y a {0} ans'},
+                 'month': {'many': 'il y a {0} mois',
+                           'one': 'il y a {0} mois',
+                           'other': 'il y a {0} mois'},
+                 'week': {'many': 'il y a {0} semaines',
+                          'one': 'il y a {0} semaine',
+                          'other': 'il y a {0} semaines'},
+                 'day': {'many': 'il y a {0} jours',
+                         'one': 'il y a {0} jour',
+                         'other': 'il y a {0} jours'},
+                 'hour': {'many': 'il y a {0} heures',
+                          'one': 'il y a {0} heure',
+                          'other': 'il y a {0} heures'},
+                 'minute': {'many': 'il y a {0} minutes',
+                            'one': 'il y a {0} minute',
+                            'other': 'il y a {0} minutes'},
+                 'second': {'many': 'il y a {0} secondes',
+                            'one': 'il y a {0} seconde',
+                            'other': 'il y a {0} secondes'}}},
+ 'he': {'future': {'year': {'one': 'בעוד שנה', 'two': 'בעוד שנתיים', 'other': 'בעוד {0} שנים'},
+                   'month': {'one': 'בעוד חודש', 'two': 'בעוד חודשיים', 'other': 'בעוד {0} חודשים'},
+                   'week': {'one': 'בעוד שבוע', 'two': 'בעוד שבועיים', 'other': 'בעוד {0} שבועות'},
+                   'day': {'one': 'בעוד יום {0}', 'two': 'בעוד יומיים', 'other': 'בעוד {0} ימים'},
+                   'hour': {'one': 'בעוד שעה', 'two': 'בעוד שעתיים', 'other': 'בעוד {0} שעות'},
+                   'minute': {'one': 'בעוד דקה', 'two': 'בעוד שתי דקות', 'other': 'בעוד {0} דקות'},
+                   'second': {'one': 'בעוד שנייה',
+                              'two': 'בעוד שתי שניות',
+                              'other': 'בעוד {0} שניות'}},
+        'past': {'year': {'one': 'לפני שנה', 'two': 'לפני שנתיים', 'other': 'לפני {0} שנים'},
+                 'month': {'one': 'לפני חודש', 'two': 'לפני חודשיים', 'other': 'לפני {0} חודשים'},
+                 'week': {'one': 'לפני שבוע', 'two': 'לפני שבועיים', 'other': 'לפני {0} שבועות'},
+                 'day': {'one': 'לפני יום {0}', 'two': 'לפני יומיים', 'other': 'לפני {0} ימים'},
+                 'hour': {'one': 'לפני שעה', 'two': 'לפני שעתיים', 'other': 'לפני {0} שעות'},
+                 'minute': {'one': 'לפני דקה', 'two': 'לפני שתי דקות', 'other': 'לפני {0} דקות'},
+                 'second': {'one': 'לפני שנייה',
+                            'two': 'לפני שתי שניות',
+                            'other': 'לפני {0} שניות'}}},
+ 'hi': {'future': {'year': {'one': '{0} वर्ष में', 'other': '{0} वर्ष में'},
+                   'month': {'one': '{0} माह में', 'other': '{0} माह में'},
+                   'week': {'one': '{0} सप्ताह में', 'other': '{0} सप्ताह में'},
+                   'day': {'one': '{0} दिन में', 'other': '{0} दिन में'},
+                   'hour': {'one': '{0} घंटे में', 'other': '{0} घंटे में'},
+                   'minute': {'one': '{0} मिनट में', 'other': '{0} मिनट में'},
+                   'second': {'one': '{0} सेकंड में', 'other': '{0} सेकंड में'}},
+        'past': {'year': {'one': '{0} वर्ष पहले', 'other': '{0} वर्ष पहले'},
+                 'month': {'one': '{0} माह पहले', 'other': '{0} माह पहले'},
+                 'week': {'one': '{0} सप्ताह पहले', 'other': '{0} सप्ताह पहले'},
+                 'day': {'one': '{0} दिन पहले', 'other': '{0} दिन पहले'},
+                 'hour': {'one': '{0} घंटे पहले', 'other': '{0} घंटे पहले'},
+                 'minute': {'one': '{0} मिनट पहले', 'other': '{0} मिनट पहले'},
+                 'second': {'one': '{0} सेकंड पहले', 'other': '{0} सेकंड पहले'}}},
+ 'hu': {'future': {'year': {'one': '{0} év múlva', 'other': '{0} év múlva'},
+                   'month': {'one': '{0} hónap múlva', 'other': '{0} hónap múlva'},
+                   'week': {'one': '{0} hét múlva', 'other': '{0} hét múlva'},
+                   'day': {'one': '{0} nap múlva', 'other': '{0} nap múlva'},
+                   'hour': {'one': '{0} óra múlva', 'other': '{0} óra múlva'},
+                   'minute': {'one': '{0} perc múlva', 'other': '{0} perc múlva'},
+                   'second': {'one': '{0} másodperc múlva', 'other': '{0} másodperc múlva'}},
+        'past': {'year': {'one': '{0} évvel ezelőtt', 'other': '{0} évvel ezelőtt'},
+                 'month': {'one': '{0} hónappal ezelőtt', 'other': '{0} hónappal ezelőtt'},
+                 'week': {'one': '{0} héttel ezelőtt', 'other': '{0} héttel ezelőtt'},
+                 'day': {'one': '{0} nappal ezelőtt', 'other': '{0} nappal ezelőtt'},
+                 'hour': {'one': '{0} órával ezelőtt', 'other': '{0} órával ezelőtt'},
+                 'minute': {'one': '{0} perccel ezelőtt', 'other': '{0} perccel ezelőtt'},
+                 'second': {'one': '{0} másodperccel ezelőtt',
+                            'other': '{0} másodperccel ezelőtt'}}},
+ 'id': {'future': {'year': {'other': 'dalam {0} tahun'},
+                   'month': {'other': 'dalam {0} bulan'},
+                   'week': {'other': 'dalam {0} minggu'},
+                   'day': {'other': 'dalam {0} hari'},
+                   'hour': {'other': 'dalam {0} jam'},
+                   'minute': {'other': 'dalam {0} menit'},
+                   'second': {'other': 'dalam {0} detik'}},
+        'past': {'year': {'other': '{0} tahun yang lalu'},
+                 'month': {'other': '{0} bulan yang lalu'},
+                 'week': {'other': '{0} minggu yang lalu'},
+                 'day': {'other': '{0} hari yang lalu'},
+                 'hour': {'other': '{0} jam yang lalu'},
+                 'minute': {'other': '{0} menit yang lalu'},
+                 'second': {'other': '{0} detik yang lalu'}}},
+ 'it': {'future': {'year': {'many': 'tra {0} anni', 'one': 'tra {0} anno', 'other': 'tra {0} anni'},
+                   'month': {'many': 'tra {0} mesi',
+                             'one': 'tra {0} mese',
+                             'other': 'tra {0} mesi'},
+                   'week': {'many': 'tra {0} settimane',
+                            'one': 'tra {0} settimana',
+                            'other': 'tra {0} settimane'},
+                   'day': {'many': 'tra {0} giorni',
+                           'one': 'tra {0} giorno',
+                           'other': 'tra {0} giorni'},
+                   'hour': {'many': 'tra {0} ore', 'one': 'tra {0} ora', 'other': 'tra {0} ore'},
+                   'minute': {'many': 'tra {0} minuti',
+                              'one': 'tra {0} minuto',
+                              'other': 'tra {0} minuti'},
+                   'second': {'many': 'tra {0} secondi',
+                              'one': 'tra {0} secondo',
+                              'other': 'tra {0} secondi'}},
+        'past': {'year': {'many': '{0} anni fa', 'one': '{0} anno fa', 'other': '{0} anni fa'},
+                 'month': {'many': '{0} mesi fa', 'one': '{0} mese fa', 'other': '{0} mesi fa'},
+                 'week': {'many': '{0} settimane fa',
+                          'one': '{0} settimana fa',
+                          'other': '{0} settimane fa'},
+                 'day': {'many': '{0} giorni fa', 'one': '{0} giorno fa', 'other': '{0} giorni fa'},
+                 'hour': {'many': '{0} ore fa', 'one': '{0} ora fa', 'other': '{0} ore fa'},
+                 'minute': {'many': '{0} minuti fa',
+                            'one': '{0} minuto fa',
+                            'other': '{0} minuti fa'},
+                 'second': {'many': '{0} secondi fa',
+                            'one': '{0} secondo fa',
+                            'other': '{0} secondi fa'}}},
+ 'ja': {'future': {'year': {'other': '{0} 年後'},
+                   'month': {'other': '{0} か月後'},
+                   'week': {'other': '{0} 週間後'},
+                   'day': {'other': '{0} 日後'},
+                   'hour': {'other': '{0} 時間後'},
+                   'minute': {'other': '{0} 分後'},
+                   'second': {'other': '{0} 秒後'}},
+        'past': {'year': {'other': '{0} 年前'},
+                 'month': {'other': '{0} か月前'},
+                 'week': {'other': '{0} 週間前'},
+                 'day': {'other': '{0} 日前'},
+                 'hour': {'other': '{0} 時間前'},
+                 'minute': {'other': '{0} 分前'},
+                 'second': {'other': '{0} 秒前'}}},
+ 'ko': {'future': {'year': {'other': '{0}년 후'},
+                   'month': {'other': '{0}개월 후'},
+                   'week': {'other': '{0}주 후'},
+                   'day': {'other': '{0}일 후'},
+                   'hour': {'other': '{0}시간 후'},
+                   'minute': {'other': '{0}분 후'},
+                   'second': {'other': '{0}초 후'}},
+        'past': {'year': {'other': '{0}년 전'},
+                 'month': {'other': '{0}개월 전'},
+                 'week': {'other': '{0}주 전'},
+                 'day': {'other': '{0}일 전'},
+                 'hour': {'other': '{0}시간 전'},
+                 'minute': {'other': '{0}분 전'},
+                 'second': {'other': '{0}초 전'}}},
+ 'mi': {'future': {'year': {'other': 'ā te {0} tau'},
+                   'month': {'other': '+{0} marama'},
+                   'week': {'other': '+{0} wiki'},
+                   'day': {'other': '+{0} rā'},
+                   'hour': {'other': '+{0} haora'},
+                   'minute': {'other': '+{0} meneti'},
+                   'second': {'other': '+{0} hēkona'}},
+        'past': {'year': {'other': 'i te {0} tau i mua'},
+                 'month': {'other': '-{0} marama i mua'},
+                 'week': {'other': '-{0} wiki i mua'},
+                 'day': {'other': '-{0} rā i mua'},
+                 'hour': {'other': '-{0} haora i mua'},
+                 'minute': {'other': '-{0} meneti i mua'},
+                 'second': {'other': '-{0} hēkona i mua'}}},
+ 'pl': {'future': {'year': {'few': 'za {0} lata',
+                            'many': 'za {0} lat',
+                            'one': 'za {0} rok',
+                            'other': 'za {0} roku'},
+                   'month': {'few': 'za {0} miesiące',
+                             'many': 'za {0} miesięcy',
+                             'one': 'za {0} miesiąc',
+                             'other': 'za {0} miesiąca'},
+                   'week': {'few': 'za {0} tygodnie',
+                            'many': 'za {0} tygodni',
+                            'one': 'za {0} tydzień',
+                            'other': 'za {0} tygodnia'},
+                   'day': {'few': 'za {0} dni',
+                           'many': 'za {0} dni',
+                           'one': 'za {0} dzień',
+                           'other': 'za {0} dnia'},
+                   'hour': {'few': 'za {0} godziny',
+                            'many': 'za {0} godzin',
+                            'one': 'za {0} godzinę',
+                            'other': 'za {0} godziny'},
+                   'minute': {'few': 'za {0} minuty',
+                              'many': 'za {0} minut',
+                              'one': 'za {0} minutę',
+                              'other': 'za {0} minuty'},
+                   'second': {'few': 'za {0} sekundy',
+                              'many': 'za {0} sekund',
+                              'one': 'za {0} sekundę',
+                              'other': 'za {0} sekundy'}},
+        'past': {'year': {'few': '{0} lata temu',
+                          'many': '{0} lat temu',
+                          'one': '{0} rok temu',
+                          'other': '{0} roku temu'},
+                 'month': {'few': '{0} miesiące temu',
+                           'many': '{0} miesięcy temu',
+                           'one': '{0} miesiąc temu',
+                           'other': '{0} miesiąca temu'},
+                 'week': {'few': '{0} tygodnie temu',
+                          'many': '{0} tygodni temu',
+                          'one': '{0} tydzień temu',
+                          'other': '{0} tygodnia temu'},
+                 'day': {'few': '{0} dni temu',
+                         'many': '{0} dni temu',
+                         'one': '{0} dzień temu',
+                         'other': '{0} dnia temu'},
+                 'hour': {'few': '{0} godziny temu',
+                          'many': '{0} godzin temu',
+                          'one': '{0} godzinę temu',
+                          'other': '{0} godziny temu'},
+                 'minute': {'few': '{0} minuty temu',
+                            'many': '{0} minut temu',
+                            'one': '{0} minutę temu',
+                            'other': '{0} minuty temu'},
+                 'second': {'few': '{0} sekundy temu',
+                            'many': '{0} sekund temu',
+                            'one': '{0} sekundę temu',
+                            'other': '{0} sekundy temu'}}},
+ 'pt': {'future': {'year': {'many': 'em {0} anos', 'one': 'em {0} ano', 'other': 'em {0} anos'},
+                   'month': {'many': 'em {0} meses', 'one': 'em {0} mês', 'other': 'em {0} meses'},
+                   'week': {'many': 'em {0} semanas',
+                            'one': 'em {0} semana',
+                            'other': 'em {0} semanas'},
+                   'day': {'many': 'em {0} dias', 'one': 'em {0} dia', 'other': 'em {0} dias'},
+                   'hour': {'many': 'em {0} horas', 'one': 'em {0} hora', 'other': 'em {0} horas'},
+                   'minute': {'many': 'em {0} minutos',
+                              'one': 'em {0} minuto',
+                              'other': 'em {0} minutos'},
+                   'second': {'many': 'em {0} segundos',
+                              'one': 'em {0} segundo',
+                              'other': 'em {0} segundos'}},
+        'past': {'year': {'many': 'há {0} anos', 'one': 'há {0} ano', 'other': 'há {0} anos'},
+                 'month': {'many': 'há {0} meses', 'one': 'há {0} mês', 'other': 'há {0} meses'},
+                 'week': {'many': 'há {0} semanas',
+                          'one': 'há {0} semana',
+                          'other': 'há {0} semanas'},
+                 'day': {'many': 'há {0} dias', 'one': 'há {0} dia', 'other': 'há {0} dias'},
+                 'hour': {'many': 'há {0} horas', 'one': 'há {0} hora', 'other': 'há {0} horas'},
+                 'minute': {'many': 'há {0} minutos',
+                            'one': 'há {0} minuto',
+                            'other': 'há {0} minutos'},
+                 'second': {'many': 'há {0} segundos',
+                            'one': 'há {0} segundo',
+                            'other': 'há {0} segundos'}}},
+ 'sv': {'future': {'year': {'one': 'om {0} år', 'other': 'om {0} år'},
+                   'month': {'one': 'om {0} månad', 'other': 'om {0} månader'},
+                   'week': {'one': 'om {0} vecka', 'other': 'om {0} veckor'},
+                   'day': {'one': 'om {0} dag', 'other': 'om {0} dagar'},
+                   'hour': {'one': 'om {0} timme', 'other': 'om {0} timmar'},
+                   'minute': {'one': 'om {0} minut', 'other': 'om {0} minuter'},
+                   'second': {'one': 'om {0} sekund', 'other': 'om {0} sekunder'}},
+        'past': {'year': {'one': 'för {0} år sedan', 'other': 'för {0} år sedan'},
+                 'month': {'one': 'för {0} månad sedan', 'other': 'för {0} månader sedan'},
+                 'week': {'one': 'för {0} vecka sedan', 'other': 'för {0} veckor sedan'},
+                 'day': {'one': 'för {0} dag sedan', 'other': 'för {0} dagar sedan'},
+                 'hour': {'one': 'för {0} timme sedan', 'other': 'för {0} timmar sedan'},
+                 'minute': {'one': 'för {0} minut sedan', 'other': 'för {0} minuter sedan'},
+                 'second': {'one': 'för {0} sekund sedan', 'other': 'för {0} sekunder sedan'}}},
+ 'ur': {'future': {'year': {'one': '{0} سال میں', 'other': '{0} سال میں'},
+                   'month': {'one': '{0} مہینہ میں', 'other': '{0} مہینے میں'},
+                   'week': {'one': '{0} ہفتہ میں', 'other': '{0} ہفتے میں'},
+                   'day': {'one': '{0} دن میں', 'other': '{0} دنوں میں'},
+                   'hour': {'one': '{0} گھنٹے میں', 'other': '{0} گھنٹے میں'},
+                   'minute': {'one': '{0} منٹ میں', 'other': '{0} منٹ میں'},
+                   'second': {'one': '{0} سیکنڈ میں', 'other': '{0} سیکنڈ میں'}},
+        'past': {'year': {'one': '{0} سال پہلے', 'other': '{0} سال پہلے'},
+                 'month': {'one': '{0} مہینہ پہلے', 'other': '{0} مہینے پہلے'},
+                 'week': {'one': '{0} ہفتہ پہلے', 'other': '{0} ہفتے پہلے'},
+                 'day': {'one': '{0} دن پہلے', 'other': '{0} دنوں پہلے'},
+                 'hour': {'one': '{0} گھنٹہ پہلے', 'other': '{0} گھنٹے پہلے'},
+                 'minute': {'one': '{0} منٹ پہلے', 'other': '{0} منٹ پہلے'},
+                 'second': {'one': '{0} سیکنڈ پہلے', 'other': '{0} سیکنڈ پہلے'}}}}
+
+
+def plural_ar(n, i, v, w, f, t, c, e):
+    if IN(MOD(n, 100), [(3, 10)]): return 'few'
+    if IN(MOD(n, 100), [(11, 99)]): return 'many'
+    if IN(n, [(1, 1)]): return 'one'
+    if IN(n, [(2, 2)]): return 'two'
+    if IN(n, [(0, 0)]): return 'zero'
+    return 'other'
+
+
+def plural_bn(n, i, v, w, f, t, c, e):
+    if (IN(i, [(0, 0)]) or IN(n, [(1, 1)])): return 'one'
+    return 'other'
+
+
+def plural_de(n, i, v, w, f, t, c, e):
+    if (IN(i, [(1, 1)]) and IN(v, [(0, 0)])): return 'one'
+    return 'other'
+
+
+def plural_en(n, i, v, w, f, t, c, e):
+    if (IN(i, [(1, 1)]) and IN(v, [(0, 0)])): return 'one'
+    return 'other'
+
+
+def plural_es(n, i, v, w, f, t, c, e):
+    if ((((IN(e, [(0, 0)]) and (not IN(i, [(0, 0)]))) and IN(MOD(i, 1000000), [(0, 0)])) and IN(v, [(0, 0)])) or (not IN(e, [(0, 5)]))): return 'many'
+    if IN(n, [(1, 1)]): return 'one'
+    return 'other'
+
+
+def plural_fa(n, i, v, w, f, t, c, e):
+    if (IN(i, [(0, 0)]) or IN(n, [(1, 1)])): return 'one'
+    return 'other'
+
+
+def plural_fr(n, i, v, w, f, t, c, e):
+    if ((((IN(e, [(0, 0)]) and (not IN(i, [(0, 0)]))) and IN(MOD(i, 1000000), [(0, 0)])) and IN(v, [(0, 0)])) or (not IN(e, [(0, 5)]))): return 'many'
+    if IN(i, [(0, 0),(1, 1)]): return 'one'
+    return 'other'
+
+
+def plural_he(n, i, v, w, f, t, c, e):
+    if ((IN(i, [(1, 1)]) and IN(v, [(0, 0)])) or (IN(i, [(0, 0)]) and (not IN(v, [(0, 0)])))): return 'one'
+    if (IN(i, [(2, 2)]) and IN(v, [(0, 0)])): return 'two'
+    return 'other'
+
+
+def plural_hi(n, i, v, w, f, t, c, e):
+    if (IN(i, [(0, 0)]) or IN(n, [(1, 1)])): return 'one'
+    return 'other'
+
+
+def plural_hu(n, i, v, w, f, t, c, e):
+    if IN(n, [(1, 1)]): return 'one'
+    return 'other'
+
+
+def plural_id(n, i, v, w, f, t, c, e):
+    return 'other'
+
+
+def plural_it(n, i, v, w, f, t, c, e):
+    if ((((IN(e, [(0, 0)]) and (not IN(i, [(0, 0)]))) and IN(MOD(i, 1000000), [(0, 0)])) and IN(v, [(0, 0)])) or (not IN(e, [(0, 5)]))): return 'many'
+    if (IN(i, [(1, 1)]) and IN(v, [(0, 0)])): return 'one'
+    return 'other'
+
+
+def plural_ja(n, i, v, w, f, t, c, e):
+    return 'other'
+
+
+def plural_ko(n, i, v, w, f, t, c, e):
+    return 'other'
+
+
+def plural_mi(n, i, v, w, f, t, c, e):
+    return 'other'
+
+
+def plural_pl(n, i, v, w, f, t, c, e):
+    if ((IN(v, [(0, 0)]) and IN(MOD(i, 10), [(2, 4)])) and (not IN(MOD(i, 100), [(12, 14)]))): return 'few'
+    if ((((IN(v, [(0, 0)]) and (not IN(i, [(1, 1)]))) and IN(MOD(i, 10), [(0, 1)])) or (IN(v, [(0, 0)]) and IN(MOD(i, 10), [(5, 9)]))) or (IN(v, [(0, 0)]) and IN(MOD(i, 100), [(12, 14)]))): return 'many'
+    if (IN(i, [(1, 1)]) and IN(v, [(0, 0)])): return 'one'
+    return 'other'
+
+
+def plural_pt(n, i, v, w, f, t, c, e):
+    if ((((IN(e, [(0, 0)]) and (not IN(i, [(0, 0)]))) and IN(MOD(i, 1000000), [(0, 0)])) and IN(v, [(0, 0)])) or (not IN(e, [(0, 5)]))): return 'many'
+    if IN(i, [(0, 1)]): return 'one'
+    return 'other'
+
+
+def plural_sv(n, i, v, w, f, t, c, e):
+    if (IN(i, [(1, 1)]) and IN(v, [(0, 0)])): return 'one'
+    return 'other'
+
+
+def plural_ur(n, i, v, w, f, t, c, e):
+    if (IN(i, [(1, 1)]) and IN(v, [(0, 0)])): return 'one'
+    return 'other'
+
+
+PLURAL_FORMS = {'ar': plural_ar, 'bn': plural_bn, 'de': plural_de, 'en': plural_en, 'es': plural_es, 'fa': plural_fa, 'fr': plural_fr, 'he': plural_he, 'hi': plural_hi, 'hu': plural_hu, 'id': plural_id, 'it': plural_it, 'ja': plural_ja, 'ko': plural_ko, 'mi': plural_mi, 'pl': plural_pl, 'pt': plural_pt, 'sv': plural_sv, 'ur': plural_ur}
@@ -0,0 +1,172 @@
+"""Translations, view counts and relative times formatted from the compiled locale table
+
+Languages with a translation in ``api/locale`` are formatted from ``api.locale_table``,
+which is generated by ``python -m api.compile_locales``, so no YAML is parsed and no
+Babel locale data is loaded at runtime. Other languages known by Babel fall back to
+the English translations and are formatted by Babel.
+"""
+
+import math
+from datetime import timedelta
+from decimal import Decimal
+from functools import lru_cache
+
+from .locale_table import (
+    COMPACT_FORMATS,
+    DECIMAL_FORMATS,
+    NUMBER_SYMBOLS,
+    PLURAL_FORMS,
+    RELATIVE_TIME,
+    TIMEDELTA_UNITS,
+    TRANSLATIONS,
+)
+from .plural import Number, plural_operands
+
+# language of the translations used when a language has none
+FALLBACK_LANG = "en"
+
+
+def has_compiled_locale(lang: str) -> bool:
+    """Whether a language is in the compiled locale table"""
+    return lang in TRANSLATIONS
+
+
+def translate(key: str, lang: str, default: str = "", **kwargs: str) -> str:
+    """Get the translation of a key, substituting %{name} placeholders with the keyword arguments
+
+    Falls back to the English translation, then to the default.
+    """
+    text = TRANSLATIONS.get(lang, {}).get(key) or TRANSLATIONS[FALLBACK_LANG].get(key, default)
+    for name, value in kwargs.items():
+        text = text.replace(f"%{{{name}}}", value)
+    return text
+
+
+def plural_form(number: Number, lang: str) -> str:
+    """Get the CLDR plural form of a number in a language with a compiled plural rule"""
+    return PLURAL_FORMS[lang](*plural_operands(number))
+
+
+def apply_pattern(number: Decimal, pattern: tuple, lang: str) -> str:
+    """Format a non-negative number with a compiled number pattern, keeping its fraction digits"""
+    prefix, suffix, int_min, frac_min, frac_max, primary_group, secondary_group = pattern
+    decimal_symbol, group_symbol = NUMBER_SYMBOLS[lang]
+    value = abs(number).normalize()
+    exponent = value.as_tuple().exponent
+    assert isinstance(exponent, int)
+    frac_max = max(frac_max, -exponent)
+    integer, _, fraction = f"{value.quantize(Decimal(10) ** -frac_max):f}".partition(".")
+    integer = integer.rjust(int_min, "0")
+    grouped = ""
+    group_size = primary_group
+    while len(integer) > group_size:
+        grouped = group_symbol + integer[-group_size:] + grouped
+        integer = integer[:-group_size]
+        group_size = secondary_group
+    fraction = (fraction or "0").ljust(frac_min, "0")
+    if frac_max == 0 or (frac_min == 0 and int(fraction) == 0):
+        fraction = ""
+    else:
+        fraction = decimal_symbol + fraction[:frac_min] + fraction[frac_min:].rstrip("0")
+    return prefix + integer + grouped + fraction + suffix
+
+
+def format_compact_number(number: int, lang: str, fraction_digits: int = 1) -> str:
+    """Format a number in short compact form (ex. 1234567 => "1.2M")
+
+    Matches ``babel.numbers.format_compact_decimal`` for non-negative numbers.
+    """
+    if lang not in COMPACT_FORMATS:
+        from babel.numbers import format_compact_decimal
+
+        return format_compact_decimal(number, locale=lang, fraction_digits=fraction_digits)
+    value = Decimal(number)
+    pattern = DECIMAL_FORMATS[lang]
+    for magnitude, divisor, patterns in COMPACT_FORMATS[lang]:
+        if value >= magnitude:
+            pattern = patterns["other"]
+            if divisor is None:
+                break
+            value = value / divisor
+            form = "1" if value == 1 and "1" in patterns else plural_form(value, lang)
+            pattern = patterns.get(form, pattern)
+            value = round(value, fraction_digits)
+            break
+    return apply_pattern(value, pattern, lang)
+
+
+def round_compact_number(number: int, lang: str, fraction_digits: int = 1) -> int:
+    """Round a number to the precision it is shown with in short compact form
+    (ex. 1234567 => 1200000), so numbers shown alike are formatted once
+
+    Numbers are returned unchanged when the rounded number would be shown otherwise, such
+    as 999999 shown as "1000K" but 1000000 as "1M", or in a language without a compiled
+    locale.
+    """
+    if lang not in COMPACT_FORMATS:
+        return number
+    value = Decimal(number)
+    upper = None
+    for magnitude, divisor, patterns in COMPACT_FORMATS[lang]:
+        if value >= magnitude:
+            if divisor is None:
+                return number
+            rounded = int(round(value / divisor, fraction_digits) * divisor)
+            if rounded < magnitude or (upper is not None and rounded >= upper):
+                return number
+            # the plural form is chosen from the unrounded number
+            if len(set(patterns.values())) > 1 and format_compact_number(
+                rounded, lang, fraction_digits
+            ) != format_compact_number(number, lang, fraction_digits):
+                return number
+            return rounded
+        upper = magnitude
+    return number
+
+
+def relative_time_unit(seconds: int, threshold: float = 0.85) -> tuple[str, int]:
+    """Get the unit and the rounded number of units a number of seconds is displayed in
+
+    Follows ``babel.dates.format_timedelta``: the largest unit with at least
+    threshold units is used, so the text only changes when this pair changes.
+    """
+    for unit, seconds_per_unit in TIMEDELTA_UNITS:
+        value = abs(seconds) / seconds_per_unit
+        if value >= threshold or unit == "second":
+            if unit == "second" and value > 0:
+                value = max(1, value)
+            return unit, int(round(value))
+    raise AssertionError("unreachable")
+
+
+def format_relative_seconds(seconds: int, lang: str, threshold: float = 0.85) -> str:
+    """Format a number of seconds relative to now (ex. -3600 => "1 hour ago")
+
+    Matches ``babel.dates.format_timedelta`` with ``add_direction=True``.
+    """
+    unit, value = relative_time_unit(seconds, threshold)
+    return format_relative_value(unit, value, seconds >= 0, lang, threshold)
+
+
+@lru_cache(maxsize=4096)
+def format_relative_value(unit: str, value: int, future: bool, lang: str, threshold: float) -> str:
+    """Format a number of units relative to now, memoized as the key is coarse"""
+    if lang not in RELATIVE_TIME:
+        from babel.dates import format_timedelta
+
+        # any number of seconds displayed in this unit gives the same text, so pick one that
+        # rounds to the value without reaching the threshold of the next larger unit
+        units = [unit_name for unit_name, _ in TIMEDELTA_UNITS]
+        seconds = value * dict(TIMEDELTA_UNITS)[unit]
+        if unit != units[0]:
+            larger = TIMEDELTA_UNITS[units.index(unit) - 1][1]
+            seconds = min(seconds, math.ceil(threshold * larger) - 1)
+        delta = timedelta(seconds=seconds if future else -seconds)
+        return format_timedelta(delta, threshold=threshold, add_direction=True, locale=lang)
+    patterns = RELATIVE_TIME[lang]["future" if future else "past"][unit]
+    return patterns.get(plural_form(value, lang), patterns["other"]).replace("{0}", str(value))
+
+
+def text_direction(lang: str) -> str:
+    """Get the direction of text in a language ("ltr" or "rtl")"""
+    return translate("direction", lang, default="ltr")
@@ -0,0 +1,220 @@
+"""Timings and counters of the server, exposed in the Prometheus text format
+
+Each stage of serving a card is timed with ``timed()`` or ``record_stage()``. Stage
+durations are kept in the timings of the current request, which are sent back in its
+``Server-Timing`` header and added to a histogram once the request is finished.
+Metrics are kept per process.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any, Callable, Iterable, Optional
+
+# upper bounds in seconds of the buckets of stage durations
+DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+# upper bounds in bytes of the buckets of response sizes
+SIZE_BUCKETS = (1024, 4096, 16384, 32768, 65536, 131072, 262144, 524288, 1048576)
+
+METRIC_PREFIX = "youtube_cards"
+
+
+class Histogram:
+    """Thread-safe counts of observed values in buckets of a metric, by label value"""
+
+    def __init__(self, name: str, description: str, label: str, buckets: tuple[float, ...]):
+        self.name = name
+        self.description = description
+        self.label = label
+        self.buckets = buckets
+        # counts per bucket, with a last bucket for values above every bound
+        self._counts: dict[str, list[int]] = {}
+        self._sums: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, label_value: str, value: float) -> None:
+        """Add a value to the histogram of a label value"""
+        self.observe_many(((label_value, value),))
+
+    def observe_many(self, observations: Iterable[tuple[str, float]]) -> None:
+        """Add values to the histograms of their label values, taking the lock once"""
+        with self._lock:
+            for label_value, value in observations:
+                counts = self._counts.get(label_value)
+                if counts is None:
+                    counts = self._counts[label_value] = [0] * (len(self.buckets) + 1)
+                counts[bisect_left(self.buckets, value)] += 1
+                self._sums[label_value] = self._sums.get(label_value, 0) + value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
+
+    def exposition(self) -> list[str]:
+        """Get the lines of the histogram in the Prometheus text format"""
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = {key: (list(counts), self._sums[key]) for key, counts in self._counts.items()}
+        for label_value, (counts, total) in sorted(series.items()):
+            labels = f'{self.label}="{escape_label(label_value)}"'
+            cumulative = 0
+            for bound, count in zip([*map(format_number, self.buckets), "+Inf"], counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{labels}}} {format_number(total)}")
+            lines.append(f"{self.name}_count{{{labels}}} {cumulative}")
+        return lines
+
+
+class Counter:
+    """Thread-safe counts of events of a metric, by the values of its labels"""
+
+    def __init__(self, name: str, description: str, labels: tuple[str, ...]):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self._counts: dict[tuple[str, ...], int] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str) -> None:
+        """Count an event with the given label values"""
+        with self._lock:
+            self._counts[label_values] = self._counts.get(label_values, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def exposition(self) -> list[str]:
+        """Get the lines of the counter in the Prometheus text format"""
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            counts = dict(self._counts)
+        for label_values, count in sorted(counts.items()):
+            lines.append(f"{self.name}{{{format_labels(self.labels, label_values)}}} {count}")
+        return lines
+
+
+class RequestTimings:
+    """Durations of the stages of a request, in the order they were recorded"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.stages: list[tuple[str, float]] = []
+
+    def server_timing(self) -> str:
+        """Get the value of the Server-Timing header, with durations in milliseconds"""
+        return ", ".join(f"{stage};dur={seconds * 1000:.2f}" for stage, seconds in self.stages)
+
+
+stage_seconds = Histogram(
+    f"{METRIC_PREFIX}_stage_seconds",
+    "Time spent in each stage of serving a card",
+    "stage",
+    DURATION_BUCKETS,
+)
+response_bytes = Histogram(
+    f"{METRIC_PREFIX}_response_bytes", "Size of card responses by status", "status", SIZE_BUCKETS
+)
+upstream_responses = Counter(
+    f"{METRIC_PREFIX}_upstream_responses_total",
+    "Responses from upstream servers by host and status, or error",
+    ("host", "status"),
+)
+
+# timings of the request being served, if any
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar("current_timings", default=None)
+
+
+def start_request() -> RequestTimings:
+    """Start timing the stages of a request in the current context"""
+    timings = RequestTimings()
+    current_timings.set(timings)
+    return timings
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    """Record the duration of a stage in the timings of the request, or in its histogram
+    right away outside of requests
+
+    The stages of a request are added to the histogram together once it is finished.
+    """
+    timings = current_timings.get()
+    if timings is None:
+        stage_seconds.observe(stage, seconds)
+    else:
+        timings.stages.append((stage, seconds))
+
+
+def finish_request() -> Optional[RequestTimings]:
+    """Record the total duration of the request being timed and stop timing it
+
+    Returns the timings of the request, or None if no request was being timed.
+    """
+    timings = current_timings.get()
+    if timings is None:
+        return None
+    timings.stages.append(("total", time.perf_counter() - timings.start))
+    current_timings.set(None)
+    stage_seconds.observe_many(timings.stages)
+    return timings
+
+
+def mark_finished(finished: dict[str, float], stage: str) -> Callable[[Any], None]:
+    """Get a done callback for a future which stores the time its stage finished"""
+    return lambda _: finished.setdefault(stage, time.perf_counter())
+
+
+def record_stages_since(start: float, finished: dict[str, float], stages: Iterable[str]) -> None:
+    """Record stages which ran concurrently since start, unfinished stages lasting until now"""
+    now = time.perf_counter()
+    for stage in stages:
+        record_stage(stage, finished.get(stage, now) - start)
+
+
+class timed:
+    """Time the code in a with block as a stage
+
+    A class rather than a generator based context manager, which costs a few times more.
+    """
+
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        record_stage(self.stage, time.perf_counter() - self.start)
+
+
+def escape_label(value: str) -> str:
+    """Escape a label value for the Prometheus text format"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    return ",".join(f'{name}="{escape_label(value)}"' for name, value in zip(names, values))
+
+
+def format_number(value: float) -> str:
+    """Format a number as short as possible for the Prometheus text format"""
+    return str(int(value)) if value == int(value) else repr(value)
+
+
+def samples_exposition(
+    name: str,
+    description: str,
+    metric_type: str,
+    labels: tuple[str, ...],
+    samples: dict[tuple[str, ...], float],
+) -> list[str]:
+    """Get the lines of a gauge or counter kept elsewhere in the Prometheus text format"""
+    lines = [f"# HELP {name} {description}", f"# TYPE {name} {metric_type}"]
+    for label_values, value in sorted(samples.items()):
+        lines.append(f"{name}{{{format_labels(labels, label_values)}}} {format_number(value)}")
+    return lines
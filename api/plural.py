@@ -0,0 +1,46 @@
+"""Operands and operators of CLDR plural rules
+
+Plural rules are compiled to Python functions of the operands by ``api.compile_locales``.
+These helpers match ``babel.plural``, so the compiled rules give the same plural forms
+as Babel without loading it.
+"""
+
+from decimal import Decimal
+from typing import Iterable, Union
+
+Number = Union[int, Decimal]
+
+
+def plural_operands(source: Number) -> tuple[Number, int, int, int, int, int, int, int]:
+    """Extract the operands (n, i, v, w, f, t, c, e) of a number used by plural rules
+
+    See https://www.unicode.org/reports/tr35/tr35-numbers.html#Operands
+    """
+    n = abs(source)
+    i = int(n)
+    if isinstance(n, Decimal):
+        exponent = n.as_tuple().exponent
+        assert isinstance(exponent, int)
+        trailing = "".join(str(d) for d in n.as_tuple().digits[exponent:]) if exponent < 0 else ""
+        no_trailing = trailing.rstrip("0")
+        v, w = len(trailing), len(no_trailing)
+        f, t = int(trailing or 0), int(no_trailing or 0)
+    else:
+        v = w = f = t = 0
+    return n, i, v, w, f, t, 0, 0
+
+
+def in_range_list(num: Number, range_list: Iterable[tuple[int, int]]) -> bool:
+    """Whether a number is an integer within any of the ranges (the "in" operator)"""
+    return num == int(num) and within_range_list(num, range_list)
+
+
+def within_range_list(num: Number, range_list: Iterable[tuple[int, int]]) -> bool:
+    """Whether a number is within any of the ranges (the "within" operator)"""
+    return any(min_ <= num <= max_ for min_, max_ in range_list)
+
+
+def cldr_modulo(a: Number, b: Number) -> Number:
+    """Modulo with the sign of the dividend (the "mod" operator)"""
+    remainder = abs(a) % abs(b)
+    return -remainder if a < 0 else remainder
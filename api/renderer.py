@@ -0,0 +1,161 @@
+"""Precompiled renderer producing the same output as the ``main.svg`` template
+
+The parts of a card that only depend on its size, colors and text direction are
+built once per combination and cached, so rendering a card only escapes and
+splices the title lines, stats, duration and thumbnail. The Jinja template remains
+the reference implementation, and the output must stay byte-identical to it
+(see ``tests/test_renderer.py``), so any change to ``main.svg`` must be made here too.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple, Union
+
+from markupsafe import escape
+
+FONT_FAMILY = "Roboto, Segoe UI, Ubuntu, Arial, sans-serif"
+
+
+class CardFragments(NamedTuple):
+    # header of the card up to the thumbnail
+    header: str
+    # opening of the title, before its lines
+    title: str
+    # opening of a title line
+    title_line: str
+    # opening of the stats
+    stats: str
+
+
+@lru_cache(maxsize=1024)
+def card_fragments(
+    width: int,
+    height: int,
+    title_line_height: int,
+    title_height: int,
+    border_radius: int,
+    background_color: str,
+    title_color: str,
+    stats_color: str,
+    rtl: bool,
+    rtl_title: bool,
+) -> CardFragments:
+    """Build the static fragments of a card for its size, colors and text direction"""
+    width_, height_ = escape(width), escape(height)
+    header = (
+        "<!-- https://github.com/DenverCoder1/github-readme-youtube-cards -->\n"
+        "<svg xmlns='http://www.w3.org/2000/svg' xmlns:xlink='http://www.w3.org/1999/xlink'\n"
+        f'    width="{width_}" height="{height_}" viewBox="0 0 {width_} {height_}">\n'
+        "    \n"
+        "    <defs>\n"
+        '        <clipPath id="image-clip">\n'
+        '            <use xlink:href="#rect" />\n'
+        "        </clipPath>\n"
+        "    </defs>\n"
+        "    <!-- outer rectangle -->\n"
+        f'    <rect id="rect" rx="{escape(border_radius)}" width="{width_}" height="{height_}"\n'
+        f'        fill="{escape(background_color)}" />\n'
+        "    <!-- thumbnail image -->\n"
+        f'    <image width="{width_}" clip-path="url(#image-clip)" href="'
+    )
+    title = (
+        "\n"
+        "    <!-- title -->\n"
+        f'    <g transform="translate({escape(width - 12 if rtl_title else 10)}, '
+        f'{escape(height - title_height - 50)})">\n'
+        f'        <text fill="{escape(title_color)}" font-family="{FONT_FAMILY}"\n'
+        '            font-weight="600" font-size="15px" '
+        f"direction=\"{'rtl' if rtl_title else 'ltr'}\">\n"
+        "            "
+    )
+    title_line = f'\n            <tspan x="0" dy="{escape(title_line_height)}px">'
+    stats = (
+        "\n"
+        "        </text>\n"
+        "    </g>\n"
+        "    <!-- views and date -->\n"
+        f'    <g transform="translate({escape(width - 10 if rtl else 10)}, {escape(height - 25)})">\n'
+        f'        <text fill="{escape(stats_color)}" font-family="{FONT_FAMILY}"\n'
+        '            font-weight="400" font-size="13px" '
+        f"direction=\"{'rtl' if rtl else 'ltr'}\">\n"
+        "            "
+    )
+    return CardFragments(header, title, title_line, stats)
+
+
+def duration_fragment(
+    width: int, height: int, title_height: int, duration: str, duration_width: Union[int, float]
+) -> str:
+    """Build the duration badge of a card"""
+    return (
+        "\n"
+        "    <!-- video duration -->\n"
+        f'    <g transform="translate({escape(width - 8 - duration_width)}, '
+        f'{escape(height - title_height - 82)})">\n'
+        f'        <rect x="0" y="0" rx="2" width="{escape(duration_width)}" height="16" '
+        'fill="#000000bb"/>\n'
+        f'        <text x="{escape(duration_width / 2)}" y="9" dominant-baseline="middle" '
+        'text-anchor="middle"\n'
+        f'            fill="#ffffff" font-family="{FONT_FAMILY}"\n'
+        '            font-weight="600" font-size="13px">\n'
+        f"            {escape(duration)}\n"
+        "        </text>\n"
+        "    </g>\n"
+        "    "
+    )
+
+
+def main_fragments(
+    *,
+    width: int,
+    height: int,
+    title_line_height: int,
+    title_height: int,
+    background_color: str,
+    title_color: str,
+    stats_color: str,
+    title_lines: list[str],
+    stats: str,
+    thumbnail: str,
+    duration: str,
+    duration_width: int,
+    border_radius: int,
+    rtl: bool,
+    rtl_title: bool,
+    reduced_bandwidth: bool = True,
+) -> list[str]:
+    """Render a card with the variables of the ``main.svg`` template as a list of fragments
+
+    Raises:
+        ValueError: If the card embeds its font, which is only supported by the template
+    """
+    if not reduced_bandwidth:
+        raise ValueError("Cards embedding their font must be rendered from the template")
+    fragments = card_fragments(
+        width,
+        height,
+        title_line_height,
+        title_height,
+        border_radius,
+        background_color,
+        title_color,
+        stats_color,
+        rtl,
+        rtl_title,
+    )
+    parts = [fragments.header, escape(thumbnail), '" />\n    ']
+    if duration != "0:00":
+        parts.append(duration_fragment(width, height, title_height, duration, duration_width))
+    parts.append(fragments.title)
+    for line in title_lines:
+        parts += (fragments.title_line, escape(line), "</tspan>\n            ")
+    parts += (fragments.stats, escape(stats), "\n        </text>\n    </g>\n</svg>")
+    return parts
+
+
+def render_main(**context) -> str:
+    """Render a card with the variables of the ``main.svg`` template
+
+    Raises:
+        ValueError: If the card embeds its font, which is only supported by the template
+    """
+    return "".join(main_fragments(**context))
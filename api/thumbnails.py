@@ -0,0 +1,125 @@
+import io
+import logging
+from functools import cache
+from types import ModuleType
+from typing import NamedTuple, Optional
+
+from .config import THUMBNAIL_FORMAT, THUMBNAIL_QUALITY, THUMBNAIL_SCALE
+
+logger = logging.getLogger(__name__)
+
+# content types of the formats thumbnails can be recompressed to
+FORMAT_MIME_TYPES = {"jpeg": "image/jpeg", "webp": "image/webp"}
+
+
+class ThumbnailVariant(NamedTuple):
+    name: str
+    width: int
+    height: int
+
+    @property
+    def letterboxed(self) -> bool:
+        """Whether the 16:9 video frame is padded with black bars to fit a 4:3 image"""
+        return self.width * 9 != self.height * 16
+
+    @property
+    def content_box(self) -> tuple[int, int, int, int]:
+        """Box of the 16:9 video frame within the image"""
+        content_height = self.width * 9 // 16
+        top = (self.height - content_height) // 2
+        return 0, top, self.width, top + content_height
+
+
+# thumbnail sizes available on i.ytimg.com from smallest to largest
+VARIANTS = (
+    ThumbnailVariant("default", 120, 90),
+    ThumbnailVariant("mqdefault", 320, 180),
+    ThumbnailVariant("hqdefault", 480, 360),
+    ThumbnailVariant("sddefault", 640, 480),
+    ThumbnailVariant("maxresdefault", 1280, 720),
+)
+# variant that exists for every video, used when the preferred one is missing
+FALLBACK_VARIANT = VARIANTS[1]
+
+
+@cache
+def load_pillow() -> Optional[ModuleType]:
+    """Import Pillow's Image module on first use, or return None if Pillow is not installed
+
+    Pillow is only imported once thumbnails are processed, since importing it slows down
+    cold starts.
+    """
+    try:
+        from PIL import Image
+    except ImportError:  # pragma: no cover - Pillow is an optional dependency
+        return None
+    return Image
+
+
+def can_process() -> bool:
+    """Whether thumbnails are cropped, resized and recompressed before they are embedded"""
+    return THUMBNAIL_FORMAT in FORMAT_MIME_TYPES and load_pillow() is not None
+
+
+def plan_thumbnail(card_width: int) -> list[tuple[ThumbnailVariant, int]]:
+    """Get the thumbnail variants to try for a card, best first, with the width to embed them at
+
+    The best variant is the smallest one at least as wide as the card, scaled by
+    THUMBNAIL_SCALE for high density displays, which is then cropped and downscaled.
+    If thumbnails are not processed, the medium size is always embedded as is,
+    since other sizes are either letterboxed or much larger.
+    """
+    if not can_process():
+        return [(FALLBACK_VARIANT, FALLBACK_VARIANT.width)]
+    target_width = max(1, round(card_width * THUMBNAIL_SCALE))
+    variant = next((v for v in VARIANTS if v.width >= target_width), VARIANTS[-1])
+    plan = [(variant, min(variant.width, target_width))]
+    if variant != FALLBACK_VARIANT:
+        plan.append((FALLBACK_VARIANT, min(FALLBACK_VARIANT.width, target_width)))
+    return plan
+
+
+def process_thumbnail(
+    data: bytes, mime_type: Optional[str], variant: ThumbnailVariant, width: int
+) -> tuple[bytes, str]:
+    """Crop a thumbnail to its video frame, downscale it to a width and recompress it
+
+    The image is returned as is if processing is disabled, Pillow is not installed
+    or the image cannot be decoded.
+    """
+    mime_type = mime_type or "image/jpeg"
+    Image = load_pillow() if can_process() else None
+    if Image is None:
+        return data, mime_type
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image = image.convert("RGB")
+            if variant.letterboxed and image.size == (variant.width, variant.height):
+                image = image.crop(variant.content_box)
+            if image.width > width:
+                height = round(image.height * width / image.width)
+                image = image.resize((width, height), Image.Resampling.LANCZOS)
+            output = io.BytesIO()
+            image.save(output, format=THUMBNAIL_FORMAT, quality=THUMBNAIL_QUALITY)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not process thumbnail %s: %s", variant.name, e)
+        return data, mime_type
+    processed = output.getvalue()
+    # keep the original if recompressing did not make it smaller
+    if len(processed) >= len(data) and not variant.letterboxed:
+        return data, mime_type
+    return processed, FORMAT_MIME_TYPES[THUMBNAIL_FORMAT]
+
+
+def log_thumbnail(
+    video_id: str, variant: ThumbnailVariant, width: int, *, original_size: int, size: int
+) -> None:
+    """Log the size of a thumbnail embedded in a card and the bytes saved by processing it"""
+    logger.info(
+        "Thumbnail %s/%s at %dpx: %d bytes embedded, %d bytes saved",
+        video_id,
+        variant.name,
+        width,
+        size,
+        original_size - size,
+    )
@@ -0,0 +1,269 @@
+import http.client
+import socket
+import ssl
+import threading
+import time
+from email.message import Message
+from typing import NamedTuple, Optional
+from urllib.parse import urljoin, urlsplit
+
+from .breaker import CircuitBreakers, is_failure_status, upstream_breakers
+from .config import (
+    UPSTREAM_CONNECT_TIMEOUT,
+    UPSTREAM_IDLE_TIMEOUT,
+    UPSTREAM_MAX_CONNECTIONS_PER_HOST,
+    UPSTREAM_READ_TIMEOUT,
+)
+from .exceptions import CircuitOpenError, UpstreamError
+from .metrics import upstream_responses
+
+# errors raised when a kept-alive connection was closed by the server while it was idle
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+class UpstreamResponse(NamedTuple):
+    status: int
+    reason: str
+    headers: Message
+    body: bytes
+
+
+class ConnectionPool:
+    """Keep-alive connections to a single upstream host
+
+    At most ``max_connections`` requests are sent to the host at the same time.
+    Connections are reused until the server closes them or they have been idle
+    for ``idle_timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        scheme: str,
+        host: str,
+        port: Optional[int],
+        *,
+        max_connections: int,
+        connect_timeout: float,
+        read_timeout: float,
+        idle_timeout: float,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.idle_timeout = idle_timeout
+        self._ssl_context = ssl_context
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        # idle connections with the time they were last used, most recent last
+        self._idle: list[tuple[http.client.HTTPConnection, float]] = []
+        self.connections_opened = 0
+        self.connections_reused = 0
+
+    @property
+    def name(self) -> str:
+        """Host name of the pool including the port if it is not the default"""
+        return self.host if self.port is None else f"{self.host}:{self.port}"
+
+    def request(self, method: str, path: str, headers: dict[str, str]) -> UpstreamResponse:
+        """Send a request and read the whole response
+
+        Raises:
+            UpstreamError: If no connection is available in time, or the request fails or times out
+        """
+        if not self._slots.acquire(timeout=self.connect_timeout):
+            raise UpstreamError(f"Timed out waiting for a connection to {self.host}", status=503)
+        try:
+            conn, reused = self._checkout()
+            try:
+                return self._send(conn, method, path, headers)
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # the server closed the idle connection, so retry once on a new one
+                conn, _ = self._checkout(reuse=False)
+                return self._send(conn, method, path, headers)
+        except socket.timeout as e:
+            raise UpstreamError(f"Timed out requesting {self.host}", status=504) from e
+        except (OSError, http.client.HTTPException) as e:
+            raise UpstreamError(f"Failed to request {self.host}: {e}") from e
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    def _checkout(self, reuse: bool = True) -> tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with self._lock:
+            while reuse and self._idle:
+                conn, last_used = self._idle.pop()
+                if now - last_used < self.idle_timeout:
+                    self.connections_reused += 1
+                    return conn, True
+                conn.close()
+            self.connections_opened += 1
+        if self.scheme == "https":
+            conn = http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.connect_timeout, context=self._ssl_context
+            )
+        else:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.connect_timeout)
+        conn.connect()
+        assert conn.sock is not None
+        conn.sock.settimeout(self.read_timeout)
+        return conn, False
+
+    def _send(
+        self, conn: http.client.HTTPConnection, method: str, path: str, headers: dict[str, str]
+    ) -> UpstreamResponse:
+        try:
+            conn.request(method, path, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            with self._lock:
+                self._idle.append((conn, time.monotonic()))
+        return UpstreamResponse(response.status, response.reason, response.msg, body)
+
+
+class HTTPClient:
+    """HTTP client shared by a process which pools keep-alive connections per upstream host"""
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int = UPSTREAM_MAX_CONNECTIONS_PER_HOST,
+        connect_timeout: float = UPSTREAM_CONNECT_TIMEOUT,
+        read_timeout: float = UPSTREAM_READ_TIMEOUT,
+        idle_timeout: float = UPSTREAM_IDLE_TIMEOUT,
+        user_agent: str = "GitHub Readme YouTube Cards",
+        max_redirects: int = 3,
+        breakers: Optional[CircuitBreakers] = None,
+    ):
+        self.max_connections_per_host = max_connections_per_host
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.idle_timeout = idle_timeout
+        self.user_agent = user_agent
+        self.max_redirects = max_redirects
+        self.breakers = breakers
+        # created with the first HTTPS connection pool, since loading certificates is slow
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._pools: dict[tuple[str, str, Optional[int]], ConnectionPool] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, *, headers: Optional[dict[str, str]] = None) -> UpstreamResponse:
+        """Send a GET request, following redirects, and return the response
+
+        Raises:
+            CircuitOpenError: If requests to the host are stopped by its circuit breaker
+            UpstreamError: If the request fails, times out or the response is an HTTP error
+        """
+        request_headers = {"User-Agent": self.user_agent} | (headers or {})
+        for _ in range(self.max_redirects + 1):
+            parts = urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path = f"{path}?{parts.query}"
+            pool = self._pool(parts.scheme, parts.hostname or "", parts.port)
+            response = self._request(pool, path, request_headers)
+            location = response.headers.get("Location")
+            if response.status not in REDIRECT_STATUSES or not location:
+                break
+            url = urljoin(url, location)
+        if response.status >= 400:
+            raise UpstreamError(
+                f"HTTP Error {response.status}: {response.reason}", status=response.status
+            )
+        return response
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.close()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return the number of connections opened and reused per host"""
+        with self._lock:
+            return {
+                pool.name: {
+                    "connections_opened": pool.connections_opened,
+                    "connections_reused": pool.connections_reused,
+                }
+                for pool in self._pools.values()
+            }
+
+    def _request(
+        self, pool: ConnectionPool, path: str, headers: dict[str, str]
+    ) -> UpstreamResponse:
+        """Send a request through a pool, recording its outcome in the breaker of the host"""
+        breaker = None if self.breakers is None else self.breakers.get(pool.name)
+        if breaker is not None and not breaker.allow():
+            upstream_responses.inc(pool.name, "circuit_open")
+            raise CircuitOpenError(f"Requests to {pool.name} are paused after repeated failures")
+        start = time.monotonic()
+        try:
+            response = pool.request("GET", path, headers)
+        except UpstreamError as e:
+            upstream_responses.inc(pool.name, "timeout" if e.status == 504 else "error")
+            if breaker is not None:
+                failed = is_failure_status(e.status, pool.name)
+                breaker.record(time.monotonic() - start, failed=failed)
+            raise
+        except BaseException:
+            upstream_responses.inc(pool.name, "error")
+            if breaker is not None:
+                breaker.record(time.monotonic() - start, failed=True)
+            raise
+        upstream_responses.inc(pool.name, str(response.status))
+        if breaker is not None:
+            failed = is_failure_status(response.status, pool.name)
+            breaker.record(time.monotonic() - start, failed=failed)
+        return response
+
+    def _pool(self, scheme: str, host: str, port: Optional[int]) -> ConnectionPool:
+        if scheme not in ("http", "https"):
+            raise UpstreamError(f"Unsupported URL scheme '{scheme}'")
+        key = (scheme, host, port)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                if scheme == "https" and self._ssl_context is None:
+                    self._ssl_context = ssl.create_default_context()
+                pool = self._pools[key] = ConnectionPool(
+                    scheme,
+                    host,
+                    port,
+                    max_connections=self.max_connections_per_host,
+                    connect_timeout=self.connect_timeout,
+                    read_timeout=self.read_timeout,
+                    idle_timeout=self.idle_timeout,
+                    ssl_context=self._ssl_context,
+                )
+            return pool
+
+
+# client used for all requests to upstream servers
+http_client = HTTPClient(breakers=upstream_breakers)
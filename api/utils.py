@@ -1,30 +1,102 @@
-import codecs
+import base64
+import math
 import textwrap
+import time
 import unicodedata as ud
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import repeat
 from typing import Optional
-from urllib.request import Request, urlopen
+from urllib.parse import urlencode
 
-import i18n
 import orjson
-from babel.dates import format_timedelta
-from babel.numbers import format_compact_decimal
 
-i18n.set("filename_format", "{locale}.{format}")
-i18n.set("enable_memoization", True)
-i18n.load_path.append("./api/locale")
+from .batching import MicroBatcher
+from .cache import LRUCache, SingleFlight, StaleWhileRevalidateCache
+from .cache_backends import create_cache
+from .config import (
+    MISSING_VIDEOS_CACHE_MAX_BYTES,
+    MISSING_VIDEOS_CACHE_TTL,
+    SHIELDS_BASE_URL,
+    THUMBNAIL_CACHE_MAX_BYTES,
+    THUMBNAIL_CACHE_TTL,
+    UPSTREAM_WORKERS,
+    VIEWS_BATCH_SIZE,
+    VIEWS_BATCH_WINDOW,
+    VIEWS_CACHE_MAX_BYTES,
+    VIEWS_CACHE_STALE_TTL,
+    VIEWS_CACHE_TTL,
+    VIEWS_PROVIDER,
+    YOUTUBE_API_BASE_URL,
+    YOUTUBE_API_KEY,
+    YTIMG_BASE_URL,
+)
+from .exceptions import CircuitOpenError, UpstreamError
+from .layout import measure_text
+from .locales import (
+    format_compact_number,
+    format_relative_seconds,
+    round_compact_number,
+    text_direction,
+    translate,
+)
+from .metrics import mark_finished, record_stages_since
+from .thumbnails import ThumbnailVariant, log_thumbnail, plan_thumbnail, process_thumbnail
+from .upstream import http_client
+
+# shared pool of threads for requests to upstream servers
+upstream_executor = ThreadPoolExecutor(max_workers=UPSTREAM_WORKERS, thread_name_prefix="upstream")
+
+# encoded thumbnail data URIs keyed by "video ID:thumbnail variant:embedded width"
+thumbnail_cache = create_cache(
+    "thumbnails", max_bytes=THUMBNAIL_CACHE_MAX_BYTES, ttl=THUMBNAIL_CACHE_TTL
+)
+# messages of the errors of videos whose thumbnail was not found keyed by video ID, kept in the
+# memory of each process whatever the cache backend, so requests for random IDs can't evict
+# the entries of existing videos, which share eviction on a Redis server
+missing_videos = LRUCache(
+    max_bytes=MISSING_VIDEOS_CACHE_MAX_BYTES,
+    ttl=MISSING_VIDEOS_CACHE_TTL,
+    size_of=lambda entry: len(entry) + 100,
+)
+# unformatted view counts keyed by video ID, empty for videos which hide their view count
+views_cache = StaleWhileRevalidateCache(
+    max_bytes=VIEWS_CACHE_MAX_BYTES,
+    ttl=VIEWS_CACHE_TTL,
+    stale_ttl=VIEWS_CACHE_STALE_TTL,
+    # load times are compared between processes and hosts sharing the cache
+    clock=time.time,
+    executor=upstream_executor,
+    backend=create_cache(
+        "views",
+        max_bytes=VIEWS_CACHE_MAX_BYTES,
+        ttl=VIEWS_CACHE_TTL + VIEWS_CACHE_STALE_TTL,
+        # view counts are short, so account for the key and bookkeeping overhead as well
+        size_of=lambda entry: len(entry) + 100,
+    ),
+)
+# concurrent requests to upstream servers for the same resource, which share one request
+upstream_calls = SingleFlight()
 
 
 def format_relative_time(timestamp: float, lang: str = "en") -> str:
     """Get relative time from unix timestamp (ex. "3 hours ago")"""
     delta = timedelta(seconds=timestamp - datetime.now().timestamp())
-    return format_timedelta(delta=delta, add_direction=True, locale=lang)
+    return format_relative_seconds(delta.days * 86400 + delta.seconds, lang)
 
 
 def data_uri_from_bytes(*, data: bytes, mime_type: str) -> str:
     """Return a base-64 data URI for bytes"""
-    base64 = codecs.encode(data, "base64").decode("utf-8").replace("\n", "")
-    return f"data:{mime_type};base64,{base64}"
+    return f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+# thumbnail of degraded cards, served while the thumbnail server is failing
+PLACEHOLDER_THUMBNAIL = data_uri_from_bytes(
+    data=b'<svg xmlns="http://www.w3.org/2000/svg" width="16" height="9">'
+    b'<rect width="16" height="9" fill="#808080"/></svg>',
+    mime_type="image/svg+xml",
+)
 
 
 def data_uri_from_url(url: str, *, mime_type: Optional[str] = None) -> str:
@@ -32,14 +104,102 @@ def data_uri_from_url(url: str, *, mime_type: Optional[str] = None) -> str:
     If not passed, the content type is determined from the response header
     if present, otherwise, jpeg is assumed.
 
+    Concurrent requests for the same URL share a single download.
+
     Raises:
-        HTTPError: If the request fails
+        UpstreamError: If the request fails
     """
-    with urlopen(url) as response:
-        data = response.read()
+    response = upstream_calls.do(("url", url), lambda: http_client.get(url))
     mime_type = mime_type or response.headers["Content-Type"] or "image/jpeg"
     assert mime_type is not None
-    return data_uri_from_bytes(data=data, mime_type=mime_type)
+    return data_uri_from_bytes(data=response.body, mime_type=mime_type)
+
+
+def encode_thumbnail(
+    video_id: str, data: bytes, mime_type: Optional[str], variant: ThumbnailVariant, width: int
+) -> str:
+    """Process a downloaded thumbnail to embed it in a card and return its base-64 data URI"""
+    processed, mime_type = process_thumbnail(data, mime_type, variant, width)
+    log_thumbnail(video_id, variant, width, original_size=len(data), size=len(processed))
+    return data_uri_from_bytes(data=processed, mime_type=mime_type)
+
+
+def fetch_thumbnail(video_id: str, card_width: int = 250) -> str:
+    """Return the base-64 data URI of a video thumbnail sized for a card width,
+    downloading it only if it is not cached
+
+    Concurrent requests for the same thumbnail share a single download.
+
+    Raises:
+        UpstreamError: If the request fails
+    """
+    plan = plan_thumbnail(card_width)
+    key = thumbnail_cache_key(video_id, plan)
+    cached = thumbnail_cache.get(key)
+    if cached is not None:
+        return cached.decode("ascii")
+    thumbnail = upstream_calls.do(("thumbnail", key), lambda: download_thumbnail(video_id, plan))
+    thumbnail_cache.set(key, thumbnail.encode("ascii"))
+    return thumbnail
+
+
+def thumbnail_cache_key(video_id: str, plan: list[tuple[ThumbnailVariant, int]]) -> str:
+    """Get the key of a thumbnail from the preferred variant and width in its plan"""
+    variant, width = plan[0]
+    return f"{video_id}:{variant.name}:{width}"
+
+
+def thumbnail_url(video_id: str, variant: ThumbnailVariant) -> str:
+    """Get the URL of a variant of the thumbnail of a video"""
+    return f"{YTIMG_BASE_URL}/vi/{video_id}/{variant.name}.jpg"
+
+
+def tries_smaller_variant(
+    error: UpstreamError, variant: ThumbnailVariant, plan: list[tuple[ThumbnailVariant, int]]
+) -> bool:
+    """Whether the next variant in the plan is downloaded after an error downloading a
+    variant, which is the case when the variant does not exist for the video
+    """
+    return error.status == 404 and variant != plan[-1][0]
+
+
+def download_thumbnail(video_id: str, plan: list[tuple[ThumbnailVariant, int]]) -> str:
+    """Download and encode the first thumbnail in the plan which exists for the video
+
+    If the preferred thumbnail size does not exist for the video, a smaller one is used.
+
+    Raises:
+        UpstreamError: If the request fails
+    """
+    for variant, width in plan:
+        try:
+            response = http_client.get(thumbnail_url(video_id, variant))
+        except UpstreamError as e:
+            if tries_smaller_variant(e, variant, plan):
+                continue
+            remember_if_missing(video_id, e)
+            raise
+        return encode_thumbnail(
+            video_id, response.body, response.headers["Content-Type"], variant, width
+        )
+    raise AssertionError("unreachable")
+
+
+def remember_if_missing(video_id: str, error: UpstreamError) -> None:
+    """Remember a video whose thumbnail was not found, so its error is not requested again"""
+    if error.status == 404:
+        missing_videos.set(video_id, str(error).encode("utf-8"))
+
+
+def raise_if_missing(video_id: str) -> None:
+    """Raise the error of a video whose thumbnail was recently not found
+
+    Raises:
+        UpstreamError: If the video is known to be missing
+    """
+    message = missing_videos.get(video_id)
+    if message is not None:
+        raise UpstreamError(message.decode("utf-8"), status=404)
 
 
 def data_uri_from_file(path: str, *, mime_type: Optional[str] = None) -> str:
@@ -84,26 +244,188 @@ def parse_metric_value(value: str) -> int:
 
 
 def format_views_value(value: str, lang: str = "en") -> str:
-    """Format view count, for example "1.2M" => "1.2M views", translations included"""
-    int_value = parse_metric_value(value)
-    if int_value == 1:
-        return i18n.t("view", locale=lang)
-    formatted_value = format_compact_decimal(int_value, locale=lang, fraction_digits=1)
-    return i18n.t("views", number=formatted_value, locale=lang)
+    """Format view count, for example "1.2M" => "1.2M views", translations included
+
+    Exact view counts from the YouTube Data API are rounded to the precision they are shown
+    with first, so results are memoized for every count shown alike.
+    """
+    return format_views_number(round_compact_number(parse_metric_value(value), lang), lang)
 
 
-def fetch_views(video_id: str, lang: str = "en") -> str:
-    """Get number of views for a YouTube video as a formatted metric"""
+def format_fetched_views(value: str, lang: str) -> str:
+    """Format a view count fetched from an upstream server, or get an empty string if the
+    video has no view count, such as when its owner hides it
+    """
+    if not value:
+        return ""
     try:
-        req = Request(f"https://img.shields.io/youtube/views/{video_id}.json")
-        req.add_header("User-Agent", "GitHub Readme YouTube Cards")
-        with urlopen(req) as response:
-            value = orjson.loads(response.read()).get("value", "")
-            return format_views_value(value, lang)
-    except Exception:
+        return format_views_value(value, lang)
+    except ValueError:
         return ""
 
 
+@lru_cache(maxsize=4096)
+def format_views_number(number: int, lang: str) -> str:
+    """Format a number of views, for example 1200000 => "1.2M views", translations included"""
+    if number == 1:
+        return translate("view", lang)
+    return translate("views", lang, number=format_compact_number(number, lang))
+
+
+def fetch_views_value(video_id: str) -> str:
+    """Get the unformatted number of views for a YouTube video from the configured provider
+
+    With the "youtube" provider, view counts are fetched from the YouTube Data API in
+    batches with those of other videos requested at the same time, falling back to
+    shields.io if the API fails.
+
+    Raises:
+        UpstreamError: If the request fails
+    """
+    if uses_youtube_api():
+        try:
+            return views_batcher.get(video_id)
+        except UpstreamError:
+            pass
+    return fetch_shields_views_value(video_id)
+
+
+def fetch_shields_views_value(video_id: str) -> str:
+    """Get the unformatted number of views for a YouTube video from shields.io (ex. "1.2M")
+
+    Raises:
+        UpstreamError: If the request fails
+    """
+    response = http_client.get(shields_views_url(video_id))
+    return parse_shields_views(response.body)
+
+
+def fetch_youtube_views_batch(video_ids: list[str]) -> dict[str, str]:
+    """Get the number of views of up to 50 videos from the YouTube Data API (ex. "1234567")
+
+    Videos which don't exist are left out, while those which hide their view count have
+    an empty one.
+
+    Raises:
+        UpstreamError: If the request fails
+    """
+    response = http_client.get(youtube_views_url(video_ids))
+    return parse_youtube_views(response.body)
+
+
+def uses_youtube_api() -> bool:
+    """Whether view counts are fetched from the YouTube Data API rather than shields.io"""
+    return VIEWS_PROVIDER == "youtube" and bool(YOUTUBE_API_KEY)
+
+
+def shields_views_url(video_id: str) -> str:
+    """Get the URL of the view count of a video on shields.io"""
+    return f"{SHIELDS_BASE_URL}/youtube/views/{video_id}.json"
+
+
+def parse_shields_views(body: bytes) -> str:
+    """Get the view count in a response of shields.io"""
+    return orjson.loads(body).get("value", "")
+
+
+def youtube_views_url(video_ids: list[str]) -> str:
+    """Get the URL of a request for the view counts of videos to the YouTube Data API"""
+    query = urlencode(
+        {
+            "part": "statistics",
+            "id": ",".join(video_ids),
+            "fields": "items(id,statistics(viewCount))",
+            "key": YOUTUBE_API_KEY,
+        }
+    )
+    return f"{YOUTUBE_API_BASE_URL}/youtube/v3/videos?{query}"
+
+
+def parse_youtube_views(body: bytes) -> dict[str, str]:
+    """Get the view count of each video in a response of the YouTube Data API"""
+    return {
+        item["id"]: item.get("statistics", {}).get("viewCount", "")
+        for item in orjson.loads(body).get("items", [])
+    }
+
+
+# view counts requested at the same time, fetched from the YouTube Data API together
+views_batcher: MicroBatcher[str] = MicroBatcher(
+    fetch_youtube_views_batch, window=VIEWS_BATCH_WINDOW, max_size=VIEWS_BATCH_SIZE
+)
+
+
+def fetch_views(
+    video_id: str, lang: str = "en", *, fetched: Optional[list[str]] = None
+) -> Optional[str]:
+    """Get number of views for a YouTube video as a formatted metric, an empty string if the
+    video has no view count, or None if it could not be fetched
+
+    Cached view counts are returned immediately, and refreshed in the background once stale.
+    Concurrent requests for the same video share a single upstream request. If a list is
+    given, a view count which had to be fetched is added to it instead of being cached, so
+    it can be cached once the video is known to exist.
+    """
+
+    def load() -> str:
+        value = upstream_calls.do(("views", video_id), lambda: fetch_views_value(video_id))
+        if fetched is not None:
+            fetched.append(value)
+        return value
+
+    try:
+        value = views_cache.get(video_id, load, store=fetched is None)
+    except Exception:
+        return None
+    return format_fetched_views(value, lang)
+
+
+def fetch_thumbnail_and_views(
+    video_id: str, card_width: int, lang: str, *, timeout: float
+) -> tuple[str, Optional[str]]:
+    """Fetch the thumbnail data URI and formatted view count of a video concurrently
+
+    Both requests share a single deadline. If the view count fails or is not ready in time,
+    it is None so the card can still be rendered without it. While the thumbnail server is
+    failing, PLACEHOLDER_THUMBNAIL is returned right away unless the thumbnail is cached.
+    Videos recently found missing fail without any requests, and view counts are only
+    cached once the thumbnail was found, so requests for random IDs don't fill the cache.
+
+    Raises:
+        UpstreamError: If the thumbnail request fails or is not fetched before the deadline
+    """
+    raise_if_missing(video_id)
+    start = time.perf_counter()
+    finished: dict[str, float] = {}
+    fetched_views: list[str] = []
+    thumbnail_future = upstream_executor.submit(fetch_thumbnail, video_id, card_width)
+    thumbnail_future.add_done_callback(mark_finished(finished, "thumbnail"))
+    views_future = upstream_executor.submit(fetch_views, video_id, lang, fetched=fetched_views)
+    views_future.add_done_callback(mark_finished(finished, "views"))
+    wait((thumbnail_future, views_future), timeout=timeout)
+    record_stages_since(start, finished, ("thumbnail", "views"))
+    if not thumbnail_future.done():
+        raise UpstreamError("Timed out fetching the video thumbnail", status=504)
+    views = views_future.result() if views_future.done() else None
+    try:
+        thumbnail = thumbnail_future.result()
+    except CircuitOpenError:
+        return PLACEHOLDER_THUMBNAIL, views
+    value = views_to_cache(views, fetched_views)
+    if value is not None:
+        views_cache.set(video_id, value)
+    return thumbnail, views
+
+
+def views_to_cache(views: Optional[str], fetched: list[str]) -> Optional[str]:
+    """Get the unformatted view count to cache once the thumbnail of its video was found,
+    returns None if it was cached already or could not be fetched
+
+    The empty view count of a video which hides it is cached too, so it isn't fetched again.
+    """
+    return fetched[0] if views is not None and fetched else None
+
+
 def seconds_to_duration(seconds: int) -> str:
     """Convert seconds to a formatted duration (ex. "1:23")"""
     hours = seconds // 3600
@@ -114,32 +436,38 @@ def seconds_to_duration(seconds: int) -> str:
     return f"{minutes}:{seconds:02d}"
 
 
-def estimate_duration_width(duration: str) -> int:
-    """Estimate width of duration string"""
-    num_digits = len([c for c in duration if c.isdigit()])
-    num_colons = len([c for c in duration if c == ":"])
-    return num_digits * 7 + num_colons * 5 + 8
+# space around the duration in its badge in pixels
+DURATION_PADDING = 8
+
+
+def estimate_duration_width(duration: str, *, font_size: float) -> int:
+    """Estimate the width of the badge of a duration from the width of its text in the card font"""
+    return math.ceil(measure_text(duration, font_size)) + DURATION_PADDING
 
 
 def is_rtl(lang: str) -> bool:
     """Check if language is to be displayed right-to-left"""
-    return i18n.t("direction", locale=lang, default="ltr") == "rtl"
+    return text_direction(lang) == "rtl"
+
+
+# bidirectional classes of characters displayed left-to-right (-1) and right-to-left (1)
+BIDI_DIRECTIONS = {
+    "L": -1,
+    "LRE": -1,
+    "LRO": -1,
+    "LRI": -1,
+    "R": 1,
+    "AL": 1,
+    "RLO": 1,
+    "RLE": 1,
+    "RLI": 1,
+}
 
 
 def is_rtl_title(title: str) -> bool:
-    """Check if a title is to be displayed right-to-left"""
-    title_bidi_properties = [ud.bidirectional(c) for c in title]
-    ltr_count = (
-        title_bidi_properties.count("L")
-        + title_bidi_properties.count("LRE")
-        + title_bidi_properties.count("LRO")
-        + title_bidi_properties.count("LRI")
-    )
-    rtl_count = (
-        title_bidi_properties.count("R")
-        + title_bidi_properties.count("AL")
-        + title_bidi_properties.count("RLO")
-        + title_bidi_properties.count("RLE")
-        + title_bidi_properties.count("RLI")
-    )
-    return rtl_count > ltr_count
+    """Check if a title is to be displayed right-to-left
+
+    Characters are classified in a single pass, counting right-to-left characters
+    as 1, left-to-right characters as -1 and neutral characters as 0.
+    """
+    return sum(map(BIDI_DIRECTIONS.get, map(ud.bidirectional, title), repeat(0))) > 0
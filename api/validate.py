@@ -1,9 +1,11 @@
 import re
+from functools import lru_cache
+from typing import Optional
 
-from babel import Locale, UnknownLocaleError
 from flask.wrappers import Request
 
 from .exceptions import ValidationError
+from .locales import has_compiled_locale
 
 
 def validate_int(req: Request, field: str, default: int = 0) -> int:
@@ -43,13 +45,32 @@ def validate_string(req: Request, field: str, default: str = "") -> str:
     return req.args.get(field, default)
 
 
+# longest language accepted, so that longer values are rejected without parsing them
+MAX_LANG_LENGTH = 32
+
+
+@lru_cache(maxsize=1024)
+def canonical_lang(value: str) -> Optional[str]:
+    """Get the canonical Babel identifier of a locale (ex. "EN" => "en"), or None if it is unknown
+
+    Results are memoized, including unknown locales, in a bounded cache.
+    """
+    # Babel is only imported for languages without translations, since it slows down cold starts
+    from babel import Locale, UnknownLocaleError
+
+    try:
+        return str(Locale.parse(value))
+    except (UnknownLocaleError, ValueError):
+        return None
+
+
 def validate_lang(req: Request, field: str, *, default: str = "en") -> str:
-    """Validate a string with a locale lang, returns the string if the locale
-    is known by Babel, otherwise the default.
+    """Validate a string with a locale lang, returns the canonical Babel identifier
+    of the locale if it is known by Babel, otherwise the default.
     """
     value = req.args.get(field, default)
-    try:
-        Locale.parse(value)
-    except UnknownLocaleError:
-        value = default
-    return value
+    if has_compiled_locale(value):
+        return value
+    if len(value) > MAX_LANG_LENGTH:
+        return default
+    return canonical_lang(value) or default
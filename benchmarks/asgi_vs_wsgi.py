@@ -0,0 +1,81 @@
+"""Compare the throughput of the Flask (WSGI) app and the ASGI app with slow upstreams
+
+Both apps run in a single process against local stand-ins for i.ytimg.com and
+img.shields.io with all caches disabled, so every card waits on both upstreams.
+
+    python -m benchmarks.asgi_vs_wsgi --requests 2000 --concurrency 200 --latency 0.05
+"""
+
+from argparse import ArgumentParser
+
+from .load import free_port, run_load, run_server
+from .upstreams import StandInServer
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000, help="Number of card requests")
+    parser.add_argument("--concurrency", type=int, default=200, help="Simultaneous connections")
+    parser.add_argument("--latency", type=float, default=0.05, help="Upstream latency in seconds")
+    parser.add_argument("--threads", type=int, default=32, help="Threads of the gunicorn worker")
+    args = parser.parse_args()
+
+    thumbnails = StandInServer(latency=args.latency)
+    views = StandInServer(latency=args.latency)
+    env = {
+        "YTIMG_BASE_URL": thumbnails.url,
+        "SHIELDS_BASE_URL": views.url,
+        "THUMBNAIL_CACHE_MAX_BYTES": "0",
+        "VIEWS_CACHE_MAX_BYTES": "0",
+        "CARD_CACHE_MAX_BYTES": "0",
+        "UPSTREAM_WORKERS": str(args.threads * 2),
+        "UPSTREAM_MAX_CONNECTIONS_PER_HOST": str(args.concurrency),
+    }
+    servers = {
+        f"WSGI (gunicorn, 1 worker, {args.threads} threads)": lambda port: [
+            "gunicorn",
+            "--bind",
+            f"127.0.0.1:{port}",
+            "--workers",
+            "1",
+            "--threads",
+            str(args.threads),
+            "api.index:app",
+        ],
+        "ASGI (uvicorn, 1 worker)": lambda port: [
+            "uvicorn",
+            "--port",
+            str(port),
+            "--workers",
+            "1",
+            "--log-level",
+            "warning",
+            "api.asgi:app",
+        ],
+    }
+
+    print(
+        f"{args.requests} requests, {args.concurrency} connections, "
+        f"{args.latency * 1000:.0f}ms upstream latency\n"
+    )
+    print(f"{'server':<42} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for name, command in servers.items():
+        port = free_port()
+        with run_server(command(port), port=port, env=env):
+            result = run_load(
+                port,
+                lambda n: f"/?id=video{n % 100:07d}&title=Benchmark&timestamp=1700000000",
+                requests=args.requests,
+                concurrency=args.concurrency,
+            )
+        print(
+            f"{name:<42} {result.throughput:>8.1f} {result.percentile(50) * 1000:>8.1f} "
+            f"{result.percentile(99) * 1000:>8.1f} {result.errors:>7}"
+        )
+
+    thumbnails.close()
+    views.close()
+
+
+if __name__ == "__main__":
+    main()
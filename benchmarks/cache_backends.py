@@ -0,0 +1,57 @@
+"""Compare the cost of reading and writing cards with each cache backend
+
+The SQLite database is created in a temporary directory. The Redis backend is
+only measured when a server is given, since none is started.
+
+    python -m benchmarks.cache_backends --operations 2000 --redis-url redis://localhost:6379/0
+"""
+
+import os
+import tempfile
+import timeit
+from argparse import ArgumentParser
+from typing import Optional
+
+from api.cache import CacheBackend, LRUCache
+from api.cache_backends import RedisCache, SQLiteCache
+
+# size of a typical card with an embedded thumbnail
+CARD_SIZE = 12 * 1024
+
+
+def create_backends(directory: str, redis_url: Optional[str]) -> dict[str, CacheBackend]:
+    """Create an empty card cache with each backend"""
+    limits = {"max_bytes": 64 * 1024 * 1024, "ttl": 3600}
+    path = os.path.join(directory, "cache.sqlite3")
+    backends: dict[str, CacheBackend] = {
+        "memory": LRUCache(**limits),
+        "sqlite": SQLiteCache(path, namespace="benchmark", **limits),
+    }
+    if redis_url:
+        backends["redis"] = RedisCache(redis_url, namespace="benchmark", **limits)
+    return backends
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument("--redis-url", default="")
+    args = parser.parse_args()
+
+    card = os.urandom(CARD_SIZE // 2).hex().encode()
+    keys = [f"card-{i}" for i in range(args.operations)]
+    print(f"{'backend':>8} {'set':>10} {'hit':>10} {'miss':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, backend in create_backends(directory, args.redis_url).items():
+            backend.clear()
+            timings = [
+                timeit.timeit(lambda: [backend.set(key, card) for key in keys], number=1),
+                timeit.timeit(lambda: [backend.get(key) for key in keys], number=1),
+                timeit.timeit(lambda: [backend.get(f"{key}-missing") for key in keys], number=1),
+            ]
+            backend.clear()
+            print(f"{name:>8} " + " ".join(f"{t / len(keys) * 1e6:>8.1f}us" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
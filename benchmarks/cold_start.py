@@ -0,0 +1,71 @@
+"""Measure the time from a cold start to the first card, in new interpreters
+
+Upstream servers are replaced by local stand-ins, so no network access is needed.
+
+    python -m benchmarks.cold_start --runs 5
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from argparse import ArgumentParser
+
+from .upstreams import StandInServer
+
+# run in a new interpreter, printing the seconds to import the app and to render the first card
+FIRST_CARD = """
+import json, time
+start = time.perf_counter()
+from api.index import app
+imported = time.perf_counter()
+response = app.test_client().get("/?id=dQw4w9WgXcQ&title=Title&timestamp=1600000000&lang=%s")
+assert response.status_code == 200, response.status_code
+print(json.dumps([imported - start, time.perf_counter() - start]))
+"""
+
+
+def cold_start(env: dict[str, str], lang: str) -> tuple[float, float]:
+    """Start a new interpreter and return the seconds to import the app and to the first card"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_CARD % lang],
+        cwd=root,
+        env=os.environ | env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported, first_card = json.loads(result.stdout)
+    return imported, first_card
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    upstream = StandInServer()
+    base_env = {"YTIMG_BASE_URL": upstream.url, "SHIELDS_BASE_URL": upstream.url}
+    configurations = {
+        "jinja, no template cache": {"CARD_RENDERER": "jinja", "TEMPLATE_CACHE_DIR": ""},
+        "jinja, template cache": {"CARD_RENDERER": "jinja"},
+        "fast renderer": {"CARD_RENDERER": "fast"},
+    }
+    try:
+        print(f"{'configuration':>26} {'lang':>5} {'import':>8} {'first card':>11}")
+        for name, env in configurations.items():
+            for lang in ("en", "zh"):
+                # the first run fills the template cache
+                cold_start(base_env | env, lang)
+                runs = [cold_start(base_env | env, lang) for _ in range(args.runs)]
+                imported = statistics.median(run[0] for run in runs)
+                first_card = statistics.median(run[1] for run in runs)
+                print(f"{name:>26} {lang:>5} {imported * 1e3:>6.0f}ms {first_card * 1e3:>9.0f}ms")
+    finally:
+        upstream.close()
+
+
+if __name__ == "__main__":
+    main()
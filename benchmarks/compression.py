@@ -0,0 +1,83 @@
+"""Measure the bytes on the wire and the CPU time of card responses in each encoding
+
+Typical cards are requested through the Flask test client, with thumbnails and view
+counts served by a local stand-in, so no network access is needed. For each encoding,
+the CPU time per response is measured with the compressed card cached, and compared
+with the time to compress the card once, which every response would cost without it.
+
+    python -m benchmarks.compression --requests 2000
+    python -m benchmarks.compression --thumbnail-size 32 --scenarios default lang-ja
+"""
+
+import time
+from argparse import ArgumentParser
+from urllib.parse import urlencode
+
+import api.utils
+from api.compression import compress, supported_encodings
+from api.index import app
+
+from .suite import SCENARIOS
+from .upstreams import StandInServer
+
+# scenarios of cards which are rendered, rather than error cards or cache variations
+CARD_SCENARIOS = ["default", "width-500", "width-1000", "lang-ja", "title-long"]
+
+
+def cpu_per_call(func, calls: int) -> float:
+    """Get the CPU time in seconds of a call of a function, averaged over a number of calls"""
+    start = time.process_time()
+    for _ in range(calls):
+        func()
+    return (time.process_time() - start) / calls
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per measurement")
+    parser.add_argument("--thumbnail-size", type=int, default=16, help="Thumbnail size in KiB")
+    parser.add_argument(
+        "--scenarios", nargs="+", default=CARD_SCENARIOS, help="Names of the scenarios to run"
+    )
+    args = parser.parse_args()
+
+    upstream = StandInServer(thumbnail_size=args.thumbnail_size * 1024)
+    api.utils.YTIMG_BASE_URL = upstream.url
+    api.utils.SHIELDS_BASE_URL = upstream.url
+    client = app.test_client()
+    encodings = ["identity", *supported_encodings()]
+    # compressing is slower than serving a response, so it is timed with fewer calls
+    compress_calls = max(1, args.requests // 10)
+
+    print(f"{args.thumbnail_size} KiB thumbnails, encodings: {', '.join(encodings)}\n")
+    print(
+        f"{'scenario':<12} {'encoding':<9} {'bytes':>7} {'saved':>6} "
+        f"{'cached µs':>10} {'compress µs':>12}"
+    )
+    for scenario in SCENARIOS:
+        if scenario.name not in args.scenarios:
+            continue
+        url = f"/?{urlencode(scenario.params)}"
+        identity_size = 0
+        for encoding in encodings:
+            headers = {"Accept-Encoding": encoding}
+            # render the card and cache it along with its compressed variant
+            response = client.get(url, headers=headers)
+            body = client.get(url).data
+            size = len(response.data)
+            identity_size = identity_size or size
+            cached = cpu_per_call(lambda: client.get(url, headers=headers), args.requests)
+            compressing = (
+                cpu_per_call(lambda: compress(body, encoding), compress_calls)
+                if encoding != "identity"
+                else 0
+            )
+            print(
+                f"{scenario.name:<12} {encoding:<9} {size:>7} {1 - size / identity_size:>6.1%} "
+                f"{cached * 1e6:>10.1f} {compressing * 1e6:>12.1f}"
+            )
+    upstream.close()
+
+
+if __name__ == "__main__":
+    main()
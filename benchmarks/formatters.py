@@ -0,0 +1,93 @@
+"""Compare the cost of formatting the stats of a card with Babel and with memoization
+
+No network access is needed.
+
+    python -m benchmarks.formatters --calls 20000
+"""
+
+import timeit
+import unicodedata as ud
+from argparse import ArgumentParser
+from datetime import timedelta
+
+from babel.dates import format_timedelta
+from babel.numbers import format_compact_decimal
+
+from api.locales import format_relative_value
+from api.utils import (
+    format_relative_time,
+    format_views_number,
+    format_views_value,
+    is_rtl_title,
+    parse_metric_value,
+)
+
+# translated and untranslated languages
+LANGS = ["en", "fr", "ar", "zh", "pt_BR"]
+
+TITLES = {
+    "latin": "Rick Astley - Never Gonna Give You Up (Official Music Video)",
+    "rtl": "أغنية جميلة جدا - الفيديو الرسمي بجودة عالية",
+}
+
+
+def format_views_with_babel(value: str, lang: str) -> str:
+    """Format a view count with Babel on every call, as before memoization"""
+    return format_compact_decimal(parse_metric_value(value), locale=lang, fraction_digits=1)
+
+
+def format_relative_time_with_babel(timestamp: float, lang: str) -> str:
+    """Format a relative time with Babel on every call, as before memoization"""
+    delta = timedelta(seconds=timestamp - 1_700_000_000)
+    return format_timedelta(delta, add_direction=True, locale=lang)
+
+
+def is_rtl_title_with_lists(title: str) -> bool:
+    """Count the bidirectional classes of a title with a list, as before the single pass"""
+    bidi = [ud.bidirectional(c) for c in title]
+    ltr_count = bidi.count("L") + bidi.count("LRE") + bidi.count("LRO") + bidi.count("LRI")
+    rtl_count = (
+        bidi.count("R")
+        + bidi.count("AL")
+        + bidi.count("RLO")
+        + bidi.count("RLE")
+        + bidi.count("RLI")
+    )
+    return rtl_count > ltr_count
+
+
+def time_call(call, calls: int) -> float:
+    """Get the best time of a call in seconds"""
+    return min(timeit.repeat(call, number=calls, repeat=3)) / calls
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'formatter':>14} {'lang':>6} {'babel':>10} {'memoized':>10}")
+    timestamp = 1_700_000_000 - 5 * 86400
+    for lang in LANGS:
+        format_views_number.cache_clear()
+        format_relative_value.cache_clear()
+        views = (
+            time_call(lambda: format_views_with_babel("1.2M", lang), args.calls),
+            time_call(lambda: format_views_value("1.2M", lang), args.calls),
+        )
+        relative_time = (
+            time_call(lambda: format_relative_time_with_babel(timestamp, lang), args.calls),
+            time_call(lambda: format_relative_time(timestamp, lang), args.calls),
+        )
+        for name, (babel, memoized) in (("views", views), ("relative time", relative_time)):
+            print(f"{name:>14} {lang:>6} {babel * 1e6:>8.2f}us {memoized * 1e6:>8.2f}us")
+
+    print(f"\n{'title':>14} {'lists':>10} {'sum':>10}")
+    for name, title in TITLES.items():
+        lists = time_call(lambda: is_rtl_title_with_lists(title), args.calls)
+        summed = time_call(lambda: is_rtl_title(title), args.calls)
+        print(f"{name:>14} {lists * 1e6:>8.2f}us {summed * 1e6:>8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Helpers to run the app in a separate process and send concurrent requests to it"""
+
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, NamedTuple
+
+
+class LoadResult(NamedTuple):
+    requests: int
+    errors: int
+    elapsed: float
+    latencies: list[float]
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed
+
+    def percentile(self, percent: float) -> float:
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * percent / 100))]
+
+
+def free_port() -> int:
+    """Find a free local TCP port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def run_server(args: list[str], *, port: int, env: dict[str, str]) -> Iterator[subprocess.Popen]:
+    """Start a server process from the repository root and wait until it accepts connections"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen(
+        [sys.executable, "-m", *args],
+        cwd=root,
+        env=os.environ | env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"Server {' '.join(args)} did not start")
+                time.sleep(0.1)
+        yield process
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def run_load(
+    port: int,
+    path_for: Callable[[int], str],
+    *,
+    requests: int,
+    concurrency: int,
+    rate: float = 0,
+) -> LoadResult:
+    """Send requests from concurrent keep-alive connections and record their latencies
+
+    ``path_for`` returns the path of the n-th request. With a rate, the n-th request is
+    scheduled n / rate seconds after the start and its latency is counted from then, so
+    time spent waiting for a free connection when the server falls behind is included.
+    Otherwise requests are sent as fast as the connections allow.
+    """
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(requests))
+    lock = threading.Lock()
+    start = time.perf_counter()
+
+    def worker():
+        nonlocal errors
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        while True:
+            with lock:
+                n = next(counter, None)
+            if n is None:
+                break
+            if rate:
+                request_start = start + n / rate
+                time.sleep(max(0.0, request_start - time.perf_counter()))
+            else:
+                request_start = time.perf_counter()
+            try:
+                conn.request("GET", path_for(n))
+                response = conn.getresponse()
+                response.read()
+                failed = response.status != 200
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+                failed = True
+            with lock:
+                latencies.append(time.perf_counter() - request_start)
+                errors += failed
+        conn.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return LoadResult(requests, errors, time.perf_counter() - start, latencies)
@@ -0,0 +1,172 @@
+"""Load test the app under gunicorn at target request rates with local stand-in upstreams
+
+Stand-ins for i.ytimg.com and img.shields.io are started with the given latency,
+error rate and thumbnail size, and the app is pointed at them through its
+configuration. Cards for a number of distinct videos are then requested at each
+target rate, reporting throughput, latency percentiles, the error rate and the
+resident memory of the gunicorn workers, sampled with ps during the run.
+
+    python -m benchmarks.loadtest --rate 50 100 200 --duration 10 --workers 2 --threads 8
+    python -m benchmarks.loadtest --rate 100 --latency 0.2 --error-rate 0.05 --videos 5
+    python -m benchmarks.loadtest --rate 100 --env CARD_CACHE_MAX_BYTES=0 --output load.json
+"""
+
+import json
+import subprocess
+import threading
+from argparse import ArgumentParser
+from typing import Any
+
+from .load import LoadResult, free_port, run_load, run_server
+from .upstreams import StandInServer
+
+
+def process_tree_rss(pid: int) -> dict[int, int]:
+    """Get the resident memory in bytes of a process and of its child processes, by PID"""
+    output = subprocess.run(
+        ["ps", "-A", "-o", "pid=,ppid=,rss="], capture_output=True, text=True, check=True
+    ).stdout
+    rss = {}
+    for line in output.splitlines():
+        child, parent, kib = map(int, line.split())
+        if pid in (child, parent):
+            rss[child] = kib * 1024
+    return rss
+
+
+class RSSSampler:
+    """Sample the resident memory of a server and its workers in the background"""
+
+    def __init__(self, pid: int, *, interval: float = 0.5):
+        self.pid = pid
+        self.interval = interval
+        self.peak_total = 0
+        self.peak_worker = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "RSSSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+
+    def sample(self) -> None:
+        rss = process_tree_rss(self.pid)
+        workers = [kib for pid, kib in rss.items() if pid != self.pid]
+        self.peak_total = max(self.peak_total, sum(rss.values()))
+        self.peak_worker = max(self.peak_worker, *workers, 0)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+def summarize(rate: float, result: LoadResult, rss: RSSSampler) -> dict[str, Any]:
+    """Get the measurements of a run at a target rate"""
+    return {
+        "target_rate": rate,
+        "requests": result.requests,
+        "throughput": round(result.throughput, 1),
+        "p50_ms": round(result.percentile(50) * 1000, 1),
+        "p90_ms": round(result.percentile(90) * 1000, 1),
+        "p99_ms": round(result.percentile(99) * 1000, 1),
+        "max_ms": round(max(result.latencies) * 1000, 1),
+        "error_rate": round(result.errors / result.requests, 4),
+        "peak_rss_bytes": rss.peak_total,
+        "peak_worker_rss_bytes": rss.peak_worker,
+    }
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rate",
+        type=float,
+        nargs="+",
+        default=[50],
+        help="Target requests per second, 0 sends 200 requests per second of duration at once",
+    )
+    parser.add_argument("--duration", type=float, default=10, help="Seconds to run each rate")
+    parser.add_argument("--concurrency", type=int, default=64, help="Simultaneous connections")
+    parser.add_argument("--videos", type=int, default=100, help="Number of distinct videos")
+    parser.add_argument("--workers", type=int, default=2, help="Gunicorn worker processes")
+    parser.add_argument("--threads", type=int, default=8, help="Threads per gunicorn worker")
+    parser.add_argument("--latency", type=float, default=0.05, help="Upstream latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0, help="Share of upstream errors")
+    parser.add_argument("--thumbnail-size", type=int, default=16, help="Thumbnail size in KiB")
+    parser.add_argument(
+        "--env", action="append", default=[], help="Extra configuration as KEY=VALUE"
+    )
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    upstreams = {
+        "thumbnails": StandInServer(
+            latency=args.latency,
+            thumbnail_size=args.thumbnail_size * 1024,
+            error_rate=args.error_rate,
+        ),
+        "views": StandInServer(latency=args.latency, error_rate=args.error_rate),
+    }
+    env = {
+        "YTIMG_BASE_URL": upstreams["thumbnails"].url,
+        "SHIELDS_BASE_URL": upstreams["views"].url,
+        **dict(setting.split("=", 1) for setting in args.env),
+    }
+    port = free_port()
+    command = [
+        "gunicorn",
+        "--bind",
+        f"127.0.0.1:{port}",
+        "--workers",
+        str(args.workers),
+        "--threads",
+        str(args.threads),
+        "api.index:app",
+    ]
+
+    print(
+        f"gunicorn with {args.workers} workers of {args.threads} threads, {args.videos} videos, "
+        f"{args.latency * 1000:.0f}ms upstream latency, {args.error_rate:.0%} upstream errors\n"
+    )
+    print(
+        f"{'target':>7} {'req/s':>8} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+        f"{'errors':>7} {'RSS MiB':>8} {'worker MiB':>10}"
+    )
+    results = []
+    with run_server(command, port=port, env=env) as server:
+        for rate in args.rate:
+            requests = max(1, round((rate or 200) * args.duration))
+            with RSSSampler(server.pid) as rss:
+                result = run_load(
+                    port,
+                    lambda n: f"/?id=video{n % args.videos:07d}&title=Load+test",
+                    requests=requests,
+                    concurrency=args.concurrency,
+                    rate=rate,
+                )
+            summary = summarize(rate, result, rss)
+            results.append(summary)
+            target = f"{rate:g}" if rate else "max"
+            print(
+                f"{target:>7} {summary['throughput']:>8.1f} {summary['p50_ms']:>8.1f} "
+                f"{summary['p90_ms']:>8.1f} {summary['p99_ms']:>8.1f} {summary['max_ms']:>8.1f} "
+                f"{summary['error_rate']:>7.1%} {rss.peak_total / 2**20:>8.1f} "
+                f"{rss.peak_worker / 2**20:>10.1f}"
+            )
+    hits = {name: upstream.hits for name, upstream in upstreams.items()}
+    print(f"\nupstream requests: {hits['thumbnails']} thumbnails, {hits['views']} views")
+    for upstream in upstreams.values():
+        upstream.close()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "upstream_hits": hits, "runs": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
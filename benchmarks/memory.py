@@ -0,0 +1,81 @@
+"""Compare the peak memory allocated to render a card in memory and to stream it
+
+Measured with tracemalloc from the thumbnail bytes to the response body, so no
+network access is needed.
+
+    python -m benchmarks.memory --thumbnail-sizes 16 64 256
+"""
+
+import base64
+import os
+import tracemalloc
+from argparse import ArgumentParser
+from typing import Callable
+
+from api.cards import CardParams
+from api.index import app, build_card, generate_card
+from api.utils import data_uri_from_bytes
+
+PARAMS = CardParams(
+    video_id="dQw4w9WgXcQ",
+    width=250,
+    border_radius=5,
+    background_color="#0d1117",
+    title_color="#ffffff",
+    stats_color="#dedede",
+    title="Rick Astley - Never Gonna Give You Up (Official Music Video)",
+    max_title_lines=2,
+    publish_timestamp=0,
+    duration_seconds=213,
+    lang="en",
+)
+
+
+def buffered(data: bytes) -> int:
+    """Render a card the way it was rendered before streaming, returning its size"""
+    encoded = base64.encodebytes(data).decode("utf-8").replace("\n", "")
+    thumbnail = f"data:image/jpeg;base64,{encoded}"
+    return len(build_card(PARAMS, thumbnail, "1.2M views").encode("utf-8"))
+
+
+def in_memory(data: bytes) -> int:
+    """Render a card in memory, returning its size"""
+    thumbnail = data_uri_from_bytes(data=data, mime_type="image/jpeg")
+    return len(build_card(PARAMS, thumbnail, "1.2M views").encode("utf-8"))
+
+
+def streamed(data: bytes) -> int:
+    """Stream a card as a server would send it, returning its size"""
+    thumbnail = data_uri_from_bytes(data=data, mime_type="image/jpeg")
+    return sum(len(chunk) for chunk in generate_card(PARAMS, thumbnail, "1.2M views"))
+
+
+def peak_memory(render: Callable[[bytes], int], data: bytes) -> int:
+    """Get the peak memory allocated while rendering a card, in bytes"""
+    tracemalloc.start()
+    try:
+        render(data)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--thumbnail-sizes", type=int, nargs="+", default=[16, 64, 256])
+    args = parser.parse_args()
+
+    renderers = {"buffered": buffered, "in memory": in_memory, "streamed": streamed}
+    print(f"{'thumbnail':>10} {'renderer':>10} {'peak':>10} {'ratio':>6}")
+    with app.app_context():
+        # load the template before measuring
+        in_memory(b"")
+        for size in args.thumbnail_sizes:
+            data = os.urandom(size * 1024)
+            for name, render in renderers.items():
+                peak = peak_memory(render, data)
+                print(f"{size:>8}KB {name:>10} {peak:>10} {peak / len(data):>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Measure the overhead of timing the stages of a card request and exposing the metrics
+
+The instrumentation of a request is timed on its own and compared with serving a
+cached card, the cheapest request it is added to. No network access is needed.
+
+    python -m benchmarks.metrics --requests 20000
+"""
+
+import time
+import timeit
+from argparse import ArgumentParser
+
+from flask import request
+
+from api.cards import card_cache_key, pack_card, parse_card_params, published_text, rendered_card
+from api.index import app, card_cache, collect_metrics
+from api.metrics import (
+    finish_request,
+    mark_finished,
+    record_stages_since,
+    response_bytes,
+    stage_seconds,
+    start_request,
+    timed,
+    upstream_responses,
+)
+
+CARD_URL = "/?id=dQw4w9WgXcQ&title=Never+Gonna+Give+You+Up&timestamp=1700000000"
+
+
+def instrument_request() -> str:
+    """Go through the instrumentation of a card request which is rendered, without the work"""
+    timings = start_request()
+    with timed("validate"):
+        pass
+    with timed("cache"):
+        pass
+    finished: dict[str, float] = {}
+    mark_finished(finished, "thumbnail")(None)
+    mark_finished(finished, "views")(None)
+    record_stages_since(timings.start, finished, ("thumbnail", "views"))
+    with timed("format"):
+        pass
+    with timed("render"):
+        pass
+    upstream_responses.inc("i.ytimg.com", "200")
+    upstream_responses.inc("img.shields.io", "200")
+    finish_request()
+    response_bytes.observe("200", 12 * 1024)
+    return timings.server_timing()
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    client = app.test_client()
+    with app.test_request_context(CARD_URL):
+        card = rendered_card(b"<svg></svg>", "etag")
+        params = parse_card_params(request)
+        card_cache.set(card_cache_key(params, published_text(params)), pack_card(card))
+
+    instrumentation = min(timeit.repeat(instrument_request, number=args.requests, repeat=3))
+    cached_card = min(timeit.repeat(lambda: client.get(CARD_URL), number=args.requests, repeat=3))
+    start = time.perf_counter()
+    exposition = collect_metrics()
+    scrape = time.perf_counter() - start
+    for metric in (stage_seconds, response_bytes, upstream_responses):
+        metric.clear()
+
+    per_request = instrumentation / args.requests
+    per_cached_card = cached_card / args.requests
+    print(f"{'instrumentation':>16} {per_request * 1e6:>8.2f}us")
+    print(f"{'cached card':>16} {per_cached_card * 1e6:>8.2f}us")
+    print(f"{'overhead':>16} {per_request / per_cached_card:>9.1%}")
+    print(f"{'/metrics':>16} {scrape * 1e6:>8.2f}us for {len(exposition)} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Compare the time to render a card with the Jinja template and the precompiled renderer
+
+No network access is needed.
+
+    python -m benchmarks.renderer --renders 20000
+"""
+
+import timeit
+from argparse import ArgumentParser
+
+from flask import render_template
+
+from api.cards import CardParams
+from api.index import app, card_context
+from api.renderer import render_main
+from api.utils import data_uri_from_bytes
+
+PARAMS = CardParams(
+    video_id="dQw4w9WgXcQ",
+    width=250,
+    border_radius=5,
+    background_color="#0d1117",
+    title_color="#ffffff",
+    stats_color="#dedede",
+    title="Rick Astley - Never Gonna Give You Up (Official Music Video)",
+    max_title_lines=2,
+    publish_timestamp=0,
+    duration_seconds=213,
+    lang="en",
+)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--renders", type=int, default=20000)
+    parser.add_argument("--thumbnail-size", type=int, default=16, help="Thumbnail size in KB")
+    args = parser.parse_args()
+
+    thumbnail = data_uri_from_bytes(data=b"\0" * args.thumbnail_size * 1024, mime_type="image/jpeg")
+    with app.app_context():
+        context = card_context(PARAMS, thumbnail, "1.2M views")
+        renderers = {
+            "jinja": lambda: render_template("main.svg", **context),
+            "fast": lambda: render_main(**context),
+        }
+        assert renderers["jinja"]() == renderers["fast"](), "renderers must produce the same card"
+        timings = {
+            name: min(timeit.repeat(render, number=args.renders, repeat=3)) / args.renders
+            for name, render in renderers.items()
+        }
+    print(f"{'renderer':>9} {'per render':>11}")
+    for name, seconds in timings.items():
+        print(f"{name:>9} {seconds * 1e6:>9.1f}us")
+    saving = timings["jinja"] - timings["fast"]
+    print(f"saving: {saving * 1e6:.1f}us per render ({saving / timings['jinja']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""Benchmark the card endpoint in a set of scenarios and compare the results with a baseline
+
+Cards are requested from the Flask app through its test client, with thumbnails and
+view counts served by local stand-ins, so no network access is needed. Each scenario
+measures throughput, p50 and p99 latency, the peak memory allocated per request and
+the size of the response. Results can be saved as JSON and compared with a later run,
+which exits with status 1 if any scenario regressed by more than the threshold.
+
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --compare baseline.json --threshold 10
+"""
+
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from statistics import median
+from typing import Any, NamedTuple
+from urllib.parse import urlencode
+
+import api.index
+import api.utils
+from api.index import app
+
+from .load import LoadResult
+from .upstreams import StandInServer
+
+LONG_TITLE = (
+    "Rick Astley - Never Gonna Give You Up (Official Music Video) [4K Remaster] "
+    "with lyrics, behind the scenes footage and an interview about the making of the song"
+)
+
+
+class Scenario(NamedTuple):
+    name: str
+    params: dict[str, Any]
+    # "cards" renders every card from cached thumbnails and views, "all" also fetches them,
+    # "none" serves every card from the card cache
+    cleared_caches: str = "cards"
+    status: int = 200
+    # fetch thumbnails from a path the stand-in answers with 404
+    missing_thumbnail: bool = False
+
+
+BASE_PARAMS = {"id": "dQw4w9WgXcQ", "title": "Never Gonna Give You Up", "timestamp": 1700000000}
+
+SCENARIOS = [
+    Scenario("default", BASE_PARAMS),
+    Scenario("cached", BASE_PARAMS, cleared_caches="none"),
+    Scenario("cold", BASE_PARAMS, cleared_caches="all"),
+    Scenario("width-500", BASE_PARAMS | {"width": 500}),
+    Scenario("width-1000", BASE_PARAMS | {"width": 1000}),
+    Scenario("lang-fr", BASE_PARAMS | {"lang": "fr"}),
+    Scenario("lang-ar", BASE_PARAMS | {"lang": "ar", "title": "أغنية جميلة - الفيديو الرسمي"}),
+    Scenario("lang-ja", BASE_PARAMS | {"lang": "ja", "title": "ネバー・ゴナ・ギヴ・ユー・アップ"}),
+    Scenario("title-long", BASE_PARAMS | {"title": LONG_TITLE}),
+    Scenario("title-long-3-lines", BASE_PARAMS | {"title": LONG_TITLE, "max_title_lines": 3}),
+    Scenario("error-invalid-id", BASE_PARAMS | {"id": "**********"}, status=400),
+    Scenario(
+        "error-unknown-video", BASE_PARAMS, cleared_caches="all", status=404, missing_thumbnail=True
+    ),
+    # the video is known to be missing, so its error card is rendered without upstream requests
+    Scenario("error-missing-video", BASE_PARAMS, status=404, missing_thumbnail=True),
+]
+
+# whether a larger value of each metric is better, for comparisons
+METRICS = {
+    "throughput": True,
+    "p50_ms": False,
+    "p99_ms": False,
+    "peak_alloc_bytes": False,
+    "response_bytes": False,
+}
+
+
+def clear_caches(cleared: str) -> None:
+    """Clear the caches a scenario renders without"""
+    if cleared == "none":
+        return
+    api.index.card_cache.clear()
+    api.index.error_cache.clear()
+    if cleared == "all":
+        api.utils.thumbnail_cache.clear()
+        api.utils.views_cache.clear()
+        api.utils.missing_videos.clear()
+
+
+def run_scenario(
+    scenario: Scenario, client, upstream: StandInServer, *, requests: int, traced: int
+) -> dict[str, Any]:
+    """Request the card of a scenario repeatedly and summarize the measurements"""
+    thumbnail_url = f"{upstream.url}/missing" if scenario.missing_thumbnail else upstream.url
+    api.utils.YTIMG_BASE_URL = thumbnail_url
+    url = f"/?{urlencode(scenario.params)}"
+    # warm up the caches which are not cleared and the templates
+    response = client.get(url)
+
+    latencies = []
+    errors = 0
+    start = time.perf_counter()
+    for _ in range(requests):
+        clear_caches(scenario.cleared_caches)
+        request_start = time.perf_counter()
+        response = client.get(url)
+        latencies.append(time.perf_counter() - request_start)
+        errors += response.status_code != scenario.status
+    result = LoadResult(requests, errors, time.perf_counter() - start, latencies)
+
+    peaks = []
+    for _ in range(traced):
+        clear_caches(scenario.cleared_caches)
+        tracemalloc.start()
+        try:
+            client.get(url)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "status": response.status_code,
+        "errors": result.errors,
+        "throughput": round(result.throughput, 1),
+        "p50_ms": round(result.percentile(50) * 1000, 3),
+        "p99_ms": round(result.percentile(99) * 1000, 3),
+        "peak_alloc_bytes": int(median(peaks)) if peaks else 0,
+        "response_bytes": len(response.data),
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Print the change of each metric from the baseline and return the regressions"""
+    regressions = []
+    print(f"\n{'scenario':<20} {'metric':<17} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, metrics in results["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if previous is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            before, after = previous[metric], metrics[metric]
+            change = (after - before) / before * 100 if before else 0
+            worse = -change if higher_is_better else change
+            flag = " !" if worse > threshold else ""
+            if flag:
+                regressions.append(f"{name} {metric}")
+            print(f"{name:<20} {metric:<17} {before:>12} {after:>12} {change:>+7.1f}%{flag}")
+    return regressions
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300, help="Requests per scenario")
+    parser.add_argument("--traced", type=int, default=10, help="Requests traced for allocations")
+    parser.add_argument("--scenarios", nargs="+", help="Names of the scenarios to run")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--compare", help="Compare with the results in this JSON file")
+    parser.add_argument(
+        "--threshold", type=float, default=10, help="Percentage change counted as a regression"
+    )
+    args = parser.parse_args()
+
+    upstream = StandInServer()
+    api.utils.SHIELDS_BASE_URL = upstream.url
+    client = app.test_client()
+    scenarios = [s for s in SCENARIOS if not args.scenarios or s.name in args.scenarios]
+    results: dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "requests": args.requests,
+        "scenarios": {},
+    }
+    print(
+        f"{'scenario':<20} {'status':>6} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'peak KiB':>9} {'bytes':>7}"
+    )
+    for scenario in scenarios:
+        metrics = run_scenario(
+            scenario, client, upstream, requests=args.requests, traced=args.traced
+        )
+        results["scenarios"][scenario.name] = metrics
+        print(
+            f"{scenario.name:<20} {metrics['status']:>6} {metrics['throughput']:>8.1f} "
+            f"{metrics['p50_ms']:>8.2f} {metrics['p99_ms']:>8.2f} "
+            f"{metrics['peak_alloc_bytes'] / 1024:>9.1f} {metrics['response_bytes']:>7}"
+        )
+        if metrics["errors"]:
+            print(f"  {metrics['errors']} responses did not have status {scenario.status}")
+    upstream.close()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regressions above {args.threshold:g}%")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Report the size of the thumbnail embedded in a card for each width and format
+
+Uses synthetic thumbnails at every i.ytimg.com size, so no network access is needed.
+Requires Pillow.
+
+    python -m benchmarks.thumbnails --widths 120 250 400 640 --quality 75
+"""
+
+import io
+import random
+from argparse import ArgumentParser
+
+from PIL import Image, ImageDraw, ImageFilter
+
+import api.thumbnails
+from api.thumbnails import VARIANTS, plan_thumbnail, process_thumbnail
+
+
+def synthetic_thumbnail(width: int, height: int, *, seed: int = 0) -> bytes:
+    """Create a JPEG with shapes, gradients and noise, letterboxed if it is not 16:9"""
+    rng = random.Random(seed)
+    frame_height = width * 9 // 16
+    frame = Image.linear_gradient("L").resize((width, frame_height)).convert("RGB")
+    draw = ImageDraw.Draw(frame)
+    for _ in range(40):
+        x, y = rng.randrange(width), rng.randrange(frame_height)
+        size = rng.randrange(width // 20, width // 4)
+        color = tuple(rng.randrange(256) for _ in range(3))
+        draw.ellipse((x, y, x + size, y + size), fill=color)
+    noise = Image.effect_noise((width, frame_height), 40).convert("RGB")
+    frame = Image.blend(frame.filter(ImageFilter.GaussianBlur(1)), noise, 0.15)
+    image = Image.new("RGB", (width, height))
+    image.paste(frame, (0, (height - frame_height) // 2))
+    output = io.BytesIO()
+    # i.ytimg.com serves thumbnails at roughly this quality
+    image.save(output, format="jpeg", quality=85)
+    return output.getvalue()
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--widths", type=int, nargs="+", default=[120, 250, 400, 640])
+    parser.add_argument("--quality", type=int, default=75, help="Quality of recompressed images")
+    parser.add_argument("--scale", type=float, default=1, help="Ratio of pixels to card width")
+    args = parser.parse_args()
+
+    api.thumbnails.THUMBNAIL_QUALITY = args.quality
+    api.thumbnails.THUMBNAIL_SCALE = args.scale
+    originals = {
+        variant.name: synthetic_thumbnail(variant.width, variant.height) for variant in VARIANTS
+    }
+    baseline = len(originals["mqdefault"])
+
+    print(
+        f"{'width':>6} {'format':>9} {'variant':>14} {'pixels':>7} {'bytes':>8} {'vs mqdefault':>13}"
+    )
+    for width in args.widths:
+        for image_format in ("original", "jpeg", "webp"):
+            api.thumbnails.THUMBNAIL_FORMAT = image_format
+            variant, pixels = plan_thumbnail(width)[0]
+            data, _ = process_thumbnail(originals[variant.name], "image/jpeg", variant, pixels)
+            print(
+                f"{width:>6} {image_format:>9} {variant.name:>14} {pixels:>7} {len(data):>8} "
+                f"{len(data) - baseline:>+13}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Local servers standing in for i.ytimg.com and img.shields.io
+
+Thumbnails are served at ``/vi/<id>/<variant>.jpg`` and view counts at
+``/youtube/views/<id>.json``, after an artificial latency. A share of requests can
+be answered with an error to imitate a failing upstream.
+"""
+
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# smallest valid JPEG header, padded to the requested payload size with random bytes, which
+# compress as poorly as the compressed image data of real thumbnails
+JPEG_HEADER = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # allow bursts of connections from load tests
+    request_queue_size = 1024
+
+    def __init__(
+        self, *, latency: float = 0, thumbnail_size: int = 16 * 1024, error_rate: float = 0
+    ):
+        self.latency = latency
+        padding = random.Random(0).randbytes(max(0, thumbnail_size - len(JPEG_HEADER)))
+        self.thumbnail = JPEG_HEADER + padding
+        self.error_rate = error_rate
+        self.hits = 0
+        self._lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def close(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, which Nagle's algorithm would delay by 40ms
+    disable_nagle_algorithm = True
+    server: StandInServer
+
+    def do_GET(self):
+        self.server.count_hit()
+        time.sleep(self.server.latency)
+        if random.random() < self.server.error_rate:
+            self.respond(500, "text/plain", b"Internal Server Error")
+        elif self.path.startswith("/vi/") and self.path.endswith(".jpg"):
+            self.respond(200, "image/jpeg", self.server.thumbnail)
+        elif self.path.startswith("/youtube/views/") and self.path.endswith(".json"):
+            self.respond(200, "application/json", b'{"label":"views","value":"1.5M"}')
+        else:
+            self.respond(404, "text/plain", b"Not Found")
+
+    def respond(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
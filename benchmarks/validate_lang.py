@@ -0,0 +1,51 @@
+"""Compare the cost of validating the language of a request with and without memoization
+
+No network access is needed.
+
+    python -m benchmarks.validate_lang --validations 20000
+"""
+
+import timeit
+from argparse import ArgumentParser
+from urllib.parse import urlencode
+
+from babel import Locale, UnknownLocaleError
+from flask.wrappers import Request
+
+from api.validate import canonical_lang, validate_lang
+
+# translated, untranslated, unknown and malformed languages
+LANGS = ["en", "fr", "zh", "pt_BR", "zz", "pt-BR", "x" * 200]
+
+
+def parse_every_time(req: Request, field: str, *, default: str = "en") -> str:
+    """Validate a language by parsing it on every request, as before memoization"""
+    value = req.args.get(field, default)
+    try:
+        Locale.parse(value)
+    except (UnknownLocaleError, ValueError):
+        value = default
+    return value
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--validations", type=int, default=20000)
+    args = parser.parse_args()
+
+    validators = {"parsed": parse_every_time, "memoized": validate_lang}
+    print(f"{'lang':>12} " + " ".join(f"{name:>10}" for name in validators))
+    for lang in LANGS:
+        req = Request({"QUERY_STRING": urlencode({"lang": lang}), "REQUEST_METHOD": "GET"})
+        timings = []
+        for validate in validators.values():
+            canonical_lang.cache_clear()
+            seconds = min(
+                timeit.repeat(lambda: validate(req, "lang"), number=args.validations, repeat=3)
+            )
+            timings.append(seconds / args.validations)
+        print(f"{lang[:12]:>12} " + " ".join(f"{t * 1e6:>8.2f}us" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compare wrapping titles by character count with textwrap and by width with the glyph table
+
+Reports the time per title and how many lines are wider than the card, measured with
+the advance widths of the card font, for a corpus of titles in several scripts.
+No network access is needed.
+
+    python -m benchmarks.wrapping --width 250 --max-lines 2
+"""
+
+import timeit
+from argparse import ArgumentParser
+from typing import Callable
+
+from api.index import TITLE_FONT_SIZE
+from api.layout import measure_text, wrap_text
+from api.utils import trim_lines
+
+CORPUS = {
+    "latin": [
+        "Rick Astley - Never Gonna Give You Up (Official Music Video)",
+        "How I Built a Tiny House in 30 Days (Full Build Timelapse)",
+        "MINIMUM WAGE vs MILLIONAIRE: WHO WINS THE WORLD'S HARDEST CHALLENGE?",
+        "illiterate little lilies fill the hill with lilting lyrical lines",
+        "Ünïcödé títlés wíth àccénts ärë wrâppéd tõo — straße façade",
+    ],
+    "cjk": [
+        "日本語のタイトルはとても長いのでここで折り返す必要があります",
+        "【公式】新しいアルバムのミュージックビデオを公開しました！",
+        "这是一个很长的中文视频标题需要在卡片中正确地换行显示",
+        "조회수가 많은 한국어 동영상 제목은 이렇게 길어질 수도 있습니다",
+    ],
+    "rtl": [
+        "مرحبا بكم في قناتي على يوتيوب هذا فيديو جديد رائع جدا",
+        "شلونكم يا جماعة اليوم عندنا تحدي جديد مع الأصدقاء",
+        "שלום לכולם וברוכים הבאים לערוץ שלי ביוטיוב",
+    ],
+    "mixed": [
+        "Python 3.12 の新機能を 10 分で解説 | What's New in Python",
+        "🎉 100K Subscribers Special 🎉 Thank you all so much!!! 🎉",
+        "Лучшие моменты матча: Спартак — Зенит 2:1 (обзор)",
+    ],
+}
+
+
+def textwrap_lines(title: str, width: int, max_lines: int) -> list[str]:
+    """Wrap a title by character count, as cards were wrapped before"""
+    return trim_lines(title, (width - 20) // 8, max_lines)
+
+
+def glyph_lines(title: str, width: int, max_lines: int) -> list[str]:
+    """Wrap a title by its width in the card font"""
+    lines = wrap_text(title, width - 20, max_lines, font_size=TITLE_FONT_SIZE)
+    return [line.text for line in lines]
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=250, help="Card width")
+    parser.add_argument("--max-lines", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    wrappers: dict[str, Callable[[str, int, int], list[str]]] = {
+        "textwrap": textwrap_lines,
+        "glyphs": glyph_lines,
+    }
+    print(f"{'script':>7} {'wrapper':>9} {'per title':>10} {'lines':>6} {'overflowing':>12}")
+    for script, titles in CORPUS.items():
+        for name, wrap in wrappers.items():
+            seconds = timeit.timeit(
+                lambda: [wrap(title, args.width, args.max_lines) for title in titles],
+                number=args.repeat,
+            )
+            lines = [line for title in titles for line in wrap(title, args.width, args.max_lines)]
+            overflowing = sum(
+                measure_text(line, TITLE_FONT_SIZE) > args.width - 20 for line in lines
+            )
+            print(
+                f"{script:>7} {name:>9} {seconds / args.repeat / len(titles) * 1e6:>8.1f}us "
+                f"{len(lines):>6} {overflowing:>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
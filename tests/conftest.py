@@ -1,7 +1,43 @@
+import fnmatch
+import math
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, NamedTuple, Optional, Union
+from urllib.parse import parse_qs, urlsplit
+
+import orjson
 import pytest
 from flask.wrappers import Request
 
+import api.index
+import api.utils
+from api.breaker import upstream_breakers
 from api.index import app
+from api.metrics import response_bytes, stage_seconds, upstream_responses
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start and end every test with empty caches and metrics and closed circuit breakers"""
+    caches = (
+        api.utils.thumbnail_cache,
+        api.utils.views_cache,
+        api.index.card_cache,
+        api.index.error_cache,
+        api.utils.missing_videos,
+        stage_seconds,
+        response_bytes,
+        upstream_responses,
+    )
+    for cache in caches:
+        cache.clear()
+    upstream_breakers.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+    upstream_breakers.clear()
 
 
 @pytest.fixture()
@@ -27,3 +63,254 @@ class MockRequest(Request):
 def req():
     """Mock request object for testing with no arguments"""
     return MockRequest()
+
+
+class StandInUpstream:
+    """Local HTTP server that stands in for an upstream server, responding to every
+    request with the same body, or a body computed from its path, after an artificial delay
+    """
+
+    def __init__(
+        self,
+        body: Union[bytes, Callable[[str], bytes]],
+        content_type: str,
+        *,
+        status: int = 200,
+        delay: float = 0,
+    ):
+        self.body = body
+        self.content_type = content_type
+        self.status = status
+        self.delay = delay
+        self.paths: list[str] = []
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                upstream.paths.append(self.path)
+                time.sleep(upstream.delay)
+                body = upstream.body(self.path) if callable(upstream.body) else upstream.body
+                self.send_response(upstream.status)
+                self.send_header("Content-Type", upstream.content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def hits(self) -> int:
+        return len(self.paths)
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture()
+def stand_in_upstream():
+    """Factory for local stand-in upstream servers which are shut down after the test"""
+    servers: list[StandInUpstream] = []
+
+    def create(
+        body: Union[bytes, Callable[[str], bytes]], content_type: str, **kwargs
+    ) -> StandInUpstream:
+        server = StandInUpstream(body, content_type, **kwargs)
+        servers.append(server)
+        return server
+
+    yield create
+    for server in servers:
+        server.close()
+
+
+class StandInUpstreams(NamedTuple):
+    thumbnails: StandInUpstream
+    views: StandInUpstream
+
+
+@pytest.fixture()
+def upstreams(stand_in_upstream, monkeypatch):
+    """Stand-ins for the thumbnail server and shields.io which the app requests instead,
+    serving a tiny JPEG and 1.5k views, whose responses can be changed through their attributes
+    """
+    thumbnails = stand_in_upstream(b"\xff\xd8\xff\xe0", "image/jpeg")
+    views = stand_in_upstream(b'{"value": "1.5k"}', "application/json")
+    monkeypatch.setattr(api.utils, "YTIMG_BASE_URL", thumbnails.url)
+    monkeypatch.setattr(api.utils, "SHIELDS_BASE_URL", views.url)
+    return StandInUpstreams(thumbnails, views)
+
+
+def youtube_api_views(path: str) -> bytes:
+    """Respond to a request for the statistics of videos like the YouTube Data API, leaving out
+    videos whose ID starts with "deleted" and the view count of those starting with "hidden"
+    """
+    video_ids = parse_qs(urlsplit(path).query)["id"][0].split(",")
+    items = [
+        {
+            "id": video_id,
+            "statistics": {} if video_id.startswith("hidden") else {"viewCount": "1234567"},
+        }
+        for video_id in video_ids
+        if not video_id.startswith("deleted")
+    ]
+    return orjson.dumps({"items": items})
+
+
+@pytest.fixture()
+def stand_in_youtube_api(stand_in_upstream):
+    """Factory for local stand-ins for the YouTube Data API, where every video has 1234567 views"""
+    return lambda: stand_in_upstream(youtube_api_views, "application/json")
+
+
+class StandInRedis:
+    """Local server that stands in for a Redis server, supporting the commands used by
+    the Redis cache backend over the RESP2 protocol
+    """
+
+    def __init__(self, *, password: Optional[str] = None):
+        self.password = password
+        self.entries: dict[bytes, tuple[Any, float]] = {}
+        self.commands: list[str] = []
+        self._lock = threading.Lock()
+        redis = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                authenticated = redis.password is None
+                while True:
+                    line = self.rfile.readline()
+                    if not line:
+                        return
+                    args = []
+                    for _ in range(int(line[1:])):
+                        length = int(self.rfile.readline()[1:])
+                        args.append(self.rfile.read(length + 2)[:-2])
+                    name = args[0].decode().upper()
+                    if name == "AUTH":
+                        authenticated = args[-1].decode() == redis.password
+                        reply = b"+OK\r\n" if authenticated else b"-WRONGPASS invalid password\r\n"
+                    elif not authenticated:
+                        reply = b"-NOAUTH Authentication required.\r\n"
+                    else:
+                        reply = redis.execute(name, args[1:])
+                    self.wfile.write(reply)
+
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def execute(self, name: str, args: list[bytes]) -> bytes:
+        """Run a command and return its encoded reply
+
+        Strings are stored as bytes, hashes as dicts and sorted sets as dicts of scores.
+        """
+        with self._lock:
+            self.commands.append(name)
+            now = time.monotonic()
+            self.entries = {k: v for k, v in self.entries.items() if v[1] > now}
+            if name in ("PING", "SELECT"):
+                return b"+OK\r\n"
+            if name == "GET":
+                entry = self.entries.get(args[0])
+                return encode_reply(entry[0] if entry else None)
+            if name == "SET":
+                milliseconds = int(args[3]) if len(args) > 3 else 10**12
+                self.entries[args[0]] = (args[1], now + milliseconds / 1000)
+                return b"+OK\r\n"
+            if name == "INCRBY":
+                value = int(self.entries.get(args[0], (b"0",))[0]) + int(args[1])
+                self.entries[args[0]] = (str(value).encode(), math.inf)
+                return encode_reply(value)
+            if name == "DEL":
+                return encode_reply(sum(self.entries.pop(key, None) is not None for key in args))
+            if name == "SCAN":
+                pattern = args[args.index(b"MATCH") + 1].decode()
+                keys = [key for key in self.entries if fnmatch.fnmatchcase(key.decode(), pattern)]
+                return encode_reply([b"0", keys])
+            if name.startswith(("H", "Z")):
+                collection = self.entries.setdefault(args[0], ({}, math.inf))[0]
+                reply = execute_on_collection(name, collection, args[1:])
+                if not collection:
+                    del self.entries[args[0]]
+                return encode_reply(reply)
+            return f"-ERR unknown command '{name}'\r\n".encode()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def execute_on_collection(name: str, collection: dict, args: list[bytes]) -> Any:
+    """Run a command on a hash, or on a sorted set kept as a dict of scores, and return its
+    reply
+    """
+    if name == "HGET":
+        return collection.get(args[0])
+    if name == "HMGET":
+        return [collection.get(field) for field in args]
+    if name == "HSET":
+        added = args[0] not in collection
+        collection[args[0]] = args[1]
+        return int(added)
+    if name in ("HDEL", "ZREM"):
+        return sum(collection.pop(field, None) is not None for field in args)
+    if name == "HLEN":
+        return len(collection)
+    if name == "ZADD":
+        existing_only = args[0] == b"XX"
+        pairs = args[1:] if existing_only else args
+        for score, member in zip(pairs[::2], pairs[1::2]):
+            if not existing_only or member in collection:
+                collection[member] = float(score)
+        return 0
+    if name == "ZRANGE":
+        members = sorted(collection, key=lambda member: (collection[member], member))
+        start, stop = int(args[0]), int(args[1])
+        return members[start : stop + 1 if stop >= 0 else None]
+    raise AssertionError(f"The stand-in Redis server doesn't support {name}")
+
+
+def encode_reply(reply: Union[bytes, int, list, None]) -> bytes:
+    """Encode a reply in the RESP2 protocol"""
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    if isinstance(reply, list):
+        return b"*%d\r\n" % len(reply) + b"".join(encode_reply(item) for item in reply)
+    return b"$%d\r\n%s\r\n" % (len(reply), reply)
+
+
+@pytest.fixture()
+def stand_in_redis():
+    """Factory for local stand-in Redis servers which are shut down after the test"""
+    servers: list[StandInRedis] = []
+
+    def create(**kwargs) -> StandInRedis:
+        server = StandInRedis(**kwargs)
+        servers.append(server)
+        return server
+
+    yield create
+    for server in servers:
+        server.close()
@@ -1,5 +1,19 @@
+import gzip
 import re
-from urllib.parse import urlencode
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import pytest
+from flask import request
+
+import api.breaker
+import api.cards
+import api.index
+import api.utils
+from api.breaker import host_of, upstream_breakers
+from api.cache_backends import SQLiteCache
 
 
 def test_request_no_id(client):
@@ -18,6 +32,21 @@ def test_request_invalid_id(client):
     assert "&#39;id&#39; expects a video ID but got &#39;**********&#39;" in data
 
 
+def test_error_cards_cached(client, monkeypatch):
+    first = client.get("/?id=**********")
+
+    def render_template(*args, **kwargs):
+        raise AssertionError("cached error cards should not be rendered again")
+
+    monkeypatch.setattr(api.index, "render_template", render_template)
+    second = client.get("/?id=**********")
+
+    assert first.status_code == second.status_code == 400
+    assert first.data == second.data
+    assert api.index.error_thumbnail() in first.data.decode("utf-8")
+    assert api.index.error_cache.stats()["hits"] == 1
+
+
 def test_request_unknown_id(client):
     response = client.get("/?id=abc_123-456")
     data = response.data.decode("utf-8")
@@ -133,3 +162,470 @@ def test_max_title_lines(client):
     assert response.status_code == 200
 
     assert data.count('<tspan x="0" dy="20px">') == 2
+
+
+def test_upstreams_fetched_concurrently(client, upstreams):
+    thumbnails, views = upstreams
+    thumbnails.delay = 0.5
+    views.delay = 0.5
+
+    start = time.perf_counter()
+    response = client.get("/?id=abc_123-456")
+    elapsed = time.perf_counter() - start
+    data = response.data.decode("utf-8")
+
+    assert response.status_code == 200
+    assert "1.5K views" in data
+    assert 'href="data:image/jpeg;base64,/9j/4A=="' in data
+    assert thumbnails.paths == ["/vi/abc_123-456/mqdefault.jpg"]
+    assert views.paths == ["/youtube/views/abc_123-456.json"]
+    # the latency is close to the slowest upstream rather than the sum of both
+    assert elapsed < 0.9
+
+
+def test_concurrent_requests_coalesced(client, upstreams):
+    thumbnails, views = upstreams
+    thumbnails.delay = 0.3
+    views.delay = 0.3
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(executor.map(lambda _: client.get("/?id=abc_123-456"), range(8)))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert len({response.data for response in responses}) == 1
+    # simultaneous requests for the same card share one request to each upstream
+    assert thumbnails.hits == 1
+    assert views.hits == 1
+
+
+def open_breaker(url: str) -> None:
+    """Open the circuit breaker of the host of a URL as if it had failed repeatedly"""
+    breaker = upstream_breakers.get(host_of(url))
+    for _ in range(breaker.failure_threshold):
+        breaker.allow()
+        breaker.record(0, failed=True)
+
+
+def test_degraded_card_while_thumbnails_fail(client, upstreams):
+    thumbnails, views = upstreams
+    thumbnails.delay = 1
+    open_breaker(thumbnails.url)
+
+    start = time.perf_counter()
+    response = client.get("/?id=abc_123-456")
+    elapsed = time.perf_counter() - start
+    data = response.data.decode("utf-8")
+
+    # the card is served right away with a placeholder thumbnail
+    assert response.status_code == 200
+    assert api.utils.PLACEHOLDER_THUMBNAIL in data
+    assert "1.5K views" in data
+    assert thumbnails.hits == 0
+    assert elapsed < 0.9
+    # degraded cards are not cached
+    assert len(api.index.card_cache) == 0
+
+
+def test_degraded_card_uses_cached_thumbnail(client, upstreams):
+    thumbnails, views = upstreams
+    client.get("/?id=abc_123-456")
+    api.index.card_cache.clear()
+    api.utils.views_cache.clear()
+    open_breaker(views.url)
+
+    response = client.get("/?id=abc_123-456")
+    data = response.data.decode("utf-8")
+
+    # the cached thumbnail is used, and the view count is left out
+    assert response.status_code == 200
+    assert 'href="data:image/jpeg;base64,/9j/4A=="' in data
+    assert "1.5K views" not in data
+    assert thumbnails.hits == 1
+    assert views.hits == 1
+
+
+def test_stats(client, upstreams):
+    thumbnails, views = upstreams
+    client.get("/?id=abc_123-456")
+    open_breaker(views.url)
+
+    response = client.get("/stats")
+    stats = response.json
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "no-store"
+    assert stats["caches"]["cards"]["entries"] == 1
+    assert stats["caches"]["thumbnails"]["misses"] == 1
+    assert stats["upstreams"][host_of(thumbnails.url)]["breaker"]["state"] == "closed"
+    assert stats["upstreams"][host_of(views.url)]["breaker"]["state"] == "open"
+    assert stats["upstreams"][host_of(views.url)]["connections"]["connections_opened"] == 1
+
+
+def test_server_timing(client, upstreams):
+    rendered = client.get("/?id=abc_123-456")
+    cached = client.get("/?id=abc_123-456")
+    error = client.get("/?id=**********")
+
+    def stages(response) -> list[str]:
+        return [timing.split(";")[0] for timing in response.headers["Server-Timing"].split(", ")]
+
+    assert stages(rendered) == [
+        "validate",
+        "cache",
+        "thumbnail",
+        "views",
+        "format",
+        "render",
+        "total",
+    ]
+    assert stages(cached) == ["validate", "cache", "total"]
+    assert stages(error) == ["validate", "total"]
+    assert "Server-Timing" not in client.get("/stats").headers
+
+
+def test_metrics(client, upstreams):
+    thumbnails, views = upstreams
+    card = client.get("/?id=abc_123-456")
+    client.get("/?id=abc_123-456")
+    open_breaker(views.url)
+
+    response = client.get("/metrics")
+    metrics = response.data.decode("utf-8").splitlines()
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "text/plain; version=0.0.4; charset=utf-8"
+    assert response.headers["Cache-Control"] == "no-store"
+    assert 'youtube_cards_stage_seconds_count{stage="total"} 2' in metrics
+    assert 'youtube_cards_stage_seconds_count{stage="render"} 1' in metrics
+    assert f'youtube_cards_response_bytes_sum{{status="200"}} {len(card.data) * 2}' in metrics
+    assert (
+        f'youtube_cards_upstream_responses_total{{host="{host_of(thumbnails.url)}",status="200"}} 1'
+        in metrics
+    )
+    assert 'youtube_cards_cache_hits_total{cache="cards"} 1' in metrics
+    assert 'youtube_cards_cache_hit_ratio{cache="cards"} 0.5' in metrics
+    assert f'youtube_cards_upstream_breaker_state{{host="{host_of(views.url)}"}} 2' in metrics
+
+
+def use_youtube_api(monkeypatch, youtube_api, *, window: float) -> None:
+    monkeypatch.setattr(api.utils, "VIEWS_PROVIDER", "youtube")
+    monkeypatch.setattr(api.utils, "YOUTUBE_API_KEY", "secret")
+    monkeypatch.setattr(api.utils, "YOUTUBE_API_BASE_URL", youtube_api.url)
+    monkeypatch.setattr(api.utils.views_batcher, "window", window)
+
+
+def test_views_batched_from_youtube_api(client, upstreams, stand_in_youtube_api, monkeypatch):
+    views = upstreams.views
+    youtube_api = stand_in_youtube_api()
+    use_youtube_api(monkeypatch, youtube_api, window=0.2)
+    video_ids = [f"video_{i}" for i in range(6)] + ["deleted_video"]
+
+    with ThreadPoolExecutor(max_workers=len(video_ids)) as executor:
+        responses = list(executor.map(lambda id: client.get(f"/?id={id}"), video_ids))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert all(b"1.2M views" in response.data for response in responses[:-1])
+    # simultaneous cards share one request, and videos missing from it fall back to shields.io
+    assert youtube_api.hits == 1
+    query = parse_qs(urlsplit(youtube_api.paths[0]).query)
+    assert sorted(query["id"][0].split(",")) == sorted(video_ids)
+    assert query["part"] == ["statistics"]
+    assert query["key"] == ["secret"]
+    assert b"1.5K views" in responses[-1].data
+    assert views.hits == 1
+
+
+def test_hidden_view_counts_cached(client, upstreams, stand_in_youtube_api, monkeypatch):
+    youtube_api = stand_in_youtube_api()
+    use_youtube_api(monkeypatch, youtube_api, window=0)
+
+    first = client.get("/?id=hidden_1234")
+    second = client.get("/?id=hidden_1234")
+
+    # a video without a view count is not a failure, so its card is cached
+    assert first.status_code == second.status_code == 200
+    assert b"1.2M views" not in first.data
+    assert first.data == second.data
+    assert api.index.card_cache.stats()["hits"] == 1
+    assert youtube_api.hits == 1
+    assert upstreams.views.hits == 0
+
+
+def test_views_fall_back_to_shields(client, upstreams, stand_in_upstream, monkeypatch):
+    views = upstreams.views
+    youtube_api = stand_in_upstream(b'{"error": {"code": 403}}', "application/json", status=403)
+    use_youtube_api(monkeypatch, youtube_api, window=0)
+
+    response = client.get("/?id=abc_123-456")
+
+    assert b"1.5K views" in response.data
+    assert youtube_api.hits == views.hits == 1
+
+
+def test_youtube_api_quota_opens_breaker(client, upstreams, stand_in_upstream, monkeypatch):
+    views = upstreams.views
+    youtube_api = stand_in_upstream(b'{"error": {"code": 403}}', "application/json", status=403)
+    use_youtube_api(monkeypatch, youtube_api, window=0)
+    monkeypatch.setattr(api.breaker, "QUOTA_HOSTS", {host_of(youtube_api.url)})
+    failures = upstream_breakers.get(host_of(youtube_api.url)).failure_threshold
+
+    responses = [client.get(f"/?id=abc_123-4{i:02}") for i in range(failures + 3)]
+
+    # once the quota is exceeded, view counts are fetched from shields.io right away
+    assert all(b"1.5K views" in response.data for response in responses)
+    assert youtube_api.hits == failures
+    assert views.hits == failures + 3
+
+
+def test_upstream_deadline(client, upstreams, monkeypatch):
+    thumbnails = upstreams.thumbnails
+    thumbnails.delay = 1
+    monkeypatch.setattr(api.index, "UPSTREAM_DEADLINE", 0.2)
+
+    start = time.perf_counter()
+    # the thumbnail request keeps running after the deadline, so use an ID no other test uses
+    response = client.get("/?id=slow_thumbnail")
+    elapsed = time.perf_counter() - start
+
+    assert response.status_code == 504
+    assert "Timed out fetching the video thumbnail" in response.data.decode("utf-8")
+    assert elapsed < 0.9
+    # let the thumbnail request finish, so its thumbnail is not cached during another test
+    deadline = time.monotonic() + 5
+    while not api.utils.thumbnail_cache.stats()["entries"] and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+def test_missing_videos_cached(client, upstreams):
+    thumbnails, views = upstreams
+    thumbnails.body = b""
+    thumbnails.content_type = "text/html"
+    thumbnails.status = 404
+
+    first = client.get("/?id=deleted_123")
+    thumbnail_hits, views_hits = thumbnails.hits, views.hits
+    # the error of a video known to be missing is served without any upstream requests
+    second = client.get("/?id=deleted_123&width=500")
+
+    assert first.status_code == second.status_code == 404
+    assert first.data == second.data
+    assert "HTTP Error 404" in second.data.decode("utf-8")
+    assert thumbnails.hits == thumbnail_hits
+    assert views.hits == views_hits
+    assert api.utils.missing_videos.stats()["hits"] == 1
+    # nothing is cached for the video besides its error
+    assert api.utils.thumbnail_cache.stats()["entries"] == 0
+    assert api.utils.views_cache.stats()["entries"] == 0
+
+
+def test_rendered_cards_cached(client, upstreams, monkeypatch):
+    thumbnails, views = upstreams
+
+    def render_template(*args, **kwargs):
+        raise AssertionError("cached cards should not be rendered again")
+
+    first = client.get("/?id=abc_123-456&width=300&title=Title")
+    monkeypatch.setattr(api.index, "render_template", render_template)
+    # equivalent parameters are normalized to the same card
+    second = client.get("/?id=abc_123-456&width=300&title=Title&lang=en&border_radius=x")
+
+    assert first.status_code == second.status_code == 200
+    assert first.data == second.data
+    assert thumbnails.hits == 1
+    assert views.hits == 1
+    assert api.index.card_cache.stats()["hits"] == 1
+
+
+def test_conditional_requests(client, upstreams):
+    thumbnails, views = upstreams
+    path = "/?id=abc_123-456&title=Title"
+
+    card = client.get(path)
+    etag = card.headers["ETag"]
+    api.utils.thumbnail_cache.clear()
+    api.utils.views_cache.clear()
+    not_modified = client.get(path, headers={"If-None-Match": f'W/"other", {etag}'})
+    not_modified_since = client.get(
+        path, headers={"If-Modified-Since": card.headers["Last-Modified"]}
+    )
+    changed = client.get(path, headers={"If-None-Match": '"other"'})
+
+    assert card.status_code == 200
+    assert "s-maxage=3600, stale-while-revalidate=86400" in card.headers["Cache-Control"]
+    # revalidating a cached card neither fetches nor renders it
+    assert not_modified.status_code == not_modified_since.status_code == 304
+    assert not_modified.data == b""
+    assert not_modified.headers["ETag"] == etag
+    assert not_modified.headers["Cache-Control"] == card.headers["Cache-Control"]
+    assert not_modified.headers["Server-Timing"].count(";dur=") == 3
+    assert changed.status_code == 200
+    assert changed.data == card.data
+    assert thumbnails.hits == views.hits == 1
+
+
+def test_uncached_cards_revalidated_before_rendering(client, upstreams, monkeypatch):
+    thumbnails, views = upstreams
+    path = "/?id=abc_123-456&title=Title"
+
+    card = client.get(path)
+    other_card = client.get("/?id=abc_123-456&title=Other")
+    api.index.card_cache.clear()
+
+    def build_card(*args):
+        raise AssertionError("cards a request has should not be rendered")
+
+    monkeypatch.setattr(api.index, "build_card", build_card)
+    not_modified = client.get(path, headers={"If-None-Match": card.headers["ETag"]})
+    monkeypatch.setattr(api.index, "STREAM_CARDS", True)
+    streamed_not_modified = client.get(path, headers={"If-None-Match": card.headers["ETag"]})
+
+    assert card.headers["ETag"] != other_card.headers["ETag"]
+    # the ETag is known from the cached thumbnail and view count, without rendering the card
+    assert not_modified.status_code == streamed_not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == streamed_not_modified.headers["ETag"]
+    assert not_modified.headers["ETag"] == card.headers["ETag"]
+    assert thumbnails.hits == views.hits == 1
+
+
+def test_etag_follows_relative_time(client, upstreams, monkeypatch):
+    hour = 1_699_999_200
+    now = hour
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.fromtimestamp(now, tz)
+
+    monkeypatch.setattr(api.utils, "datetime", FrozenDatetime)
+    path = f"/?id=abc_123-456&timestamp={hour - 3610}"
+
+    first = client.get(path)
+    now = hour + 3500
+    second = client.get(path, headers={"If-None-Match": first.headers["ETag"]})
+
+    # both times are within the same hour, but the cached card shows another relative time
+    assert "1 hour ago" in first.text
+    assert second.status_code == 200
+    assert "2 hours ago" in second.text
+    assert first.headers["ETag"] != second.headers["ETag"]
+
+
+def test_compressed_cards(client, upstreams, monkeypatch):
+    thumbnails, views = upstreams
+    thumbnails.body = b"\xff\xd8\xff\xe0" * 1000
+    path = "/?id=abc_123-456&title=Title"
+
+    card = client.get(path)
+    compressed = client.get(path, headers={"Accept-Encoding": "gzip, deflate"})
+
+    def compress(*args):
+        raise AssertionError("cached cards should not be compressed again")
+
+    monkeypatch.setattr(api.index, "compress", compress)
+    cached = client.get(path, headers={"Accept-Encoding": "deflate, gzip;q=0.5"})
+    not_modified = client.get(
+        path, headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["ETag"]}
+    )
+    uncompressed = client.get(path, headers={"Accept-Encoding": "deflate"})
+
+    assert "Content-Encoding" not in card.headers
+    assert card.headers["Vary"] == compressed.headers["Vary"] == "Accept-Encoding"
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed.data) == card.data
+    assert len(compressed.data) < len(card.data)
+    # each encoding of a card has an ETag of its own
+    assert compressed.headers["ETag"] == card.headers["ETag"][:-1] + '-gzip"'
+    assert cached.data == compressed.data
+    assert not_modified.status_code == 304
+    assert uncompressed.data == card.data
+    assert thumbnails.hits == views.hits == 1
+
+
+def test_brotli_compressed_cards(client, upstreams):
+    brotli = pytest.importorskip("brotli")
+    thumbnails = upstreams.thumbnails
+    thumbnails.body = b"\xff\xd8\xff\xe0" * 1000
+    path = "/?id=abc_123-456&title=Title"
+
+    card = client.get(path)
+    # brotli is preferred when it is accepted as much as gzip
+    compressed = client.get(path, headers={"Accept-Encoding": "gzip, deflate, br"})
+    gzip_preferred = client.get(path, headers={"Accept-Encoding": "gzip, br;q=0.9"})
+
+    assert compressed.headers["Content-Encoding"] == "br"
+    assert brotli.decompress(compressed.data) == card.data
+    assert gzip_preferred.headers["Content-Encoding"] == "gzip"
+
+
+def test_cards_cached_without_validators(client, upstreams):
+    with api.index.app.test_request_context("/?id=abc_123-456"):
+        params = api.cards.parse_card_params(request)
+        key = api.cards.card_cache_key(params, api.cards.published_text(params))
+    # cards cached by an older version are rendered again
+    api.index.card_cache.set(key, b"<svg>\n</svg>")
+
+    response = client.get("/?id=abc_123-456")
+
+    assert response.status_code == 200
+    assert response.data != b"<svg>\n</svg>"
+    assert api.cards.unpack_card(api.index.card_cache.get(key)).body == response.data
+
+
+def test_cards_shared_between_workers(client, upstreams, monkeypatch, tmp_path):
+    thumbnails = upstreams.thumbnails
+    path = str(tmp_path / "cache.sqlite3")
+
+    def start_worker():
+        """Give the app the caches a new worker process would open"""
+        card_cache = SQLiteCache(path, namespace="cards", max_bytes=2**20, ttl=60)
+        thumbnail_cache = SQLiteCache(path, namespace="thumbnails", max_bytes=2**20, ttl=60)
+        monkeypatch.setattr(api.index, "card_cache", card_cache)
+        monkeypatch.setattr(api.utils, "thumbnail_cache", thumbnail_cache)
+        return card_cache
+
+    start_worker()
+    first = client.get("/?id=abc_123-456&title=Title")
+    second_worker_cards = start_worker()
+    second = client.get("/?id=abc_123-456&title=Title")
+    # a thumbnail cached by another worker is reused for a card that isn't cached yet
+    third = client.get("/?id=abc_123-456&title=Other")
+
+    assert first.status_code == second.status_code == third.status_code == 200
+    assert first.data == second.data
+    assert second_worker_cards.stats()["hits"] == 1
+    assert thumbnails.hits == 1
+
+
+def test_streamed_cards(client, upstreams, monkeypatch):
+    thumbnails = upstreams.thumbnails
+    thumbnails.body = b"\xff\xd8\xff\xe0" * 10000
+    monkeypatch.setattr(api.index, "STREAM_CHUNK_SIZE", 1024)
+    query = {"id": "abc_123-456", "title": "<thumbnail> & more", "duration": 61, "timestamp": 10**9}
+    path = f"/?{urlencode(query)}"
+
+    buffered = client.get(path)
+    api.index.card_cache.clear()
+    monkeypatch.setattr(api.index, "STREAM_CARDS", True)
+    streamed = client.get(path)
+
+    assert streamed.status_code == 200
+    assert streamed.is_streamed
+    assert streamed.data == buffered.data
+    assert streamed.headers["ETag"] == buffered.headers["ETag"]
+    assert b"&lt;thumbnail&gt; &amp; more" in streamed.data
+    assert len(api.index.card_cache) == 0
+
+
+def test_generate_card_chunks(monkeypatch):
+    monkeypatch.setattr(api.index, "STREAM_CHUNK_SIZE", 1024)
+    params = api.cards.CardParams(
+        "abc_123-456", 250, 5, "#0d1117", "#ffffff", "#dedede", "Title", 1, 0, 0, "en"
+    )
+    thumbnail = "data:image/jpeg;base64," + "A" * 10000
+    with api.index.app.app_context():
+        chunks = list(api.index.generate_card(params, thumbnail, "1.5k views"))
+        expected = api.index.build_card(params, thumbnail, "1.5k views")
+
+    assert b"".join(chunks).decode("utf-8") == expected
+    assert max(len(chunk) for chunk in chunks) <= 1024 * 4
+    assert len(chunks) > 10
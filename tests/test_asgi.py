@@ -0,0 +1,264 @@
+import asyncio
+import gzip
+import threading
+from typing import Any, Optional
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+import api.asgi  # noqa: E402
+import api.index  # noqa: E402
+import api.utils  # noqa: E402
+from api.cache_backends import SQLiteCache  # noqa: E402
+
+
+def request_asgi(
+    path: str, query_string: str = "", headers: Optional[dict[str, str]] = None
+) -> tuple[int, dict[str, str], bytes]:
+    """Send a GET request to the ASGI app and return the status, headers and body"""
+    return request_asgi_concurrently(path, query_string, headers, requests=1)[0]
+
+
+def request_asgi_concurrently(
+    path: str, query_string: str = "", headers: Optional[dict[str, str]] = None, *, requests: int
+) -> list[tuple[int, dict[str, str], bytes]]:
+    """Send simultaneous GET requests to the ASGI app and return the status, headers and body
+    of each response
+    """
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query_string.encode("latin-1"),
+        "headers": [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in (headers or {}).items()
+        ],
+    }
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def request() -> tuple[int, dict[str, str], bytes]:
+        messages: list[dict[str, Any]] = []
+
+        async def send(message: dict[str, Any]) -> None:
+            messages.append(message)
+
+        await api.asgi.app(scope, receive, send)
+        start, body = messages
+        headers = {name.decode(): value.decode() for name, value in start["headers"]}
+        return start["status"], headers, body["body"]
+
+    async def run():
+        responses = await asyncio.gather(*(request() for _ in range(requests)))
+        await api.asgi.http_client.close()
+        return responses
+
+    return asyncio.run(run())
+
+
+def test_asgi_card_matches_flask(client, upstreams):
+    thumbnails, views = upstreams
+    query = "id=abc_123-456&title=Title&timestamp=1256450400&duration=211&lang=fr"
+
+    status, headers, body = request_asgi("/", query)
+    api.index.card_cache.clear()
+    response = client.get(f"/?{query}")
+
+    assert status == 200
+    assert headers["content-type"] == "image/svg+xml; charset=utf-8"
+    assert headers["cache-control"] == response.headers["Cache-Control"]
+    assert "1,5 k vues" in body.decode("utf-8")
+    assert body == response.data
+    assert thumbnails.hits == 1
+    assert views.hits == 1
+
+
+def test_asgi_concurrent_requests_coalesced(upstreams):
+    thumbnails, views = upstreams
+    thumbnails.delay = 0.3
+    views.delay = 0.3
+
+    responses = request_asgi_concurrently("/", "id=abc_123-456", requests=8)
+
+    assert all(status == 200 for status, _, _ in responses)
+    assert len({body for _, _, body in responses}) == 1
+    # simultaneous requests for the same card share one request to each upstream
+    assert thumbnails.hits == 1
+    assert views.hits == 1
+
+
+def test_asgi_degraded_card(upstreams):
+    thumbnails, views = upstreams
+    breaker = api.asgi.upstream_breakers.get(api.asgi.host_of(thumbnails.url))
+    for _ in range(breaker.failure_threshold):
+        breaker.allow()
+        breaker.record(0, failed=True)
+
+    status, _, body = request_asgi("/", "id=abc_123-456")
+
+    assert status == 200
+    assert api.asgi.PLACEHOLDER_THUMBNAIL.encode() in body
+    assert b"1.5K views" in body
+    assert thumbnails.hits == 0
+    assert len(api.index.card_cache) == 0
+
+
+def test_asgi_server_timing(upstreams):
+    views = upstreams.views
+
+    _, headers, body = request_asgi("/", "id=abc_123-456")
+    stages = [timing.split(";")[0] for timing in headers["server-timing"].split(", ")]
+
+    assert stages == ["validate", "cache", "thumbnail", "views", "format", "render", "total"]
+    assert f'status="200"}} {len(body)}' in "\n".join(api.asgi.response_bytes.exposition())
+    host = api.asgi.host_of(views.url)
+    assert f'{{host="{host}",status="200"}} 1' in "\n".join(
+        api.asgi.upstream_responses.exposition()
+    )
+
+
+def test_asgi_conditional_requests(client, upstreams, monkeypatch):
+    thumbnails, views = upstreams
+
+    _, headers, body = request_asgi("/", "id=abc_123-456")
+    status, not_modified_headers, not_modified = request_asgi(
+        "/", "id=abc_123-456", {"If-None-Match": headers["etag"]}
+    )
+    flask_response = client.get("/?id=abc_123-456", headers={"If-None-Match": headers["etag"]})
+    api.index.card_cache.clear()
+    monkeypatch.setattr(api.asgi, "build_card", None)
+    uncached_status, _, _ = request_asgi("/", "id=abc_123-456", {"If-None-Match": headers["etag"]})
+
+    assert status == flask_response.status_code == uncached_status == 304
+    assert not_modified == b""
+    assert not_modified_headers["etag"] == headers["etag"] == flask_response.headers["ETag"]
+    assert "content-length" not in not_modified_headers
+    assert thumbnails.hits == views.hits == 1
+
+
+def test_asgi_compressed_cards(client, upstreams):
+    thumbnails = upstreams.thumbnails
+    thumbnails.body = b"\xff\xd8\xff\xe0" * 1000
+
+    _, headers, body = request_asgi("/", "id=abc_123-456", {"Accept-Encoding": "gzip"})
+    flask_response = client.get("/?id=abc_123-456", headers={"Accept-Encoding": "gzip"})
+    _, not_modified_headers, _ = request_asgi(
+        "/", "id=abc_123-456", {"Accept-Encoding": "gzip", "If-None-Match": headers["etag"]}
+    )
+
+    assert headers["content-encoding"] == "gzip"
+    assert headers["vary"] == "Accept-Encoding"
+    assert headers["content-length"] == str(len(body))
+    assert gzip.decompress(body) == gzip.decompress(flask_response.data)
+    assert headers["etag"] == flask_response.headers["ETag"]
+    assert "content-encoding" not in not_modified_headers
+
+
+def test_asgi_views_batched_from_youtube_api(upstreams, stand_in_youtube_api, monkeypatch):
+    views = upstreams.views
+    youtube_api = stand_in_youtube_api()
+    monkeypatch.setattr(api.utils, "VIEWS_PROVIDER", "youtube")
+    monkeypatch.setattr(api.utils, "YOUTUBE_API_KEY", "secret")
+    monkeypatch.setattr(api.utils, "YOUTUBE_API_BASE_URL", youtube_api.url)
+    monkeypatch.setattr(api.asgi.views_batcher, "window", 0.05)
+    video_ids = [f"video_{i}" for i in range(6)] + ["deleted_video"]
+
+    async def fetch_all():
+        try:
+            return await asyncio.gather(*map(api.asgi.fetch_views, video_ids))
+        finally:
+            await api.asgi.http_client.close()
+
+    views_text = asyncio.run(fetch_all())
+
+    assert views_text == ["1.2M views"] * 6 + ["1.5K views"]
+    assert youtube_api.hits == views.hits == 1
+
+
+def test_asgi_blocking_cache_backends(upstreams, monkeypatch, tmp_path):
+    thumbnails = upstreams.thumbnails
+    threads = set()
+
+    class RecordingSQLiteCache(SQLiteCache):
+        def get(self, key: str) -> Optional[bytes]:
+            threads.add(threading.current_thread())
+            return super().get(key)
+
+    path = str(tmp_path / "cache.sqlite3")
+    for name in ("card_cache", "thumbnail_cache"):
+        cache = RecordingSQLiteCache(path, namespace=name, max_bytes=2**20, ttl=60)
+        monkeypatch.setattr(api.asgi, name, cache)
+    monkeypatch.setattr(api.index, "card_cache", api.asgi.card_cache)
+
+    first = request_asgi("/", "id=abc_123-456", {"Accept-Encoding": "gzip"})
+    second = request_asgi("/", "id=abc_123-456", {"Accept-Encoding": "gzip"})
+
+    assert first[0] == second[0] == 200
+    assert first[2] == second[2]
+    assert thumbnails.hits == 1
+    # the backends block, so they are never called on the event loop's thread
+    assert len(threads) > 0 and threading.main_thread() not in threads
+
+
+def test_asgi_errors(client):
+    status, _, body = request_asgi("/", "id=**********")
+    assert status == 400
+    assert body == client.get("/?id=**********").data
+
+    status, _, _ = request_asgi("/unknown")
+    assert status == 404
+
+
+def test_asgi_missing_videos_cached(upstreams):
+    thumbnails = upstreams.thumbnails
+    thumbnails.body = b""
+    thumbnails.content_type = "text/html"
+    thumbnails.status = 404
+
+    first = request_asgi("/", "id=deleted_123")
+    thumbnail_hits = thumbnails.hits
+    second = request_asgi("/", "id=deleted_123&width=500")
+
+    assert first[0] == second[0] == 404
+    assert first[2] == second[2]
+    assert thumbnails.hits == thumbnail_hits
+    assert api.utils.missing_videos.stats()["hits"] == 1
+    assert api.utils.views_cache.stats()["entries"] == 0
+
+
+def test_asgi_upstream_deadline(upstreams, monkeypatch):
+    thumbnails = upstreams.thumbnails
+    thumbnails.delay = 1
+    monkeypatch.setattr(api.asgi, "UPSTREAM_DEADLINE", 0.2)
+
+    status, _, body = request_asgi("/", "id=abc_123-456")
+
+    assert status == 504
+    assert b"Timed out fetching the video thumbnail" in body
+
+
+def test_asgi_upstream_errors_name_host(upstreams, monkeypatch):
+    thumbnails = upstreams.thumbnails
+    thumbnails.delay = 1
+    monkeypatch.setattr(api.asgi.http_client, "read_timeout", 0.2)
+
+    status, _, body = request_asgi("/", "id=abc_123-456")
+
+    assert status == 504
+    # error cards name the upstream host, not the URL of the request
+    assert f"Timed out requesting {api.asgi.host_of(thumbnails.url)}".encode() in body
+    assert b"/vi/abc_123-456" not in body
+
+
+def test_asgi_index_page():
+    status, headers, body = request_asgi("/")
+    assert status == 200
+    assert headers["content-type"] == "text/html; charset=utf-8"
+    assert b"</html>" in body
+
+    status, headers, _ = request_asgi("/static/css/style.css")
+    assert status == 200
+    assert headers["content-type"].startswith("text/css")
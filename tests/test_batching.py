@@ -0,0 +1,127 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api.batching import AsyncMicroBatcher, MicroBatcher, MissingFromBatchError
+from api.exceptions import UpstreamError
+
+
+class RecordingLoader:
+    """Batch loader which records its batches and returns each key in upper case"""
+
+    def __init__(self, *, missing: tuple[str, ...] = ()):
+        self.missing = missing
+        self.batches: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, keys: list[str]) -> dict[str, str]:
+        with self._lock:
+            self.batches.append(sorted(keys))
+        return {key: key.upper() for key in keys if key not in self.missing}
+
+
+def test_micro_batcher_merges_concurrent_keys():
+    loader = RecordingLoader()
+    batcher = MicroBatcher(loader, window=0.2, max_size=50)
+    keys = ["a", "b", "c", "a", "d"]
+
+    with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+        values = list(executor.map(batcher.get, keys))
+
+    assert values == ["A", "B", "C", "A", "D"]
+    assert loader.batches == [["a", "b", "c", "d"]]
+    assert batcher.stats() == {"batches": 1, "keys": 4, "largest_batch": 4}
+
+
+def test_micro_batcher_loads_full_batches_right_away():
+    loader = RecordingLoader()
+    # the window is longer than the test may take, so only full batches are loaded early
+    batcher = MicroBatcher(loader, window=30, max_size=2)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        values = list(executor.map(batcher.get, "abcd"))
+
+    assert values == ["A", "B", "C", "D"]
+    assert sorted(map(len, loader.batches)) == [2, 2]
+
+
+def test_micro_batcher_errors():
+    def fail(keys: list[str]) -> dict[str, str]:
+        raise UpstreamError("HTTP Error 403: Forbidden", status=403)
+
+    missing = MicroBatcher(RecordingLoader(missing=("a",)), window=0, max_size=50)
+    failing = MicroBatcher(fail, window=0, max_size=50)
+
+    with pytest.raises(MissingFromBatchError) as exc_info:
+        missing.get("a")
+    assert exc_info.value.status == 404
+    assert missing.get("b") == "B"
+    with pytest.raises(UpstreamError) as exc_info:
+        failing.get("a")
+    assert exc_info.value.status == 403
+
+
+def test_async_micro_batcher():
+    loader = RecordingLoader()
+
+    async def load(keys: list[str]) -> dict[str, str]:
+        await asyncio.sleep(0)
+        return loader(keys)
+
+    batcher = AsyncMicroBatcher(load, window=0.05, max_size=3)
+
+    async def run():
+        return await asyncio.gather(*map(batcher.get, "abcda"))
+
+    assert asyncio.run(run()) == ["A", "B", "C", "D", "A"]
+    # keys after a full batch go in the next one, even if they were in it
+    assert loader.batches == [["a", "b", "c"], ["a", "d"]]
+    assert batcher.stats() == {"batches": 2, "keys": 5, "largest_batch": 3}
+
+
+def test_async_micro_batcher_new_event_loop():
+    loader = RecordingLoader()
+
+    async def load(keys: list[str]) -> dict[str, str]:
+        return loader(keys)
+
+    batcher = AsyncMicroBatcher(load, window=0.05, max_size=50)
+
+    # the event loop is closed while the batch is still open
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(batcher.get("a"), timeout=0.001))
+
+    assert asyncio.run(asyncio.wait_for(batcher.get("b"), timeout=1)) == "B"
+    assert loader.batches == [["b"]]
+
+
+def test_async_micro_batcher_cancelled():
+    async def load(keys: list[str]) -> dict[str, str]:
+        await asyncio.sleep(10)
+        return {}
+
+    batcher = AsyncMicroBatcher(load, window=0, max_size=50)
+
+    async def run():
+        waiting = asyncio.ensure_future(batcher.get("a"))
+        await asyncio.sleep(0.01)
+        # such as the load being cancelled at shutdown
+        for task in batcher._loading:
+            task.cancel()
+        await asyncio.wait_for(waiting, timeout=1)
+
+    # callers waiting on the batch are cancelled rather than left waiting
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(run())
+
+
+def test_async_micro_batcher_missing_key():
+    async def load(keys: list[str]) -> dict[str, str]:
+        return {}
+
+    batcher = AsyncMicroBatcher(load, window=0, max_size=50)
+
+    with pytest.raises(MissingFromBatchError):
+        asyncio.run(batcher.get("a"))
@@ -0,0 +1,102 @@
+from api.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, host_of, is_failure_status
+
+
+class FakeClock:
+    """Manually advanced clock for testing the reset timeout"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: FakeClock, failure_threshold: int = 3) -> CircuitBreaker:
+    return CircuitBreaker(
+        failure_threshold=failure_threshold, slow_threshold=2, reset_timeout=10, clock=clock
+    )
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = make_breaker(FakeClock())
+
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record(0.1, failed=True)
+    # a success resets the count of consecutive failures
+    assert breaker.allow()
+    breaker.record(0.1, failed=False)
+    for _ in range(3):
+        assert breaker.state == CLOSED
+        assert breaker.allow()
+        breaker.record(0.1, failed=True)
+
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.stats() == {
+        "state": OPEN,
+        "consecutive_failures": 3,
+        "failures": 5,
+        "opened": 1,
+        "rejected": 1,
+    }
+
+
+def test_breaker_slow_responses_are_failures():
+    breaker = make_breaker(FakeClock(), failure_threshold=2)
+
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record(2.5, failed=False)
+
+    assert breaker.state == OPEN
+
+
+def test_breaker_half_open_trial():
+    clock = FakeClock()
+    breaker = make_breaker(clock, failure_threshold=1)
+    breaker.allow()
+    breaker.record(0.1, failed=True)
+
+    # a single trial request is let through after the reset timeout
+    clock.now = 10
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    # a failed trial opens the breaker again for another reset timeout
+    breaker.record(0.1, failed=True)
+    assert breaker.state == OPEN
+    clock.now = 15
+    assert not breaker.allow()
+    # a successful trial closes it
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record(0.1, failed=False)
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+    assert breaker.stats()["opened"] == 2
+
+
+def test_breaker_disabled():
+    breaker = make_breaker(FakeClock(), failure_threshold=0)
+
+    for _ in range(10):
+        assert breaker.allow()
+        breaker.record(10, failed=True)
+
+
+def test_is_failure_status():
+    assert is_failure_status(500)
+    assert is_failure_status(503)
+    assert is_failure_status(429)
+    # missing videos and thumbnails don't mean the server is failing
+    assert not is_failure_status(404)
+    assert not is_failure_status(200)
+    # an exceeded quota fails every request until it resets
+    assert is_failure_status(403, "youtube.googleapis.com")
+    assert not is_failure_status(403, "i.ytimg.com")
+
+
+def test_host_of():
+    assert host_of("https://i.ytimg.com/vi/abc/mqdefault.jpg") == "i.ytimg.com"
+    assert host_of("http://127.0.0.1:8080/youtube/views/abc.json") == "127.0.0.1:8080"
@@ -0,0 +1,204 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import pytest
+
+from api.cache import LRUCache, SingleFlight, StaleWhileRevalidateCache
+
+
+class FakeClock:
+    """Manually advanced clock for testing expiry"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def wait_for(predicate: Callable[[], bool], timeout: float = 5) -> bool:
+    """Wait until a condition is met by a background thread"""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_lru_cache_get_set():
+    cache = LRUCache(max_bytes=100, ttl=60)
+    assert cache.get("a") is None
+    cache.set("a", "12345")
+    assert cache.get("a") == "12345"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["bytes"] == 5
+
+
+def test_lru_cache_evicts_least_recently_used_by_size():
+    cache = LRUCache(max_bytes=10, ttl=60)
+    cache.set("a", "aaaa")
+    cache.set("b", "bbbb")
+    # access "a" so that "b" becomes the least recently used
+    assert cache.get("a") == "aaaa"
+    cache.set("c", "cccc")
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.get("c") == "cccc"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 8
+
+
+def test_lru_cache_skips_values_larger_than_limit():
+    cache = LRUCache(max_bytes=4, ttl=60)
+    cache.set("a", "aaaa")
+    cache.set("b", "bbbbb")
+    assert cache.get("a") == "aaaa"
+    assert cache.get("b") is None
+
+
+def test_lru_cache_expiry():
+    clock = FakeClock()
+    cache = LRUCache(max_bytes=100, ttl=10, clock=clock)
+    cache.set("a", "aaaa")
+    cache.set("b", "bbbb", ttl=30)
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.get("b") == "bbbb"
+    assert cache.stats()["bytes"] == 4
+    clock.now = 30
+    assert cache.get("b") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_replace_and_clear():
+    cache = LRUCache(max_bytes=100, ttl=60)
+    cache.set("a", "aaaa")
+    cache.set("a", "aa")
+    assert cache.get("a") == "aa"
+    assert cache.stats()["bytes"] == 2
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.set("b", "bbbb")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats() == {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "entries": 0,
+        "bytes": 0,
+        "max_bytes": 100,
+    }
+
+
+def test_stale_while_revalidate_cache():
+    clock = FakeClock()
+    cache = StaleWhileRevalidateCache(max_bytes=100, ttl=10, stale_ttl=20, clock=clock)
+    values = iter(["1", "2", "3"])
+
+    def load() -> str:
+        return next(values)
+
+    # first request loads the value
+    assert cache.get("a", load) == "1"
+    # fresh value is served from the cache
+    clock.now = 9
+    assert cache.get("a", load) == "1"
+    # stale value is served immediately while it is refreshed in the background
+    clock.now = 15
+    assert cache.get("a", load) == "1"
+    clock.now = 16
+    assert wait_for(lambda: cache.get("a", load) == "2")
+    assert cache.stats()["stale_hits"] == 1
+    # once past the stale window, the value is loaded before returning
+    clock.now = 100
+    assert cache.get("a", load) == "3"
+
+
+def test_stale_while_revalidate_cache_errors():
+    clock = FakeClock()
+    cache = StaleWhileRevalidateCache(max_bytes=100, ttl=10, stale_ttl=20, clock=clock)
+    failed = threading.Event()
+
+    def fail() -> str:
+        failed.set()
+        raise RuntimeError("upstream error")
+
+    # errors are raised when there is nothing to serve
+    with pytest.raises(RuntimeError):
+        cache.get("a", fail)
+    # failed background refreshes keep the stale value
+    cache.get("a", lambda: "1")
+    clock.now = 15
+    failed.clear()
+    assert cache.get("a", fail) == "1"
+    assert failed.wait(timeout=5)
+    assert cache.get("a", lambda: "2") == "1"
+
+
+def test_single_flight():
+    calls = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def load() -> str:
+        started.set()
+        release.wait(timeout=5)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        leader = executor.submit(calls.do, "a", load)
+        assert started.wait(timeout=5)
+        followers = [executor.submit(calls.do, "a", load) for _ in range(7)]
+        assert wait_for(lambda: calls.stats()["shared"] == 7)
+        release.set()
+        assert [f.result() for f in [leader, *followers]] == ["value"] * 8
+    assert calls.stats() == {"calls": 1, "shared": 7, "in_flight": 0}
+    # once the call completes, the next call for the key is made again
+    assert calls.do("a", lambda: "new value") == "new value"
+    assert calls.stats()["calls"] == 2
+
+
+def test_single_flight_errors():
+    calls = SingleFlight()
+    release = threading.Event()
+
+    def fail() -> str:
+        release.wait(timeout=5)
+        raise RuntimeError("upstream error")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(calls.do, "a", fail) for _ in range(4)]
+        assert wait_for(lambda: calls.stats()["shared"] == 3)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError, match="upstream error"):
+                future.result()
+    assert calls.stats() == {"calls": 1, "shared": 3, "in_flight": 0}
+
+
+def test_single_flight_async():
+    calls = SingleFlight()
+    loads = []
+
+    async def load() -> str:
+        loads.append(1)
+        await asyncio.sleep(0.1)
+        return "value"
+
+    async def run():
+        cancelled = asyncio.ensure_future(calls.do_async("a", load))
+        waiting = [asyncio.ensure_future(calls.do_async("a", load)) for _ in range(7)]
+        await asyncio.sleep(0)
+        # cancelling one caller does not cancel the call shared by the others
+        cancelled.cancel()
+        return await asyncio.gather(*waiting)
+
+    assert asyncio.run(run()) == ["value"] * 7
+    assert loads == [1]
+    assert calls.stats() == {"calls": 1, "shared": 7, "in_flight": 0}
@@ -0,0 +1,356 @@
+import os
+import sqlite3
+import tempfile
+import time
+
+import pytest
+
+import api.cache_backends
+from api.cache import LRUCache, StaleWhileRevalidateCache
+from api.cache_backends import RedisCache, SQLiteCache, create_cache
+
+
+class FakeClock:
+    """Manually advanced clock for testing expiry"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def sqlite_path(tmp_path):
+    return os.path.join(tmp_path, "cache.sqlite3")
+
+
+def test_sqlite_cache_get_set(sqlite_path):
+    cache = SQLiteCache(sqlite_path, namespace="cards", max_bytes=100, ttl=60)
+
+    assert cache.get("a") is None
+    cache.set("a", b"value")
+    assert cache.get("a") == b"value"
+    cache.set("a", b"other")
+    assert cache.get("a") == b"other"
+    cache.delete("a")
+    assert cache.get("a") is None
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 2,
+        "evictions": 0,
+        "errors": 0,
+        "entries": 0,
+        "bytes": 0,
+        "max_bytes": 100,
+    }
+
+
+def test_sqlite_cache_expiry(sqlite_path):
+    clock = FakeClock()
+    cache = SQLiteCache(sqlite_path, namespace="cards", max_bytes=100, ttl=10, clock=clock)
+    cache.set("a", b"1")
+    cache.set("b", b"2", ttl=30)
+
+    clock.now += 9
+    assert cache.get("a") == b"1"
+    clock.now += 1
+    assert cache.get("a") is None
+    assert cache.get("b") == b"2"
+    # reads don't write, so expired entries are only removed once their space is needed
+    assert len(cache) == 2
+
+
+def test_sqlite_cache_evicts_least_recently_used(sqlite_path):
+    clock = FakeClock()
+    cache = SQLiteCache(
+        sqlite_path, namespace="cards", max_bytes=10, ttl=60, touch_interval=0, clock=clock
+    )
+    for key in "abc":
+        cache.set(key, b"123")
+        clock.now += 1
+    # using "a" makes "b" the least recently used entry
+    assert cache.get("a") == b"123"
+    clock.now += 1
+    cache.set("d", b"1234")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == cache.get("c") == b"123"
+    assert cache.get("d") == b"1234"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 10
+    # values larger than the whole cache are not stored
+    cache.set("e", b"12345678901")
+    assert cache.get("e") is None
+
+
+def test_sqlite_cache_hits_without_writing(sqlite_path):
+    clock = FakeClock()
+    cache = SQLiteCache(
+        sqlite_path, namespace="cards", max_bytes=6, ttl=60, touch_interval=0, clock=clock
+    )
+    cache.set("a", b"12")
+    clock.now += 1
+    cache.set("b", b"12")
+    clock.now += 1
+    # another process holds the write lock, which hits don't need
+    other = sqlite3.connect(sqlite_path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    assert cache.get("a") == b"12"
+    other.execute("ROLLBACK")
+    other.close()
+    clock.now += 1
+
+    # the hit is written with the next store, so "b" is the least recently used entry
+    cache.set("c", b"1234")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"12"
+    assert cache.stats()["errors"] == 0
+
+
+def test_sqlite_cache_size_kept_by_stores(sqlite_path):
+    cache = SQLiteCache(sqlite_path, namespace="cards", max_bytes=10, ttl=60)
+    other_worker = SQLiteCache(sqlite_path, namespace="cards", max_bytes=10, ttl=60)
+    cache.set("a", b"1234")
+    other_worker.set("b", b"1234")
+    cache.set("a", b"12")
+    other_worker.delete("b")
+
+    with sqlite3.connect(sqlite_path) as conn:
+        assert conn.execute("SELECT size FROM cache_sizes").fetchall() == [(2,)]
+    assert cache.stats()["bytes"] == 2
+    cache.clear()
+    cache.set("c", b"1234567890")
+    assert other_worker.get("c") == b"1234567890"
+
+
+def test_sqlite_cache_shared_between_processes(sqlite_path):
+    # each worker process opens the database separately
+    worker = SQLiteCache(sqlite_path, namespace="cards", max_bytes=100, ttl=60)
+    other_worker = SQLiteCache(sqlite_path, namespace="cards", max_bytes=100, ttl=60)
+    views = SQLiteCache(sqlite_path, namespace="views", max_bytes=100, ttl=60)
+
+    worker.set("a", b"card")
+    views.set("a", b"views")
+
+    assert other_worker.get("a") == b"card"
+    assert views.get("a") == b"views"
+    # clearing a namespace leaves the others
+    other_worker.clear()
+    assert worker.get("a") is None
+    assert views.get("a") == b"views"
+
+
+def test_sqlite_cache_locked(sqlite_path):
+    cache = SQLiteCache(sqlite_path, namespace="cards", max_bytes=100, ttl=60, timeout=0.05)
+    cache.set("a", b"card")
+    # another process holds the write lock
+    other = sqlite3.connect(sqlite_path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+
+    start = time.perf_counter()
+    cache.set("b", b"card")
+    elapsed = time.perf_counter() - start
+    other.execute("ROLLBACK")
+    other.close()
+
+    # stores are skipped after the short busy timeout instead of failing the request
+    assert elapsed < 1
+    assert cache.get("b") is None
+    assert cache.get("a") == b"card"
+    assert cache.stats()["errors"] == 1
+
+
+def test_sqlite_cache_unavailable(tmp_path):
+    # the directory of the database doesn't exist
+    cache = SQLiteCache(
+        str(tmp_path / "missing" / "cache.sqlite3"), namespace="cards", max_bytes=100, ttl=60
+    )
+
+    cache.set("a", b"card")
+    assert cache.get("a") is None
+    assert cache.stats()["errors"] == 2
+
+
+def test_redis_cache(stand_in_redis):
+    redis = stand_in_redis()
+    cache = RedisCache(redis.url, namespace="cards", max_bytes=10, ttl=60)
+    other_worker = RedisCache(redis.url, namespace="cards", max_bytes=10, ttl=60)
+    views = RedisCache(redis.url, namespace="views", max_bytes=10, ttl=60)
+
+    assert cache.get("a") is None
+    cache.set("a", b"card")
+    views.set("a", b"views")
+    assert other_worker.get("a") == b"card"
+    assert views.get("a") == b"views"
+    # values larger than the size limit are not stored
+    cache.set("b", b"12345678901")
+    assert cache.get("b") is None
+    cache.delete("a")
+    assert cache.get("a") is None
+    # clearing a namespace leaves the others
+    views.set("b", b"views")
+    cache.set("a", b"card")
+    views.clear()
+    assert views.get("a") is None
+    assert cache.get("a") == b"card"
+    assert not [key for key in redis.entries if key.startswith(b"youtube-cards:views")]
+    assert b"youtube-cards:cards:a" in redis.entries
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 3,
+        "evictions": 0,
+        "errors": 0,
+        "entries": 1,
+        "bytes": 4,
+        "max_bytes": 10,
+    }
+
+
+def test_redis_cache_eviction(stand_in_redis):
+    redis = stand_in_redis()
+    cache = RedisCache(redis.url, namespace="cards", max_bytes=10, ttl=60)
+    other_worker = RedisCache(redis.url, namespace="cards", max_bytes=10, ttl=60)
+    views = RedisCache(redis.url, namespace="views", max_bytes=10, ttl=60)
+
+    cache.set("a", b"1234")
+    other_worker.set("b", b"1234")
+    views.set("a", b"1234")
+    # a was used more recently than b, once marked by the next store
+    assert cache.get("a") == b"1234"
+    cache.set("c", b"1234")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"1234"
+    # the size limit applies to each namespace across processes
+    assert views.get("a") == b"1234"
+    assert cache.stats()["evictions"] == 1
+    assert other_worker.stats()["bytes"] == 8
+    # replacing an entry only counts its new size
+    cache.set("a", b"12")
+    assert cache.stats()["bytes"] == 6
+
+
+def test_redis_cache_expiry(stand_in_redis):
+    redis = stand_in_redis()
+    cache = RedisCache(redis.url, namespace="cards", max_bytes=10, ttl=0.1)
+
+    cache.set("a", b"card")
+    cache.set("b", b"card", ttl=60)
+
+    assert cache.get("a") == b"card"
+    assert wait_until_missing(cache, "a")
+    assert cache.get("b") == b"card"
+
+
+def wait_until_missing(cache: RedisCache, key: str) -> bool:
+    for _ in range(100):
+        if cache.get(key) is None:
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_redis_cache_password(stand_in_redis):
+    redis = stand_in_redis(password="secret")
+    url = redis.url.replace("redis://", "redis://:secret@")
+    cache = RedisCache(url, namespace="cards", max_bytes=10, ttl=60)
+    unauthenticated = RedisCache(redis.url, namespace="cards", max_bytes=10, ttl=60)
+
+    cache.set("a", b"card")
+
+    assert cache.get("a") == b"card"
+    assert unauthenticated.get("a") is None
+    assert unauthenticated.stats()["errors"] == 1
+    assert redis.commands[-1] == "GET"
+    assert "AUTH" not in redis.commands
+
+
+def test_redis_cache_unavailable(stand_in_redis):
+    redis = stand_in_redis()
+    cache = RedisCache(redis.url, namespace="cards", max_bytes=10, ttl=60)
+    redis.close()
+
+    # errors are misses, so cards are still served
+    cache.set("a", b"card")
+    assert cache.get("a") is None
+    assert cache.stats()["errors"] == 2
+
+
+def test_redis_cache_reconnect_backoff(stand_in_redis, monkeypatch):
+    redis = stand_in_redis()
+    cache = RedisCache(redis.url, namespace="cards", max_bytes=10, ttl=60, retry_interval=60)
+    redis.close()
+    connections = []
+    connect = api.cache_backends.RedisConnection
+
+    def counted_connect(*args, **kwargs):
+        connections.append(args)
+        return connect(*args, **kwargs)
+
+    monkeypatch.setattr(api.cache_backends, "RedisConnection", counted_connect)
+
+    for _ in range(5):
+        assert cache.get("a") is None
+    # no connection is attempted again until the retry interval has passed
+    assert len(connections) == 1
+    assert cache.stats()["errors"] == 5
+    cache._retry_at = 0
+    assert cache.get("a") is None
+    assert len(connections) == 2
+
+
+def test_create_cache(sqlite_path, monkeypatch):
+    monkeypatch.setattr("api.cache_backends.CACHE_SQLITE_PATH", sqlite_path)
+
+    assert isinstance(create_cache("cards", max_bytes=10, ttl=60, backend="memory"), LRUCache)
+    sqlite = create_cache("cards", max_bytes=10, ttl=60, backend="sqlite")
+    assert isinstance(sqlite, SQLiteCache)
+    assert sqlite.path == sqlite_path
+    assert isinstance(create_cache("cards", max_bytes=10, ttl=60, backend="redis"), RedisCache)
+
+
+def test_create_cache_size_of(sqlite_path, stand_in_redis, monkeypatch):
+    monkeypatch.setattr("api.cache_backends.CACHE_SQLITE_PATH", sqlite_path)
+    monkeypatch.setattr("api.cache_backends.CACHE_REDIS_URL", stand_in_redis().url)
+
+    for backend in ("memory", "sqlite", "redis"):
+        cache = create_cache(
+            "views", max_bytes=10, ttl=60, size_of=lambda entry: len(entry) + 5, backend=backend
+        )
+        # the overhead of entries counts towards the size limit
+        cache.set("a", b"12345")
+        cache.set("b", b"12345")
+        assert cache.get("a") is None, backend
+        assert cache.get("b") == b"12345", backend
+
+
+def test_default_sqlite_path_private(tmp_path, monkeypatch):
+    monkeypatch.setattr("api.cache_backends.CACHE_SQLITE_PATH", None)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    sqlite = create_cache("cards", max_bytes=10, ttl=60, backend="sqlite")
+    directory = os.path.dirname(sqlite.path)  # type: ignore
+
+    assert os.path.dirname(directory) == str(tmp_path)
+    assert os.stat(directory).st_mode & 0o777 == 0o700
+    # a directory another user could write to is refused
+    os.chmod(directory, 0o777)
+    with pytest.raises(OSError):
+        create_cache("cards", max_bytes=10, ttl=60, backend="sqlite")
+
+
+def test_stale_while_revalidate_cache_backend(sqlite_path):
+    clock = FakeClock()
+    backend = SQLiteCache(sqlite_path, namespace="views", max_bytes=100, ttl=30, clock=clock)
+    cache = StaleWhileRevalidateCache(
+        max_bytes=100, ttl=10, stale_ttl=20, clock=clock, backend=backend
+    )
+    other_worker = StaleWhileRevalidateCache(
+        max_bytes=100, ttl=10, stale_ttl=20, clock=clock, backend=backend
+    )
+
+    assert cache.get("a", lambda: "1.5k") == "1.5k"
+    assert other_worker.get("a", lambda: "2k") == "1.5k"
+    assert backend.get("a") == b'["1.5k",1000000.0]'
@@ -0,0 +1,97 @@
+from api.cards import (
+    CardParams,
+    card_cache_key,
+    card_etag,
+    card_reply,
+    error_reply,
+    error_status,
+    is_complete,
+    published_text,
+    rendered_card,
+    revalidated_reply,
+)
+from api.exceptions import UpstreamError, ValidationError
+from api.utils import PLACEHOLDER_THUMBNAIL
+
+
+def test_card_cache_key():
+    params = CardParams(
+        video_id="dQw4w9WgXcQ",
+        width=250,
+        border_radius=5,
+        background_color="#0d1117",
+        title_color="#ffffff",
+        stats_color="#dedede",
+        title="Title",
+        max_title_lines=1,
+        publish_timestamp=0,
+        duration_seconds=0,
+        lang="en",
+    )
+
+    assert published_text(params) == ""
+    assert card_cache_key(params, "") == card_cache_key(params, "")
+    assert card_cache_key(params, "") != card_cache_key(params._replace(width=300), "")
+    assert card_cache_key(params, "1 hour ago") != card_cache_key(params, "2 hours ago")
+
+
+def test_card_etag():
+    thumbnail = "data:image/jpeg;base64,AAAA"
+    etag = card_etag("key", thumbnail, "1.5K views", "1 hour ago")
+
+    assert etag == card_etag("key", thumbnail, "1.5K views", "1 hour ago")
+    assert etag != card_etag("other", thumbnail, "1.5K views", "1 hour ago")
+    assert etag != card_etag("key", "data:image/jpeg;base64,BBBB", "1.5K views", "1 hour ago")
+    assert etag != card_etag("key", thumbnail, "1.6K views", "1 hour ago")
+    assert etag != card_etag("key", thumbnail, "1.5K views", "2 hours ago")
+
+
+def test_is_complete():
+    thumbnail = "data:image/jpeg;base64,AAAA"
+
+    assert is_complete(thumbnail, "1.5K views")
+    # videos may hide their view count
+    assert is_complete(thumbnail, "")
+    assert not is_complete(thumbnail, None)
+    assert not is_complete(PLACEHOLDER_THUMBNAIL, "1.5K views")
+
+
+def test_card_reply():
+    card = rendered_card(b"<svg></svg>", "etag-gzip")
+
+    sent = card_reply({}, card, "gzip")
+    revalidated = card_reply({"HTTP_IF_NONE_MATCH": '"etag-gzip"'}, card, "gzip")
+
+    assert sent.status == 200
+    assert sent.body == b"<svg></svg>"
+    assert sent.headers["Content-Encoding"] == "gzip"
+    assert sent.headers["ETag"] == '"etag-gzip"'
+    assert sent.headers["Vary"] == "Accept-Encoding"
+    assert revalidated.status == 304
+    assert revalidated.body == b""
+    assert "Content-Encoding" not in revalidated.headers
+    assert revalidated.headers["ETag"] == sent.headers["ETag"]
+
+
+def test_revalidated_reply():
+    environ = {"HTTP_IF_NONE_MATCH": '"etag-br"'}
+
+    revalidated = revalidated_reply(environ, "etag", "br")
+
+    assert revalidated is not None
+    assert revalidated.status == 304
+    assert revalidated.headers["ETag"] == '"etag-br"'
+    assert revalidated_reply(environ, "etag", None) is None
+    assert revalidated_reply({}, "etag", "br") is None
+
+
+def test_error_reply():
+    assert error_status(ValidationError("Invalid video ID")) == 400
+    assert error_status(UpstreamError("Timed out", status=504)) == 504
+    assert error_status(KeyError("id")) == 500
+
+    reply = error_reply(404, b"<svg>404</svg>")
+
+    assert reply.status == 404
+    assert reply.headers["Content-Type"] == "image/svg+xml; charset=utf-8"
+    assert "max-age=" in reply.headers["Cache-Control"]
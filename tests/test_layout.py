@@ -0,0 +1,75 @@
+import pytest
+
+from api.compile_glyphs import TABLE_PATH, compile_glyphs
+from api.glyph_table import UNITS_PER_EM
+from api.layout import ELLIPSIS, advance, measure_text, wrap_text
+
+TITLES = [
+    "Rick Astley - Never Gonna Give You Up (Official Music Video)",
+    "WWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWW",
+    "illiterate little lilies fill the hill with lilting lyrical lines",
+    "日本語のタイトルはとても長いのでここで折り返す必要があります",
+    "조회수가 많은 한국어 동영상 제목은 이렇게 길어질 수도 있습니다",
+    "مرحبا بكم في قناتي على يوتيوب هذا فيديو جديد رائع جدا",
+    "שלום לכולם וברוכים הבאים לערוץ שלי ביוטיוב",
+    "Ünïcödé títlés wíth àccénts ärë wrâppéd tõo 🎉🎉🎉",
+]
+
+
+def test_glyph_table_up_to_date():
+    with open(TABLE_PATH, encoding="utf-8") as f:
+        assert f.read() == compile_glyphs(), "run python -m api.compile_glyphs"
+
+
+def test_advance():
+    assert advance("i") < advance("n") < advance("W")
+    # characters missing from the font are measured by class
+    assert advance("日") == UNITS_PER_EM
+    assert advance("́") == 0
+    assert 0 < advance("ب") < UNITS_PER_EM
+    assert measure_text("nn", 15) == pytest.approx(2 * measure_text("n", 15))
+
+
+@pytest.mark.parametrize("title", TITLES)
+@pytest.mark.parametrize("max_width", [80, 230, 380])
+def test_wrap_text_fits(title, max_width):
+    lines = wrap_text(title, max_width, 3, font_size=15)
+
+    assert 1 <= len(lines) <= 3
+    for line in lines:
+        assert line.text == line.text.strip()
+        assert line.width == pytest.approx(measure_text(line.text, 15))
+        assert line.width <= max_width
+    # nothing is lost unless the last line is trimmed
+    if not lines[-1].text.endswith(ELLIPSIS):
+        assert "".join("".join(line.text.split()) for line in lines) == "".join(title.split())
+
+
+def test_wrap_text_breaks_at_spaces():
+    lines = wrap_text("Never Gonna Give You Up", 120, 3, font_size=15)
+
+    assert [line.text for line in lines] == ["Never Gonna Give", "You Up"]
+
+
+def test_wrap_text_breaks_wide_characters():
+    lines = wrap_text("日本語のタイトル", 4 * 15, 3, font_size=15)
+
+    assert [line.text for line in lines] == ["日本語の", "タイトル"]
+
+
+def test_wrap_text_ellipsis():
+    lines = wrap_text("Never Gonna Give You Up", 120, 1, font_size=15)
+
+    # the last line is trimmed until the ellipsis fits
+    assert [line.text for line in lines] == [f"Never Gonna Gi{ELLIPSIS}"]
+    assert lines[0].width <= 120
+    lines = wrap_text("Never Gonna Give You Up", 130, 1, font_size=15)
+    assert [line.text for line in lines] == [f"Never Gonna Give{ELLIPSIS}"]
+
+
+def test_wrap_text_edge_cases():
+    assert wrap_text("", 230, 1, font_size=15) == []
+    assert wrap_text("Title", 230, 0, font_size=15) == []
+    assert [line.text for line in wrap_text("  a \t b\n c  ", 230, 1, font_size=15)] == ["a b c"]
+    # a character wider than a line still takes a line
+    assert [line.text for line in wrap_text("WW", 1, 3, font_size=15)] == ["W", "W"]
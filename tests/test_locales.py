@@ -1,7 +1,23 @@
+import math
 import os
+from datetime import timedelta
 
+import i18n
+import pytest
 import yaml
 from babel import Locale, UnknownLocaleError
+from babel.dates import format_timedelta
+from babel.numbers import format_compact_decimal
+
+from api.compile_locales import TABLE_PATH, compile_locales, compile_plural_rule
+from api.locales import (
+    format_compact_number,
+    format_relative_seconds,
+    format_relative_value,
+    round_compact_number,
+    text_direction,
+    translate,
+)
 
 
 def test_locales_valid():
@@ -28,3 +44,94 @@ def test_locales_valid():
             Locale.parse(locale)
         except UnknownLocaleError:
             assert False, f"{locale} is not a valid locale"
+
+
+LANGS = sorted(file.split(".")[0] for file in os.listdir(os.path.join("api", "locale")))
+
+
+def test_babel_private_apis():
+    """Test that the private Babel APIs the locale table is compiled with still behave as
+    expected, since they may change in any release of Babel
+    """
+    message = "api/compile_locales.py must be updated for this version of Babel"
+    locale = Locale.parse("en")
+    assert {"date_fields", "unit_patterns"} <= set(locale._data.keys()), message
+    assert locale._data["date_fields"]["hour"]["past"]["other"] == "{0} hours ago", message
+    assert compile_plural_rule("plural_en", locale).splitlines() == [
+        "def plural_en(n, i, v, w, f, t, c, e):",
+        "    if (IN(i, [(1, 1)]) and IN(v, [(0, 0)])): return 'one'",
+        "    return 'other'",
+    ], message
+
+
+def test_locale_table_up_to_date():
+    """Test that the compiled locale table matches the locale files and Babel data"""
+    with open(TABLE_PATH, encoding="utf-8") as f:
+        assert f.read() == compile_locales(), "run python -m api.compile_locales"
+
+
+@pytest.mark.parametrize("lang", LANGS + ["zh", "pt_BR"])
+def test_compact_numbers_match_babel(lang):
+    numbers = [0, 1, 2, 5, 11, 21, 100, 999, 1000, 1001, 1050, 1500, 1950, 1999, 2000]
+    numbers += [
+        int(mantissa * 10**exponent)
+        for mantissa in (1, 1.2, 3.45, 99.9)
+        for exponent in range(3, 16)
+    ]
+    numbers += [10**6, 1_000_000_000, 2_100_000, 12_345_678, 987_654_321_000]
+    for number in numbers:
+        expected = format_compact_decimal(number, locale=lang, fraction_digits=1)
+        assert format_compact_number(number, lang) == expected, number
+
+
+def test_round_compact_number():
+    assert round_compact_number(1_234_567, "en") == 1_200_000
+    assert round_compact_number(1_249_999, "en") == 1_200_000
+    assert round_compact_number(1_234_567, "ja") == 1_235_000
+    assert round_compact_number(999, "en") == 999
+    # rounding up to the next magnitude would show "1M" rather than "1000K"
+    assert round_compact_number(999_999, "en") == 999_999
+
+
+@pytest.mark.parametrize("lang", LANGS)
+def test_rounded_compact_numbers_shown_alike(lang):
+    numbers = [1049, 1050, 1999, 2951, 99_999, 123_456, 999_951, 1_234_567, 987_654_321_000]
+    for number in numbers:
+        rounded = round_compact_number(number, lang)
+        assert format_compact_number(rounded, lang) == format_compact_number(number, lang), number
+
+
+@pytest.mark.parametrize("lang", LANGS + ["zh", "pt_BR"])
+def test_relative_times_match_babel(lang):
+    units = [1, 60, 3600, 86400, 7 * 86400, 30 * 86400, 365 * 86400]
+    # just below and at the threshold of each unit, where rounding may reach the next unit
+    thresholds = [math.ceil(0.85 * unit) + offset for unit in units for offset in (-1, 0)]
+    for seconds in (
+        [0, 1, 2, 44, 45, 59]
+        + thresholds
+        + [n * unit for unit in units for n in (1, 2, 3, 5, 11, 21)]
+    ):
+        for signed in (seconds, -seconds):
+            expected = format_timedelta(timedelta(seconds=signed), add_direction=True, locale=lang)
+            assert format_relative_seconds(signed, lang) == expected, signed
+
+
+def test_relative_times_memoized():
+    format_relative_value.cache_clear()
+    assert format_relative_seconds(-3600, "fr") == "il y a 1 heure"
+    assert format_relative_seconds(-3700, "fr") == "il y a 1 heure"
+    assert format_relative_seconds(-3700, "pt_BR") == "há 1 hora"
+    assert format_relative_seconds(-3800, "pt_BR") == "há 1 hora"
+    assert format_relative_seconds(7200, "fr") == "dans 2 heures"
+    assert format_relative_value.cache_info().misses == 3
+    assert format_relative_value.cache_info().hits == 2
+
+
+@pytest.mark.parametrize("lang", LANGS + ["zh", "pt_BR"])
+def test_translations_match_i18n(lang):
+    i18n.set("filename_format", "{locale}.{format}")
+    if "./api/locale" not in i18n.load_path:
+        i18n.load_path.append("./api/locale")
+    assert translate("view", lang) == i18n.t("view", locale=lang)
+    assert translate("views", lang, number="12K") == i18n.t("views", number="12K", locale=lang)
+    assert text_direction(lang) == i18n.t("direction", locale=lang, default="ltr")
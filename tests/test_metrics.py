@@ -0,0 +1,89 @@
+import time
+
+from api.metrics import (
+    Counter,
+    Histogram,
+    current_timings,
+    finish_request,
+    format_number,
+    mark_finished,
+    record_stages_since,
+    samples_exposition,
+    stage_seconds,
+    start_request,
+    timed,
+)
+
+
+def test_histogram_exposition():
+    histogram = Histogram("card_seconds", "Time to render cards", "stage", (0.1, 1))
+    histogram.observe("render", 0.05)
+    histogram.observe("render", 0.1)
+    histogram.observe("render", 2)
+    histogram.observe("cache", 0.5)
+
+    assert histogram.exposition() == [
+        "# HELP card_seconds Time to render cards",
+        "# TYPE card_seconds histogram",
+        'card_seconds_bucket{stage="cache",le="0.1"} 0',
+        'card_seconds_bucket{stage="cache",le="1"} 1',
+        'card_seconds_bucket{stage="cache",le="+Inf"} 1',
+        'card_seconds_sum{stage="cache"} 0.5',
+        'card_seconds_count{stage="cache"} 1',
+        'card_seconds_bucket{stage="render",le="0.1"} 2',
+        'card_seconds_bucket{stage="render",le="1"} 2',
+        'card_seconds_bucket{stage="render",le="+Inf"} 3',
+        'card_seconds_sum{stage="render"} 2.15',
+        'card_seconds_count{stage="render"} 3',
+    ]
+    histogram.clear()
+    assert len(histogram.exposition()) == 2
+
+
+def test_counter_exposition():
+    counter = Counter("responses_total", "Upstream responses", ("host", "status"))
+    counter.inc("i.ytimg.com", "200")
+    counter.inc("i.ytimg.com", "200")
+    counter.inc('odd"host\\', "timeout")
+
+    assert counter.exposition() == [
+        "# HELP responses_total Upstream responses",
+        "# TYPE responses_total counter",
+        'responses_total{host="i.ytimg.com",status="200"} 2',
+        'responses_total{host="odd\\"host\\\\",status="timeout"} 1',
+    ]
+
+
+def test_samples_exposition():
+    assert samples_exposition("hit_ratio", "Hits", "gauge", ("cache",), {("cards",): 0.25}) == [
+        "# HELP hit_ratio Hits",
+        "# TYPE hit_ratio gauge",
+        'hit_ratio{cache="cards"} 0.25',
+    ]
+    assert format_number(3.0) == "3"
+    assert format_number(0.0025) == "0.0025"
+
+
+def test_request_timings():
+    timings = start_request()
+    with timed("validate"):
+        pass
+    finished: dict[str, float] = {}
+    mark_finished(finished, "thumbnail")(None)
+    record_stages_since(timings.start, finished, ("thumbnail", "views"))
+
+    assert finish_request() is timings
+    assert [stage for stage, _ in timings.stages] == ["validate", "thumbnail", "views", "total"]
+    assert timings.stages[1][1] <= timings.stages[2][1] <= timings.stages[3][1]
+    assert timings.server_timing().startswith("validate;dur=0.")
+    assert current_timings.get() is None
+    assert finish_request() is None
+    assert 'stage_seconds_count{stage="total"} 1' in "\n".join(stage_seconds.exposition())
+
+
+def test_stages_recorded_without_request():
+    with timed("render"):
+        time.sleep(0.01)
+
+    assert current_timings.get() is None
+    assert 'stage_seconds_count{stage="render"} 1' in "\n".join(stage_seconds.exposition())
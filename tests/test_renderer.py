@@ -0,0 +1,92 @@
+import itertools
+
+import pytest
+from flask import render_template
+
+from api.cards import CardParams
+from api.index import app, card_context
+from api.renderer import card_fragments, render_main
+
+TITLES = [
+    "",
+    "Title",
+    "Rick Astley - Never Gonna Give You Up (Official Music Video)",
+    "<script>alert('x')</script> & \"quotes\"",
+    "שלום עולם",
+    "A very long title which is wrapped over several lines and then trimmed with an ellipsis",
+]
+THUMBNAILS = ["data:image/jpeg;base64,/9j/4AAQSkZJRg==", 'data:image/jpeg;base64,<&">']
+
+
+def card_params(**kwargs) -> CardParams:
+    defaults = CardParams(
+        video_id="dQw4w9WgXcQ",
+        width=250,
+        border_radius=5,
+        background_color="#0d1117",
+        title_color="#ffffff",
+        stats_color="#dedede",
+        title="Title",
+        max_title_lines=1,
+        publish_timestamp=0,
+        duration_seconds=0,
+        lang="en",
+    )
+    return defaults._replace(**kwargs)
+
+
+def assert_conforms(params: CardParams, thumbnail: str, views: str):
+    with app.app_context():
+        context = card_context(params, thumbnail, views)
+        assert render_main(**context) == render_template("main.svg", **context)
+
+
+@pytest.mark.parametrize(
+    "title, max_title_lines, width",
+    list(itertools.product(TITLES, [1, 2, 3], [100, 250, 401])),
+)
+def test_titles_conform(title, max_title_lines, width):
+    params = card_params(title=title, max_title_lines=max_title_lines, width=width)
+    assert_conforms(params, THUMBNAILS[0], "1.2M views")
+
+
+@pytest.mark.parametrize(
+    "duration_seconds, publish_timestamp, views",
+    list(itertools.product([0, 7, 61, 3600, 86399], [0, 1_000_000_000], ["", "1.2M views"])),
+)
+def test_stats_conform(duration_seconds, publish_timestamp, views):
+    params = card_params(duration_seconds=duration_seconds, publish_timestamp=publish_timestamp)
+    assert_conforms(params, THUMBNAILS[0], views)
+
+
+@pytest.mark.parametrize("lang", ["en", "he", "ar", "fa", "ja", "pt_BR"])
+def test_languages_conform(lang):
+    params = card_params(lang=lang, publish_timestamp=1_000_000_000, duration_seconds=61)
+    assert_conforms(params, THUMBNAILS[0], "1.2M views")
+
+
+@pytest.mark.parametrize("thumbnail", THUMBNAILS)
+def test_styles_conform(thumbnail):
+    params = card_params(
+        border_radius=-3,
+        background_color="#abcd",
+        title_color="#123",
+        stats_color="#12345678",
+    )
+    assert_conforms(params, thumbnail, "<b>1.2M</b> views")
+
+
+def test_fragments_cached():
+    card_fragments.cache_clear()
+    for title in TITLES[1:4]:
+        assert_conforms(card_params(title=title), THUMBNAILS[0], "1.2M views")
+
+    assert card_fragments.cache_info().hits == 2
+    assert card_fragments.cache_info().misses == 1
+
+
+def test_embedded_font_unsupported():
+    with app.app_context():
+        context = card_context(card_params(), THUMBNAILS[0], "1.2M views")
+    with pytest.raises(ValueError):
+        render_main(**(context | {"reduced_bandwidth": False}))
@@ -0,0 +1,62 @@
+import os
+import re
+import subprocess
+import sys
+
+from api.index import app, template_bytecode_cache
+
+# seconds importing the app may take after a cold start, with room for slower machines
+IMPORT_TIME_BUDGET = float(os.environ.get("IMPORT_TIME_BUDGET", "1.0"))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def import_time(module: str) -> float:
+    """Get the seconds spent importing a module in a new interpreter, including its imports"""
+    result = run_python(f"import {module}", "-X", "importtime")
+    match = re.search(rf"\|\s*(\d+) \|\s*{re.escape(module)}$", result.stderr, re.MULTILINE)
+    assert match, result.stderr
+    return int(match.group(1)) / 1e6
+
+
+def test_import_time_budget():
+    # the fastest of a few runs is the least affected by other processes
+    seconds = min(import_time("api.index") for _ in range(3))
+    assert seconds < IMPORT_TIME_BUDGET, f"importing api.index took {seconds:.3f}s"
+
+
+def test_heavy_imports_deferred():
+    heavy = ("babel", "PIL", "yaml", "i18n")
+    result = run_python(
+        f"import sys, api.index; print(*[m for m in {heavy!r} if m in sys.modules])"
+    )
+    assert result.stdout.split() == []
+
+
+def test_template_bytecode_cached(client):
+    cache = app.jinja_env.bytecode_cache
+    assert cache is not None
+    client.get("/")
+
+    assert any(file.startswith("__jinja2_") for file in os.listdir(cache.directory))  # type: ignore
+
+
+def test_template_bytecode_cache_private(tmp_path):
+    directory = tmp_path / "templates"
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o777)
+    shared.chmod(0o777)
+
+    cache = template_bytecode_cache(str(directory))
+
+    assert cache is not None
+    assert directory.stat().st_mode & 0o777 == 0o700
+    # templates planted by other users in a directory they can write to are not loaded
+    assert template_bytecode_cache(str(shared)) is None
+    assert template_bytecode_cache("") is None
@@ -0,0 +1,71 @@
+import io
+
+import pytest
+
+import api.thumbnails
+from api.thumbnails import VARIANTS, plan_thumbnail, process_thumbnail
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def create_jpeg(width: int, height: int, *, letterboxed: bool = False) -> bytes:
+    """Create a JPEG image with black bars above and below a 16:9 frame if letterboxed"""
+    image = Image.new("RGB", (width, height), "#000000")
+    frame_height = width * 9 // 16 if letterboxed else height
+    top = (height - frame_height) // 2
+    image.paste(Image.new("RGB", (width, frame_height), "#3366cc"), (0, top))
+    output = io.BytesIO()
+    image.save(output, format="jpeg", quality=95)
+    return output.getvalue()
+
+
+def variant(name: str):
+    return next(v for v in VARIANTS if v.name == name)
+
+
+def test_plan_thumbnail_original(monkeypatch):
+    monkeypatch.setattr(api.thumbnails, "THUMBNAIL_FORMAT", "original")
+    # thumbnails that can't be processed are always embedded at the medium size
+    assert plan_thumbnail(120) == [(variant("mqdefault"), 320)]
+    assert plan_thumbnail(320) == [(variant("mqdefault"), 320)]
+    assert plan_thumbnail(500) == [(variant("mqdefault"), 320)]
+
+
+def test_plan_thumbnail_processed(monkeypatch):
+    monkeypatch.setattr(api.thumbnails, "THUMBNAIL_FORMAT", "webp")
+    assert plan_thumbnail(100) == [(variant("default"), 100), (variant("mqdefault"), 100)]
+    assert plan_thumbnail(250) == [(variant("mqdefault"), 250)]
+    assert plan_thumbnail(400) == [(variant("hqdefault"), 400), (variant("mqdefault"), 320)]
+    assert plan_thumbnail(2000) == [
+        (variant("maxresdefault"), 1280),
+        (variant("mqdefault"), 320),
+    ]
+    monkeypatch.setattr(api.thumbnails, "THUMBNAIL_SCALE", 2)
+    assert plan_thumbnail(250) == [(variant("sddefault"), 500), (variant("mqdefault"), 320)]
+
+
+def test_process_thumbnail_original(monkeypatch):
+    monkeypatch.setattr(api.thumbnails, "THUMBNAIL_FORMAT", "original")
+    data = create_jpeg(320, 180)
+    assert process_thumbnail(data, "image/jpeg", variant("mqdefault"), 250) == (data, "image/jpeg")
+
+
+def test_process_thumbnail_crops_and_resizes(monkeypatch):
+    monkeypatch.setattr(api.thumbnails, "THUMBNAIL_FORMAT", "webp")
+    data = create_jpeg(480, 360, letterboxed=True)
+
+    processed, mime_type = process_thumbnail(data, "image/jpeg", variant("hqdefault"), 400)
+
+    assert mime_type == "image/webp"
+    assert len(processed) < len(data)
+    with Image.open(io.BytesIO(processed)) as image:
+        assert image.format == "WEBP"
+        assert image.size == (400, 225)
+        # the black bars are cropped away
+        assert image.convert("RGB").getpixel((200, 2)) != (0, 0, 0)
+
+
+def test_process_thumbnail_invalid_image(monkeypatch):
+    monkeypatch.setattr(api.thumbnails, "THUMBNAIL_FORMAT", "jpeg")
+    data = b"\xff\xd8\xff\xe0"
+    assert process_thumbnail(data, "image/jpeg", variant("mqdefault"), 250) == (data, "image/jpeg")
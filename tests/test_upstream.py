@@ -0,0 +1,97 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api.breaker import OPEN, CircuitBreakers, host_of
+from api.exceptions import CircuitOpenError, UpstreamError
+from api.metrics import upstream_responses
+from api.upstream import HTTPClient
+
+
+def test_http_client_reuses_connections(stand_in_upstream):
+    upstream = stand_in_upstream(b'{"value": "1.5k"}', "application/json")
+    client = HTTPClient()
+
+    for _ in range(3):
+        response = client.get(f"{upstream.url}/youtube/views/abc_123-456.json")
+        assert response.status == 200
+        assert response.body == b'{"value": "1.5k"}'
+        assert response.headers["Content-Type"] == "application/json"
+
+    assert upstream.hits == 3
+    [stats] = client.stats().values()
+    assert stats == {"connections_opened": 1, "connections_reused": 2}
+    client.close()
+
+
+def test_http_client_http_error(stand_in_upstream):
+    upstream = stand_in_upstream(b"", "text/html", status=404)
+    client = HTTPClient()
+
+    with pytest.raises(UpstreamError) as exc_info:
+        client.get(f"{upstream.url}/vi/abc_123-456/mqdefault.jpg")
+    assert exc_info.value.status == 404
+    assert str(exc_info.value) == "HTTP Error 404: Not Found"
+    client.close()
+
+
+def test_http_client_read_timeout(stand_in_upstream):
+    upstream = stand_in_upstream(b"", "text/html", delay=1)
+    client = HTTPClient(read_timeout=0.1)
+
+    with pytest.raises(UpstreamError) as exc_info:
+        client.get(upstream.url)
+    assert exc_info.value.status == 504
+    client.close()
+
+
+def test_http_client_connection_limit(stand_in_upstream):
+    upstream = stand_in_upstream(b"", "text/html", delay=0.5)
+    client = HTTPClient(max_connections_per_host=1, connect_timeout=0.1)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(client.get, upstream.url) for _ in range(2)]
+        errors = [future.exception() for future in futures]
+
+    # only one request is sent at a time, the other gives up waiting for a connection
+    assert upstream.hits == 1
+    assert sorted(getattr(error, "status", 200) for error in errors) == [200, 503]
+    client.close()
+
+
+def test_http_client_circuit_breaker(stand_in_upstream):
+    upstream = stand_in_upstream(b"", "text/html", status=500)
+    breakers = CircuitBreakers(failure_threshold=2, slow_threshold=5, reset_timeout=60)
+    client = HTTPClient(breakers=breakers)
+
+    for _ in range(2):
+        with pytest.raises(UpstreamError) as exc_info:
+            client.get(upstream.url)
+        assert exc_info.value.status == 500
+    # once open, requests fail right away without reaching the server
+    with pytest.raises(CircuitOpenError) as exc_info:
+        client.get(upstream.url)
+    assert exc_info.value.status == 503
+    assert upstream.hits == 2
+    [stats] = breakers.stats().values()
+    assert stats["state"] == OPEN
+    assert stats["rejected"] == 1
+    client.close()
+
+
+def test_http_client_counts_responses(stand_in_upstream):
+    failing = stand_in_upstream(b"", "text/html", status=500)
+    slow = stand_in_upstream(b"", "text/html", delay=1)
+    breakers = CircuitBreakers(failure_threshold=1, slow_threshold=5, reset_timeout=60)
+    client = HTTPClient(read_timeout=0.1, breakers=breakers)
+
+    for url in (failing.url, failing.url, slow.url):
+        with pytest.raises(UpstreamError):
+            client.get(url)
+
+    exposition = [line.split("_total", 1)[1] for line in upstream_responses.exposition()[2:]]
+    assert len(exposition) == 3
+    assert f'{{host="{host_of(failing.url)}",status="500"}} 1' in exposition
+    assert f'{{host="{host_of(failing.url)}",status="circuit_open"}} 1' in exposition
+    assert f'{{host="{host_of(slow.url)}",status="timeout"}} 1' in exposition
+    client.close()
@@ -1,13 +1,21 @@
 import re
 from datetime import datetime
 
+import pytest
+
+import api.thumbnails
+import api.utils
+from api.exceptions import UpstreamError
 from api.utils import (
     data_uri_from_file,
     data_uri_from_url,
     estimate_duration_width,
+    fetch_thumbnail,
     fetch_views,
     format_relative_time,
+    format_views_number,
     format_views_value,
+    is_rtl_title,
     parse_metric_value,
     seconds_to_duration,
     trim_lines,
@@ -19,6 +27,20 @@ def test_fetch_views():
     assert metric_regex.match(fetch_views("dQw4w9WgXcQ"))
 
 
+def test_fetch_views_cached(monkeypatch):
+    requested_ids = []
+
+    def mock_fetch_views_value(video_id: str) -> str:
+        requested_ids.append(video_id)
+        return "1.5k"
+
+    monkeypatch.setattr(api.utils, "fetch_views_value", mock_fetch_views_value)
+
+    assert fetch_views("abc_123-456") == "1.5K views"
+    assert fetch_views("abc_123-456", "fr") == "1,5\u00a0k vues"
+    assert requested_ids == ["abc_123-456"]
+
+
 def test_format_views_value():
     views_regex = re.compile(r"^\d+(?:\.\d)?[KMBT]? views$")
     assert format_views_value("1") == "1 view"
@@ -39,6 +61,24 @@ def test_format_views_value_i18n():
     assert views_regex.match(format_views_value("1.5G", "fr"))
 
 
+def test_format_views_value_memoized():
+    format_views_number.cache_clear()
+    assert format_views_value("1.5k", "fr") == "1,5\u00a0k vues"
+    assert format_views_value("1.5k", "fr") == "1,5\u00a0k vues"
+    assert format_views_value("1.5k", "en") == "1.5K views"
+    assert format_views_number.cache_info().misses == 2
+    assert format_views_number.cache_info().hits == 1
+
+
+def test_format_views_value_memoized_exact_counts():
+    format_views_number.cache_clear()
+    assert format_views_value("1234567") == "1.2M views"
+    assert format_views_value("1249999") == "1.2M views"
+    assert format_views_value("1500") == format_views_value("1.5k")
+    assert format_views_number.cache_info().misses == 2
+    assert format_views_number.cache_info().hits == 2
+
+
 def test_format_relative_time():
     # values are handled by Babel, so we just test that the function is called successfully
     assert format_relative_time(datetime.now().timestamp() - 3600) == "1 hour ago"
@@ -66,6 +106,34 @@ def test_data_uri_from_url_and_file():
     assert thumbnail_png.startswith("data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/")
 
 
+def test_fetch_thumbnail_cached(upstreams):
+    thumbnails = upstreams.thumbnails
+
+    assert fetch_thumbnail("abc_123-456") == "data:image/jpeg;base64,/9j/4A=="
+    assert fetch_thumbnail("abc_123-456") == "data:image/jpeg;base64,/9j/4A=="
+    assert fetch_thumbnail("abc_123-456", 200) == "data:image/jpeg;base64,/9j/4A=="
+    assert thumbnails.paths == ["/vi/abc_123-456/mqdefault.jpg"]
+    assert api.utils.thumbnail_cache.stats()["hits"] == 2
+
+
+def test_fetch_thumbnail_fallback(upstreams, monkeypatch):
+    pytest.importorskip("PIL")
+    thumbnails = upstreams.thumbnails
+    thumbnails.body = b""
+    thumbnails.content_type = "text/html"
+    thumbnails.status = 404
+    monkeypatch.setattr(api.thumbnails, "THUMBNAIL_FORMAT", "jpeg")
+
+    with pytest.raises(UpstreamError) as exc_info:
+        fetch_thumbnail("abc_123-456", 500)
+    assert exc_info.value.status == 404
+    # the smaller thumbnail is tried when the preferred size does not exist
+    assert thumbnails.paths == [
+        "/vi/abc_123-456/sddefault.jpg",
+        "/vi/abc_123-456/mqdefault.jpg",
+    ]
+
+
 def test_trim_lines():
     assert trim_lines("abcdefghijklmnopqrstuvwxyz", 100, 1) == ["abcdefghijklmnopqrstuvwxyz"]
     assert trim_lines("abcdefghijklmnopqrstuvwxyz", 10, 1) == ["abcdefghi…"]
@@ -85,7 +153,22 @@ def test_seconds_to_duration():
 
 
 def test_estimate_duration_width():
-    assert estimate_duration_width("1:00") == 34
-    assert estimate_duration_width("10:00") == 41
-    assert estimate_duration_width("1:00:00") == 53
-    assert estimate_duration_width("10:00:00") == 60
+    assert estimate_duration_width("1:00", font_size=13) == 34
+    assert estimate_duration_width("10:00", font_size=13) == 41
+    assert estimate_duration_width("1:00:00", font_size=13) == 51
+    assert estimate_duration_width("10:00:00", font_size=13) == 59
+    # colons are narrower than digits
+    assert estimate_duration_width("1:00:00", font_size=13) < estimate_duration_width(
+        "100000", font_size=13
+    )
+
+
+def test_is_rtl_title():
+    assert not is_rtl_title("Hello world")
+    assert is_rtl_title("שלום עולם")
+    assert is_rtl_title("مرحبا بالعالم 2024")
+    # more right-to-left than left-to-right letters
+    assert is_rtl_title("שלום עולם hi")
+    assert not is_rtl_title("Hello world שלום")
+    # numbers and punctuation are neutral
+    assert not is_rtl_title("123 !?")
@@ -2,8 +2,10 @@ import pytest
 
 from api.validate import (
     ValidationError,
+    canonical_lang,
     validate_color,
     validate_int,
+    validate_lang,
     validate_string,
     validate_video_id,
 )
@@ -62,3 +64,34 @@ def test_validate_string(req):
     # valid field
     req.set_args(text="Hello, world!")
     assert validate_string(req, "text", default="Hello, world!") == "Hello, world!"
+
+
+def test_validate_lang(req):
+    canonical_lang.cache_clear()
+    # missing field
+    assert validate_lang(req, "lang", default="en") == "en"
+    # translated languages are accepted as is
+    req.set_args(lang="fr")
+    assert validate_lang(req, "lang", default="en") == "fr"
+    # other languages are normalized to their canonical identifier
+    req.set_args(lang="ZH")
+    assert validate_lang(req, "lang", default="en") == "zh"
+    req.set_args(lang="pt_br")
+    assert validate_lang(req, "lang", default="en") == "pt_BR"
+    # unknown and malformed languages are replaced with the default
+    for lang in ("zz", "pt-BR", "", "x" * 10_000):
+        req.set_args(lang=lang)
+        assert validate_lang(req, "lang", default="en") == "en"
+    # long values are rejected without being parsed or memoized
+    assert canonical_lang.cache_info().currsize == 5
+
+
+def test_validate_lang_memoized(req):
+    canonical_lang.cache_clear()
+    for _ in range(3):
+        for lang in ("zh", "zz"):
+            req.set_args(lang=lang)
+            validate_lang(req, "lang", default="en")
+
+    assert canonical_lang.cache_info().misses == 2
+    assert canonical_lang.cache_info().hits == 4